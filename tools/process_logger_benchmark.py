@@ -0,0 +1,110 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the number of lines per second the process executor
+# can log from the output of a background process, writing every line
+# separately as it used to, and with the buffered ProcessLogger.
+#
+# Usage: python tools/process_logger_benchmark.py [number of lines]
+
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from subprocess import Popen, PIPE
+
+EXECUTOR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+    'web', 'pgadmin', 'misc', 'bgprocess', 'process_executor.py'
+)
+
+# Writes the lines as fast as possible, like pg_dump --verbose on a database
+# with many objects.
+PRODUCER = """
+import sys
+line = b'pg_dump: dumping contents of table "public.some_table_name"\\n'
+for i in range({0} // 1000):
+    sys.stdout.buffer.write(line * 1000)
+"""
+
+
+def load_executor():
+    # The process executor runs standalone, do not import pgadmin.
+    spec = importlib.util.spec_from_file_location('process_executor',
+                                                  EXECUTOR)
+    executor = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(executor)
+    return executor
+
+
+class LineLogger(object):
+    """
+    Logs every line with a separate write, as the process executor did.
+    """
+
+    def __init__(self, out_dir, stream_type):
+        self.logger = open(os.path.join(out_dir, stream_type), 'wb')
+
+    def log(self, msg):
+        self.logger.write(
+            datetime.utcnow().strftime('%y%m%d%H%M%S%f').encode('utf-8')
+        )
+        self.logger.write(b',')
+        self.logger.write(msg.lstrip(b'\n'))
+        self.logger.write(os.linesep.encode('utf-8'))
+
+    def run(self, process):
+        while True:
+            line = process.stdout.readline()
+            if line:
+                self.log(line)
+            elif process.poll() is not None:
+                break
+        self.logger.close()
+
+
+def run_line_logger(out_dir, lines):
+    process = Popen([sys.executable, '-c', PRODUCER.format(lines)],
+                    stdout=PIPE)
+    start_time = time.time()
+    LineLogger(out_dir, 'out_lines').run(process)
+    return time.time() - start_time
+
+
+def run_process_logger(executor, out_dir, lines):
+    executor._out_dir = out_dir
+    process = Popen([sys.executable, '-c', PRODUCER.format(lines)],
+                    stdout=PIPE)
+    start_time = time.time()
+    logger = executor.ProcessLogger('out')
+    logger.attach_process_stream(process, process.stdout)
+    logger.start()
+    logger.join()
+    logger.release()
+    return time.time() - start_time
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    executor = load_executor()
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        line_time = run_line_logger(out_dir, lines)
+        buffered_time = run_process_logger(executor, out_dir, lines)
+
+    print('Lines logged     : {0}'.format(lines))
+    print('Line by line     : {0:.0f} lines/sec'.format(lines / line_time))
+    print('Buffered         : {0:.0f} lines/sec'.format(
+        lines / buffered_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken by a new process to create the
+# application, i.e. to import and register all the modules before the first
+# request can be served, scanning the packages and with the module manifest.
+#
+# Usage: python tools/startup_benchmark.py [RUNS]
+
+import os
+import subprocess
+import sys
+import tempfile
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'web'
+)
+
+# Run in a new interpreter, so that no module has been imported yet.
+STARTUP_SCRIPT = """
+import builtins
+import sys
+import time
+start_time = time.time()
+builtins.SERVER_MODE = False
+sys.path.insert(0, {web_dir!r})
+import config
+config.MODULE_MANIFEST_PATH = {manifest!r}
+from pgadmin import create_app
+from pgadmin.utils.module_manifest import save_module_manifest
+app = create_app(config.APP_NAME + '-cli')
+elapsed = time.time() - start_time
+if {save!r}:
+    save_module_manifest({manifest!r}, app.discovered_modules)
+print(elapsed)
+"""
+
+
+def startup_time(manifest, save=False):
+    """
+    Creates the application in a new process, and returns the time taken.
+    """
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        STARTUP_SCRIPT.format(web_dir=WEB_DIR, manifest=manifest, save=save)
+    ], cwd=WEB_DIR, stderr=subprocess.DEVNULL)
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as manifest_dir:
+        manifest = os.path.join(manifest_dir, 'modules.json')
+        # Generate the manifest, and warm up the file system caches.
+        startup_time(None)
+        startup_time(manifest, save=True)
+
+        without_manifest = min(startup_time(None) for _ in range(runs))
+        with_manifest = min(startup_time(manifest) for _ in range(runs))
+
+    print('Best of {0} runs'.format(runs))
+    print('Scanning the packages : {0:.3f} seconds'.format(without_manifest))
+    print('With the manifest     : {0:.3f} seconds'.format(with_manifest))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the latency of the first requests served by a new
+# process, without and with the compiled templates cache (i.e. with
+# TEMPLATE_CACHE_PATH set to None, and to a directory filled by a previous
+# process). The first requests are the browser page along with its scripts,
+# served through the test client, and then the first use of every SQL
+# template, which the first requests of the nodes pay in turn as they render
+# them.
+#
+# Usage: python tools/template_cache_benchmark.py [RUNS]
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'web'
+)
+
+FIRST_REQUESTS = [
+    '/browser/',
+    '/browser/js/utils.js',
+    '/browser/js/endpoints.js',
+    '/browser/js/constants.js',
+    '/browser/js/error.js',
+    '/browser/js/messages.js',
+    '/browser/browser.css',
+]
+
+SQL_TEMPLATES = 'All the SQL templates'
+
+# Run in a new interpreter, so that no template has been compiled yet.
+FIRST_REQUESTS_SCRIPT = """
+import json
+import sys
+import time
+sys.path.insert(0, {web_dir!r})
+import config
+config.SERVER_MODE = False
+config.TEMPLATE_CACHE_PATH = {cache_path!r}
+from pgadmin import create_app
+from pgadmin.utils.versioned_template_loader import precompile_templates
+app = create_app(config.APP_NAME + '-cli')
+app.PGADMIN_INT_KEY = ''
+client = app.test_client()
+timings = dict()
+for url in {urls!r}:
+    start_time = time.time()
+    status = client.get(url, follow_redirects=True).status_code
+    timings[url] = time.time() - start_time
+    if status != 200:
+        raise Exception('{{0}} returned {{1}}'.format(url, status))
+with app.app_context():
+    start_time = time.time()
+    precompile_templates(app.jinja_env)
+    timings[{sql_templates!r}] = time.time() - start_time
+print(json.dumps(timings))
+"""
+
+
+def first_request_times(cache_path):
+    """
+    Serves the first requests in a new process, and returns the time taken
+    by each of them.
+    """
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        FIRST_REQUESTS_SCRIPT.format(
+            web_dir=WEB_DIR, cache_path=cache_path, urls=FIRST_REQUESTS,
+            sql_templates=SQL_TEMPLATES)
+    ], cwd=WEB_DIR, stderr=subprocess.DEVNULL)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def best_times(cache_path, runs):
+    """
+    Returns the best time of each request over the runs.
+    """
+    timings = [first_request_times(cache_path) for _ in range(runs)]
+    return dict(
+        (name, min(t[name] for t in timings)) for name in timings[0]
+    )
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as cache_path:
+        # Fill the cache, and warm up the file system caches.
+        first_request_times(None)
+        first_request_times(cache_path)
+
+        without_cache = best_times(None, runs)
+        with_cache = best_times(cache_path, runs)
+
+    print('Best of {0} runs, in milliseconds'.format(runs))
+    print('{0:<30} {1:>13} {2:>13}'.format(
+        'First request', 'Without cache', 'With cache'))
+    for name in FIRST_REQUESTS + [SQL_TEMPLATES]:
+        print('{0:<30} {1:>13.1f} {2:>13.1f}'.format(
+            name, without_cache[name] * 1000, with_cache[name] * 1000))
+    print('{0:<30} {1:>13.1f} {2:>13.1f}'.format(
+        'Total', sum(without_cache.values()) * 1000,
+        sum(with_cache.values()) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -90,6 +90,18 @@ LANGUAGES = {
 # List of modules to skip when dynamically loading
 MODULE_BLACKLIST = ['test']
 
+# Module manifest, listing the modules to load for each package, so that the
+# packages do not have to be scanned at startup. This saves little of the
+# startup time (see tools/startup_benchmark.py), so it is off by default, as a
+# stale manifest silently skips the modules added since it was generated. It
+# must be generated again whenever the modules change, by running:
+#
+#   python setup.py --generate-module-manifest
+#
+# The manifest is ignored if it was generated for another version of pgAdmin.
+# Set it to None to scan the packages.
+MODULE_MANIFEST_PATH = None
+
 # DO NOT CHANGE UNLESS YOU KNOW WHAT YOU ARE DOING!
 # List of treeview browser nodes to skip when dynamically loading
 NODE_BLACKLIST = []
@@ -348,6 +360,45 @@ MAX_QUERY_HIST_STORED = 20
 ##########################################################################
 SESSION_DB_PATH = os.path.join(DATA_DIR, 'sessions')
 
+# SESSION_STORAGE specifies how the sessions are stored in SESSION_DB_PATH:
+#
+# 'file'   - Each session is stored in its own file, which is rewritten
+#            whenever the session is changed.
+# 'sqlite' - Sessions are stored in a SQLite database with one row per key
+#            of the session, and only the changed keys are written. It is
+#            recommended when many Query Tool/View Data tabs are open per
+#            session. Do not use it if SESSION_DB_PATH is on a network file
+#            system, which may not support the locking used by SQLite.
+SESSION_STORAGE = 'file'
+
+# SESSION_EXPIRY_INDEX makes the 'file' session storage record the last write
+# time of the sessions in a SQLite database in SESSION_DB_PATH, so that the
+# expired sessions are found without scanning the directory. It is useful with
+# many sessions, but do not enable it if SESSION_DB_PATH is on a network file
+# system. The directory is scanned if the index can not be used.
+SESSION_EXPIRY_INDEX = False
+
+##########################################################################
+# Compiled templates cache path
+#
+# TEMPLATE_CACHE_PATH (Default: $HOME/.pgadmin4/template_cache)
+##########################################################################
+#
+# The SQL and other Jinja templates are compiled on their first use by each
+# worker process. The compiled templates are stored in this directory, so
+# that those are not compiled again after a restart. Templates are compiled
+# again when their source is changed.
+#
+# If the specified directory does not exist, it will be created with
+# permission mode 700. The cache can be filled in advance by running:
+#
+#   python setup.py --precompile-templates
+#
+# Set it to None to disable the cache.
+#
+##########################################################################
+TEMPLATE_CACHE_PATH = os.path.join(DATA_DIR, 'template_cache')
+
 SESSION_COOKIE_NAME = 'pga4_session'
 
 ##########################################################################
@@ -426,6 +477,16 @@ CHECK_SUPPORTED_BROWSER = True
 ##########################################################################
 STORAGE_DIR = os.path.join(DATA_DIR, 'storage')
 
+# Number of seconds the file manager keeps the listing of a directory, for
+# paging through it. The directory is read again earlier if it is changed.
+# Set to 0 to read the directory on every request.
+FILE_MANAGER_LISTING_CACHE_TIMEOUT = 10
+
+# Size in bytes of the chunks the files are uploaded in by the file manager.
+# Every chunk is sent by a separate request, and the failed chunks are sent
+# again, hence large files can be uploaded without a long running request.
+FILE_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 ##########################################################################
 # Default locations for binary utilities (pg_dump, pg_restore etc)
 #
@@ -794,6 +855,56 @@ ENABLE_BINARY_PATH_BROWSING = False
 #############################################################################
 AUTO_DISCOVER_SERVERS = True
 
+##########################################################################
+# Background process settings
+##########################################################################
+# Maximum number of the background processes (backup, restore, maintenance,
+# import/export etc.) running at the same time in total, for the same
+# database host, and for the same server. The processes over these limits
+# are queued, and started as the running processes finish. Set to 0 for no
+# limit.
+BG_PROCESS_MAX_JOBS = 8
+BG_PROCESS_MAX_JOBS_PER_HOST = 4
+BG_PROCESS_MAX_JOBS_PER_SERVER = 2
+
+# Maximum number of the databases backed up at the same time, by the Backup
+# Databases job of a server. The whole job counts as one background process
+# for the limits above.
+BACKUP_PARALLEL_DATABASES = 4
+
+##########################################################################
+# Browser tree settings
+##########################################################################
+# The nodes of the browser tree are cached, and served from the cache as long
+# as the system catalogs have not changed according to the statistics
+# collector, which reports the changes of the other sessions with a delay.
+# The cached nodes are fetched again after BROWSER_NODES_CACHE_MAX_AGE
+# seconds anyway.
+BROWSER_NODES_CACHE_MAX_AGE = 60
+
+##########################################################################
+# Search objects settings
+##########################################################################
+# Keep the names of the objects of the searched databases in memory, and
+# search them instead of querying the catalogs on every search. The index is
+# refreshed for the object types whose catalogs have changed (according to
+# the statistics collector) before a search, and loaded again in full after
+# SEARCH_OBJECTS_INDEX_MAX_AGE seconds. Set to False to always query the
+# catalogs.
+SEARCH_OBJECTS_INDEX = True
+SEARCH_OBJECTS_INDEX_MAX_AGE = 300
+
+##########################################################################
+# Schema diff settings
+##########################################################################
+# The results of the schema diff comparisons, along with the DDL of the
+# compared objects, are kept in memory until the schema diff tab is closed.
+# The comparison not used for SCHEMA_DIFF_CACHE_MAX_AGE seconds (e.g. whose
+# tab was not closed properly) is discarded, along with the least recently
+# used ones beyond SCHEMA_DIFF_CACHE_MAX_ENTRIES comparisons.
+SCHEMA_DIFF_CACHE_MAX_AGE = 3600
+SCHEMA_DIFF_CACHE_MAX_ENTRIES = 20
+
 ##########################################################################
 # Local config settings
 ##########################################################################
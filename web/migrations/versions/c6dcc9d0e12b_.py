@@ -0,0 +1,35 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Index the background processes by user
+
+Revision ID: c6dcc9d0e12b
+Revises: 1586db67b98e
+Create Date: 2022-03-02 10:21:44.182093
+
+"""
+from pgadmin.model import db
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6dcc9d0e12b'
+down_revision = '1586db67b98e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    db.engine.execute(
+        'CREATE INDEX IF NOT EXISTS ix_process_user_id ON process (user_id)'
+    )
+
+
+def downgrade():
+    # pgAdmin only upgrades, downgrade not implemented.
+    pass
@@ -32,15 +32,18 @@ from flask_security import Security, SQLAlchemyUserDatastore, current_user
 from flask_security.utils import login_user, logout_user
 from werkzeug.datastructures import ImmutableDict
 from werkzeug.local import LocalProxy
+from werkzeug.routing import Rule
 from werkzeug.utils import find_modules
 from jinja2 import select_autoescape
 
 from pgadmin.model import db, Role, Server, SharedServer, ServerGroup, \
     User, Keys, Version, SCHEMA_VERSION as CURRENT_SCHEMA_VERSION
 from pgadmin.utils import PgAdminModule, driver, KeyManager
+from pgadmin.utils.module_manifest import load_module_manifest
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.session import create_session_interface, pga_unauthorised
-from pgadmin.utils.versioned_template_loader import VersionedTemplateLoader
+from pgadmin.utils.versioned_template_loader import VersionedTemplateLoader, \
+    TemplateBytecodeCache
 from datetime import timedelta, datetime
 from pgadmin.setup import get_version, set_version, check_db_tables
 from pgadmin.utils.ajax import internal_server_error, make_json_response
@@ -67,7 +70,29 @@ socketio = SocketIO(manage_session=False, async_mode='threading',
                     ping_interval=25, ping_timeout=120)
 
 
+class PgAdminRule(Rule):
+    """
+    A URL rule which compiles its URL builder the first time url_for() needs
+    it. Werkzeug compiles two builders for each rule while registering it,
+    which is most of the startup time with over a thousand rules, though
+    most of them are never built in a session.
+    """
+    def _compile_builder(self, append_unknown=True):
+        builder = None
+
+        def _build(rule, *args, **kwargs):
+            nonlocal builder
+            if builder is None:
+                builder = Rule._compile_builder(
+                    rule, append_unknown).__get__(rule, None)
+            return builder(*args, **kwargs)
+
+        return _build
+
+
 class PgAdmin(Flask):
+    url_rule_class = PgAdminRule
+
     def __init__(self, *args, **kwargs):
         # Set the template loader to a postgres-version-aware loader
         self.jinja_options = ImmutableDict(
@@ -75,23 +100,62 @@ class PgAdmin(Flask):
             loader=VersionedTemplateLoader(self)
         )
         self.logout_hooks = []
+        # {package: [names of the modules holding a PgAdminModule]}, as
+        # found while registering the modules, for the module manifest.
+        self.discovered_modules = {}
+        self._module_manifest = False
 
         super(PgAdmin, self).__init__(*args, **kwargs)
 
+    @property
+    def module_manifest(self):
+        """
+        The module manifest read from MODULE_MANIFEST_PATH, None if there is
+        no usable manifest and the packages must be scanned.
+        """
+        if self._module_manifest is False:
+            path = self.config.get('MODULE_MANIFEST_PATH', None)
+            try:
+                self._module_manifest = load_module_manifest(path)
+            except Exception as e:
+                self.logger.warning(
+                    f'Unable to read the module manifest {path}: {e}')
+                self._module_manifest = None
+
+            if path is not None and self._module_manifest is None:
+                self.logger.warning(
+                    f'The module manifest {path} is missing or outdated, '
+                    f'scanning the packages for the modules.')
+        return self._module_manifest
+
     def find_submodules(self, basemodule):
+        manifest = self.module_manifest
+        if manifest is not None and basemodule in manifest:
+            # Only the modules holding a PgAdminModule are imported.
+            module_names = manifest[basemodule]
+        else:
+            module_names = find_modules(basemodule, True)
+
+        discovered = []
         try:
-            for module_name in find_modules(basemodule, True):
+            for module_name in module_names:
                 if module_name in self.config['MODULE_BLACKLIST']:
                     self.logger.info(f'Skipping blacklisted module: {module_name}')
                     continue
                 self.logger.info(f'Examining potential module: {module_name}')
                 module = import_module(module_name)
+                found = False
                 for key in list(module.__dict__.keys()):
                     if isinstance(module.__dict__[key], PgAdminModule):
+                        found = True
                         yield module.__dict__[key]
+                if found:
+                    discovered.append(module_name)
         except Exception:
             return []
 
+        self.discovered_modules[basemodule] = discovered
+
     @property
     def submodules(self):
         for blueprint in self.blueprints.values():
@@ -291,6 +355,15 @@ def create_app(app_name=None):
     app.logger.info('########################################################')
     app.logger.debug("Python syspath: %s", sys.path)
 
+    ##########################################################################
+    # Cache the compiled templates on the disk
+    ##########################################################################
+    if config.TEMPLATE_CACHE_PATH and \
+            os.path.isdir(config.TEMPLATE_CACHE_PATH):
+        app.jinja_env.bytecode_cache = TemplateBytecodeCache(
+            config.TEMPLATE_CACHE_PATH
+        )
+
     ##########################################################################
     # Setup i18n
     ##########################################################################
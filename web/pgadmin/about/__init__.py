@@ -18,7 +18,6 @@ from pgadmin.utils.constants import MIMETYPE_APP_JS
 import config
 import httpagentparser
 from pgadmin.model import User
-from user_agents import parse
 import platform
 
 MODULE_NAME = 'about'
@@ -113,6 +112,8 @@ def detect_browser(request):
     """This function returns the browser and os details"""
     nwjs_version = None
     agent = request.environ.get('HTTP_USER_AGENT')
+    # Imported here, as it is slow to import and only used by this dialog.
+    from user_agents import parse
     os_details = parse(platform.platform()).ua_string
 
     if 'Nwjs' in agent:
@@ -43,7 +43,8 @@ from pgadmin.authenticate import get_logout_url
 from pgadmin.authenticate.mfa.utils import mfa_required, is_mfa_enabled
 from pgadmin.settings import get_setting, store_setting
 from pgadmin.utils import PgAdminModule
-from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.ajax import make_json_response, bad_request
+from pgadmin.browser.utils import get_batch_nodes
 from pgadmin.utils.csrf import pgCSRFProtect
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.menu import MenuItem
@@ -309,7 +310,7 @@ class BrowserModule(PgAdminModule):
         Returns:
             list: a list of url endpoints exposed to the client.
         """
-        return [BROWSER_INDEX, 'browser.nodes',
+        return [BROWSER_INDEX, 'browser.nodes', 'browser.batch_nodes',
                 'browser.check_corrupted_db_file',
                 'browser.check_master_password',
                 'browser.set_master_password',
@@ -893,6 +894,29 @@ def get_nodes():
     return make_json_response(data=nodes)
 
 
+@blueprint.route("/batch_nodes/<path:parent_path>", endpoint="batch_nodes")
+@login_required
+def batch_nodes(parent_path):
+    """
+    Build the treeview nodes of several collections of a parent node, i.e.
+    /browser/batch_nodes/1/1/13/2200/?types=table,view,function
+
+    Args:
+        parent_path: Ids of the parent node separated by '/'
+    """
+    try:
+        parent_ids = [int(_id) for _id in parent_path.strip('/').split('/')]
+    except ValueError:
+        return bad_request(gettext('Invalid parent node specified.'))
+
+    node_types = [
+        node_type for node_type in request.args.get('types', '').split(',')
+        if node_type
+    ]
+
+    return get_batch_nodes(node_types, parent_ids)
+
+
 def form_master_password_response(existing=True, present=False, errmsg=None):
     content_new = (
         gettext("Set Master Password"),
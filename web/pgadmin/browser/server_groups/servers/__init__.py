@@ -14,6 +14,9 @@ from flask import render_template, request, make_response, jsonify, \
 from flask_babel import gettext
 from flask_security import current_user, login_required
 from pgadmin.browser.server_groups.servers.types import ServerType
+# Registers the EDB Advanced Server type, as the module manifest does not
+# list the modules without a PgAdminModule.
+from pgadmin.browser.server_groups.servers import ppas  # noqa: F401
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, bad_request, forbidden, \
     make_response as ajax_response, internal_server_error, unauthorized, gone
@@ -11,7 +11,7 @@ import re
 from functools import wraps
 
 import simplejson as json
-from flask import render_template, request, jsonify, current_app
+from flask import render_template, request, jsonify, current_app, Response
 from flask_babel import gettext
 
 import pgadmin.browser.server_groups.servers as servers
@@ -897,9 +897,11 @@ It may have been removed by another user.
         )
 
     @check_precondition
-    def children(self, **kwargs):
-        """Build a list of treeview nodes from the child nodes."""
-
+    def get_backend_support_keywords(self, **kwargs):
+        """
+        Returns the keyword arguments for backend_supported() of the child
+        modules, i.e. whether the schema is a catalog, or the error response.
+        """
         SQL = render_template(
             "/".join([self.template_path, 'sql/is_catalog.sql']),
             scid=kwargs['scid'], _=gettext
@@ -921,6 +923,17 @@ It may have been removed by another user.
         backend_support_keywords['db_support'] = data['db_support']
         backend_support_keywords['schema_name'] = data['schema_name']
 
+        return backend_support_keywords
+
+    @check_precondition
+    def children(self, **kwargs):
+        """Build a list of treeview nodes from the child nodes."""
+
+        backend_support_keywords = \
+            self.get_backend_support_keywords(**kwargs)
+        if isinstance(backend_support_keywords, Response):
+            return backend_support_keywords
+
         nodes = []
         for module in self.blueprint.submodules:
             if isinstance(module, PGChildModule):
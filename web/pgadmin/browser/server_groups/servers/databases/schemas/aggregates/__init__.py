@@ -206,6 +206,26 @@ class AggregateView(PGChildNodeView):
             else internal_server_error(errormsg=res)
         )
 
+    @check_precondition
+    def get_nodes_sql(self, gid, sid, did, scid):
+        """
+        Returns the SQL to fetch the aggregate nodes.
+        """
+        return render_template(
+            "/".join([self.template_path, self._NODES_SQL]), scid=scid
+        )
+
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the aggregate nodes for the rows of the nodes SQL.
+        """
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'], scid, row['name'], icon="icon-aggregate"
+            )
+            for row in rows
+        ]
+
     @check_precondition
     def nodes(self, gid, sid, did, scid):
         """
@@ -222,21 +242,13 @@ class AggregateView(PGChildNodeView):
         Returns:
             JSON of available aggregate child nodes
         """
-
-        SQL = render_template("/".join([self.template_path,
-                                        self._NODES_SQL]), scid=scid)
+        SQL = self.get_nodes_sql(gid=gid, sid=sid, did=did, scid=scid)
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
 
-        res = [
-            self.blueprint.generate_browser_node(
-                row['oid'], scid, row['name'], icon="icon-aggregate"
-            )
-            for row in rset['rows']
-        ]
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
@@ -326,6 +326,26 @@ class DomainView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             else internal_server_error(errormsg=res)
         )
 
+    @check_precondition
+    def get_nodes_sql(self, gid, sid, did, scid):
+        """
+        Returns the SQL to fetch the domain nodes.
+        """
+        return render_template(
+            "/".join([self.template_path, self._NODE_SQL]), scid=scid
+        )
+
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the domain nodes for the rows of the nodes SQL.
+        """
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'], scid, row['name'], icon="icon-domain"
+            )
+            for row in rows
+        ]
+
     @check_precondition
     def nodes(self, gid, sid, did, scid):
         """
@@ -337,21 +357,13 @@ class DomainView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             did: Database Id
             scid: Schema Id
         """
-
-        SQL = render_template("/".join([self.template_path, self._NODE_SQL]),
-                              scid=scid)
+        SQL = self.get_nodes_sql(gid=gid, sid=sid, did=did, scid=scid)
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
 
-        res = [
-            self.blueprint.generate_browser_node(
-                row['oid'], scid, row['name'], icon="icon-domain"
-            )
-            for row in rset['rows']
-        ]
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
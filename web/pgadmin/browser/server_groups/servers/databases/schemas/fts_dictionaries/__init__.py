@@ -286,6 +286,26 @@ class FtsDictionaryView(PGChildNodeView, SchemaDiffObjectCompare):
             status=200
         )
 
+    @check_precondition
+    def get_nodes_sql(self, gid, sid, did, scid):
+        """
+        Returns the SQL to fetch the FTS dictionary nodes.
+        """
+        return render_template(
+            "/".join([self.template_path, self._NODES_SQL]), scid=scid
+        )
+
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the FTS dictionary nodes for the rows of the nodes SQL.
+        """
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'], scid, row['name'], icon="icon-fts_dictionary"
+            )
+            for row in rows
+        ]
+
     @check_precondition
     def nodes(self, gid, sid, did, scid):
         """
@@ -297,23 +317,13 @@ class FtsDictionaryView(PGChildNodeView, SchemaDiffObjectCompare):
             did: Database Id
             scid: Schema Id
         """
-
-        sql = render_template(
-            "/".join([self.template_path, self._NODES_SQL]),
-            scid=scid
-        )
-        status, rset = self.conn.execute_2darray(sql)
+        SQL = self.get_nodes_sql(gid=gid, sid=sid, did=did, scid=scid)
+        status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
 
-        res = [
-            self.blueprint.generate_browser_node(
-                row['oid'], scid, row['name'], icon="icon-fts_dictionary"
-            )
-            for row in rset['rows']
-        ]
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
@@ -265,23 +265,34 @@ class FtsParserView(PGChildNodeView, SchemaDiffObjectCompare):
         )
 
     @check_precondition
-    def nodes(self, gid, sid, did, scid):
-        sql = render_template(
-            "/".join([self.template_path, self._NODES_SQL]),
-            scid=scid
+    def get_nodes_sql(self, gid, sid, did, scid):
+        """
+        Returns the SQL to fetch the FTS parser nodes.
+        """
+        return render_template(
+            "/".join([self.template_path, self._NODES_SQL]), scid=scid
         )
-        status, rset = self.conn.execute_2darray(sql)
-        if not status:
-            return internal_server_error(errormsg=rset)
 
-        res = [
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the FTS parser nodes for the rows of the nodes SQL.
+        """
+        return [
             self.blueprint.generate_browser_node(
                 row['oid'], scid, row['name'], icon="icon-fts_parser"
             )
-            for row in rset['rows']
+            for row in rows
         ]
+
+    @check_precondition
+    def nodes(self, gid, sid, did, scid):
+        SQL = self.get_nodes_sql(gid=gid, sid=sid, did=did, scid=scid)
+        status, rset = self.conn.execute_2darray(SQL)
+        if not status:
+            return internal_server_error(errormsg=rset)
+
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
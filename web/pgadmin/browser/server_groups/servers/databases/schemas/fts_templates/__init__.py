@@ -246,27 +246,34 @@ class FtsTemplateView(PGChildNodeView, SchemaDiffObjectCompare):
         )
 
     @check_precondition
-    def nodes(self, gid, sid, did, scid):
-        res = []
-        sql = render_template(
-            "/".join([self.template_path, self._NODES_SQL]),
-            scid=scid
+    def get_nodes_sql(self, gid, sid, did, scid):
+        """
+        Returns the SQL to fetch the FTS template nodes.
+        """
+        return render_template(
+            "/".join([self.template_path, self._NODES_SQL]), scid=scid
         )
-        status, rset = self.conn.execute_2darray(sql)
+
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the FTS template nodes for the rows of the nodes SQL.
+        """
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'], scid, row['name'], icon="icon-fts_template"
+            )
+            for row in rows
+        ]
+
+    @check_precondition
+    def nodes(self, gid, sid, did, scid):
+        SQL = self.get_nodes_sql(gid=gid, sid=sid, did=did, scid=scid)
+        status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
 
-        for row in rset['rows']:
-            res.append(
-                self.blueprint.generate_browser_node(
-                    row['oid'],
-                    scid,
-                    row['name'],
-                    icon="icon-fts_template"
-                ))
-
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
@@ -395,6 +395,33 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             status=200
         )
 
+    @check_precondition
+    def get_nodes_sql(self, gid, sid, did, scid, fnid=None):
+        """
+        Returns the SQL to fetch the function nodes.
+        """
+        return render_template(
+            "/".join([self.sql_template_path, self._NODE_SQL]),
+            scid=scid,
+            fnid=fnid
+        )
+
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the function nodes for the rows of the nodes SQL.
+        """
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'],
+                scid,
+                row['name'],
+                icon="icon-" + self.node_type,
+                funcowner=row['funcowner'],
+                language=row['lanname']
+            )
+            for row in rows
+        ]
+
     @check_precondition
     def nodes(self, gid, sid, did, scid, fnid=None):
         """
@@ -406,12 +433,8 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             did: Database Id
             scid: Schema Id
         """
-
-        res = []
-        sql = render_template(
-            "/".join([self.sql_template_path, self._NODE_SQL]),
-            scid=scid,
-            fnid=fnid
+        sql = self.get_nodes_sql(
+            gid=gid, sid=sid, did=did, scid=scid, fnid=fnid
         )
         status, rset = self.conn.execute_2darray(sql)
 
@@ -438,19 +461,8 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
                 )
             )
 
-        for row in rset['rows']:
-            res.append(
-                self.blueprint.generate_browser_node(
-                    row['oid'],
-                    scid,
-                    row['name'],
-                    icon="icon-" + self.node_type,
-                    funcowner=row['funcowner'],
-                    language=row['lanname']
-                ))
-
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
@@ -192,6 +192,33 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
             status=200
         )
 
+    @check_precondition(action='nodes')
+    def get_nodes_sql(self, gid, sid, did, scid, seid=None):
+        """
+        Returns the SQL to fetch the sequence nodes.
+        """
+        # Internal sequences are shown along with the system objects.
+        return render_template(
+            "/".join([self.template_path, self._NODES_SQL]),
+            scid=scid,
+            seid=seid,
+            show_internal=self.blueprint.show_system_objects
+        )
+
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the sequence nodes for the rows of the nodes SQL.
+        """
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'],
+                scid,
+                row['name'],
+                icon=self.node_icon
+            )
+            for row in rows
+        ]
+
     @check_precondition(action='nodes')
     def nodes(self, gid, sid, did, scid, seid=None):
         """
@@ -207,17 +234,8 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
         Returns:
 
         """
-        res = []
-        show_internal = False
-        # If show_system_objects is true then no need to hide any sequences.
-        if self.blueprint.show_system_objects:
-            show_internal = True
-
-        SQL = render_template(
-            "/".join([self.template_path, self._NODES_SQL]),
-            scid=scid,
-            seid=seid,
-            show_internal=show_internal
+        SQL = self.get_nodes_sql(
+            gid=gid, sid=sid, did=did, scid=scid, seid=seid
         )
         status, rset = self.conn.execute_dict(SQL)
         if not status:
@@ -237,17 +255,8 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
                 status=200
             )
 
-        for row in rset['rows']:
-            res.append(
-                self.blueprint.generate_browser_node(
-                    row['oid'],
-                    scid,
-                    row['name'],
-                    icon=self.node_icon
-                ))
-
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
@@ -319,19 +319,19 @@ class TableView(BaseTableView, DataTypeReader, SchemaDiffTableCompare):
 
     def get_icon_css_class(self, table_info, default_val='icon-table'):
         if ('is_inherits' in table_info and
-            table_info['is_inherits'] > '0') or \
+            int(table_info['is_inherits']) > 0) or \
                 ('coll_inherits' in table_info and
                  len(table_info['coll_inherits']) > 0):
 
             if ('is_inherited' in table_info and
-                table_info['is_inherited'] > '0')\
+                int(table_info['is_inherited']) > 0)\
                     or ('relhassubclass' in table_info and
                         table_info['relhassubclass']):
                 default_val = 'icon-table-multi-inherit'
             else:
                 default_val = 'icon-table-inherits'
         elif ('is_inherited' in table_info and
-              table_info['is_inherited'] > '0')\
+              int(table_info['is_inherited']) > 0)\
                 or ('relhassubclass' in table_info and
                     table_info['relhassubclass']):
             default_val = 'icon-table-inherited'
@@ -384,6 +384,36 @@ class TableView(BaseTableView, DataTypeReader, SchemaDiffTableCompare):
             status=200
         )
 
+    @BaseTableView.check_precondition
+    def get_nodes_sql(self, gid, sid, did, scid):
+        """
+        Returns the SQL to fetch the table nodes.
+        """
+        return render_template(
+            "/".join([self.table_template_path, self._NODES_SQL]),
+            scid=scid
+        )
+
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the table nodes for the rows of the nodes SQL.
+        """
+        # Counts are numbers in the JSON rows, but the driver fetches them as
+        # strings in nodes().
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'],
+                scid,
+                row['name'],
+                icon=self.get_icon_css_class(row),
+                tigger_count=str(row['triggercount']),
+                has_enable_triggers=str(row['has_enable_triggers']),
+                is_partitioned=self.is_table_partitioned(row),
+                rows_cnt=0
+            )
+            for row in rows
+        ]
+
     @BaseTableView.check_precondition
     def nodes(self, gid, sid, did, scid):
         """
@@ -399,32 +429,13 @@ class TableView(BaseTableView, DataTypeReader, SchemaDiffTableCompare):
         Returns:
             JSON of available table nodes
         """
-        res = []
-        SQL = render_template(
-            "/".join([self.table_template_path, self._NODES_SQL]),
-            scid=scid
-        )
+        SQL = self.get_nodes_sql(gid=gid, sid=sid, did=did, scid=scid)
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
 
-        for row in rset['rows']:
-            icon = self.get_icon_css_class(row)
-
-            res.append(
-                self.blueprint.generate_browser_node(
-                    row['oid'],
-                    scid,
-                    row['name'],
-                    icon=icon,
-                    tigger_count=row['triggercount'],
-                    has_enable_triggers=row['has_enable_triggers'],
-                    is_partitioned=self.is_table_partitioned(row),
-                    rows_cnt=0
-                ))
-
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
@@ -59,18 +59,25 @@ class SchemaDiffTableCompare(SchemaDiffObjectCompare):
 
         group_name = kwargs.get('group_name')
         source_schema_name = kwargs.get('source_schema_name', None)
+        source_snapshot = kwargs.get('source_snapshot', None)
+        target_snapshot = kwargs.get('target_snapshot', None)
         source_tables = {}
         target_tables = {}
+        source_entries = None
+        target_entries = None
 
-        status, target_schema = self.get_schema(**target_params)
+        status, target_schema = self.get_target_schema(target_params,
+                                                       target_snapshot)
         if not status:
             return internal_server_error(errormsg=target_schema)
 
         if 'scid' in source_params and source_params['scid'] is not None:
-            source_tables = self.fetch_tables(**source_params)
+            source_tables, source_entries = self.fetch_compare_objects(
+                source_snapshot, **source_params)
 
         if 'scid' in target_params and target_params['scid'] is not None:
-            target_tables = self.fetch_tables(**target_params)
+            target_tables, target_entries = self.fetch_compare_objects(
+                target_snapshot, **target_params)
 
         # If both the dict have no items then return None.
         if not (source_tables or target_tables) or (
@@ -89,7 +96,25 @@ class SchemaDiffTableCompare(SchemaDiffObjectCompare):
                                     ignore_keys=self.keys_to_ignore,
                                     source_schema_name=source_schema_name,
                                     ignore_owner=ignore_owner,
-                                    ignore_whitespaces=ignore_whitespaces)
+                                    ignore_whitespaces=ignore_whitespaces,
+                                    source_snapshot=source_entries,
+                                    target_snapshot=target_entries,
+                                    ddl_cache=kwargs.get('ddl_cache', None))
+
+    def fetch_compare_objects(self, snapshot=None, **kwargs):
+        """
+        This function will fetch the tables to compare from the snapshot
+        if specified else from the live database.
+
+        :param snapshot: snapshot dictionary
+        :param kwargs: sid, did and scid of the tables
+        :return: table data dictionary and snapshot entries (if any)
+        """
+        if snapshot is not None:
+            return super(SchemaDiffTableCompare, self).fetch_compare_objects(
+                snapshot, **kwargs)
+
+        return self.fetch_tables(**kwargs), None
 
     def ddl_compare(self, **kwargs):
         """
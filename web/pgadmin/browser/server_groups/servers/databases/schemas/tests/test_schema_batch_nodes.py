@@ -0,0 +1,143 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import uuid
+
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+from . import utils as schema_utils
+
+
+class SchemaBatchNodesTestCase(BaseTestGenerator):
+    """ This class will fetch the nodes of several schema collections. """
+
+    scenarios = [
+        ('Fetch nodes of several collections in one request', dict(
+            url='/browser/batch_nodes/',
+            node_types='table,view,sequence,function',
+            invalid_parent=False,
+            status_code=200)),
+        ('Fetch no nodes of the collection not supported by the schema',
+         dict(
+             url='/browser/batch_nodes/',
+             node_types='table,view,sequence,catalog_object',
+             invalid_parent=False,
+             status_code=200)),
+        ('Fetch nodes of an unknown collection', dict(
+            url='/browser/batch_nodes/',
+            node_types='table,unknown',
+            invalid_parent=False,
+            status_code=400)),
+        ('Fetch nodes of an invalid parent', dict(
+            url='/browser/batch_nodes/',
+            node_types='table',
+            invalid_parent=True,
+            status_code=400)),
+    ]
+
+    def setUp(self):
+        self.database_info = parent_node_dict["database"][-1]
+        self.db_name = self.database_info["db_name"]
+        self.schema_name = "schema_batch_%s" % str(uuid.uuid4())[1:8]
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'])
+        self.schema_details = schema_utils.create_schema(connection,
+                                                         self.schema_name)
+
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'])
+        pg_cursor = connection.cursor()
+        pg_cursor.execute(
+            "CREATE TABLE \"{0}\".tab1 (id serial PRIMARY KEY);"
+            "CREATE VIEW \"{0}\".view1 AS SELECT * FROM \"{0}\".tab1"
+            .format(self.schema_name)
+        )
+        connection.commit()
+        connection.close()
+
+    def get_batch_nodes(self, parent_path):
+        """
+        This function returns the batch nodes response
+        :return: batch nodes response
+        """
+        return self.tester.get(
+            self.url + parent_path + '/?types=' + self.node_types,
+            follow_redirects=True)
+
+    def runTest(self):
+        """ This function will fetch the nodes of schema collections. """
+        self.server_id = self.database_info["server_id"]
+        self.db_id = self.database_info["db_id"]
+        db_con = database_utils.connect_database(self, utils.SERVER_GROUP,
+                                                 self.server_id, self.db_id)
+        if not db_con['data']["connected"]:
+            raise Exception("Could not connect to database.")
+
+        self.schema_id = self.schema_details[0]
+        parent_path = '/'.join([
+            str(utils.SERVER_GROUP), str(self.server_id), str(self.db_id),
+            'invalid' if self.invalid_parent else str(self.schema_id)
+        ])
+
+        response = self.get_batch_nodes(parent_path)
+        self.assertEqual(response.status_code, self.status_code)
+
+        if self.status_code != 200:
+            return
+
+        data = json.loads(response.data.decode('utf-8'))['data']
+        for node_type in self.node_types.split(','):
+            # Catalog objects are only shown under the catalogs.
+            if node_type == 'catalog_object':
+                self.assertEqual(data[node_type],
+                                 {'nodes': [], 'count': 0})
+                continue
+
+            # Nodes must be same as fetched from the collection itself.
+            nodes_response = self.tester.get(
+                '/browser/{0}/nodes/{1}/'.format(node_type, parent_path),
+                follow_redirects=True)
+            nodes = json.loads(nodes_response.data.decode('utf-8'))['data']
+
+            self.assertEqual(data[node_type]['nodes'], nodes)
+            self.assertEqual(data[node_type]['count'], len(nodes))
+
+        self.assertEqual(
+            [node['label'] for node in data['table']['nodes']], ['tab1'])
+        self.assertEqual(
+            [node['label'] for node in data['view']['nodes']], ['view1'])
+        self.assertEqual(
+            [node['label'] for node in data['sequence']['nodes']],
+            ['tab1_id_seq'])
+
+    def tearDown(self):
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'])
+        pg_cursor = connection.cursor()
+        pg_cursor.execute(
+            "DROP SCHEMA IF EXISTS \"{0}\" CASCADE".format(self.schema_name)
+        )
+        connection.commit()
+        connection.close()
+
+        # Disconnect the database
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
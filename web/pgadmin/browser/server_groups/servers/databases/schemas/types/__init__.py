@@ -334,6 +334,29 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             status=200
         )
 
+    @check_precondition
+    def get_nodes_sql(self, gid, sid, did, scid):
+        """
+        Returns the SQL to fetch the type nodes.
+        """
+        return render_template(
+            "/".join([self.template_path, self._NODES_SQL]),
+            scid=scid,
+            show_system_objects=self.blueprint.show_system_objects
+        )
+
+    def get_nodes_from_rows(self, rows, scid, **kwargs):
+        """
+        Returns the type nodes for the rows of the nodes SQL.
+        """
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'], scid, row['name'],
+                icon=self.icon_str % self.node_type
+            )
+            for row in rows
+        ]
+
     @check_precondition
     def nodes(self, gid, sid, did, scid):
         """
@@ -351,27 +374,13 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         Returns:
             JSON of available type child nodes
         """
-
-        res = []
-        SQL = render_template(
-            "/".join([self.template_path,
-                      self._NODES_SQL]), scid=scid,
-            show_system_objects=self.blueprint.show_system_objects)
+        SQL = self.get_nodes_sql(gid=gid, sid=sid, did=did, scid=scid)
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
 
-        for row in rset['rows']:
-            res.append(
-                self.blueprint.generate_browser_node(
-                    row['oid'],
-                    scid,
-                    row['name'],
-                    icon=self.icon_str % self.node_type
-                ))
-
         return make_json_response(
-            data=res,
+            data=self.get_nodes_from_rows(rset['rows'], scid=scid),
             status=200
         )
 
@@ -0,0 +1,11 @@
+{### Nodes of several collections fetched in one round trip ###}
+{% for node in nodes %}
+{% if not loop.first %}
+UNION ALL
+{% endif %}
+SELECT {{ node.type|qtLiteral }} AS node_type, (
+    SELECT pg_catalog.json_agg(nodes) FROM (
+{{ node.sql }}
+    ) nodes
+) AS node_rows
+{% endfor %}
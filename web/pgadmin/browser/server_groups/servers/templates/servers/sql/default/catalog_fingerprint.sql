@@ -0,0 +1,9 @@
+{### Changes in the system catalogs of the database and shared catalogs ###}
+{### NULL when the statistics are not collected (e.g. track_counts is off) ###}
+SELECT CASE WHEN COALESCE(sum(n_tup_ins + n_tup_upd + n_tup_del), 0) = 0
+    THEN NULL
+    ELSE sum(n_tup_ins + n_tup_upd + n_tup_del)::text || '-' ||
+        count(*)::text
+    END AS fingerprint
+FROM pg_catalog.pg_stat_sys_tables
+WHERE schemaname = 'pg_catalog';
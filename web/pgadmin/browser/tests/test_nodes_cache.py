@@ -0,0 +1,69 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import time
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.psycopg2.server_manager import ServerManager
+
+
+class NodesCacheTestCase(BaseTestGenerator):
+    """
+    This class validates the browser tree nodes cache of the server manager.
+    """
+
+    scenarios = [
+        ('Cached nodes are returned for the same fingerprint', dict(
+            did=1, fingerprint='10-60', invalidate=False,
+            invalidate_did=None, expected=b'[]')),
+        ('Cached nodes are discarded when the fingerprint changes', dict(
+            did=1, fingerprint='11-60', invalidate=False,
+            invalidate_did=None, expected=None)),
+        ('Cached nodes are discarded when those are too old', dict(
+            did=1, fingerprint='10-60', invalidate=False,
+            invalidate_did=None, age=61, expected=None)),
+        ('Cached nodes are discarded on the database invalidation', dict(
+            did=1, fingerprint='10-60', invalidate=True,
+            invalidate_did=1, expected=None)),
+        ('Server level nodes are discarded on the database invalidation',
+         dict(did=None, fingerprint='10-60', invalidate=True,
+              invalidate_did=1, expected=None)),
+        ('Cached nodes are kept on other database invalidation', dict(
+            did=1, fingerprint='10-60', invalidate=True,
+            invalidate_did=2, expected=b'[]')),
+        ('Cached nodes are discarded on the server invalidation', dict(
+            did=1, fingerprint='10-60', invalidate=True,
+            invalidate_did=None, expected=None)),
+    ]
+
+    @patch.object(ServerManager, 'update')
+    def runTest(self, update_mock):
+        manager = ServerManager(None)
+        path = '/browser/schema/nodes/1/1/{0}/'.format(self.did)
+
+        manager.cache_nodes(self.did, path, '10-60', b'[]')
+        if self.invalidate:
+            manager.invalidate_nodes_cache(self.invalidate_did)
+
+        now = time.time() + getattr(self, 'age', 0)
+        with patch.object(config, 'BROWSER_NODES_CACHE_MAX_AGE', 60), \
+                patch('pgadmin.utils.driver.psycopg2.server_manager.time.'
+                      'time', return_value=now):
+            self.assertEqual(
+                manager.get_cached_nodes(self.did, path, self.fingerprint),
+                self.expected)
+
+        # Least recently used nodes are discarded first
+        for idx in range(ServerManager._NODES_CACHE_SIZE + 1):
+            manager.cache_nodes(self.did, str(idx), '10-60', b'[]')
+        self.assertIsNone(manager.get_cached_nodes(self.did, '0', '10-60'))
+        self.assertEqual(manager.get_cached_nodes(self.did, '1', '10-60'),
+                         b'[]')
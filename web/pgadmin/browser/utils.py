@@ -9,16 +9,18 @@
 
 """Browser helper utilities"""
 
+import json
 from abc import abstractmethod
+from urllib.parse import urlencode
 
 import flask
-from flask import render_template, current_app
+from flask import render_template, current_app, Response
 from flask.views import View, MethodViewType
 from flask_babel import gettext
 
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.ajax import make_json_response, precondition_required,\
-    internal_server_error
+    internal_server_error, get_no_cache_header, bad_request
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 
@@ -383,6 +385,123 @@ class PGChildNodeView(NodeView):
     _GET_SUBTYPES_SQL = 'get_subtypes.sql'
     _GET_EXTERNAL_FUNCTIONS_SQL = 'get_external_functions.sql'
     _GET_TABLE_FOR_PUBLICATION = 'get_tables.sql'
+    _CATALOG_FINGERPRINT_SQL = 'catalog_fingerprint.sql'
+    _BATCH_NODES_SQL = 'batch_nodes.sql'
+
+    def dispatch_request(self, *args, **kwargs):
+        """
+        Serves the browser tree nodes from the cache of the server manager
+        when the catalog has not changed, and invalidates that cache when
+        any object is created, updated or deleted through pgAdmin.
+        """
+        if 'sid' not in kwargs:
+            return super().dispatch_request(*args, **kwargs)
+
+        from pgadmin.utils.driver import get_driver
+        manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
+            sid=kwargs['sid']
+        )
+        did = kwargs.get('did', None)
+
+        if flask.request.method in ('GET', 'HEAD'):
+            if self.cmd in ('nodes', 'children') and manager is not None:
+                return self._get_cached_nodes(manager, *args, **kwargs)
+            return super().dispatch_request(*args, **kwargs)
+
+        try:
+            return super().dispatch_request(*args, **kwargs)
+        finally:
+            if manager is not None:
+                manager.invalidate_nodes_cache(did)
+
+    def _get_catalog_fingerprint(self, manager, did):
+        """
+        Returns the fingerprint of the system catalogs of the database, which
+        changes whenever any object is created, altered or dropped. Returns
+        None if it can not be fetched, or the statistics are not collected,
+        in which case the nodes are not cached.
+        """
+        try:
+            conn = manager.connection(did=did)
+            if not conn.connected():
+                return None
+
+            status, fingerprint = conn.execute_scalar(render_template(
+                "/".join(['servers/sql/#{0}#'.format(manager.version),
+                          self._CATALOG_FINGERPRINT_SQL])
+            ))
+        except Exception:
+            return None
+
+        return fingerprint if status else None
+
+    def _get_cached_nodes(self, manager, *args, **kwargs):
+        """
+        Returns the cached nodes/children response for the request, or
+        fetches and caches them. 'refresh' request argument bypasses the
+        cache.
+        """
+        did = kwargs.get('did', None)
+        path = flask.request.path
+        query_args = [
+            (k, v) for k, v in sorted(flask.request.args.items(multi=True))
+            if k != 'refresh'
+        ]
+        if query_args:
+            path += '?' + urlencode(query_args)
+        fingerprint = self._get_catalog_fingerprint(manager, did)
+
+        if fingerprint is None:
+            return super().dispatch_request(*args, **kwargs)
+
+        if not flask.request.args.get('refresh', None):
+            nodes = manager.get_cached_nodes(did, path, fingerprint)
+            if nodes is not None:
+                return Response(
+                    response=nodes,
+                    status=200,
+                    mimetype="application/json",
+                    headers=get_no_cache_header()
+                )
+
+        response = super().dispatch_request(*args, **kwargs)
+        if isinstance(response, Response) and response.status_code == 200:
+            manager.cache_nodes(did, path, fingerprint, response.get_data())
+
+        return response
+
+    def get_nodes_sql(self, **kwargs):
+        """
+        Returns the SQL to fetch the nodes of the collection, or None when
+        those can not be fetched using a single query. It allows
+        get_batch_nodes() to fetch the nodes of several collections in one
+        round trip.
+        """
+        return None
+
+    def get_nodes_from_rows(self, rows, **kwargs):
+        """
+        Returns the browser tree nodes for the rows fetched using the SQL
+        returned by get_nodes_sql(). By default, the rows must have the oid
+        and the name of the objects, which are the children of the last
+        parent node. Override it when the nodes need more than that.
+        """
+        parent_id = kwargs[self.parent_ids[-1]['id']]
+        return [
+            self.blueprint.generate_browser_node(
+                row['oid'], parent_id, row['name'],
+                icon='icon-{0}'.format(self.node_type)
+            )
+            for row in rows
+        ]
+
+    def get_backend_support_keywords(self, **kwargs):
+        """
+        Returns the keyword arguments for backend_supported() of the child
+        modules, or the error response. Override it when the child modules
+        need more than the ids of the node.
+        """
+        return kwargs
 
     def get_children_nodes(self, manager, **kwargs):
         """
@@ -709,3 +828,136 @@ class PGChildNodeView(NodeView):
         return gettext(
             f"Could not find the specified {custom_label or self.node_label}.".lower()
         )
+
+
+def _get_parent_node_view(module):
+    """
+    Returns the view of the node, whose children include the collection
+    module, or None if it is not a PGChildNodeView.
+    """
+    for parent in current_app.blueprints.values():
+        if module not in getattr(parent, 'submodules', []):
+            continue
+
+        # Children are always fetched by the id of the parent node.
+        view_func = current_app.view_functions.get(
+            '{0}.children_id'.format(parent.name), None
+        )
+        view_class = getattr(view_func, 'view_class', None)
+        if view_class is not None and \
+                issubclass(view_class, PGChildNodeView):
+            return view_class(cmd='children')
+
+    return None
+
+
+def get_batch_nodes(node_types, parent_ids):
+    """
+    Returns the nodes of several collections of the same parent node. The
+    nodes SQL of the collections are combined into a single query, while
+    the collections which can not be fetched that way are served by their
+    nodes().
+
+    :param node_types: Node types of the collections
+    :param parent_ids: Ids of the parent node (i.e. gid, sid, did, scid)
+    :return: JSON response with the nodes and count of each collection
+    """
+    from pgadmin.utils.driver import get_driver
+
+    views = dict()
+    for node_type in node_types:
+        view_func = current_app.view_functions.get(
+            'NODE-{0}.nodes'.format(node_type), None
+        )
+        view_class = getattr(view_func, 'view_class', None)
+
+        if view_class is None or \
+                len(view_class.parent_ids) != len(parent_ids):
+            return bad_request(gettext(
+                'Could not find the {0} nodes for the specified parent.'
+            ).format(node_type))
+
+        views[node_type] = (
+            view_class(cmd='nodes'),
+            dict(zip([p['id'] for p in view_class.parent_ids], parent_ids))
+        )
+
+    if len(views) == 0:
+        return bad_request(gettext('Node types are not specified.'))
+
+    kwargs = next(iter(views.values()))[1]
+    if 'sid' not in kwargs:
+        return precondition_required(
+            gettext('Required properties are missing.')
+        )
+
+    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
+        sid=kwargs['sid']
+    )
+    conn = manager.connection(did=kwargs.get('did', None))
+    if not conn.connected():
+        return precondition_required(
+            gettext("Connection to the server has been lost.")
+        )
+
+    res = dict()
+    batch = []
+    support_keywords = dict()
+    for node_type, (view, kwargs) in views.items():
+        module = view.blueprint
+        if isinstance(module, PGChildModule):
+            parent_view = _get_parent_node_view(module)
+            if parent_view is None:
+                return bad_request(gettext(
+                    'Could not find the {0} nodes for the specified parent.'
+                ).format(node_type))
+
+            # Keywords are same for the collections of the same parent.
+            if parent_view.node_type not in support_keywords:
+                support_keywords[parent_view.node_type] = \
+                    parent_view.get_backend_support_keywords(**kwargs)
+            keywords = support_keywords[parent_view.node_type]
+            if isinstance(keywords, Response):
+                return keywords
+
+            if not module.backend_supported(manager, **keywords):
+                res[node_type] = []
+                continue
+
+        sql = view.get_nodes_sql(**kwargs)
+        if isinstance(sql, Response):
+            return sql
+
+        if sql is not None:
+            batch.append({'type': node_type, 'sql': sql.strip().rstrip(';')})
+            continue
+
+        response = view.nodes(**kwargs)
+        if response.status_code != 200:
+            return response
+        res[node_type] = json.loads(response.get_data())['data']
+
+    if batch:
+        status, rset = conn.execute_2darray(render_template(
+            "/".join(['servers/sql/#{0}#'.format(manager.version),
+                      PGChildNodeView._BATCH_NODES_SQL]),
+            nodes=batch
+        ))
+        if not status:
+            return internal_server_error(errormsg=rset)
+
+        for row in rset['rows']:
+            view, kwargs = views[row['node_type']]
+            rows = json.loads(row['node_rows'] or '[]')
+            # JSON has no oid type, so the oids are aggregated as strings.
+            for node_row in rows:
+                if node_row.get('oid', None) is not None:
+                    node_row['oid'] = int(node_row['oid'])
+            res[row['node_type']] = view.get_nodes_from_rows(rows, **kwargs)
+
+    return make_json_response(
+        data={
+            node_type: {'nodes': nodes, 'count': len(nodes)}
+            for node_type, nodes in res.items()
+        }
+    )
@@ -9,6 +9,7 @@
 
 """A blueprint module implementing the dashboard frame."""
 import math
+import time
 from functools import wraps
 from flask import render_template, url_for, Response, g, request
 from flask_babel import gettext
@@ -17,16 +18,31 @@ import simplejson as json
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response as ajax_response,\
     internal_server_error
-from pgadmin.utils.ajax import precondition_required
+from pgadmin.utils.ajax import precondition_required, bad_request
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.menu import Panel
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS
+from .history import get_history, RESOLUTIONS
+from .sampler import get_sampler
 
 from config import PG_DEFAULT_DRIVER
 
 MODULE_NAME = 'dashboard'
 
+# Columns identifying the rows of the statistics, which can be fetched as the
+# changes since the version of the rows the viewer has.
+ROW_KEY_COLUMNS = {
+    'activity.sql': ('pid',),
+    # Every column of the lock tag, along with the holder and the mode.
+    'locks.sql': (
+        'pid', 'locktype', 'datname', 'relation', 'page', 'tuple',
+        'virtualxid', 'transactionid', 'classid', 'objid', 'objsubid',
+        'virtualtransaction', 'mode'
+    ),
+    'prepared.sql': ('gid',),
+}
+
 
 class DashboardModule(PgAdminModule):
     def __init__(self, *args, **kwargs):
@@ -171,6 +187,9 @@ class DashboardModule(PgAdminModule):
             'dashboard.dashboard_stats',
             'dashboard.dashboard_stats_sid',
             'dashboard.dashboard_stats_did',
+            'dashboard.history',
+            'dashboard.history_sid',
+            'dashboard.history_did',
             'dashboard.activity',
             'dashboard.get_activity_by_server_id',
             'dashboard.get_activity_by_database_id',
@@ -326,20 +345,45 @@ def get_data(sid, did, template, check_long_running_query=False):
     if not sid:
         return internal_server_error(errormsg='Server ID not specified.')
 
-    sql = render_template(
-        "/".join([g.template_path, template]), did=did
-    )
-    status, res = g.conn.execute_dict(sql)
+    def collect():
+        sql = render_template(
+            "/".join([g.template_path, template]), did=did
+        )
+        status, res = g.conn.execute_dict(sql)
+        return status, res['rows'] if status else res
+
+    # All the viewers of this server share the same sample.
+    sampler = get_sampler(template, sid, did, g.manager.user)
+
+    # Viewers sending the version of the rows they have, get only the
+    # changes since then.
+    since = request.args.get('version', None)
+    if since is not None and template in ROW_KEY_COLUMNS:
+        status, res = sampler.get_changes(
+            collect, since, ROW_KEY_COLUMNS[template]
+        )
+    else:
+        status, res = sampler.get(collect)
 
     if not status:
         return internal_server_error(errormsg=res)
 
     # Check the long running query status and set the row type.
     if check_long_running_query:
-        get_long_running_query_status(res['rows'])
+        # Row type depends on the preferences of this user, do not modify
+        # the shared sample.
+        if isinstance(res, dict):
+            res = dict(res)
+            for name in ('rows', 'added', 'changed'):
+                if name in res:
+                    res[name] = [dict(row) for row in res[name]]
+                    get_long_running_query_status(res[name])
+        else:
+            res = [dict(row) for row in res]
+            get_long_running_query_status(res)
 
     return ajax_response(
-        response=res['rows'],
+        response=res,
         status=200
     )
 
@@ -392,15 +436,31 @@ def dashboard_stats(sid=None, did=None):
         if not sid:
             return internal_server_error(errormsg='Server ID not specified.')
 
-        sql = render_template(
-            "/".join([g.template_path, 'dashboard_stats.sql']), did=did,
-            chart_names=chart_names,
-        )
-        status, res = g.conn.execute_dict(sql)
+        def collect():
+            sql = render_template(
+                "/".join([g.template_path, 'dashboard_stats.sql']), did=did,
+                chart_names=chart_names,
+            )
+            status, res = g.conn.execute_dict(sql)
+            if not status:
+                return False, res
 
-        for chart_row in res['rows']:
-            resp_data[chart_row['chart_name']] = \
-                json.loads(chart_row['chart_data'])
+            data = dict(
+                (chart_row['chart_name'], json.loads(chart_row['chart_data']))
+                for chart_row in res['rows']
+            )
+            get_history(sid, did, g.manager.user).record(time.time(), data)
+
+            return True, data
+
+        # All the viewers of this server share the same sample.
+        status, resp_data = get_sampler(
+            'dashboard_stats.sql', sid, did, g.manager.user,
+            tuple(sorted(chart_names))
+        ).get(collect)
+
+        if not status:
+            return internal_server_error(errormsg=resp_data)
 
     return ajax_response(
         response=resp_data,
@@ -408,6 +468,47 @@ def dashboard_stats(sid=None, did=None):
     )
 
 
+@blueprint.route('/history', endpoint='history')
+@blueprint.route('/history/<int:sid>', endpoint='history_sid')
+@blueprint.route('/history/<int:sid>/<int:did>', endpoint='history_did')
+@login_required
+@check_precondition
+def history(sid=None, did=None):
+    """
+    This function returns the history of the graph statistics recorded for
+    the server (or database), oldest value first. The counters are returned
+    as the change per second.
+    :param sid: server id
+    :param did: database id
+    :return:
+    """
+    if not sid:
+        return internal_server_error(errormsg='Server ID not specified.')
+
+    try:
+        resolution = int(request.args.get('resolution', RESOLUTIONS[0][0]))
+    except ValueError:
+        resolution = None
+
+    if resolution not in dict(RESOLUTIONS):
+        return bad_request(errormsg=gettext(
+            "Resolution must be one of {0} seconds."
+        ).format(', '.join(str(step) for step, _ in RESOLUTIONS)))
+
+    end = time.time()
+
+    return ajax_response(
+        response={
+            'resolution': resolution,
+            'end': int(end // resolution) * resolution,
+            'charts': get_history(sid, did, g.manager.user).get(
+                resolution, end
+            )
+        },
+        status=200
+    )
+
+
 @blueprint.route('/activity/', endpoint='activity')
 @blueprint.route('/activity/<int:sid>', endpoint='get_activity_by_server_id')
 @blueprint.route(
@@ -417,7 +518,8 @@ def dashboard_stats(sid=None, did=None):
 @check_precondition
 def activity(sid=None, did=None):
     """
-    This function returns server activity information
+    This function returns server activity information, or only the changes
+    in it since the version given in the request arguments.
     :param sid: server id
     :return:
     """
@@ -433,7 +535,8 @@ def activity(sid=None, did=None):
 @check_precondition
 def locks(sid=None, did=None):
     """
-    This function returns server lock information
+    This function returns server lock information, or only the changes in
+    it since the version given in the request arguments.
     :param sid: server id
     :return:
     """
@@ -449,7 +552,8 @@ def locks(sid=None, did=None):
 @check_precondition
 def prepared(sid=None, did=None):
     """
-    This function returns prepared XACT information
+    This function returns prepared XACT information, or only the changes in
+    it since the version given in the request arguments.
     :param sid: server id
     :return:
     """
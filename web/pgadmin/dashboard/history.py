@@ -0,0 +1,197 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+History of the dashboard graph statistics.
+
+Every sample of the graph statistics is recorded in fixed size ring buffers
+at several resolutions, so that a newly opened dashboard can render the
+graphs from the history instead of starting empty. Each slot of a buffer
+keeps the mean of the values recorded in its interval, hence the coarser
+resolutions are downsampled automatically, and the memory used by the
+history of a server does not depend on the number of samples.
+"""
+
+import threading
+import time
+from array import array
+
+# (seconds per slot, number of slots), i.e. per second for 10 minutes, and
+# per minute for 24 hours.
+RESOLUTIONS = ((1, 600), (60, 1440))
+
+# Graphs showing the change of the cumulative counters, which are recorded
+# as the change per second.
+COUNTER_CHARTS = ('tps_stats', 'ti_stats', 'to_stats', 'bio_stats')
+
+
+class RingBuffer(object):
+    """
+    Keeps the mean of the values of each series recorded in each of the last
+    `size` intervals of `step` seconds.
+    """
+
+    def __init__(self, step, size):
+        self.step = step
+        self.size = size
+        # Number of the interval held by each slot
+        self.slots = array('q', [-1] * size)
+        # {series: (sums, counts)}
+        self.series = dict()
+
+    def add(self, t, values):
+        """
+        Records the values of the series at the given time.
+
+        :param t: Time of the sample (seconds since the epoch)
+        :param values: {series: value}
+        """
+        interval = int(t // self.step)
+        slot = interval % self.size
+
+        if self.slots[slot] != interval:
+            # Slot held an older interval, start it again.
+            self.slots[slot] = interval
+            for sums, counts in self.series.values():
+                sums[slot] = 0.0
+                counts[slot] = 0
+
+        for name, value in values.items():
+            if name not in self.series:
+                self.series[name] = (
+                    array('d', [0.0] * self.size),
+                    array('l', [0] * self.size)
+                )
+            sums, counts = self.series[name]
+            sums[slot] += value
+            counts[slot] += 1
+
+    def get(self, t):
+        """
+        Returns the values of all the series for the last `size` intervals
+        ending at the given time, oldest first. Intervals without any sample
+        have None.
+
+        :param t: Time of the last interval (seconds since the epoch)
+        :returns: {series: [value]}
+        """
+        last = int(t // self.step)
+        intervals = range(last - self.size + 1, last + 1)
+
+        result = dict()
+        for name, (sums, counts) in self.series.items():
+            values = []
+            for interval in intervals:
+                slot = interval % self.size
+                if self.slots[slot] != interval or counts[slot] == 0:
+                    values.append(None)
+                else:
+                    values.append(sums[slot] / counts[slot])
+            result[name] = values
+
+        return result
+
+
+class MetricsHistory(object):
+    """
+    History of the graph statistics of a server (or database) at all the
+    resolutions.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buffers = dict(
+            (step, RingBuffer(step, size)) for step, size in RESOLUTIONS
+        )
+        # Last value of the counters, i.e. {(chart, label): (t, value)}
+        self.counters = dict()
+        self.recorded_at = time.time()
+
+    def record(self, t, charts):
+        """
+        Records a sample of the graph statistics.
+
+        :param t: Time of the sample (seconds since the epoch)
+        :param charts: {chart_name: {label: value}}, as returned by the
+                       dashboard_stats.sql
+        """
+        values = dict()
+
+        with self.lock:
+            for chart_name, chart_data in charts.items():
+                for label, value in chart_data.items():
+                    if value is None:
+                        continue
+                    name = (chart_name, label)
+                    value = float(value)
+
+                    if chart_name not in COUNTER_CHARTS:
+                        values[name] = value
+                        continue
+
+                    last = self.counters.get(name)
+                    self.counters[name] = (t, value)
+
+                    # Counters may have been reset on the server.
+                    if last is not None and t > last[0] and \
+                            value >= last[1]:
+                        values[name] = (value - last[1]) / (t - last[0])
+
+            for buffer in self.buffers.values():
+                buffer.add(t, values)
+            self.recorded_at = t
+
+    def get(self, step, t=None):
+        """
+        Returns the history at the given resolution.
+
+        :param step: Seconds per value
+        :param t: Time of the last value (default: now)
+        :returns: {chart_name: {label: [value]}}, oldest value first
+        """
+        if t is None:
+            t = time.time()
+
+        charts = dict()
+        with self.lock:
+            series = self.buffers[step].get(t)
+
+        for (chart_name, label), values in series.items():
+            charts.setdefault(chart_name, dict())[label] = values
+
+        return charts
+
+
+_histories = dict()
+_histories_lock = threading.Lock()
+
+
+def get_history(*key):
+    """
+    Returns the metrics history for the given server, database and the role
+    used to connect to the server.
+
+    The histories, which have not recorded anything within the longest
+    resolution, are removed.
+    """
+    now = time.time()
+    max_age = max(step * size for step, size in RESOLUTIONS)
+
+    with _histories_lock:
+        for old_key in [
+            k for k, history in _histories.items()
+            if now - history.recorded_at > max_age
+        ]:
+            _histories.pop(old_key)
+
+        history = _histories.get(key)
+        if history is None:
+            history = _histories[key] = MetricsHistory()
+
+    return history
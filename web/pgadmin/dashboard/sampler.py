@@ -0,0 +1,199 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Shared samples of the dashboard statistics.
+
+All the dashboards watching the same server (or database) share one sample
+of the statistics per interval. The first viewer asking for the statistics
+after the sample became older than the interval collects a new sample
+through its own connection, while the other viewers wait for it and get the
+same sample, instead of running the same query again on the monitored
+server.
+
+The samples are collected only when requested by the viewers, hence nothing
+is executed against a server, which is not being watched by anyone, and the
+samplers not requested for a while are removed.
+
+The last few samples are kept with their versions, so that a viewer sending
+the version of the sample it has got only the rows added, changed and
+removed since then.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from uuid import uuid4
+
+# Number of seconds, for which a sample is served to all the viewers.
+SAMPLE_INTERVAL = 1
+
+# Number of seconds after which a sampler not requested by any viewer is
+# removed.
+SAMPLER_IDLE_TIMEOUT = 60
+
+# Number of the last samples kept to find the changes since them.
+SAMPLES_KEPT = 5
+
+
+class DashboardSampler(object):
+    """
+    Holds the latest sample of a statistics query for all the viewers.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.sampled_at = None
+        self.last_viewed = time.time()
+        # Versions are only valid in this process, the token makes the
+        # versions of the other processes unknown here.
+        self.token = uuid4().hex[:8]
+        self.collected = 0
+        # (version, sample) of the latest sample
+        self.latest = (None, None)
+        # {version: sample}
+        self.samples = OrderedDict()
+
+    def _is_fresh(self, now):
+        return self.sampled_at is not None and \
+            now - self.sampled_at < self.interval
+
+    def _get(self, collect):
+        self.last_viewed = time.time()
+
+        if self._is_fresh(self.last_viewed):
+            return (True,) + self.latest
+
+        with self.lock:
+            # Another viewer may have collected it while we were waiting.
+            if self._is_fresh(time.time()):
+                return (True,) + self.latest
+
+            status, sample = collect()
+
+            # Errors are not shared, every viewer gets its own.
+            if not status:
+                return False, None, sample
+
+            self.collected += 1
+            version = '{0}:{1}'.format(self.token, self.collected)
+
+            self.samples[version] = sample
+            while len(self.samples) > SAMPLES_KEPT:
+                self.samples.popitem(last=False)
+
+            self.latest = (version, sample)
+            self.sampled_at = time.time()
+
+        return True, version, sample
+
+    def get(self, collect):
+        """
+        Returns the latest sample, collects a new one using the collect
+        function if the latest sample is older than the interval.
+
+        :param collect: function returning (status, sample)
+        :returns: (status, sample or error message)
+        """
+        status, _, sample = self._get(collect)
+        return status, sample
+
+    def get_changes(self, collect, since, key_columns):
+        """
+        Returns the changes in the rows of the latest sample since the sample
+        of the given version. All the rows are returned, if the sample of
+        that version is not known anymore.
+
+        :param collect: function returning (status, rows)
+        :param since: Version of the sample the viewer has
+        :param key_columns: Columns identifying a row
+        :returns: (status, changes or error message), where changes is one
+                  of {'version', 'unchanged'}, {'version', 'rows'} or
+                  {'version', 'key', 'added', 'changed', 'removed'}
+        """
+        status, version, rows = self._get(collect)
+
+        if not status:
+            return False, rows
+
+        if since == version:
+            return True, {'version': version, 'unchanged': True}
+
+        old_rows = self.samples.get(since)
+        if old_rows is None:
+            return True, {'version': version, 'rows': rows}
+
+        changes = get_row_changes(old_rows, rows, key_columns)
+        changes['version'] = version
+        changes['key'] = list(key_columns)
+
+        return True, changes
+
+
+def get_row_changes(old_rows, new_rows, key_columns):
+    """
+    Returns the rows added, changed and removed (keys only) in the new rows
+    compared to the old rows.
+
+    :param old_rows: List of the old rows (dict)
+    :param new_rows: List of the new rows (dict)
+    :param key_columns: Columns identifying a row
+    :returns: {'added', 'changed', 'removed'}
+    """
+    def get_key(row):
+        return tuple(row.get(column) for column in key_columns)
+
+    old_rows = dict((get_key(row), row) for row in old_rows)
+    added = []
+    changed = []
+
+    for row in new_rows:
+        old_row = old_rows.pop(get_key(row), None)
+        if old_row is None:
+            added.append(row)
+        elif old_row != row:
+            changed.append(row)
+
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': [list(key) for key in old_rows]
+    }
+
+
+_samplers = dict()
+_samplers_lock = threading.Lock()
+
+
+def get_sampler(*key):
+    """
+    Returns the sampler for the given key, i.e. the statistics, server,
+    database and the role used to connect to the server. The role is part of
+    the key, as the statistics visible on the server depend on it.
+
+    The samplers not requested since SAMPLER_IDLE_TIMEOUT are removed.
+    """
+    now = time.time()
+
+    with _samplers_lock:
+        for idle_key in [
+            k for k, sampler in _samplers.items()
+            if now - sampler.last_viewed > SAMPLER_IDLE_TIMEOUT
+        ]:
+            _samplers.pop(idle_key)
+
+        sampler = _samplers.get(key)
+        if sampler is None:
+            sampler = _samplers[key] = DashboardSampler()
+
+        # Do not let it be removed before it gets used.
+        sampler.last_viewed = now
+
+    return sampler
@@ -7,7 +7,7 @@
 //
 //////////////////////////////////////////////////////////////
 // eslint-disable-next-line react/display-name
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import gettext from 'sources/gettext';
 import PropTypes from 'prop-types';
 import getApiInstance from 'sources/api_instance';
@@ -38,6 +38,29 @@ function parseData(data) {
   return res;
 }
 
+/* Apply the changes since the version of the rows, as returned by the
+ * server, to the rows.
+ */
+export function applyRowChanges(rows, changes) {
+  if(changes.rows) {
+    return changes.rows;
+  }
+  if(changes.unchanged) {
+    return rows;
+  }
+
+  const getKey = (row)=>JSON.stringify(changes.key.map((column)=>row[column]));
+  let changed = {};
+  changes.changed.forEach((row)=>{
+    changed[getKey(row)] = row;
+  });
+  let removed = new Set(changes.removed.map((key)=>JSON.stringify(key)));
+
+  return rows.filter((row)=>!removed.has(getKey(row)))
+    .map((row)=>changed[getKey(row)] || row)
+    .concat(changes.added);
+}
+
 const useStyles = makeStyles((theme) => ({
   emptyPanel: {
     height: '100%',
@@ -126,6 +149,8 @@ export default function Dashboard({
   const classes = useStyles();
   let tabs = ['Sessions', 'Locks', 'Prepared Transactions'];
   const [dashData, setdashData] = useState([]);
+  // Rows of the activity, locks or prepared transactions with their version
+  const feedRef = useRef({url: null, version: null, rows: []});
   const [msg, setMsg] = useState('');
   const [tabVal, setTabVal] = useState(0);
   const [refresh, setRefresh] = useState(false);
@@ -750,13 +775,22 @@ export default function Dashboard({
       else url += sid;
 
       const api = getApiInstance();
+      // Fetch only the changes since the rows we have, except the config.
+      const isFeed = (tabVal < 3);
+      const feed = (feedRef.current.url === url) ? feedRef.current : {rows: []};
       if (node) {
         api({
           url: url,
           type: 'GET',
+          params: isFeed ? {version: feed.version || ''} : {},
         })
           .then((res) => {
-            setdashData(parseData(res.data));
+            let rows = res.data;
+            if (isFeed) {
+              rows = applyRowChanges(feed.rows, res.data);
+              feedRef.current = {url: url, version: res.data.version, rows: rows};
+            }
+            setdashData(parseData(rows));
           })
           .catch((error) => {
             Notify.alert(
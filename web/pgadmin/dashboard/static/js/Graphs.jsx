@@ -63,6 +63,35 @@ export function getStatsUrl(sid=-1, did=-1, chart_names=[]) {
   return base_url;
 }
 
+/* URL for fetching graphs history */
+export function getHistoryUrl(sid=-1, did=-1) {
+  let base_url = url_for('dashboard.history');
+  base_url += '/' + sid;
+  base_url += (did > 0) ? ('/' + did) : '';
+  return base_url;
+}
+
+/* This will convert the chart history, recorded per second with the oldest
+ * value first, to the charts data with one value per refresh and the latest
+ * value first.
+ */
+export function historyToStats(history, refreshRate, counter) {
+  let newState = {};
+  Object.keys(history).forEach(label => {
+    let values = history[label];
+    newState[label] = [];
+    for(let i = values.length - 1; i >= 0 && newState[label].length < X_AXIS_LENGTH; i -= refreshRate) {
+      if(values[i] === null) {
+        newState[label].push(null);
+      } else {
+        /* Counters are recorded as the change per second */
+        newState[label].push(counter ? values[i] * refreshRate : values[i]);
+      }
+    }
+  });
+  return newState;
+}
+
 /* This will process incoming charts data add it the previous charts
  * data to get the new state.
  */
@@ -153,6 +182,31 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
     }
   }, [preferences]);
 
+  useEffect(()=>{
+    if(!enablePoll) {
+      return;
+    }
+    /* Render the charts history recorded on the server so far */
+    axios.get(getHistoryUrl(sid, did))
+      .then((resp)=>{
+        let charts = resp.data.charts || {};
+        [
+          ['session_stats', sessionStatsReduce, false],
+          ['tps_stats', tpsStatsReduce, true],
+          ['ti_stats', tiStatsReduce, true],
+          ['to_stats', toStatsReduce, true],
+          ['bio_stats', bioStatsReduce, true],
+        ].forEach(([name, reduce, counter])=>{
+          if(charts[name]) {
+            reduce({reset: historyToStats(charts[name], preferences[name+'_refresh'], counter)});
+          }
+        });
+      })
+      .catch(()=>{
+        /* Charts will be filled by polling anyway */
+      });
+  }, [sid, did]);
+
   useEffect(()=>{
     /* Charts rendered are not visible when, the dashboard is hidden but later visible */
     if(pageVisible && !chartDrawnOnce) {
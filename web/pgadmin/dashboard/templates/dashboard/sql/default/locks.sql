@@ -6,7 +6,7 @@ SELECT
     relation::regclass,
     page,
     tuple,
-    virtualxid
+    virtualxid,
     transactionid,
     classid::regclass,
     objid,
@@ -0,0 +1,52 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard.history import MetricsHistory
+
+
+class DashboardHistoryTestCase(BaseTestGenerator):
+    """
+    This class validates the history of the graph statistics recorded at
+    several resolutions.
+    """
+
+    scenarios = [
+        ('Gauge is recorded as it is', dict(
+            chart_name='session_stats', samples=[(0, 1), (1, 2), (2, 3)],
+            resolution=1, expected=[1.0, 2.0, 3.0])),
+        ('Counter is recorded as the change per second', dict(
+            chart_name='tps_stats', samples=[(0, 10), (2, 30), (3, 35)],
+            resolution=1, expected=[None, None, 10.0, 5.0])),
+        ('Reset counter is skipped', dict(
+            chart_name='tps_stats', samples=[(0, 10), (1, 20), (2, 5)],
+            resolution=1, expected=[None, 10.0, None])),
+        ('Gauge is downsampled to the mean', dict(
+            chart_name='session_stats',
+            samples=[(0, 1), (30, 3), (60, 10), (90, 20)],
+            resolution=60, expected=[2.0, 15.0])),
+        ('Older samples are overwritten', dict(
+            chart_name='session_stats', samples=[(0, 1), (600, 2)],
+            resolution=1, expected=[2.0])),
+    ]
+
+    def runTest(self):
+        start = 1650000000
+        history = MetricsHistory()
+        for t, value in self.samples:
+            history.record(start + t, {self.chart_name: {'Total': value}})
+
+        end = start + self.samples[-1][0]
+        values = history.get(self.resolution, end)[self.chart_name]['Total']
+
+        # Memory used by the history does not depend on the samples.
+        self.assertEqual(len(values), history.buffers[self.resolution].size)
+        self.assertEqual(values[-len(self.expected):], self.expected)
+        self.assertTrue(all(v is None
+                            for v in values[:-len(self.expected)]))
@@ -0,0 +1,68 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard.sampler import DashboardSampler
+
+
+class DashboardRowChangesTestCase(BaseTestGenerator):
+    """
+    This class validates only the changes in the rows since the version the
+    viewer has are returned.
+    """
+
+    scenarios = [
+        ('Unchanged rows', dict(
+            since='previous',
+            expected={'unchanged': True})),
+        ('Changes since the previous rows', dict(
+            since='first',
+            expected={
+                'key': ['pid'],
+                'added': [{'pid': 4, 'state': 'active'}],
+                'changed': [{'pid': 1, 'state': 'active'}],
+                'removed': [[2]]
+            })),
+        ('All the rows for an unknown version', dict(
+            since='unknown:1',
+            expected={'rows': [{'pid': 1, 'state': 'active'},
+                               {'pid': 3, 'state': 'idle'},
+                               {'pid': 4, 'state': 'active'}]})),
+    ]
+
+    def runTest(self):
+        samples = [
+            [{'pid': 1, 'state': 'idle'}, {'pid': 2, 'state': 'active'},
+             {'pid': 3, 'state': 'idle'}],
+            [{'pid': 1, 'state': 'active'}, {'pid': 3, 'state': 'idle'},
+             {'pid': 4, 'state': 'active'}],
+        ]
+        # Collect a new sample on every request.
+        sampler = DashboardSampler(interval=0)
+
+        status, res = sampler.get_changes(
+            lambda: (True, samples[0]), '', ('pid',))
+        self.assertTrue(status)
+        self.assertEqual(res['rows'], samples[0])
+        first = res['version']
+
+        status, res = sampler.get_changes(
+            lambda: (True, samples[1]), first, ('pid',))
+        self.assertTrue(status)
+        previous = res['version']
+
+        # Same sample is returned again to the viewers.
+        sampler.interval = 60
+        since = dict(first=first, previous=previous).get(
+            self.since, self.since)
+        status, res = sampler.get_changes(None, since, ('pid',))
+
+        self.assertTrue(status)
+        self.assertEqual(res.pop('version'), previous)
+        self.assertEqual(res, self.expected)
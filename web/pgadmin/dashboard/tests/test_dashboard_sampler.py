@@ -0,0 +1,74 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+import time
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard import sampler
+
+
+class DashboardSamplerTestCase(BaseTestGenerator):
+    """
+    This class validates the viewers of a server share the same sample of
+    the statistics.
+    """
+
+    scenarios = [
+        ('Viewers of the same server share the sample', dict(
+            keys=[('activity.sql', 1, None, 'postgres')] * 5,
+            expected_samples=1, error=False)),
+        ('Viewers connected with different roles do not share', dict(
+            keys=[('activity.sql', 1, None, 'postgres'),
+                  ('activity.sql', 1, None, 'readonly')],
+            expected_samples=2, error=False)),
+        ('Errors are not shared', dict(
+            keys=[('locks.sql', 1, 2, 'postgres')] * 3,
+            expected_samples=3, error=True)),
+    ]
+
+    def setUp(self):
+        sampler._samplers.clear()
+        self.samples = 0
+
+    def collect(self):
+        self.samples += 1
+        # Let the other viewers wait for this sample.
+        time.sleep(0.1)
+        if self.error:
+            return False, 'error'
+        return True, [{'pid': self.samples}]
+
+    def runTest(self):
+        results = []
+
+        def view(key):
+            results.append(sampler.get_sampler(*key).get(self.collect))
+
+        viewers = [threading.Thread(target=view, args=(key,))
+                   for key in self.keys]
+        for viewer in viewers:
+            viewer.start()
+        for viewer in viewers:
+            viewer.join()
+
+        self.assertEqual(self.samples, self.expected_samples)
+        self.assertEqual(len(results), len(self.keys))
+        for status, _ in results:
+            self.assertEqual(status, not self.error)
+
+        # Idle samplers are removed.
+        for s in sampler._samplers.values():
+            s.last_viewed -= sampler.SAMPLER_IDLE_TIMEOUT + 1
+        sampler.get_sampler('config.sql', 1, None, 'postgres')
+        self.assertEqual(list(sampler._samplers),
+                         [('config.sql', 1, None, 'postgres')])
+
+    def tearDown(self):
+        sampler._samplers.clear()
@@ -11,13 +11,14 @@
 A blueprint module providing utility functions for the notify the user about
 the long running background-processes.
 """
-from flask import url_for
+from flask import url_for, request
 from flask_security import login_required
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response, gone, success_return,\
     make_json_response
 
 from .processes import BatchProcess
+from .log_reader import MAX_PAGE_LINES, MAX_PAGE_BYTES
 
 MODULE_NAME = 'bgprocess'
 
@@ -78,13 +79,25 @@ def status(pid, out=-1, err=-1):
         out: position of the last stdout fetched
         err: position of the last stderr fetched
 
+    Request arguments (optional):
+        tail: fetch only the last 'tail' lines, when out, and err are 0
+        max_lines: maximum number of lines fetched from each log
+        max_bytes: maximum number of bytes read from each log
+
     Returns:
         Status of the process and logs (if out, and err not equal to -1)
     """
     try:
         process = BatchProcess(id=pid)
 
-        return make_response(response=process.status(out, err))
+        return make_response(response=process.status(
+            out, err,
+            tail=request.args.get('tail', None, type=int),
+            max_lines=request.args.get(
+                'max_lines', MAX_PAGE_LINES, type=int),
+            max_bytes=request.args.get(
+                'max_bytes', MAX_PAGE_BYTES, type=int)
+        ))
     except LookupError as lerr:
         return gone(errormsg=str(lerr))
 
@@ -0,0 +1,222 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Reads the stdout/stderr logs of the background processes in pages.
+
+Every line of a log is written by the process executor as
+'<timestamp>,<message>', where the timestamp is in the '%y%m%d%H%M%S%f'
+format. The logs are read in large blocks, and split in lines at once,
+instead of reading, and parsing them line by line.
+
+A reader is kept for each log, which indexes the offset of every
+INDEX_INTERVAL-th line while reading, so that the last lines of the log can
+be found without reading it from the beginning again.
+"""
+
+import os
+import threading
+from array import array
+from collections import OrderedDict
+
+# Maximum number of lines returned in a page.
+MAX_PAGE_LINES = 10000
+
+# Maximum number of bytes read for a page.
+MAX_PAGE_BYTES = 1024 * 1024
+
+# Offset of every INDEX_INTERVAL-th line is indexed.
+INDEX_INTERVAL = 1024
+
+# Number of the logs, for which the readers are kept.
+MAX_READERS = 64
+
+# Size of the blocks read backwards from the end of the log.
+TAIL_BLOCK_SIZE = 64 * 1024
+
+_TIMESTAMP_LENGTH = 18
+
+
+def _parse_lines(data, enc):
+    """
+    Splits the block of log in the lines, and returns a list of
+    [timestamp, message] of the lines written by the process executor, and a
+    list of the offsets of their ends in the block.
+    """
+    lines = []
+    ends = []
+    end = 0
+    for line in data.split(b'\n'):
+        end += len(line) + 1
+        timestamp = line[:_TIMESTAMP_LENGTH]
+        if line[_TIMESTAMP_LENGTH:_TIMESTAMP_LENGTH + 1] != b',' or \
+                not timestamp.isdigit():
+            # Ignore this line
+            continue
+        lines.append([
+            timestamp.decode('ascii'),
+            line[_TIMESTAMP_LENGTH + 1:].rstrip(b'\r').decode(enc, 'replace')
+        ])
+        ends.append(min(end, len(data)))
+    return lines, ends
+
+
+class LogReader(object):
+    """
+    Reads the log of a background process in pages.
+    """
+
+    def __init__(self, logfile):
+        self.logfile = logfile
+        self.lock = threading.Lock()
+        # Offsets of the line number 0, INDEX_INTERVAL, 2 * INDEX_INTERVAL...
+        self.index = array('q', [0])
+        # Number of lines before, and the offset of the end of the indexed
+        # part of the log.
+        self.indexed_lines = 0
+        self.indexed_pos = 0
+
+    def _update_index(self, pos, data):
+        """
+        Indexes the lines of the complete block read from the given offset,
+        if it continues the indexed part of the log.
+        """
+        if pos != self.indexed_pos:
+            return
+
+        start = 0
+        while True:
+            end = data.find(b'\n', start)
+            if end == -1:
+                break
+            start = end + 1
+            self.indexed_lines += 1
+            if self.indexed_lines % INDEX_INTERVAL == 0:
+                self.index.append(pos + start)
+
+        self.indexed_pos = pos + start
+
+    def read(self, pos, ctime=None, max_lines=MAX_PAGE_LINES,
+             max_bytes=MAX_PAGE_BYTES, enc='utf-8'):
+        """
+        Reads a page of the complete lines from the given offset.
+
+        :param pos: Offset to start reading from
+        :param ctime: Lines logged after this time are not read
+        :param max_lines: Maximum number of lines in the page
+        :param max_bytes: Maximum number of bytes to read
+        :param enc: Encoding of the log
+        :returns: (lines, offset after the page, offset of the end of log)
+        """
+        if not os.path.isfile(self.logfile):
+            return [], pos, pos
+
+        with open(self.logfile, 'rb') as f:
+            eofs = os.fstat(f.fileno()).st_size
+            f.seek(pos, 0)
+            data = f.read(max(0, min(max_bytes, eofs - pos)))
+
+        # Line being written is read in the next page, unless a single line
+        # is bigger than the page.
+        end = data.rfind(b'\n') + 1
+        if end == 0 and pos + len(data) < eofs:
+            end = len(data)
+        data = data[:end]
+
+        with self.lock:
+            self._update_index(pos, data)
+
+        lines, ends = _parse_lines(data, enc)
+
+        # Stop at the lines logged after the given time, or the maximum
+        # number of lines.
+        count = len(lines)
+        if ctime is not None:
+            count = next(
+                (i for i, line in enumerate(lines) if line[0] > ctime), count
+            )
+        count = min(count, max_lines)
+
+        if count < len(lines):
+            return lines[:count], pos + (ends[count - 1] if count else 0), \
+                eofs
+
+        return lines, pos + len(data), eofs
+
+    def tail(self, max_lines, enc='utf-8'):
+        """
+        Reads the last lines of the log.
+
+        :param max_lines: Number of lines to read
+        :param enc: Encoding of the log
+        :returns: (lines, offset of the end of the lines read)
+        """
+        if not os.path.isfile(self.logfile):
+            return [], 0
+
+        with open(self.logfile, 'rb') as f:
+            eofs = os.fstat(f.fileno()).st_size
+
+            with self.lock:
+                if self.indexed_pos > 0 and eofs - self.indexed_pos < \
+                        TAIL_BLOCK_SIZE:
+                    # Start reading from the indexed line before the last
+                    # lines.
+                    first = max(0, self.indexed_lines - max_lines)
+                    start = self.index[min(
+                        first // INDEX_INTERVAL, len(self.index) - 1
+                    )]
+                else:
+                    start = None
+
+            if start is None:
+                # Read backwards until enough lines are found.
+                start = eofs
+                newlines = 0
+                while start > 0 and newlines <= max_lines:
+                    block = min(TAIL_BLOCK_SIZE, start)
+                    start -= block
+                    f.seek(start, 0)
+                    newlines += f.read(block).count(b'\n')
+
+            f.seek(start, 0)
+            data = f.read(eofs - start)
+
+        end = data.rfind(b'\n') + 1
+        lines, _ = _parse_lines(data[:end], enc)
+        return lines[-max_lines:] if max_lines else [], start + end
+
+
+_readers = OrderedDict()
+_readers_lock = threading.Lock()
+
+
+def get_log_reader(logfile):
+    """
+    Returns the reader of the given log, the readers of the least recently
+    read logs are removed.
+    """
+    with _readers_lock:
+        reader = _readers.pop(logfile, None)
+        if reader is None:
+            reader = LogReader(logfile)
+        _readers[logfile] = reader
+
+        while len(_readers) > MAX_READERS:
+            _readers.popitem(last=False)
+
+    return reader
+
+
+def remove_log_reader(logfile):
+    """
+    Removes the reader of the given log.
+    """
+    with _readers_lock:
+        _readers.pop(logfile, None)
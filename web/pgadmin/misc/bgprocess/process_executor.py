@@ -28,6 +28,7 @@ Args:
 It also depends on the following environment variable for proper execution.
 PROCID - Process-id
 OUTDIR - Output directory
+PGA_BGP_EVENTS - Directory to notify the status changes in (optional)
 """
 
 # To make print function compatible with python2 & python3
@@ -35,8 +36,9 @@ import sys
 import os
 from datetime import datetime, timedelta, tzinfo
 from subprocess import Popen, PIPE
-from threading import Thread
+from threading import Thread, Lock
 import signal
+import time
 
 _IS_WIN = (os.name == 'nt')
 _ZERO = timedelta(0)
@@ -44,6 +46,8 @@ _sys_encoding = None
 _fs_encoding = None
 _out_dir = None
 _log_file = None
+_status_seq = 0
+_log_second = None
 
 
 def _log(msg):
@@ -138,11 +142,49 @@ def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
     ).strftime(format)
 
 
+# Maximum number of bytes of the log lines buffered before writing them.
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Maximum number of seconds the log lines are buffered before writing them.
+LOG_FLUSH_INTERVAL = 0.5
+
+# Maximum number of bytes read from the stream at once.
+LOG_READ_SIZE = 64 * 1024
+
+
+def get_log_timestamp(now=None):
+    """
+    This function will return the timestamp of the log lines in the
+    '%y%m%d%H%M%S%f' format (UTC), formatting only the microseconds, while
+    the time is in the same second.
+    """
+    global _log_second
+
+    if now is None:
+        now = time.time()
+    second = int(now)
+
+    if _log_second is None or _log_second[0] != second:
+        _log_second = (
+            second, time.strftime('%y%m%d%H%M%S', time.gmtime(second))
+        )
+
+    return '{0}{1:06d}'.format(
+        _log_second[1], int((now - second) * 1000000)
+    )
+
+
 class ProcessLogger(Thread):
     """
     This class definition is responsible for capturing & logging
     stdout & stderr messages from subprocess
 
+    Every line is written as '<timestamp>,<message>', and only the complete
+    lines are written, hence the log can be read from any offset reached
+    before. The lines are buffered, and written together, once the buffer
+    is full, LOG_FLUSH_INTERVAL seconds after the last write, or when
+    nothing more is coming from the stream.
+
     Methods:
     --------
     * __init__(stream_type)
@@ -165,12 +207,14 @@ class ProcessLogger(Thread):
         Returns:
             None
         """
-        import codecs
-
         Thread.__init__(self)
         self.process = None
         self.stream = None
         self.logger = open(os.path.join(_out_dir, stream_type), 'wb')
+        self.lock = Lock()
+        self.buffer = []
+        self.buffer_size = 0
+        self.flushed_at = time.time()
 
     def attach_process_stream(self, process, stream):
         """
@@ -186,6 +230,40 @@ class ProcessLogger(Thread):
         self.process = process
         self.stream = stream
 
+    def _add_lines(self, lines):
+        """
+        This function will buffer the complete lines with the timestamp.
+
+        Args:
+            lines: list of lines (bytes) without the line endings
+
+        Returns:
+            None
+        """
+        prefix = get_log_timestamp().encode('utf-8') + b','
+        data = b''.join(prefix + line + b'\n' for line in lines)
+
+        with self.lock:
+            self.buffer.append(data)
+            self.buffer_size += len(data)
+            if self.buffer_size >= LOG_BUFFER_SIZE:
+                self._flush()
+
+    def _flush(self):
+        if self.buffer and self.logger:
+            self.logger.write(b''.join(self.buffer))
+            self.logger.flush()
+        self.buffer = []
+        self.buffer_size = 0
+        self.flushed_at = time.time()
+
+    def flush(self):
+        """
+        This function will write the buffered lines to the log file.
+        """
+        with self.lock:
+            self._flush()
+
     def log(self, msg):
         """
         This function will update log file
@@ -199,33 +277,65 @@ class ProcessLogger(Thread):
         # Write into log file
         if self.logger:
             if msg:
-                self.logger.write(
-                    get_current_time(
-                        format='%y%m%d%H%M%S%f'
-                    ).encode('utf-8')
-                )
-                self.logger.write(b',')
-                self.logger.write(
-                    msg.lstrip(b'\r\n' if _IS_WIN else b'\n')
-                )
-                self.logger.write(os.linesep.encode('utf-8'))
+                if not isinstance(msg, bytes):
+                    msg = msg.encode('utf-8')
+                msg = msg.lstrip(b'\r\n' if _IS_WIN else b'\n')
+                self._add_lines(msg.rstrip(b'\r\n').split(b'\n'))
 
             return True
         return False
 
+    def _wait_for_data(self, fd):
+        """
+        This function will wait for the data on the stream until the
+        buffered lines are due to be written.
+
+        Returns:
+            False if the buffered lines are due, True otherwise
+        """
+        if not self.buffer:
+            return True
+
+        timeout = self.flushed_at + LOG_FLUSH_INTERVAL - time.time()
+        if timeout <= 0:
+            return False
+
+        # Pipes can not be polled on Windows, the lines are written after
+        # every read there.
+        if _IS_WIN:
+            return False
+
+        import select
+        return bool(select.select([fd], [], [], timeout)[0])
+
     def run(self):
         if self.process and self.stream:
+            fd = self.stream.fileno()
+            partial = b''
+
             while True:
-                nextline = self.stream.readline()
+                if not self._wait_for_data(fd):
+                    self.flush()
+                    continue
 
-                if nextline:
-                    self.log(nextline)
-                else:
-                    if self.process.poll() is not None:
-                        break
+                data = os.read(fd, LOG_READ_SIZE)
+                if not data:
+                    break
+
+                lines = (partial + data).split(b'\n')
+                partial = lines.pop()
+                if lines:
+                    if _IS_WIN:
+                        lines = [line.rstrip(b'\r') for line in lines]
+                    self._add_lines(lines)
+
+            if partial:
+                self._add_lines([partial.rstrip(b'\r')])
+            self.flush()
 
     def release(self):
         if self.logger:
+            self.flush()
             self.logger.close()
             self.logger = None
 
@@ -248,12 +358,42 @@ def update_status(**kw):
             if k in ('start_time', 'end_time', 'exit_code', 'pid')
         )
         _log('Updating the status:\n{0}'.format(json.dumps(status)))
-        with open(os.path.join(_out_dir, 'status'), 'w') as fp:
+        # Replace the status at once, so that it is never read half written.
+        status_file = os.path.join(_out_dir, 'status')
+        with open(status_file + '.tmp', 'w') as fp:
             json.dump(status, fp)
+        os.replace(status_file + '.tmp', status_file)
+        _notify_status_change()
     else:
         raise ValueError("Please verify pid and db_file arguments.")
 
 
+def _notify_status_change():
+    """
+    This function will let the web server know, that the status of this
+    process has changed, by creating an event file named
+    '<process id>.<sequence>' in the events directory.
+
+    Returns:
+        None
+    """
+    global _status_seq
+
+    events_dir = os.environ.get('PGA_BGP_EVENTS', None)
+    procid = os.environ.get('PROCID', None)
+    if not events_dir or not procid:
+        return
+
+    _status_seq += 1
+    try:
+        with open(os.path.join(
+            events_dir, '{0}.{1}'.format(procid, _status_seq)
+        ), 'w'):
+            pass
+    except Exception:
+        _log_exception()
+
+
 def _handle_execute_exception(ex, args, _stderr, exit_code=None):
     """
     Used internally by execute to handle exception
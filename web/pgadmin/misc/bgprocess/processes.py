@@ -27,6 +27,11 @@ from pgadmin.utils import u_encode, file_quote, fs_encoding, \
 from pgadmin.browser.server_groups.servers.utils import does_server_exists
 from pgadmin.utils.constants import KERBEROS
 from pgadmin.utils.locker import ConnectionLocker
+from .log_reader import get_log_reader, remove_log_reader, MAX_PAGE_LINES, \
+    MAX_PAGE_BYTES
+from .status_events import get_status_events_dir, get_status_events, \
+    remove_status_events
+from .scheduler import Job, JobScheduler, PRIORITY_NORMAL
 
 import pytz
 from dateutil import parser
@@ -35,17 +40,23 @@ from flask_babel import gettext as _
 from flask_security import current_user
 
 import config
-from pgadmin.model import Process, db
+from pgadmin.model import Process, Server, db
 from io import StringIO
 
 PROCESS_NOT_STARTED = 0
 PROCESS_STARTED = 1
 PROCESS_FINISHED = 2
 PROCESS_TERMINATED = 3
+PROCESS_QUEUED = 4
 PROCESS_NOT_FOUND = _("Could not find a process with the specified ID.")
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S.%f %z'
 
+# Users, whose active processes have been checked without waiting for the
+# status events by this server process.
+_status_checked_users = set()
 
-def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
+
+def get_current_time(format=TIME_FORMAT):
     """
     Generate the current time string in the given format.
     """
@@ -54,6 +65,16 @@ def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
     ).strftime(format)
 
 
+def parse_time(value):
+    """
+    Parse the time string written by the process executor.
+    """
+    try:
+        return datetime.strptime(value, TIME_FORMAT)
+    except ValueError:
+        return parser.parse(value)
+
+
 class IProcessDesc(object, metaclass=ABCMeta):
     @abstractproperty
     def message(self):
@@ -123,7 +144,7 @@ class BatchProcess(object):
             _cmd = kwargs['cmd']
             # Get system's interpreter
             if kwargs['cmd'] == 'python':
-                _cmd = self._get_python_interpreter()
+                _cmd = self.get_python_interpreter()
 
             self._create_process(
                 kwargs['desc'], _cmd, kwargs['args']
@@ -251,7 +272,8 @@ class BatchProcess(object):
                 _('The process has already finished and cannot be restarted.')
             )
 
-    def _get_python_interpreter(self):
+    @classmethod
+    def get_python_interpreter(cls):
         """Get Python Interpreter"""
         if os.name == 'nt':
             paths = os.environ['PATH'].split(os.pathsep)
@@ -261,20 +283,24 @@ class BatchProcess(object):
                 str(paths)
             )
 
-            interpreter = self.get_windows_interpreter(paths)
+            interpreter = cls.get_windows_interpreter(paths)
         else:
             interpreter = sys.executable
 
         return interpreter if interpreter else 'python'
 
-    def start(self, cb=None):
+    def start(self, cb=None, priority=PRIORITY_NORMAL):
+        """
+        Start the process, or queue it until the number of the running
+        processes is below the limits.
+        """
         self.check_start_end_time()
 
         executor = file_quote(os.path.join(
             os.path.dirname(u_encode(__file__)), 'process_executor.py'
         ))
 
-        interpreter = self._get_python_interpreter()
+        interpreter = self.get_python_interpreter()
 
         cmd = [interpreter, executor, self.cmd]
         cmd.extend(self.args)
@@ -292,6 +318,8 @@ class BatchProcess(object):
 
         env['PROCID'] = self.id
         env['OUTDIR'] = self.log_dir
+        env['PGA_BGP_EVENTS'] = get_status_events_dir()
+        os.makedirs(env['PGA_BGP_EVENTS'], int('700', 8), exist_ok=True)
         env['PGA_BGP_FOREGROUND'] = "1"
         if config.SERVER_MODE and session and \
                 session['auth_source_manager']['current_source'] == \
@@ -303,6 +331,88 @@ class BatchProcess(object):
 
         if cb is not None:
             cb(env)
+
+        server_id, host = self._get_server_host()
+
+        # Update the process state to "Queued", it is updated again once
+        # started. Until then, the utility PID is the PID of the server
+        # process holding the job in its queue, so that the jobs lost by a
+        # restart can be found.
+        p = Process.query.filter_by(
+            pid=self.id, user_id=current_user.id
+        ).first()
+        p.process_state = self.process_state = PROCESS_QUEUED
+        p.utility_pid = os.getpid()
+        db.session.commit()
+
+        job_scheduler.submit(
+            Job(self.id, lambda: self._launch(cmd, env), server_id, host,
+                priority),
+            current_app._get_current_object()
+        )
+
+    def _get_server_host(self):
+        """
+        Get the ID, and the host of the server, the process works on.
+        """
+        sid = getattr(self.desc, 'sid', None)
+        server = Server.query.filter_by(id=sid).first() \
+            if sid is not None else None
+
+        if server is None:
+            return None, None
+
+        return server.id, server.host or server.hostaddr
+
+    def _launch(self, cmd, env):
+        """
+        Launch the process executor, it may be called by the job scheduler
+        outside of the request.
+        """
+        # Claim the process, unless it has been stopped (maybe by another
+        # server process) since it was queued.
+        claimed = Process.query.filter_by(
+            pid=self.id, process_state=PROCESS_QUEUED
+        ).update({
+            'process_state': PROCESS_STARTED, 'utility_pid': None
+        }, synchronize_session=False)
+        db.session.commit()
+        if not claimed:
+            return
+
+        try:
+            p = self._popen(cmd, env)
+            self.ecode = p.poll()
+        except Exception as e:
+            current_app.logger.exception(e)
+            self.ecode = -1
+        else:
+            # Until the executor reports the PID of the utility, keep its own
+            # PID, so that the process is not counted as running forever if
+            # the executor dies before reporting it.
+            Process.query.filter_by(
+                pid=self.id, utility_pid=None
+            ).update({'utility_pid': p.pid}, synchronize_session=False)
+            db.session.commit()
+
+        p = Process.query.filter_by(pid=self.id).first()
+        if p is None:
+            return
+
+        # Execution completed immediately.
+        # Process executor cannot update the status, if it was not able to
+        # start properly.
+        if self.ecode is not None and self.ecode != 0:
+            # There is no way to find out the error message from this process
+            # as standard output, and standard error were redirected to
+            # devnull.
+            p.start_time = p.end_time = get_current_time()
+            if not p.exit_code:
+                p.exit_code = self.ecode
+            p.process_state = PROCESS_FINISHED
+            db.session.commit()
+
+    def _popen(self, cmd, env):
         if os.name == 'nt':
             DETACHED_PROCESS = 0x00000008
             from subprocess import CREATE_NEW_PROCESS_GROUP
@@ -336,30 +446,7 @@ class BatchProcess(object):
                     preexec_fn=self.preexec_function, env=env
                 )
 
-        self.ecode = p.poll()
-
-        # Execution completed immediately.
-        # Process executor cannot update the status, if it was not able to
-        # start properly.
-        if self.ecode is not None and self.ecode != 0:
-            # There is no way to find out the error message from this process
-            # as standard output, and standard error were redirected to
-            # devnull.
-            p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
-            ).first()
-            p.start_time = p.end_time = get_current_time()
-            if not p.exit_code:
-                p.exit_code = self.ecode
-            p.process_state = PROCESS_FINISHED
-            db.session.commit()
-        else:
-            # Update the process state to "Started"
-            p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
-            ).first()
-            p.process_state = PROCESS_STARTED
-            db.session.commit()
+        return p
 
     def get_process_output(self, cmd, env):
         """
@@ -391,7 +478,8 @@ class BatchProcess(object):
         # Explicitly ignoring signals in the child process
         signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-    def get_windows_interpreter(self, paths):
+    @classmethod
+    def get_windows_interpreter(cls, paths):
         """
         Get interpreter.
         :param paths:
@@ -400,9 +488,9 @@ class BatchProcess(object):
         paths.insert(0, os.path.join(u_encode(sys.prefix), 'Scripts'))
         paths.insert(0, u_encode(sys.prefix))
 
-        interpreter = self.which('pythonw.exe', paths)
+        interpreter = cls.which('pythonw.exe', paths)
         if interpreter is None:
-            interpreter = self.which('python.exe', paths)
+            interpreter = cls.which('python.exe', paths)
 
         current_app.logger.info(
             "Process Executor: Interpreter value in path: %s",
@@ -426,9 +514,9 @@ class BatchProcess(object):
                 os.path.join(bin_path, '..\\venv')
             )
 
-            interpreter = self.which('pythonw.exe', [venv])
+            interpreter = cls.which('pythonw.exe', [venv])
             if interpreter is None:
-                interpreter = self.which('python.exe', [venv])
+                interpreter = cls.which('python.exe', [venv])
 
             current_app.logger.info(
                 "Process Executor: Interpreter value in virtual "
@@ -445,7 +533,8 @@ class BatchProcess(object):
 
         return interpreter
 
-    def which(self, program, paths):
+    @staticmethod
+    def which(program, paths):
         def is_exe(fpath):
             return os.path.exists(fpath) and os.access(fpath, os.X_OK)
 
@@ -457,44 +546,39 @@ class BatchProcess(object):
                 return file_quote(exe_file)
         return None
 
-    def read_log(self, logfile, log, pos, ctime, ecode=None, enc='utf-8'):
-        import re
-        completed = True
-        idx = 0
-        c = re.compile(r"(\d+),(.*$)")
+    def read_log(self, logfile, log, pos, ctime, ecode=None, enc='utf-8',
+                 max_lines=MAX_PAGE_LINES, max_bytes=MAX_PAGE_BYTES):
+        """
+        Read a page of the log from the given position, and append the
+        [timestamp, message] of its lines to the log.
 
+        Returns the position of the next page, and whether the whole log
+        has been read after the process has finished.
+        """
         if not os.path.isfile(logfile):
             return 0, False
 
-        with open(logfile, 'rb') as f:
-            eofs = os.fstat(f.fileno()).st_size
-            f.seek(pos, 0)
-            if pos == eofs and ecode is None:
-                completed = False
-
-            while pos < eofs:
-                idx += 1
-                line = f.readline()
-                line = line.decode(enc, 'replace')
-                r = c.split(line)
-                if len(r) < 3:
-                    # ignore this line
-                    pos = f.tell()
-                    continue
-                if r[1] > ctime:
-                    completed = False
-                    break
-                log.append([r[1], r[2]])
-                pos = f.tell()
-                if idx >= 1024:
-                    completed = False
-                    break
-                if pos == eofs:
-                    if ecode is None:
-                        completed = False
-                    break
-
-        return pos, completed
+        lines, pos, eofs = get_log_reader(logfile).read(
+            pos, ctime, max_lines, max_bytes, enc
+        )
+        log.extend(lines)
+
+        return pos, ecode is not None and pos >= eofs
+
+    def tail_log(self, logfile, log, max_lines, ecode=None, enc='utf-8'):
+        """
+        Append the last lines of the log to the log.
+
+        Returns the position after the lines read, and whether the whole log
+        has been read after the process has finished.
+        """
+        if not os.path.isfile(logfile):
+            return 0, False
+
+        lines, pos = get_log_reader(logfile).tail(max_lines, enc)
+        log.extend(lines)
+
+        return pos, ecode is not None and pos >= os.path.getsize(logfile)
 
     def _get_cloud_instance_details(self, _process):
         """
@@ -538,7 +622,13 @@ class BatchProcess(object):
             return update_server(cloud_instance)
         return True, {}
 
-    def status(self, out=0, err=0):
+    def status(self, out=0, err=0, tail=None, max_lines=MAX_PAGE_LINES,
+               max_bytes=MAX_PAGE_BYTES):
+        """
+        Returns the status of the process, and the next page of its stdout,
+        and stderr logs from the given positions, or only the last 'tail'
+        lines of them, when reading from the beginning.
+        """
         ctime = get_current_time(format='%y%m%d%H%M%S%f')
 
         stdout = []
@@ -554,6 +644,7 @@ class BatchProcess(object):
             enc = 'utf-8'
 
         execution_time = None
+        stime = None
 
         if j is not None:
             status, updated = BatchProcess.update_process_info(j)
@@ -564,17 +655,26 @@ class BatchProcess(object):
             self.ecode = j.exit_code
 
             if self.stime is not None:
-                stime = parser.parse(self.stime)
-                etime = parser.parse(self.etime or get_current_time())
+                stime = parse_time(self.stime)
+                etime = parse_time(self.etime or get_current_time())
 
                 execution_time = BatchProcess.total_seconds(etime - stime)
 
-            if process_output:
+            if process_output and tail and out == 0 and err == 0:
+                out, out_completed = self.tail_log(
+                    self.stdout, stdout, tail, self.ecode, enc
+                )
+                err, err_completed = self.tail_log(
+                    self.stderr, stderr, tail, self.ecode, enc
+                )
+            elif process_output:
                 out, out_completed = self.read_log(
-                    self.stdout, stdout, out, ctime, self.ecode, enc
+                    self.stdout, stdout, out, ctime, self.ecode, enc,
+                    max_lines, max_bytes
                 )
                 err, err_completed = self.read_log(
-                    self.stderr, stderr, err, ctime, self.ecode, enc
+                    self.stderr, stderr, err, ctime, self.ecode, enc,
+                    max_lines, max_bytes
                 )
         else:
             out_completed = err_completed = False
@@ -582,6 +682,7 @@ class BatchProcess(object):
         if out == -1 or err == -1:
             return {
                 'start_time': self.stime,
+                'stime': stime,
                 'exit_code': self.ecode,
                 'execution_time': execution_time,
                 'process_state': self.process_state
@@ -599,6 +700,7 @@ class BatchProcess(object):
                 'done': err_completed
             },
             'start_time': self.stime,
+            'stime': stime,
             'exit_code': self.ecode,
             'execution_time': execution_time
         }
@@ -686,32 +788,105 @@ class BatchProcess(object):
         return desc, details, type_desc, current_storage_dir
 
     @staticmethod
-    def list():
-        processes = Process.query.filter_by(user_id=current_user.id)
+    def _apply_status_events():
+        """
+        Update the processes, which have notified a change in their status
+        since the last time.
+        """
+        events_dir = get_status_events_dir()
+        events = get_status_events(events_dir)
+        if not events:
+            return
+
+        applied = dict(events)
+        for p in Process.query.filter(Process.pid.in_(list(events))):
+            status, _ = BatchProcess.update_process_info(p)
+            if not status:
+                # Try again with the next event.
+                applied.pop(str(p.pid), None)
+        db.session.commit()
+
+        # Events of the acknowledged processes are removed too.
+        remove_status_events(
+            events_dir, [name for names in applied.values() for name in names]
+        )
+
+    @staticmethod
+    def _check_active_processes(processes):
+        """
+        Update the processes, which have not finished yet, from their status
+        files, once per user. Processes started before the status events
+        were introduced do not notify their status.
+        """
+        if current_user.id in _status_checked_users:
+            return
+
         changed = False
+        for p in processes:
+            if p.end_time is None:
+                _, updated = BatchProcess.update_process_info(p)
+                changed = changed or updated
+        if changed:
+            db.session.commit()
 
-        res = []
+        _status_checked_users.add(current_user.id)
+
+    @staticmethod
+    def _is_lost_job(p):
+        """
+        Check if the queued process will never start, as the server process
+        holding it in its queue has exited (e.g. restarted).
+        """
+        if p.utility_pid == os.getpid():
+            return not job_scheduler.is_queued(p.pid)
+        return p.utility_pid is None or not psutil.pid_exists(p.utility_pid)
+
+    @staticmethod
+    def _terminate_lost_jobs(processes):
+        changed = False
         for p in processes:
-            status, updated = BatchProcess.update_process_info(p)
-            if not status:
-                continue
-            elif not changed:
-                changed = updated
+            if p.start_time is None and \
+                    p.process_state == PROCESS_QUEUED and \
+                    BatchProcess._is_lost_job(p):
+                p.start_time = p.end_time = get_current_time()
+                p.exit_code = -1
+                p.process_state = PROCESS_TERMINATED
+                changed = True
+        if changed:
+            db.session.commit()
+
+    @staticmethod
+    def list():
+        BatchProcess._apply_status_events()
+
+        processes = list(Process.query.filter_by(user_id=current_user.id))
+        BatchProcess._check_active_processes(processes)
+        BatchProcess._terminate_lost_jobs(processes)
 
-            if p.start_time is None or (
+        server_ids = set(
+            s.id for s in Server.query.with_entities(Server.id)
+        )
+
+        res = []
+        for p in processes:
+            queued = p.start_time is None and \
+                p.process_state == PROCESS_QUEUED
+            if (p.start_time is None and not queued) or (
                 p.acknowledge is not None and p.end_time is None
             ):
                 continue
 
-            if BatchProcess._operate_orphan_process(p):
+            if BatchProcess._operate_orphan_process(p, server_ids):
                 continue
 
-            execution_time = None
-
-            stime = parser.parse(p.start_time)
-            etime = parser.parse(p.end_time or get_current_time())
+            if queued:
+                stime = None
+                execution_time = 0
+            else:
+                stime = parse_time(p.start_time)
+                etime = parse_time(p.end_time or get_current_time())
 
-            execution_time = BatchProcess.total_seconds(etime - stime)
+                execution_time = BatchProcess.total_seconds(etime - stime)
 
             desc, details, type_desc, current_storage_dir = BatchProcess.\
                 _check_process_desc(p)
@@ -730,17 +905,18 @@ class BatchProcess(object):
                 'current_storage_dir': current_storage_dir,
             })
 
-        if changed:
-            db.session.commit()
-
         return res
 
     @staticmethod
-    def _operate_orphan_process(p):
+    def _operate_orphan_process(p, server_ids=None):
 
         if p and p.desc:
             desc = loads(p.desc)
-            if does_server_exists(desc.sid, current_user.id) is False:
+            if server_ids is not None:
+                exists = desc.sid in server_ids
+            else:
+                exists = does_server_exists(desc.sid, current_user.id)
+            if exists is False:
                 current_app.logger.warning(
                     _("Server with id '{0}' is either removed or does "
                       "not exists for the background process "
@@ -787,6 +963,8 @@ class BatchProcess(object):
             db.session.delete(p)
             import shutil
             shutil.rmtree(logdir, True)
+            remove_log_reader(os.path.join(logdir, 'out'))
+            remove_log_reader(os.path.join(logdir, 'err'))
         else:
             p.acknowledge = get_current_time()
         db.session.commit()
@@ -824,6 +1002,23 @@ class BatchProcess(object):
         if p is None:
             raise LookupError(PROCESS_NOT_FOUND)
 
+        if p.process_state == PROCESS_QUEUED:
+            # Never started, remove it from the queue.
+            job_scheduler.cancel(p.pid)
+            p.start_time = p.end_time = get_current_time()
+            p.exit_code = -1
+            p.process_state = PROCESS_TERMINATED
+            db.session.commit()
+            return
+
+        if p.utility_pid is None:
+            # Being launched, the utility is not known yet.
+            current_app.logger.warning(
+                _("Unable to kill the background process '{0}'").format(
+                    p.pid)
+            )
+            return
+
         try:
             process = psutil.Process(p.utility_pid)
             process.terminate()
@@ -849,3 +1044,37 @@ class BatchProcess(object):
         # Update the cloud server id
         p.server_id = _sid
         db.session.commit()
+
+
+def _get_running_jobs():
+    """
+    Get the (server_id, host) of the running processes of all the users.
+    """
+    BatchProcess._apply_status_events()
+
+    running = []
+    for p in Process.query.filter(
+        Process.process_state == PROCESS_STARTED, Process.end_time.is_(None)
+    ):
+        # Executor may have been killed without updating the status.
+        if p.utility_pid and not psutil.pid_exists(p.utility_pid):
+            continue
+        running.append(getattr(loads(p.desc), 'sid', None))
+
+    hosts = dict(
+        (s.id, s.host or s.hostaddr) for s in Server.query.filter(
+            Server.id.in_(set(running))
+        )
+    ) if running else dict()
+
+    return [
+        (sid if sid in hosts else None, hosts.get(sid)) for sid in running
+    ]
+
+
+def _get_limits():
+    return config.BG_PROCESS_MAX_JOBS, config.BG_PROCESS_MAX_JOBS_PER_HOST, \
+        config.BG_PROCESS_MAX_JOBS_PER_SERVER
+
+
+job_scheduler = JobScheduler(_get_running_jobs, _get_limits)
@@ -0,0 +1,188 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Queues the background processes, and starts them as the slots free up.
+
+A process is started at once, if the number of the running processes in
+total, for its database host, and for its server are below the configured
+limits, otherwise it waits in the queue. The queued processes are started in
+the order of their priority, and then of their submission, skipping the ones
+whose server or host is still busy.
+
+The running processes are counted from the Process table, hence the limits
+hold for all the server processes, but the queue itself, holding the
+environment (including the password) of the processes to start, is kept in
+the memory of the server process, which has accepted them. A process is
+claimed in the Process table before being started, so that a process stopped
+meanwhile is not started, and the processes lost by a restart of the server
+process are marked as terminated when the processes are listed.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import Counter
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# Number of seconds between the checks for the free slots, while any process
+# is queued.
+QUEUE_CHECK_INTERVAL = 2
+
+
+class Job(object):
+    """
+    A background process waiting to be started.
+    """
+
+    def __init__(self, pid, launch, server_id=None, host=None,
+                 priority=PRIORITY_NORMAL):
+        """
+        :param pid: Process ID
+        :param launch: function starting the process
+        :param server_id: ID of the server the process works on
+        :param host: Host of that server
+        :param priority: PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+        """
+        self.pid = pid
+        self.launch = launch
+        self.server_id = server_id
+        self.host = host
+        self.priority = priority
+
+
+class JobScheduler(object):
+    """
+    Starts the submitted jobs within the concurrency limits.
+    """
+
+    def __init__(self, get_running_jobs, get_limits):
+        """
+        :param get_running_jobs: function returning the list of the
+                                 (server_id, host) of the running processes
+        :param get_limits: function returning the maximum number of the
+                           running processes (total, per host, per server),
+                           where 0 means no limit
+        """
+        self._get_running_jobs = get_running_jobs
+        self._get_limits = get_limits
+        self._lock = threading.Lock()
+        # [(priority, sequence, job)]
+        self._queue = []
+        self._sequence = itertools.count()
+        self._thread = None
+
+    def submit(self, job, app=None):
+        """
+        Starts the job, or queues it if there is no free slot. The queued
+        jobs are started by a background thread within the app context.
+
+        :returns: True if the job has been started, False if queued
+        """
+        with self._lock:
+            heapq.heappush(
+                self._queue, (job.priority, next(self._sequence), job)
+            )
+            self._schedule()
+
+            queued = self.is_queued(job.pid)
+            if queued and app is not None and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, args=(app,), daemon=True
+                )
+                self._thread.start()
+
+        return not queued
+
+    def cancel(self, pid):
+        """
+        Removes the job from the queue.
+
+        :returns: True if the job was queued
+        """
+        with self._lock:
+            queue = [item for item in self._queue if item[2].pid != pid]
+            if len(queue) == len(self._queue):
+                return False
+            heapq.heapify(queue)
+            self._queue = queue
+        return True
+
+    def is_queued(self, pid):
+        return any(item[2].pid == pid for item in self._queue)
+
+    def schedule(self):
+        """
+        Starts the queued jobs fitting in the limits.
+        """
+        with self._lock:
+            self._schedule()
+
+    def _schedule(self):
+        if not self._queue:
+            return
+
+        max_jobs, max_per_host, max_per_server = self._get_limits()
+
+        running = list(self._get_running_jobs())
+        total = len(running)
+        per_host = Counter(host for _, host in running if host)
+        per_server = Counter(
+            server_id for server_id, _ in running if server_id is not None
+        )
+
+        queue = []
+        while self._queue:
+            item = heapq.heappop(self._queue)
+            job = item[2]
+
+            if (max_jobs and total >= max_jobs) or (
+                max_per_host and job.host and
+                per_host[job.host] >= max_per_host
+            ) or (
+                max_per_server and job.server_id is not None and
+                per_server[job.server_id] >= max_per_server
+            ):
+                queue.append(item)
+                continue
+
+            total += 1
+            if job.host:
+                per_host[job.host] += 1
+            if job.server_id is not None:
+                per_server[job.server_id] += 1
+
+            try:
+                job.launch()
+            except Exception:
+                # The launch function records its own failure, the other
+                # jobs must not be lost.
+                pass
+
+        heapq.heapify(queue)
+        self._queue = queue
+
+    def _run(self, app):
+        while True:
+            time.sleep(QUEUE_CHECK_INTERVAL)
+
+            with self._lock:
+                if not self._queue:
+                    self._thread = None
+                    return
+
+                try:
+                    with app.app_context():
+                        self._schedule()
+                except Exception as e:
+                    app.logger.exception(e)
@@ -24,6 +24,9 @@ define('misc.bgprocess', [
 
   var wcDocker = window.wcDocker;
 
+  // Number of the last log lines shown, when the details are opened.
+  var BGPROCESS_TAIL_LINES = 1000;
+
   var BGProcess = function(info, notify) {
     var self = this;
     setTimeout(
@@ -61,7 +64,7 @@ define('misc.bgprocess', [
           details: false,
           notify: (_.isUndefined(notify) || notify),
           curr_status: null,
-          state: 0, // 0: NOT Started, 1: Started, 2: Finished, 3: Terminated
+          state: 0, // 0: NOT Started, 1: Started, 2: Finished, 3: Terminated, 4: Queued
           completed: false,
           current_storage_dir: null,
 
@@ -116,13 +119,18 @@ define('misc.bgprocess', [
         switch (type) {
         case 'status':
           if (this.details && this.out != -1 && this.err != -1) {
-            return url_for(
+            var url = url_for(
               'bgprocess.detailed_status', {
                 'pid': this.id,
                 'out': this.out,
                 'err': this.err,
               }
             );
+            // Show only the last lines of a long log, when opened.
+            if (this.out == 0 && this.err == 0) {
+              url += '?tail=' + BGPROCESS_TAIL_LINES;
+            }
+            return url;
           }
           return url_for('bgprocess.status', {
             'pid': this.id,
@@ -145,7 +153,8 @@ define('misc.bgprocess', [
           out = [],
           err = [];
 
-        if ('stime' in data)
+        // Queued process has not started yet.
+        if ('stime' in data && data.stime)
           self.stime = new Date(data.stime);
 
         if ('execution_time' in data)
@@ -264,7 +273,7 @@ define('misc.bgprocess', [
             self.curr_status = self.other_status_tpl({status_text:gettext('Terminating the process...')});
           }
 
-          if (self.state == 0 && self.stime) {
+          if ((self.state == 0 || self.state == 4) && self.stime) {
             self.state = 1;
             pgBrowser.Events && pgBrowser.Events.trigger(
               'pgadmin-bgprocess:started:' + self.id, self, self
@@ -278,6 +287,12 @@ define('misc.bgprocess', [
             );
           }
 
+          setTimeout(function() {
+            self.show.apply(self);
+          }, 10);
+        } else if (self.state == 4) {
+          self.curr_status = self.other_status_tpl({status_text:gettext('Queued')});
+
           setTimeout(function() {
             self.show.apply(self);
           }, 10);
@@ -372,7 +387,7 @@ define('misc.bgprocess', [
               </div>
               <div class="card-body px-2">
                 <div class="py-1">${self.desc}</div>
-                <div class="py-1">${self.stime.toString()}</div>
+                <div class="py-1 pg-bg-stime"></div>
                 <div class="d-flex py-1">
                   <div class="my-auto mr-2">
                     <span class="fa fa-clock fa-lg" role="img"></span>
@@ -427,6 +442,10 @@ define('misc.bgprocess', [
             content.find('.bg-process-stop').off('click').on('click', self.stop_process.bind(this));
           }
 
+          self.container.find('.pg-bg-stime').text(
+            self.stime ? self.stime.toString() : ''
+          );
+
           // TODO:: Formatted execution time
           self.container.find('.pg-bg-etime').empty().append(
             $('<span></span>').text(
@@ -440,8 +459,9 @@ define('misc.bgprocess', [
           $status_bar.html(self.curr_status);
           var $btn_stop_process = $(self.container.find('.bg-process-stop'));
 
-          // Enable Stop Process button only when process is running
-          if (parseInt(self.state) === 1) {
+          // Enable Stop Process button only when process is running, or
+          // queued
+          if (parseInt(self.state) === 1 || parseInt(self.state) === 4) {
             $btn_stop_process.attr('disabled', false);
           } else {
             $btn_stop_process.attr('disabled', true);
@@ -490,8 +510,8 @@ define('misc.bgprocess', [
           $btn_storage_manager.off('click').on('click', self.storage_manager.bind(this));
         }
 
-        // Enable Stop Process button only when process is running
-        if (parseInt(self.state) === 1) {
+        // Enable Stop Process button only when process is running, or queued
+        if (parseInt(self.state) === 1 || parseInt(self.state) === 4) {
           $btn_stop_process.attr('disabled', false);
         } else {
           $btn_stop_process.attr('disabled', true);
@@ -0,0 +1,68 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Notifications of the status changes of the background processes.
+
+The process executor writes the status of the process in its log directory,
+and then creates an empty file named '<process id>.<sequence>' in the status
+events directory. The web server updates the Process table only for the
+processes having such a file, and removes the files it has seen afterwards,
+so that the status files of the other processes are never read.
+
+The status is always written before the event, hence an event seen here
+means the status file is at least as new as that event, and an event created
+while the status is being read has another name, and is not removed.
+"""
+
+import os
+
+import config
+
+STATUS_EVENTS_DIR = 'status_events'
+
+
+def get_status_events_dir():
+    """
+    Returns the directory, in which the process executors create the events.
+    """
+    return os.path.join(
+        config.SESSION_DB_PATH, 'process_logs', STATUS_EVENTS_DIR
+    )
+
+
+def get_status_events(events_dir):
+    """
+    Returns the names of the pending events per process id, i.e.
+    {process id: [event file name]}
+    """
+    events = dict()
+
+    try:
+        with os.scandir(events_dir) as it:
+            for entry in it:
+                pid, sep, _ = entry.name.rpartition('.')
+                if sep and pid:
+                    events.setdefault(pid, []).append(entry.name)
+    except FileNotFoundError:
+        pass
+
+    return events
+
+
+def remove_status_events(events_dir, names):
+    """
+    Removes the events, which have been applied to the Process table.
+    """
+    for name in names:
+        try:
+            os.unlink(os.path.join(events_dir, name))
+        except FileNotFoundError:
+            # Removed by another worker
+            pass
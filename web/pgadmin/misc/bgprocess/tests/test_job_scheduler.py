@@ -0,0 +1,156 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+from pickle import dumps
+from unittest.mock import patch, MagicMock
+
+from pgadmin.model import db, Process, User
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess.processes import BatchProcess, \
+    PROCESS_QUEUED, _get_running_jobs
+from pgadmin.misc.bgprocess.scheduler import Job, JobScheduler, \
+    PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL
+
+
+class JobSchedulerTestCase(BaseTestGenerator):
+    """
+    This class validates the background processes are started within the
+    concurrency limits, in the order of their priority.
+    """
+
+    scenarios = [
+        ('Jobs are started without the limits', dict(
+            limits=(0, 0, 0),
+            jobs=[('a', 1, 'h1', PRIORITY_NORMAL),
+                  ('b', 1, 'h1', PRIORITY_NORMAL)],
+            started=['a', 'b'], next_started=[], queued=[])),
+        ('Jobs over the server limit are queued', dict(
+            limits=(0, 0, 1),
+            jobs=[('a', 1, 'h1', PRIORITY_NORMAL),
+                  ('b', 1, 'h1', PRIORITY_NORMAL),
+                  ('c', 2, 'h1', PRIORITY_NORMAL)],
+            started=['a', 'c'], next_started=['b'], queued=[])),
+        ('Jobs over the host limit are queued', dict(
+            limits=(0, 1, 0),
+            jobs=[('a', 1, 'h1', PRIORITY_NORMAL),
+                  ('b', 2, 'h1', PRIORITY_NORMAL),
+                  ('c', 3, 'h2', PRIORITY_NORMAL)],
+            started=['a', 'c'], next_started=['b'], queued=[])),
+        ('Queued jobs are started by priority', dict(
+            limits=(1, 0, 0),
+            jobs=[('a', 1, 'h1', PRIORITY_NORMAL),
+                  ('b', 2, 'h2', PRIORITY_LOW),
+                  ('c', 3, 'h3', PRIORITY_HIGH)],
+            started=['a'], next_started=['c'], queued=['b'])),
+    ]
+
+    def runTest(self):
+        running = []
+        started = []
+
+        def launch(job):
+            started.append(job.pid)
+            running.append((job.server_id, job.host))
+
+        scheduler = JobScheduler(lambda: running, lambda: self.limits)
+
+        for pid, server_id, host, priority in self.jobs:
+            job = Job(pid, None, server_id, host, priority)
+            job.launch = lambda job=job: launch(job)
+            scheduler.submit(job)
+
+        self.assertEqual(started, self.started)
+
+        # First job finishes.
+        running.pop(0)
+        del started[:]
+        scheduler.schedule()
+        self.assertEqual(started, self.next_started)
+
+        for pid, _, _, _ in self.jobs:
+            self.assertEqual(scheduler.cancel(pid), pid in self.queued)
+
+
+class LostJobTestCase(BaseTestGenerator):
+    """
+    This class validates the queued processes, whose server process has
+    exited, are found as they will never start.
+    """
+
+    scenarios = [
+        ('Queued in this server process', dict(
+            utility_pid='self', in_queue=True, lost=False)),
+        ('No longer queued in this server process', dict(
+            utility_pid='self', in_queue=False, lost=True)),
+        ('Queued in an exited server process', dict(
+            utility_pid='exited', in_queue=False, lost=True)),
+        ('Queued in a running server process', dict(
+            utility_pid='parent', in_queue=False, lost=False)),
+        ('Queued by an unknown server process', dict(
+            utility_pid=None, in_queue=False, lost=True)),
+    ]
+
+    def runTest(self):
+        utility_pid = {
+            'self': os.getpid(), 'parent': os.getppid(),
+            'exited': 2 ** 22 + 1, None: None
+        }[self.utility_pid]
+        p = MagicMock(pid='pid', utility_pid=utility_pid)
+
+        with patch('pgadmin.misc.bgprocess.processes.job_scheduler') as js:
+            js.is_queued.return_value = self.in_queue
+            self.assertEqual(BatchProcess._is_lost_job(p), self.lost)
+
+
+class ExecutorPidTestCase(BaseTestGenerator):
+    """
+    This class validates the started processes are no longer counted as
+    running once their executor has died, even if it never reported the
+    PID of the utility.
+    """
+
+    scenarios = [
+        ('Executor is running', dict(executor_alive=True, running=1)),
+        ('Executor died before reporting the utility', dict(
+            executor_alive=False, running=0)),
+    ]
+
+    def setUp(self):
+        self.executor_pid = 2 ** 22 + 1
+        with self.app.app_context():
+            db.session.add(Process(
+                pid='220101000000000001', user_id=User.query.first().id,
+                command='', desc=dumps(None), arguments='',
+                process_state=PROCESS_QUEUED, utility_pid=os.getpid()
+            ))
+            db.session.commit()
+
+    def runTest(self):
+        bp = BatchProcess.__new__(BatchProcess)
+        bp.id = '220101000000000001'
+        executor = MagicMock(pid=self.executor_pid)
+        executor.poll.return_value = None
+
+        with self.app.app_context(), \
+                patch.object(bp, '_popen', return_value=executor), \
+                patch('pgadmin.misc.bgprocess.processes.psutil') as ps:
+            bp._launch([], {})
+
+            p = Process.query.filter_by(pid=bp.id).first()
+            self.assertEqual(p.utility_pid, self.executor_pid)
+
+            ps.pid_exists.side_effect = lambda pid: \
+                self.executor_alive and pid == self.executor_pid
+            self.assertEqual(len(_get_running_jobs()), self.running)
+
+    def tearDown(self):
+        with self.app.app_context():
+            Process.query.filter_by(pid='220101000000000001').delete()
+            db.session.commit()
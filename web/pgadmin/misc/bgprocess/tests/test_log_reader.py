@@ -0,0 +1,77 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import tempfile
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess.log_reader import LogReader
+
+
+class LogReaderTestCase(BaseTestGenerator):
+    """
+    This class validates the logs of the background processes are read in
+    pages, or from the end.
+    """
+
+    scenarios = [
+        ('Read the whole log', dict(
+            kwargs=dict(), tail=None, expected=list(range(3000)))),
+        ('Read the lines limited page', dict(
+            kwargs=dict(max_lines=10), tail=None, expected=list(range(10)))),
+        ('Read the bytes limited page', dict(
+            kwargs=dict(max_bytes=100), tail=None, expected=[0, 1, 2])),
+        ('Read the lines logged till the given time', dict(
+            kwargs=dict(ctime='220101000000000004'), tail=None,
+            expected=list(range(5)))),
+        ('Read the last lines', dict(
+            kwargs=dict(), tail=5, expected=list(range(2995, 3000)))),
+    ]
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.logfile = os.path.join(self.log_dir, 'out')
+
+        # Same format as written by the process executor.
+        with open(self.logfile, 'wb') as f:
+            for i in range(3000):
+                f.write(b'%d,line %d\n\n' % (220101000000000000 + i, i))
+            # Line being written
+            f.write(b'220101000000003000,line')
+
+    def runTest(self):
+        reader = LogReader(self.logfile)
+
+        if self.tail:
+            lines, pos = reader.tail(self.tail)
+        else:
+            lines, pos, eofs = reader.read(0, **self.kwargs)
+
+        self.assertEqual([line[1] for line in lines],
+                         ['line %d' % i for i in self.expected])
+
+        # Next page starts after the lines read.
+        lines, _, _ = reader.read(pos, max_lines=1)
+        self.assertEqual(
+            [line[1] for line in lines],
+            ['line %d' % (self.expected[-1] + 1)]
+            if self.expected[-1] < 2999 else []
+        )
+
+        if not self.tail:
+            # Offsets of the lines are indexed while reading.
+            reader.read(0)
+            self.assertTrue(reader.indexed_lines >= 6000)
+            lines, _ = reader.tail(5)
+            self.assertEqual([line[1] for line in lines],
+                             ['line %d' % i for i in range(2995, 3000)])
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
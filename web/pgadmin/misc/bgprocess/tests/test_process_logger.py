@@ -0,0 +1,59 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+from subprocess import Popen, PIPE
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess import process_executor
+from pgadmin.misc.bgprocess.log_reader import LogReader
+
+
+class ProcessLoggerTestCase(BaseTestGenerator):
+    """
+    This class validates the buffered logger writes every line of the
+    output, in the format read by the log reader.
+    """
+
+    scenarios = [
+        ('Log the lines', dict(
+            output='print("\\n".join("line %d" % i for i in range(5000)))',
+            expected=['line %d' % i for i in range(5000)])),
+        ('Log the last line without the line ending', dict(
+            output='import sys; sys.stdout.write("first\\nlast")',
+            expected=['first', 'last'])),
+        ('Log nothing', dict(
+            output='pass', expected=[])),
+    ]
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+
+    def runTest(self):
+        with patch.object(process_executor, '_out_dir', self.out_dir):
+            process = Popen([sys.executable, '-c', self.output],
+                            stdout=PIPE)
+            logger = process_executor.ProcessLogger('out')
+            logger.attach_process_stream(process, process.stdout)
+            logger.start()
+            logger.join()
+            process.wait()
+            logger.release()
+
+        lines, _, _ = LogReader(os.path.join(self.out_dir, 'out')).read(
+            0, max_lines=10000
+        )
+        self.assertEqual([line[1] for line in lines], self.expected)
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir, ignore_errors=True)
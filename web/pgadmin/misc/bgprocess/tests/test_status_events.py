@@ -0,0 +1,70 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess import process_executor
+from pgadmin.misc.bgprocess.status_events import get_status_events, \
+    remove_status_events
+
+
+class StatusEventsTestCase(BaseTestGenerator):
+    """
+    This class validates the process executor notifies the status changes,
+    and only the events seen are removed.
+    """
+
+    scenarios = [
+        ('Status change is notified', dict(
+            updates=1, seen=1, pending=[])),
+        ('Events created while applying are kept', dict(
+            updates=3, seen=2, pending=['220101000000000000.3'])),
+    ]
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+        self.events_dir = tempfile.mkdtemp()
+
+    def runTest(self):
+        env = {
+            'PROCID': '220101000000000000',
+            'PGA_BGP_EVENTS': self.events_dir
+        }
+
+        with patch.dict(os.environ, env), \
+                patch.object(process_executor, '_out_dir', self.out_dir), \
+                patch.object(process_executor, '_log_file', os.path.join(
+                    self.out_dir, 'log')), \
+                patch.object(process_executor, '_status_seq', 0):
+            for exit_code in range(self.updates):
+                process_executor.update_status(
+                    start_time='2022-01-01 00:00:00.000000 +0000',
+                    exit_code=exit_code
+                )
+                if exit_code + 1 == self.seen:
+                    events = get_status_events(self.events_dir)
+
+        with open(os.path.join(self.out_dir, 'status')) as fp:
+            self.assertEqual(json.load(fp)['exit_code'], self.updates - 1)
+
+        self.assertEqual(list(events), ['220101000000000000'])
+        remove_status_events(self.events_dir, events['220101000000000000'])
+
+        self.assertEqual(
+            sorted(os.listdir(self.events_dir)), self.pending
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir, ignore_errors=True)
+        shutil.rmtree(self.events_dir, ignore_errors=True)
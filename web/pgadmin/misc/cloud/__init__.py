@@ -21,6 +21,7 @@ from pgadmin.utils.ajax import make_json_response,\
 
 from pgadmin.utils.constants import MIMETYPE_APP_JS
 from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.misc.bgprocess.scheduler import PRIORITY_HIGH
 from pgadmin.model import db, Server, Process
 from pgadmin.misc.cloud.utils.rds import RDS, verify_aws_credentials,\
     get_aws_db_instances, get_aws_db_versions, clear_aws_session,\
@@ -258,7 +259,7 @@ def deploy_on_cloud():
 
         p.set_env_variables(None, env=env)
         p.update_server_id(p.id, sid)
-        p.start()
+        p.start(priority=PRIORITY_HIGH)
 
     except Exception as e:
         current_app.logger.exception(e)
@@ -9,10 +9,8 @@
 
 # AWS RDS PostgreSQL provider
 
-import boto3
 import pickle
 from flask import session
-from boto3.session import Session
 from .aws_regions import AWS_REGIONS
 
 
@@ -35,6 +33,8 @@ class RDS():
         if type in self._clients:
             return self._clients[type]
 
+        # boto3 is imported on first use, as it is slow to import.
+        import boto3
         session = boto3.Session(
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
@@ -162,6 +162,7 @@ def get_aws_db_versions():
 def get_aws_regions():
     """Get AWS DB Versions"""
     clear_aws_session()
+    from boto3.session import Session
     _session = Session()
     res = _session.get_available_regions('rds')
     regions = []
@@ -19,6 +19,7 @@ from sys import platform as _platform
 import config
 import codecs
 import pathlib
+import shutil
 from werkzeug.exceptions import InternalServerError
 
 import simplejson as json
@@ -28,9 +29,11 @@ from flask_babel import gettext
 from flask_security import login_required
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils import get_storage_directory
-from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.ajax import make_json_response, forbidden
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PREF_LABEL_OPTIONS, MIMETYPE_APP_JS
+from pgadmin.misc.file_manager.listing import directory_cache, \
+    list_directory, is_protected, splitext
 
 # Checks if platform is Windows
 if _platform == "win32":
@@ -49,6 +52,11 @@ path_exists = os.path.exists
 split_path = os.path.split
 encode_json = json.JSONEncoder().encode
 
+# Size of the buffer used to write the uploaded files (4MB)
+UPLOAD_BUFFER_SIZE = 4194304
+# Suffix of the hidden partial file, the chunks of an upload are written to
+UPLOAD_PART_SUFFIX = '.pgadmin-upload'
+
 
 # utility functions
 # convert bytes type to human readable format
@@ -74,17 +82,6 @@ def getdrivesize(path):
         return free_bytes.value
 
 
-# split extension for files
-def splitext(path):
-    for ext in ['.tar.gz', '.tar.bz2']:
-        if path.endswith(ext):
-            path, ext = path[:-len(ext)], path[-len(ext):]
-            break
-    else:
-        path, ext = os.path.splitext(path)
-    return ext[1:]
-
-
 # check if file is hidden in windows platform
 def is_folder_hidden(filepath):
     if _platform == "win32":
@@ -475,6 +472,7 @@ class Filemanager(object):
 
         file_upload_size = blueprint.get_file_size_preference().get()
         configs['upload']['fileSizeLimit'] = file_upload_size
+        configs['upload']['chunkSize'] = config.FILE_UPLOAD_CHUNK_SIZE
         file_manager_data[trans_id] = configs
         session['fileManagerData'] = file_manager_data
         Filemanager.resume_windows_warning()
@@ -587,7 +585,7 @@ class Filemanager(object):
     @staticmethod
     def get_files_in_path(
         show_hidden_files, files_only, folders_only, supported_types,
-            file_type, user_dir, orig_path):
+            file_type, user_dir, orig_path, page=None):
         """
         Get list of files and dirs in the path
         :param show_hidden_files: boolean
@@ -597,61 +595,50 @@ class Filemanager(object):
         :param file_type: file type
         :param user_dir: base user dir
         :param orig_path: path after user dir
-        :return:
+        :param page: dict of the offset, limit, sort_by, sort_order and
+                     name_filter of the page to list, None to list all
+        :return: files and dirs, and the number of all the matching ones
         """
-        files = {}
-
-        for f in sorted(os.listdir(orig_path)):
-            system_path = os.path.join(os.path.join(orig_path, f))
-
-            # continue if file/folder is hidden (based on user preference)
-            if not show_hidden_files and is_folder_hidden(system_path):
-                continue
-            try:
-                user_path = os.path.join(os.path.join(user_dir, f))
-                created = time.ctime(os.path.getctime(system_path))
-                modified = time.ctime(os.path.getmtime(system_path))
-                file_extension = str(splitext(system_path))
-            except Exception:
-                continue
+        def entry_filter(entry):
+            # list files only or folders only
+            if entry.is_dir:
+                return files_only != 'true'
+            # filter files based on file_type
+            return not Filemanager._skip_file_extension(
+                file_type, supported_types, folders_only, entry.extension)
 
-            # set protected to 1 if no write or read permission
-            protected = 0
-            if (not os.access(system_path, os.R_OK) or
-                    not os.access(system_path, os.W_OK)):
-                protected = 1
+        entries, total = list_directory(
+            orig_path, show_hidden_files, entry_filter, **(page or {})
+        )
 
-            # list files only or folders only
-            if os.path.isdir(system_path):
-                if files_only == 'true':
-                    continue
-                file_extension = "dir"
+        files = {}
+        for entry in entries:
+            user_path = os.path.join(user_dir, entry.name)
+            if entry.is_dir:
                 user_path = "{0}/".format(user_path)
-            # filter files based on file_type
-            elif Filemanager._skip_file_extension(
-                    file_type, supported_types, folders_only, file_extension):
-                continue
 
             # create a list of files and folders
-            files[f] = {
-                "Filename": f,
+            files[entry.name] = {
+                "Filename": entry.name,
                 "Path": user_path,
-                "file_type": file_extension,
-                "Protected": protected,
+                "file_type": entry.extension,
+                # set protected to 1 if no write or read permission
+                "Protected": is_protected(entry),
                 "Properties": {
-                    "Date Created": created,
-                    "Date Modified": modified,
-                    "Size": sizeof_fmt(getsize(system_path))
+                    "Date Created": time.ctime(entry.created),
+                    "Date Modified": time.ctime(entry.modified),
+                    "Size": sizeof_fmt(entry.size)
                 }
             }
 
-        return files
+        return files, total
 
     @staticmethod
-    def list_filesystem(in_dir, path, trans_data, file_type, show_hidden):
+    def list_filesystem(in_dir, path, trans_data, file_type, show_hidden,
+                        page=None):
         """
         It lists all file and folders within the given
-        directory.
+        directory, or only a page of them if the page is given.
         """
         Filemanager.suspend_windows_warning()
         is_show_hidden_files = show_hidden
@@ -686,6 +673,8 @@ class Filemanager(object):
                     }
                 }
             Filemanager.resume_windows_warning()
+            if page is not None:
+                files = Filemanager._get_page(files, len(files), page)
             return files
 
         orig_path = Filemanager.get_abs_path(in_dir, path)
@@ -704,10 +693,12 @@ class Filemanager(object):
 
         orig_path = unquote(orig_path)
         try:
-            files = Filemanager.get_files_in_path(
+            files, total = Filemanager.get_files_in_path(
                 is_show_hidden_files, files_only, folders_only,
-                supported_types, file_type, user_dir, orig_path
+                supported_types, file_type, user_dir, orig_path, page
             )
+            if page is not None:
+                files = Filemanager._get_page(files, total, page)
         except Exception as e:
             Filemanager.resume_windows_warning()
             err_msg = str(e)
@@ -722,6 +713,19 @@ class Filemanager(object):
         Filemanager.resume_windows_warning()
         return files
 
+    @staticmethod
+    def _get_page(files, total, page):
+        """
+        Used internally by list_filesystem to return the files of the page
+        along with the number of all of them, for the client to page through.
+        """
+        return {
+            'files': files,
+            'total': total,
+            'offset': page.get('offset', 0),
+            'limit': page.get('limit', None)
+        }
+
     @staticmethod
     def check_access_permission(in_dir, path):
         if not config.SERVER_MODE:
@@ -857,9 +861,11 @@ class Filemanager(object):
         return thefile
 
     def getfolder(self, path=None, file_type="", name=None, req=None,
-                  show_hidden=False):
+                  show_hidden=False, offset=0, limit=None, sort_by='name',
+                  sort_order='asc', name_filter=None):
         """
-        Returns files and folders in give path
+        Returns files and folders in give path, or a page of them sorted
+        and filtered on the server if the limit is given.
         """
         trans_data = Filemanager.get_trasaction_selection(self.trans_id)
         the_dir = None
@@ -868,8 +874,18 @@ class Filemanager(object):
             if the_dir is not None and not the_dir.endswith('/'):
                 the_dir += '/'
 
+        page = None
+        if limit is not None:
+            page = {
+                'offset': offset,
+                'limit': limit,
+                'sort_by': sort_by,
+                'sort_order': sort_order,
+                'name_filter': name_filter
+            }
+
         filelist = self.list_filesystem(
-            the_dir, path, trans_data, file_type, show_hidden)
+            the_dir, path, trans_data, file_type, show_hidden, page)
         return filelist
 
     def rename(self, old=None, new=None, req=None):
@@ -918,6 +934,8 @@ class Filemanager(object):
             code = 0
             error_msg = "{0} {1}".format(
                 gettext('There was an error renaming the file:'), e)
+        directory_cache.invalidate(oldpath_sys)
+        directory_cache.invalidate(newpath_sys)
 
         result = {
             'Old Path': old,
@@ -959,6 +977,7 @@ class Filemanager(object):
         except Exception as e:
             code = 0
             err_msg = str(e.strerror)
+        directory_cache.invalidate(orig_path)
 
         result = {
             'Path': path,
@@ -968,16 +987,82 @@ class Filemanager(object):
 
         return result
 
+    @staticmethod
+    def _get_upload_chunk(form):
+        """
+        Used internally by add to get the chunk of a chunked upload, sent by
+        the client as the index and count of the chunks, the offset of the
+        chunk, and the size of the whole file.
+        :return: (index, count, offset, size), None if the file is uploaded
+                 at once
+        """
+        if 'dzchunkindex' not in form:
+            return None
+
+        chunk = (
+            int(form['dzchunkindex']), int(form['dztotalchunkcount']),
+            int(form['dzchunkbyteoffset']), int(form['dztotalfilesize'])
+        )
+        index, count, offset, size = chunk
+        if index < 0 or index >= count or offset < 0 or offset > size:
+            raise ValueError(gettext('Invalid chunk of the uploaded file.'))
+        return chunk
+
+    @staticmethod
+    def _save_upload_chunk(file_obj, new_name, chunk):
+        """
+        Used internally by add to write the chunk at its offset in the hidden
+        partial file, which replaces the uploaded file once the last chunk
+        is written. The client sends the chunks one by one, and sends a
+        failed chunk again, hence the upload goes on from the failed chunk
+        instead of starting over.
+        :return: True if the upload is complete
+        """
+        index, count, offset, size = chunk
+        dir_name, file_name = split_path(new_name)
+        part_name = os.path.join(dir_name, '.{0}.{1}{2}'.format(
+            file_name, size, UPLOAD_PART_SUFFIX
+        ))
+
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        if index == 0:
+            flags |= os.O_TRUNC
+
+        incomplete_error = gettext(
+            'The upload of the file is incomplete, please upload it again.'
+        )
+
+        with os.fdopen(os.open(part_name, flags, 0o666), 'wb') as f:
+            # The previous chunks must have been written.
+            if os.fstat(f.fileno()).st_size < offset:
+                raise ValueError(incomplete_error)
+            f.seek(offset)
+            shutil.copyfileobj(file_obj, f, UPLOAD_BUFFER_SIZE)
+
+        if index < count - 1:
+            return False
+
+        if os.path.getsize(part_name) != size:
+            os.remove(part_name)
+            raise ValueError(incomplete_error)
+
+        os.replace(part_name, new_name)
+        return True
+
     def add(self, req=None):
         """
         File upload functionality
+        :return: (result, HTTP status), the status is an error status if the
+                 upload failed, so that the client sends a rejected chunk
+                 again or reports the failure
         """
         if not self.validate_request('upload'):
-            return self.ERROR_NOT_ALLOWED
+            return self.ERROR_NOT_ALLOWED, 403
 
         the_dir = self.dir if self.dir is not None else ''
         err_msg = ''
         code = 1
+        status = 200
         try:
             path = req.form.get('currentpath')
 
@@ -995,17 +1080,23 @@ class Filemanager(object):
                         )
                     ).relative_to(the_dir)
             except ValueError:
-                return self.ERROR_NOT_ALLOWED
-
-            with open(new_name, 'wb') as f:
-                while True:
-                    # 4MB chunk (4 * 1024 * 1024 Bytes)
-                    data = file_obj.read(4194304)
-                    if not data:
-                        break
-                    f.write(data)
+                return self.ERROR_NOT_ALLOWED, 403
+
+            chunk = Filemanager._get_upload_chunk(req.form)
+            if chunk is None:
+                with open(new_name, 'wb') as f:
+                    shutil.copyfileobj(file_obj, f, UPLOAD_BUFFER_SIZE)
+                directory_cache.invalidate(new_name)
+            elif Filemanager._save_upload_chunk(file_obj, new_name, chunk):
+                directory_cache.invalidate(new_name)
+        except ValueError as e:
+            # The chunk is invalid, or the previous chunks are missing.
+            code = 0
+            status = 400
+            err_msg = str(e)
         except Exception as e:
             code = 0
+            status = 500
             err_msg = str(e.strerror) if hasattr(e, 'strerror') else str(e)
 
         try:
@@ -1015,7 +1106,7 @@ class Filemanager(object):
                 'Error': str(e),
                 'Code': 0
             }
-            return res
+            return res, 403
 
         result = {
             'Path': path,
@@ -1023,7 +1114,7 @@ class Filemanager(object):
             'Error': err_msg,
             'Code': code
         }
-        return result
+        return result, status
 
     def is_file_exist(self, path, name, req=None):
         """
@@ -1195,6 +1286,7 @@ class Filemanager(object):
             except Exception as e:
                 code = 0
                 err_msg = str(e.strerror)
+        directory_cache.invalidate(new_path)
 
         result = {
             'Parent': path,
@@ -1210,7 +1302,7 @@ class Filemanager(object):
         Functionality to download file
         """
         if not self.validate_request('download'):
-            return self.ERROR_NOT_ALLOWED
+            return forbidden(self.ERROR_NOT_ALLOWED['Error'])
 
         the_dir = self.dir if self.dir is not None else ''
         orig_path = "{0}{1}".format(the_dir, path)
@@ -1220,10 +1312,8 @@ class Filemanager(object):
                 the_dir, "{}{}".format(path, path)
             )
         except Exception as e:
-            resp = Response(str(e))
-            resp.headers['Content-Disposition'] = \
-                'attachment; filename=' + name
-            return resp
+            # Not a file, the browser reports the download as failed.
+            return forbidden(str(e))
 
         name = os.path.basename(path)
         if orig_path and len(orig_path) > 0:
@@ -1231,9 +1321,13 @@ class Filemanager(object):
         else:
             dir_path = os.path.dirname(path)
 
+        # The file is served by the WSGI server (using sendfile where
+        # available), and the range requests are answered with the requested
+        # part only, so that the browser can resume an interrupted download.
         response = send_from_directory(dir_path, name,
                                        mimetype='application/octet-stream',
-                                       as_attachment=True)
+                                       as_attachment=True,
+                                       conditional=True)
         response.headers["filename"] = name
 
         return response
@@ -1281,6 +1375,19 @@ def file_manager(trans_id):
         }
         mode = req.args['mode']
 
+    # The file is sent as is, the browser downloads it by itself.
+    if mode == 'download':
+        return my_fm.download(**kwargs)
+
+    if mode == 'add':
+        res, status = my_fm.add(**kwargs)
+        if status != 200:
+            return make_json_response(
+                success=0, errormsg=res['Error'], status=status,
+                data={'result': res, 'status': False}
+            )
+        return make_json_response(data={'result': res, 'status': True})
+
     try:
         func = getattr(my_fm, mode)
         res = func(**kwargs)
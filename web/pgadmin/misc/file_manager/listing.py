@@ -0,0 +1,220 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Lists the directories for the file manager.
+
+A directory is read once with os.scandir, which returns the type of the
+entries without an extra system call, and the entries are stat'ed once. The
+result is cached for FILE_MANAGER_LISTING_CACHE_TIMEOUT seconds, so that
+paging, sorting and filtering the same directory do not read it again. A
+cached listing is dropped when the modification time of the directory
+changes, or when the file manager adds, renames or deletes anything in it.
+
+The checks needing a system call per entry (access permissions) are only run
+for the entries of the requested page.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from sys import platform as _platform
+
+import config
+
+# Number of the directories kept in the cache.
+MAX_CACHED_DIRECTORIES = 32
+
+# FILE_ATTRIBUTE_HIDDEN on Windows
+_FILE_ATTRIBUTE_HIDDEN = 2
+
+# Sort key: DirEntry attribute, the entries are sorted by name within.
+SORT_KEYS = {
+    'name': None,
+    'size': 'size',
+    'modified': 'modified',
+    'created': 'created',
+    'type': 'extension'
+}
+
+DirEntry = namedtuple(
+    'DirEntry',
+    ['name', 'path', 'is_dir', 'hidden', 'extension', 'size', 'created',
+     'modified', 'sort_key']
+)
+
+
+def splitext(path):
+    for ext in ['.tar.gz', '.tar.bz2']:
+        if path.endswith(ext):
+            return ext[1:]
+    return os.path.splitext(path)[1][1:]
+
+
+def natural_key(name):
+    """
+    Returns the key sorting the names case insensitively, and the numbers
+    within them by value, like the file manager dialog does.
+    """
+    return [int(part) if part.isdigit() else part
+            for part in re.split(r'(\d+)', name.lower())]
+
+
+def _is_hidden(entry, stat):
+    if _platform == 'win32':
+        return bool(
+            getattr(stat, 'st_file_attributes', 0) & _FILE_ATTRIBUTE_HIDDEN
+        )
+    return entry.name.startswith('.')
+
+
+def scan_directory(path):
+    """
+    Reads the entries of the directory, skipping the ones which can not be
+    stat'ed (e.g. broken links).
+
+    :returns: list of DirEntry
+    """
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                # Follows the links, like os.path.isdir() and os.stat().
+                stat = entry.stat()
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            entries.append(DirEntry(
+                name=entry.name,
+                path=entry.path,
+                is_dir=is_dir,
+                hidden=_is_hidden(entry, stat),
+                extension='dir' if is_dir else splitext(entry.name),
+                size=stat.st_size,
+                created=stat.st_ctime,
+                modified=stat.st_mtime,
+                sort_key=natural_key(entry.name)
+            ))
+    return entries
+
+
+class DirectoryCache(object):
+    """
+    Caches the entries of the recently listed directories.
+    """
+
+    def __init__(self, max_size=MAX_CACHED_DIRECTORIES):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # {path: (modification time of the directory, read time, entries)}
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def get_entries(self, path):
+        """
+        Returns the entries of the directory, reading it only if the cached
+        listing is missing, stale, or the directory has changed since.
+        """
+        key = self._key(path)
+        timeout = getattr(config, 'FILE_MANAGER_LISTING_CACHE_TIMEOUT', 0)
+        dir_mtime = os.stat(path).st_mtime_ns
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == dir_mtime and \
+                    time.time() - cached[1] < timeout:
+                self._cache.move_to_end(key)
+                return cached[2]
+
+        read_time = time.time()
+        entries = scan_directory(path)
+
+        if timeout > 0:
+            with self._lock:
+                self._cache[key] = (dir_mtime, read_time, entries)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._max_size:
+                    self._cache.popitem(last=False)
+
+        return entries
+
+    def invalidate(self, path):
+        """
+        Drops the listing of the directory, and of the directory containing
+        it, after it has been changed.
+        """
+        key = self._key(path)
+        with self._lock:
+            self._cache.pop(key, None)
+            self._cache.pop(os.path.dirname(key), None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+directory_cache = DirectoryCache()
+
+
+def list_directory(path, show_hidden=False, entry_filter=None,
+                   name_filter=None, sort_by='name', sort_order='asc',
+                   offset=0, limit=None):
+    """
+    Lists a page of the entries of the directory.
+
+    :param path: directory to list
+    :param show_hidden: include the hidden entries
+    :param entry_filter: function returning False for the DirEntry to skip
+    :param name_filter: only include the names containing this text,
+                        ignoring the case
+    :param sort_by: one of SORT_KEYS
+    :param sort_order: 'asc' or 'desc'
+    :param offset: number of the entries to skip
+    :param limit: maximum number of the entries to return, None for all
+    :returns: (list of DirEntry in the page, number of the matching entries)
+    """
+    entries = directory_cache.get_entries(path)
+
+    if not show_hidden:
+        entries = [e for e in entries if not e.hidden]
+    if entry_filter is not None:
+        entries = [e for e in entries if entry_filter(e)]
+    if name_filter:
+        name_filter = name_filter.lower()
+        entries = [e for e in entries if name_filter in e.name.lower()]
+
+    attr = SORT_KEYS.get(sort_by, None)
+    if attr is None:
+        def sort_key(e):
+            return e.sort_key
+    else:
+        def sort_key(e):
+            return getattr(e, attr), e.sort_key
+
+    entries = sorted(entries, key=sort_key, reverse=(sort_order == 'desc'))
+
+    total = len(entries)
+    offset = max(int(offset or 0), 0)
+    if limit is None:
+        return entries[offset:], total
+    return entries[offset:offset + max(int(limit), 0)], total
+
+
+def is_protected(entry):
+    """
+    Returns 1 if the entry can not be read or written, 0 otherwise.
+    """
+    return 0 if os.access(entry.path, os.R_OK) and \
+        os.access(entry.path, os.W_OK) else 1
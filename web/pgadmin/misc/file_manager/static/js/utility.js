@@ -33,6 +33,21 @@ define([
   // Set the CSRF Token
   csrf.setPGCSRFToken(pgAdmin.csrf_token_header, pgAdmin.csrf_token);
 
+  // Number of the files and folders listed at once, the next ones are
+  // listed on demand.
+  var FILE_LISTING_PAGE_SIZE = 1000;
+
+  // Order and name filter of the files and folders, which are applied by the
+  // server as it lists one page of them at once. Columns of the list view
+  // are in the order of SORT_COLUMNS.
+  var SORT_COLUMNS = ['name', 'size', 'modified'];
+  var listing_options = {
+    'path': null,
+    'sort_by': 'name',
+    'sort_order': 'asc',
+    'name_filter': '',
+  };
+
   // Return file extension
   var getFileExtension = function(name) {
     var found = name.lastIndexOf('.') + 1;
@@ -676,9 +691,10 @@ define([
 
   /*
    * Retrieves data for all items within the given folder and
-   * creates a list view.
+   * creates a list view. The loaded listing is given to list the next page
+   * after its items.
    */
-  var getFolderInfo = function(path, file_type, user_input) {
+  var getFolderInfo = function(path, file_type, user_input, loaded) {
     $('.storage_dialog #uploader .input-path').prop('disabled', true);
     if (!file_type) {
       file_type = '';
@@ -727,11 +743,23 @@ define([
       '<img src="' + loading_icon_url + '" alt="' + gettext('Loading...') + '/>'
     );
 
+    // Name filter applies to the folder it was entered for.
+    if (listing_options.path !== path) {
+      listing_options.path = path;
+      listing_options.name_filter = '';
+      $('.allowed_file_types .fm_name_filter').val('');
+    }
+
     var post_data = {
       'path': path,
       'mode': 'getfolder',
       'file_type': file_type || '*',
       'show_hidden': $('#show_hidden').prop('checked'),
+      'offset': loaded ? Object.keys(loaded).length : 0,
+      'limit': FILE_LISTING_PAGE_SIZE,
+      'sort_by': listing_options.sort_by,
+      'sort_order': listing_options.sort_order,
+      'name_filter': listing_options.name_filter,
     };
 
     $.ajax({
@@ -754,6 +782,11 @@ define([
           return;
         }
 
+        // The server returns a page of the files and folders in the
+        // listing order, along with the number of all of them.
+        var total = data.total;
+        data = _.extend({}, loaded, data.files);
+
         var $this, orig_value, newvalue;
 
         // generate HTML for files/folder and render into container
@@ -767,9 +800,27 @@ define([
         // Add the new markup to the DOM.
         $('.fileinfo .file_listing').html(result);
 
+        let listed = Object.keys(data).length;
+        if (total > listed) {
+          $('.fileinfo .file_listing').append(
+            `<div class="fm_load_more p-2">
+              ${_.escape(gettext('Showing %s of %s items.', listed, total))}
+              <a href="#" class="fm_load_more_link" tabindex="0">${gettext('Load more')}</a>
+            </div>`
+          );
+          $('.fileinfo .file_listing .fm_load_more_link').on('click', function(e) {
+            e.preventDefault();
+            getFolderInfo(path, file_type, null, data);
+          });
+        }
+
         let $listing_table = $('.fileinfo .file_listing .file_listing_table');
 
         $listing_table.tablesorter({
+          sortList: [[
+            SORT_COLUMNS.indexOf(listing_options.sort_by),
+            listing_options.sort_order == 'desc' ? 1 : 0,
+          ]],
           widgets: [ 'resizable', 'stickyHeaders' ],
           widgetOptions : {
             stickyHeaders_attachTo:'.file_listing',
@@ -778,6 +829,24 @@ define([
           },
         });
 
+        // Only the loaded items are sorted here, the first ones in the new
+        // order are listed again if there are more.
+        $listing_table.on('sortEnd', function() {
+          let sort = this.config.sortList[0];
+          if (!sort || (
+            SORT_COLUMNS[sort[0]] == listing_options.sort_by &&
+            (sort[1] ? 'desc' : 'asc') == listing_options.sort_order
+          )) {
+            return;
+          }
+
+          listing_options.sort_by = SORT_COLUMNS[sort[0]];
+          listing_options.sort_order = sort[1] ? 'desc' : 'asc';
+          if (total > listed) {
+            getFolderInfo(path, file_type);
+          }
+        });
+
         /* In order to fit our UI, some things need to be explicitly set
          * as tablesorter resizable is creating trouble.
          */
@@ -1252,58 +1321,20 @@ define([
       is_protected == undefined;
   };
 
-  // Download selected file
+  // Download selected file. The browser downloads it by itself, instead of
+  // holding the whole file in the memory, and can resume an interrupted
+  // download with a range request.
   var download_file = function (path) {
-
-    var data = { 'path': path, 'mode': 'download' },
-      params = {};
-
-    params[pgAdmin.csrf_token_header] = pgAdmin.csrf_token;
-
-    $.ajax({
-      type: 'POST',
-      url: pgAdmin.FileUtils.fileConnector,
-      contentType: false,
-      headers: params,
-      xhrFields: {
-        responseType: 'blob',
-      },
-      cache: false,
-      data: JSON.stringify(data),
-      success: function (blob, status, xhr) {
-        // check for a filename
-        var filename = xhr.getResponseHeader('filename');
-
-        if (typeof window.navigator.msSaveBlob !== 'undefined') {
-          // IE workaround for "HTML7007: One or more blob URLs were revoked by closing the blob for which they were created. These URLs will no longer resolve as the data backing the URL has been freed."
-          window.navigator.msSaveBlob(blob, filename);
-        } else {
-          var URL = window.URL || window.webkitURL;
-          var downloadUrl = URL.createObjectURL(blob);
-
-          if (filename) {
-            // use HTML5 a[download] attribute to specify filename
-            var a = document.createElement('a');
-            // safari doesn't support this yet
-            if (typeof a.download === 'undefined') {
-              window.location.href = downloadUrl;
-            } else {
-              a.href = downloadUrl;
-              a.download = filename;
-              document.body.appendChild(a);
-              a.click();
-            }
-          } else {
-            window.location.href = downloadUrl;
-          }
-
-          setTimeout(function () { URL.revokeObjectURL(downloadUrl); }, 100); // cleanup
-        }
-      },
-      error: function (error) {
-        Notify.error(error);
-      },
+    var a = document.createElement('a');
+    a.href = pgAdmin.FileUtils.fileConnector + '?' + $.param({
+      'mode': 'download',
+      'path': path,
     });
+    a.download = '';
+    a.style.display = 'none';
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
   };
 
   /*---------------------------------------------------------
@@ -1404,6 +1435,7 @@ define([
             `<input  aria-label="Show hidden files and folders" type='checkbox' id='show_hidden' onclick='pgAdmin.FileUtils.handleClick(this)' tabindex='0'>
           </div>
           <div class="ml-auto">
+            <input aria-label="` + gettext('Filter') + `" type="search" class="fm_name_filter" placeholder="` + gettext('Filter') + `" tabindex="0">
             <label class="my-auto">` + gettext('Format') + `</label>
             <select aria-label="select" name='type' tabindex='0'>${fileFormats}</select>
           <div>`;
@@ -1411,6 +1443,12 @@ define([
 
         $('.allowed_file_types').html(select_box);
 
+        // List the files and folders with the name containing the filter.
+        $('.allowed_file_types .fm_name_filter').on('input', _.debounce(function() {
+          listing_options.name_filter = $(this).val();
+          getFolderInfo($('.currentpath').val(), $('.allowed_file_types select').val());
+        }, 500));
+
         $('.allowed_file_types select').on('change', function() {
           var selected_val = $(this).val(),
             curr_path = $('.currentpath').val(),
@@ -1757,6 +1795,13 @@ define([
               config.upload.fileSizeLimit + ' ' + lg.mb,
             acceptedFiles: acceptFiles,
             autoProcessQueue: true,
+            // Upload the files in chunks, one request each, sending a failed
+            // chunk again instead of starting over.
+            chunking: true,
+            chunkSize: config.upload.chunkSize,
+            parallelChunkUploads: false,
+            retryChunks: true,
+            retryChunksLimit: 3,
             init: function() {
               $('.dz_cross_btn').off().on('click', function() {
                 $('.file_manager .upload_file').toggleClass('d-none');
@@ -1786,6 +1831,20 @@ define([
               }
               getFolderInfo(path);
             },
+            // A failed upload, or a rejected chunk, is answered with an
+            // error status and the reason in the response.
+            error: function(file, response) {
+              var $this = $(file.previewTemplate),
+                message = response;
+
+              if (typeof response !== 'string' && response.errormsg) {
+                message = response.errormsg;
+              }
+              file.previewElement.classList.add('dz-error');
+              $this.find('[data-dz-errormessage]').text(message);
+              $this.find('.dz-upload').addClass('error');
+              $this.find('.dz-upload').css('width', '0%').html('0%');
+            },
             totaluploadprogress: function() {/*This is intentional (SonarQube)*/},
             complete: function(file) {
               if (file.status == 'error') {
@@ -0,0 +1,118 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.file_manager import listing
+
+
+class DirectoryListingTestCase(BaseTestGenerator):
+    """
+    This class validates the directory listing is sorted, filtered and paged
+    on the server.
+    """
+
+    scenarios = [
+        ('List all the entries sorted by name', dict(
+            kwargs=dict(),
+            expected=['a', 'b.sql', 'file2.sql', 'file10.backup', 'x.tar.gz'],
+            expected_total=5)),
+        ('List the hidden entries', dict(
+            kwargs=dict(show_hidden=True),
+            expected=['.hidden', 'a', 'b.sql', 'file2.sql', 'file10.backup',
+                      'x.tar.gz'],
+            expected_total=6)),
+        ('List a page', dict(
+            kwargs=dict(offset=1, limit=2),
+            expected=['b.sql', 'file2.sql'],
+            expected_total=5)),
+        ('List a page in the descending order', dict(
+            kwargs=dict(sort_order='desc', limit=2),
+            expected=['x.tar.gz', 'file10.backup'],
+            expected_total=5)),
+        ('List the entries sorted by size', dict(
+            kwargs=dict(sort_by='size', entry_filter=lambda e: not e.is_dir),
+            expected=['b.sql', 'file10.backup', 'x.tar.gz', 'file2.sql'],
+            expected_total=4)),
+        ('List the entries sorted by type', dict(
+            kwargs=dict(sort_by='type'),
+            expected=['file10.backup', 'a', 'b.sql', 'file2.sql', 'x.tar.gz'],
+            expected_total=5)),
+        ('List the entries matching the name filter', dict(
+            kwargs=dict(name_filter='FILE'),
+            expected=['file2.sql', 'file10.backup'],
+            expected_total=2)),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.dir, 'a'))
+        for name, size in (('b.sql', 1), ('file10.backup', 2),
+                           ('x.tar.gz', 3), ('file2.sql', 4),
+                           ('.hidden', 5)):
+            with open(os.path.join(self.dir, name), 'w') as f:
+                f.write('x' * size)
+        listing.directory_cache.clear()
+
+    def runTest(self):
+        entries, total = listing.list_directory(self.dir, **self.kwargs)
+        self.assertEqual([e.name for e in entries], self.expected)
+        self.assertEqual(total, self.expected_total)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+class DirectoryCacheTestCase(BaseTestGenerator):
+    """
+    This class validates the cached listing is used until it is invalidated.
+    """
+
+    scenarios = [
+        ('Cached listing is used', dict(
+            invalidate=False, timeout=60, expected=['a'])),
+        ('Invalidated listing is read again', dict(
+            invalidate=True, timeout=60, expected=['a', 'b'])),
+        ('Listing is not cached without the timeout', dict(
+            invalidate=False, timeout=0, expected=['a', 'b'])),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        open(os.path.join(self.dir, 'a'), 'w').close()
+
+    def runTest(self):
+        cache = listing.DirectoryCache()
+
+        with patch.object(config, 'FILE_MANAGER_LISTING_CACHE_TIMEOUT',
+                          self.timeout, create=True):
+            cache.get_entries(self.dir)
+
+            # Keep the modification time of the directory, to check the
+            # invalidation on its own.
+            stat = os.stat(self.dir)
+            new_file = os.path.join(self.dir, 'b')
+            open(new_file, 'w').close()
+            os.utime(self.dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            if self.invalidate:
+                cache.invalidate(new_file)
+
+            self.assertEqual(
+                sorted(e.name for e in cache.get_entries(self.dir)),
+                self.expected
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
@@ -0,0 +1,121 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import io
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.file_manager import Filemanager
+
+CONTENT = b'0123456789' * 10
+
+
+class UploadChunksTestCase(BaseTestGenerator):
+    """
+    This class validates the chunks of an upload are assembled into the
+    uploaded file.
+    """
+
+    scenarios = [
+        ('Upload the chunks in order', dict(
+            chunks=[0, 1, 2, 3], expected_complete=True)),
+        ('Upload a failed chunk again', dict(
+            chunks=[0, 1, 1, 2, 3], expected_complete=True)),
+        ('Upload in a single chunk', dict(
+            chunks=[0], chunk_size=len(CONTENT), expected_complete=True)),
+        ('Upload with a missing chunk', dict(
+            chunks=[0, 2], expected_complete=False)),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.new_name = os.path.join(self.dir, 'dump.sql')
+
+    def runTest(self):
+        chunk_size = getattr(self, 'chunk_size', 30)
+        count = (len(CONTENT) + chunk_size - 1) // chunk_size
+
+        complete = False
+        try:
+            for index in self.chunks:
+                offset = index * chunk_size
+                complete = Filemanager._save_upload_chunk(
+                    io.BytesIO(CONTENT[offset:offset + chunk_size]),
+                    self.new_name, (index, count, offset, len(CONTENT))
+                )
+        except ValueError:
+            complete = False
+
+        self.assertEqual(complete, self.expected_complete)
+        if self.expected_complete:
+            with open(self.new_name, 'rb') as f:
+                self.assertEqual(f.read(), CONTENT)
+            # The partial file is moved in place of the uploaded file.
+            self.assertEqual(os.listdir(self.dir), ['dump.sql'])
+        else:
+            self.assertFalse(os.path.exists(self.new_name))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+class UploadStatusTestCase(BaseTestGenerator):
+    """
+    This class validates a failed upload, or a rejected chunk, is answered
+    with an error status.
+    """
+
+    scenarios = [
+        ('Upload a file', dict(
+            form=dict(), allowed=True, expected_status=200)),
+        ('Upload a chunk', dict(
+            form=dict(dzchunkindex=0, dztotalchunkcount=2,
+                      dzchunkbyteoffset=0, dztotalfilesize=len(CONTENT)),
+            allowed=True, expected_status=200)),
+        ('Upload an invalid chunk', dict(
+            form=dict(dzchunkindex=2, dztotalchunkcount=2,
+                      dzchunkbyteoffset=0, dztotalfilesize=len(CONTENT)),
+            allowed=True, expected_status=400)),
+        ('Upload a chunk after a missing chunk', dict(
+            form=dict(dzchunkindex=1, dztotalchunkcount=2,
+                      dzchunkbyteoffset=50, dztotalfilesize=len(CONTENT)),
+            allowed=True, expected_status=400)),
+        ('Upload without the upload capability', dict(
+            form=dict(), allowed=False, expected_status=403)),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def runTest(self):
+        fm = Filemanager.__new__(Filemanager)
+        fm.trans_id = 0
+        fm.dir = self.dir
+
+        form = dict((k, str(v)) for k, v in self.form.items())
+        form['currentpath'] = '/'
+        file_obj = io.BytesIO(CONTENT[:50])
+        file_obj.filename = 'dump.sql'
+        req = SimpleNamespace(form=form, files={'newfile': file_obj})
+
+        with patch.object(config, 'SERVER_MODE', False), \
+                patch.object(Filemanager, 'validate_request',
+                             return_value=self.allowed):
+            res, status = fm.add(req=req)
+
+        self.assertEqual(status, self.expected_status)
+        self.assertEqual(res['Code'], 1 if status == 200 else 0)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
@@ -30,7 +30,7 @@ import uuid
 #
 ##########################################################################
 
-SCHEMA_VERSION = 33
+SCHEMA_VERSION = 34
 
 ##########################################################################
 #
@@ -314,7 +314,8 @@ class Process(db.Model):
     user_id = db.Column(
         db.Integer,
         db.ForeignKey(USER_ID),
-        nullable=False
+        nullable=False,
+        index=True
     )
     command = db.Column(db.String(), nullable=False)
     desc = db.Column(db.String(), nullable=False)
@@ -22,6 +22,7 @@ from pgadmin.utils.ajax import success_return, \
     make_response as ajax_response, internal_server_error
 from pgadmin.utils.menu import MenuItem
 from pgadmin.utils.preferences import Preferences
+from pgadmin.utils.driver import get_driver
 from pgadmin.utils.constants import MIMETYPE_APP_JS
 from pgadmin.browser.server_groups import ServerGroupModule as sgm
 
@@ -231,6 +232,10 @@ def save():
         if not res:
             return internal_server_error(errormsg=msg)
 
+        # Browser tree nodes depend on the preferences, i.e. show system
+        # objects, so cached nodes can not be used anymore.
+        get_driver(config.PG_DEFAULT_DRIVER).invalidate_nodes_cache()
+
         response = success_return()
 
         # Set cookie & session for language settings.
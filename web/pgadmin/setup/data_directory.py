@@ -112,6 +112,16 @@ def create_app_data_directory(config):
                 config.APP_VERSION))
         exit(1)
 
+    # Create the compiled templates cache directory (if not present).
+    # pgAdmin works without the cache, so don't fail if it can't be created.
+    try:
+        if _create_directory_if_not_exists(config.TEMPLATE_CACHE_PATH) and \
+                os.name != 'nt':
+            os.chmod(config.TEMPLATE_CACHE_PATH, 0o700)
+    except PermissionError as e:
+        print(FAILED_CREATE_DIR.format(config.TEMPLATE_CACHE_PATH, e))
+        print("HINT   : The compiled templates will not be cached.")
+
     # Create Kerberos Credential Cache directory (if not present).
     if config.SERVER_MODE and KERBEROS in config.AUTHENTICATION_SOURCES:
         try:
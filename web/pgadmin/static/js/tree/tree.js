@@ -89,7 +89,18 @@ export class Tree {
     if(item.children?.length == 0) {
       item._children = null;
     }
-    await this.tree.refresh(item);
+    // Explicit refresh must not use the nodes cached by the server.
+    let node = findInTree(this.rootNode, item.path);
+    if(node) {
+      node.refresh = true;
+    }
+    try {
+      await this.tree.refresh(item);
+    } finally {
+      if(node) {
+        node.refresh = false;
+      }
+    }
   }
 
   async add(item, data) {
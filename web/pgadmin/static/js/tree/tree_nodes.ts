@@ -16,10 +16,35 @@ import { findInTree } from './tree';
 
 import { unix } from 'path-fx';
 
+// Milliseconds, after which the nodes fetched in a batch are fetched again.
+const BATCH_NODES_MAX_AGE = 60000;
+
+async function jsonData(fetch_url) {
+  let result = await fetch(fetch_url, {
+    headers: {
+      'X-Requested-With': 'XMLHttpRequest',
+      'X-pgA-CSRFToken': pgAdmin.csrf_token
+    },
+  });
+
+  if (result.status == 200) {
+    try {
+      let json = await result.json();
+      return json.data;
+    } catch (e) {
+      console.warn(e);
+    }
+  }
+  throw new Error("Node Load Error...");
+}
+
 export class ManageTreeNodes {
   constructor(fs) {
     this.tree = {}
 	this.tempTree = new TreeNode(undefined, {});
+    // Nodes of the collections fetched in one batch along with their
+    // siblings, by the URL of the nodes of the collection.
+    this.batchNodes = {};
   }
 
   public init = (_root: string) => new Promise((res, rej) => {
@@ -88,7 +113,8 @@ export class ManageTreeNodes {
     var self = this;
 
     async function loadData() {
-      let url = '';
+      let url = '',
+        batch_nodes = null;
       if (_path == '/browser') {
         url = url_for('browser.nodes');
       } else {
@@ -100,6 +126,11 @@ export class ManageTreeNodes {
           if (node.metadata.data._type.includes("coll-")) {
             let _type = node.metadata.data._type.replace("coll-", "")
             url = _type + '/nodes/' + _parent_url + '/';
+            let batch = self.batchNodes[base_url + url];
+            delete self.batchNodes[base_url + url];
+            if (batch && Date.now() - batch.time < BATCH_NODES_MAX_AGE) {
+              batch_nodes = batch.nodes;
+            }
           }
           else {
             url = node.metadata.data._type + '/children/' + _parent_url + '/' + node.metadata.data._id;
@@ -107,6 +138,9 @@ export class ManageTreeNodes {
         }
 
         url = base_url + url;
+        if (node.refresh) {
+          url += '?refresh=true';
+        }
 
         temp_tree_path = node.path;
 
@@ -115,38 +149,23 @@ export class ManageTreeNodes {
         }
       }
 
-      async function jsonData(fetch_url) {
-        let result = await fetch(fetch_url, {
-          headers: {
-            'X-Requested-With': 'XMLHttpRequest',
-            'X-pgA-CSRFToken': pgAdmin.csrf_token
-          },
-        });
-
-        if (result.status == 200) {
-          try {
-            let json = await result.json();
-            return json.data;
-          } catch (e) {
-            console.warn(e);
-          }
-        }
-        throw new Error("Node Load Error...");
-      }
-
       let treeData = null;
-      if (url) treeData = await jsonData(url);
+      if (batch_nodes && !node.refresh) treeData = await batch_nodes;
+      if (!treeData && url) treeData = await jsonData(url);
 
       const Path = BrowserFS.BFSRequire('path')
+      let collections = [];
       const fill = async (tree) => {
         for (let idx in tree) {
           const _node = tree[idx]
           const _pathl = Path.join(_path, _node.id)
-          await self.addNode(temp_tree_path, _pathl, _node);
+          let treeNode = await self.addNode(temp_tree_path, _pathl, _node);
+          if (_node.is_collection) collections.push(treeNode);
         }
       }
 
       await fill(treeData);
+      if (collections.length > 1) self.fetchBatchNodes(collections);
       if (node.children.length > 0) res(node.children);
       else res(null);
 
@@ -154,6 +173,35 @@ export class ManageTreeNodes {
     loadData();
   })
 
+  /*
+   * Fetch the nodes of all the collections of a node in one request, which
+   * are used when the collections are expanded.
+   */
+  public fetchBatchNodes = (collections) => {
+    let now = Date.now(),
+      base_url = pgAdmin.Browser.URL,
+      parent_url = this.generate_url(collections[0].path),
+      types = collections.map((coll) => coll.metadata.data._type.replace('coll-', '')),
+      batch = jsonData(
+        base_url + 'batch_nodes/' + parent_url + '/?types=' + types.join(',')
+      ).catch(() => null);
+
+    for (let url in this.batchNodes) {
+      if (now - this.batchNodes[url].time >= BATCH_NODES_MAX_AGE) {
+        delete this.batchNodes[url];
+      }
+    }
+
+    for (let type of types) {
+      this.batchNodes[base_url + type + '/nodes/' + parent_url + '/'] = {
+        time: now,
+        nodes: batch.then(
+          (data) => (data && data[type]) ? data[type].nodes : null
+        ),
+      };
+    }
+  }
+
   public generate_url = (path: string) => {
     let _path = path;
     let _parent_path = [];
@@ -23,6 +23,7 @@ from pgadmin.utils import PgAdminModule, get_storage_directory, html, \
     fs_short_path, document_dir, does_utility_exist, get_server
 from pgadmin.utils.ajax import make_json_response, bad_request
 
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.model import Server, SharedServer
 from pgadmin.misc.bgprocess import escape_dquotes_process_arg
@@ -83,6 +84,7 @@ class BACKUP(object):
     GLOBALS = 1
     SERVER = 2
     OBJECT = 3
+    DATABASES = 4
 
 
 class BackupMessage(IProcessDesc):
@@ -97,6 +99,7 @@ class BackupMessage(IProcessDesc):
         self.sid = _sid
         self.bfile = _bfile
         self.database = _kwargs['database'] if 'database' in _kwargs else None
+        self.utility = _kwargs['utility'] if 'utility' in _kwargs else None
         self.cmd = ''
         self.args_str = "{0} ({1}:{2})"
 
@@ -134,6 +137,8 @@ class BackupMessage(IProcessDesc):
             return _("Backing up the global objects")
         elif self.backup_type == BACKUP.SERVER:
             return _("Backing up the server")
+        elif self.backup_type == BACKUP.DATABASES:
+            return _("Backing up all the databases")
         else:
             # It should never reach here.
             return _("Unknown Backup")
@@ -165,6 +170,13 @@ class BackupMessage(IProcessDesc):
                     name, host, port
                 )
             )
+        elif self.backup_type == BACKUP.DATABASES:
+            return _("Backing up all the databases on the server "
+                     "'{0}'").format(
+                self.args_str.format(
+                    name, host, port
+                )
+            )
         else:
             # It should never reach here.
             return "Unknown Backup"
@@ -200,6 +212,14 @@ class BackupMessage(IProcessDesc):
                 )
             )
             res += html.safe_str(msg)
+        elif self.backup_type == BACKUP.DATABASES:
+            msg = _("Backing up all the databases on the server "
+                    "'{0}'...").format(
+                self.args_str.format(
+                    name, host, port
+                )
+            )
+            res += html.safe_str(msg)
         else:
             # It should never reach here.
             res += "Backup"
@@ -207,7 +227,11 @@ class BackupMessage(IProcessDesc):
         res += '</div><div class="py-1">'
         res += _("Running command:")
         res += '<div class="pg-bg-cmd enable-selection p-1">'
-        res += html.safe_str(cmd + self.cmd)
+        # The databases are backed up by a helper script, show the pg_dump
+        # command run for each of them.
+        res += html.safe_str(
+            (getattr(self, 'utility', None) or cmd) + self.cmd
+        )
         res += '</div></div>'
 
         return res
@@ -385,6 +409,66 @@ def _get_args_params_values(data, conn, backup_obj_type, backup_file, server,
     return args
 
 
+def _get_databases_job_args(data, conn, backup_dir, server, manager,
+                            pg_dump, pg_dumpall):
+    """
+    Used internally by create_backup_objects_job. This function will create
+    the args of the helper script, backing up the globals and every database
+    of the server in parallel.
+    :param data: input data
+    :param conn: connection obj
+    :param backup_dir: directory to back up into
+    :param server: server obj
+    :param manager: connection manager
+    :param pg_dump: path of pg_dump
+    :param pg_dumpall: path of pg_dumpall
+    :return: (script args, pg_dump args)
+    """
+    status, res = conn.execute_2darray(
+        "SELECT datname FROM pg_catalog.pg_database "
+        "WHERE datallowconn AND NOT datistemplate ORDER BY datname"
+    )
+    if not status:
+        raise Exception(res)
+
+    # Every database is backed up into its own file, named by the script.
+    pg_dump_args = _get_args_params_values(
+        data, conn, 'objects', backup_dir, server, manager)[2:]
+
+    # Only the connection options apply to pg_dumpall --globals-only.
+    globals_args = pg_dump_args[:pg_dump_args.index('--no-password') + 1]
+    globals_args.extend(
+        ['--database', server.maintenance_db, '--globals-only']
+    )
+    if data.get('verbose', None):
+        globals_args.append('--verbose')
+    if data.get('role', None):
+        globals_args.extend(['--role', data['role']])
+
+    args = [
+        os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), 'parallel_backup.py'
+        ),
+        '--pg-dump=' + pg_dump,
+        '--pg-dumpall=' + pg_dumpall,
+        '--jobs=' + str(config.BACKUP_PARALLEL_DATABASES),
+        '--directory=' + backup_dir,
+        '--extension=' + {
+            'custom': 'backup',
+            'tar': 'tar',
+            'plain': 'sql',
+            'directory': ''
+        }[data.get('format', 'custom')]
+    ]
+    # The values start with a dash, hence they must be joined with the option.
+    args.extend('--globals=' + arg for arg in globals_args)
+    args.extend('--database=' + row['datname'] for row in res['rows'])
+    args.append('--')
+    args.extend(pg_dump_args)
+
+    return args, pg_dump_args
+
+
 @blueprint.route(
     '/job/<int:sid>', methods=['POST'], endpoint='create_server_job'
 )
@@ -398,7 +482,8 @@ def create_backup_objects_job(sid):
         sid: Server ID
 
         Creates a new job for backup task
-        (Backup Database(s)/Schema(s)/Table(s))
+        (Backup Database(s)/Schema(s)/Table(s), or all the databases of the
+        server)
 
     Returns:
         None
@@ -409,7 +494,8 @@ def create_backup_objects_job(sid):
 
     try:
         backup_file = filename_with_file_manager_path(
-            data['file'], (data.get('format', '') != 'directory'))
+            data['file'], (data.get('format', '') != 'directory' and
+                           backup_obj_type != 'databases'))
     except Exception as e:
         return bad_request(errormsg=str(e))
 
@@ -439,14 +525,28 @@ def create_backup_objects_job(sid):
         else manager.utility('backup_server')
 
     ret_val = does_utility_exist(utility)
+    if not ret_val and backup_obj_type == 'databases':
+        ret_val = does_utility_exist(manager.utility('backup'))
     if ret_val:
         return make_json_response(
             success=0,
             errormsg=ret_val
         )
 
-    args = _get_args_params_values(
-        data, conn, backup_obj_type, backup_file, server, manager)
+    try:
+        if backup_obj_type == 'databases':
+            args, pg_dump_args = _get_databases_job_args(
+                data, conn, backup_file, server, manager,
+                manager.utility('backup'), utility)
+        else:
+            args = _get_args_params_values(
+                data, conn, backup_obj_type, backup_file, server, manager)
+    except Exception as e:
+        current_app.logger.exception(e)
+        return make_json_response(
+            success=0,
+            errormsg=str(e)
+        )
 
     escaped_args = [
         escape_dquotes_process_arg(arg) for arg in args
@@ -454,7 +554,17 @@ def create_backup_objects_job(sid):
     try:
         bfile = data['file'].encode('utf-8') \
             if hasattr(data['file'], 'encode') else data['file']
-        if backup_obj_type == 'objects':
+        if backup_obj_type == 'databases':
+            p = BatchProcess(
+                desc=BackupMessage(
+                    BACKUP.DATABASES, server.id, bfile,
+                    *pg_dump_args,
+                    utility=manager.utility('backup')
+                ),
+                cmd=BatchProcess.get_python_interpreter(),
+                args=escaped_args
+            )
+        elif backup_obj_type == 'objects':
             args.append(data['database'])
             escaped_args.append(data['database'])
             p = BatchProcess(
@@ -532,6 +642,8 @@ def check_utility_exists(sid, backup_obj_type):
         else manager.utility('backup_server')
 
     ret_val = does_utility_exist(utility)
+    if not ret_val and backup_obj_type == 'databases':
+        ret_val = does_utility_exist(manager.utility('backup'))
     if ret_val:
         return make_json_response(
             success=0,
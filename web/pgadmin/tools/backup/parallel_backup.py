@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL License
+#
+##########################################################################
+
+"""
+This python script backs up all the given databases of a server in parallel.
+
+It is run by the process executor as a single background process, and runs
+pg_dumpall --globals-only, and then pg_dump for every database, running at
+most the given number of pg_dump at the same time. The output of the
+utilities is forwarded with the name of the database, and the progress of
+the whole backup is reported on the standard output.
+
+This script executes separately from pgadmin, hence it must not depend on
+anything but the standard library.
+
+Usage:
+  parallel_backup.py --pg-dump=<path> --pg-dumpall=<path> --jobs=<n>
+                     --directory=<path> --extension=<ext>
+                     [--globals=<pg_dumpall argument>]...
+                     --database=<name> [--database=<name>]...
+                     -- <pg_dump arguments>
+
+The values must be given in the --option=value form, as the arguments of
+pg_dumpall start with a dash themselves.
+"""
+
+import argparse
+import os
+import re
+import signal
+import sys
+from subprocess import Popen, PIPE, DEVNULL
+from threading import Thread, Lock, Semaphore, Event
+
+_output_lock = Lock()
+_processes = dict()
+_processes_lock = Lock()
+_terminated = False
+_terminate_event = Event()
+
+
+def _print(stream, msg):
+    with _output_lock:
+        stream.write(msg + '\n')
+        stream.flush()
+
+
+def get_backup_file(directory, database, extension, used):
+    """
+    This function will return the path of the backup of the database, the
+    name of the database is used as the file name, as far as the file system
+    allows it.
+    """
+    name = re.sub(r'[^\w.-]', '_', database).lstrip('.') or 'database'
+    file_name = name
+    count = 1
+    while file_name.lower() in used:
+        count += 1
+        file_name = '{0}_{1}'.format(name, count)
+    used.add(file_name.lower())
+
+    if extension:
+        file_name = '{0}.{1}'.format(file_name, extension)
+    return os.path.join(directory, file_name)
+
+
+def _run(name, cmd):
+    """
+    This function will run the utility, and forward its output prefixed
+    with the name.
+
+    Returns:
+        exit code of the utility
+    """
+    with _processes_lock:
+        if _terminated:
+            return -1
+        process = Popen(cmd, stdout=DEVNULL, stderr=PIPE, stdin=DEVNULL)
+        _processes[name] = process
+
+    for line in iter(process.stderr.readline, b''):
+        _print(sys.stderr, '[{0}] {1}'.format(
+            name, line.decode('utf-8', 'replace').rstrip('\r\n')
+        ))
+
+    exit_code = process.wait()
+    with _processes_lock:
+        _processes.pop(name, None)
+    return exit_code
+
+
+def backup_databases(args, pg_dump_args):
+    """
+    This function will back up the globals, and all the databases.
+
+    Returns:
+        number of the failed backups
+    """
+    databases = args.database or []
+    total = len(databases) + (1 if args.globals else 0)
+    done = []
+    failed = []
+    slots = Semaphore(max(1, args.jobs))
+
+    def report(name, exit_code):
+        with _output_lock:
+            done.append(name)
+            if exit_code != 0:
+                failed.append(name)
+        _print(sys.stdout, 'Progress: {0}/{1} done, {2} failed - '
+                           '{3} {4}'.format(
+                               len(done), total, len(failed), name,
+                               'completed' if exit_code == 0 else
+                               'failed (exit code: {0})'.format(exit_code)))
+
+    if args.globals:
+        globals_file = os.path.join(args.directory, 'globals.sql')
+        report('globals', _run('globals', [
+            args.pg_dumpall, '--file', globals_file
+        ] + args.globals))
+
+    used = set(['globals'])
+
+    def backup(database, backup_file):
+        try:
+            report(database, _run(database, [
+                args.pg_dump, '--file', backup_file
+            ] + pg_dump_args + [database]))
+        finally:
+            slots.release()
+
+    threads = []
+    for database in databases:
+        slots.acquire()
+        thread = Thread(target=backup, args=(
+            database, get_backup_file(
+                args.directory, database, args.extension, used
+            )
+        ))
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    if failed:
+        _print(sys.stdout, 'Failed to back up: {0}'.format(', '.join(failed)))
+    return len(failed)
+
+
+def _terminate_processes():
+    """
+    This function will stop all the running utilities, once the backup has
+    been stopped by the user.
+    """
+    _terminate_event.wait()
+
+    with _processes_lock:
+        for process in _processes.values():
+            try:
+                process.terminate()
+            except OSError:
+                pass
+
+
+def terminate(signum, frame):
+    """
+    This function is the handler of SIGTERM, which is sent when the backup
+    is stopped by the user.
+
+    The handler runs in the main thread, which may be holding the lock of
+    the running utilities, hence it must not take it. It only flags the
+    termination, so that no more utility is started, and the running ones
+    are stopped by the _terminate_processes thread.
+    """
+    global _terminated
+
+    _terminated = True
+    _terminate_event.set()
+
+
+def main(argv):
+    if '--' in argv:
+        pg_dump_args = argv[argv.index('--') + 1:]
+        argv = argv[:argv.index('--')]
+    else:
+        pg_dump_args = []
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pg-dump', required=True)
+    parser.add_argument('--pg-dumpall', required=True)
+    parser.add_argument('--jobs', type=int, default=1)
+    parser.add_argument('--directory', required=True)
+    parser.add_argument('--extension', default='')
+    parser.add_argument('--globals', action='append')
+    parser.add_argument('--database', action='append')
+    args = parser.parse_args(argv)
+
+    Thread(target=_terminate_processes, daemon=True).start()
+    signal.signal(signal.SIGTERM, terminate)
+
+    if not os.path.exists(args.directory):
+        os.makedirs(args.directory)
+
+    return 1 if backup_databases(args, pg_dump_args) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
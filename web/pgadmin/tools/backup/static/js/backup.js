@@ -79,6 +79,18 @@ define([
         data: {
           data_disabled: gettext('Please select any server from the browser tree to take Server Backup.'),
         },
+      }, {
+        name: 'backup_databases',
+        module: this,
+        applies: ['tools'],
+        callback: 'startBackupDatabases',
+        priority: 3,
+        label: gettext('Backup Databases...'),
+        icon: 'fa fa-save',
+        enable: menuUtils.menuEnabledServer,
+        data: {
+          data_disabled: gettext('Please select any server from the browser tree to take Backup of all the databases.'),
+        },
       }, {
         name: 'backup_global_ctx',
         module: this,
@@ -105,6 +117,19 @@ define([
         data: {
           data_disabled: gettext('Please select any server from the browser tree to take Server Backup.'),
         },
+      }, {
+        name: 'backup_databases_ctx',
+        module: this,
+        node: 'server',
+        applies: ['context'],
+        callback: 'startBackupDatabases',
+        priority: 3,
+        label: gettext('Backup Databases...'),
+        icon: 'fa fa-save',
+        enable: menuUtils.menuEnabledServer,
+        data: {
+          data_disabled: gettext('Please select any server from the browser tree to take Backup of all the databases.'),
+        },
       }, {
         name: 'backup_object',
         module: this,
@@ -174,6 +199,25 @@ define([
       var extraData = this.setExtraParameters(typeOfDialog);
       this.showBackupDialog(schema, treeItem, j, data, panel, typeOfDialog, serverIdentifier, extraData);
     },
+    // Backs up every database of the server into its own file, several at
+    // a time, along with the global objects.
+    startBackupDatabases: function(action, treeItem) {
+      pgBrowser.Node.registerUtilityPanel();
+      var panel = pgBrowser.Node.addUtilityPanel(pgBrowser.stdW.md, pgBrowser.stdH.lg);
+      var tree = pgBrowser.tree,
+        i = treeItem || tree.selected(),
+        data = i ? tree.itemData(i) : undefined,
+        j = panel.$container.find('.obj_properties').first();
+
+      var schema = this.getUISchema(treeItem, 'databases');
+      panel.title(gettext('Backup Databases'));
+      panel.focus();
+      var typeOfDialog = 'databases';
+      var serverIdentifier = this.retrieveServerIdentifier();
+
+      var extraData = this.setExtraParameters(typeOfDialog);
+      this.showBackupDialog(schema, treeItem, j, data, panel, typeOfDialog, serverIdentifier, extraData);
+    },
     saveCallBack: function(data, dialog) {
       if(data.errormsg) {
         Notify.alert(
@@ -315,6 +359,8 @@ define([
         extraData['type'] = 'server';
       } else if(typeOfDialog === 'globals') {
         extraData['type'] = 'globals';
+      } else if(typeOfDialog === 'databases') {
+        extraData['type'] = 'databases';
       }
 
       return extraData;
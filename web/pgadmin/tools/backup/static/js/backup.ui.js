@@ -421,13 +421,14 @@ export default class BackupSchema extends BaseUISchema {
     var obj = this;
     return [{
       id: 'file',
-      label: gettext('Filename'),
+      label: obj.backupType === 'databases' ? gettext('Directory') : gettext('Filename'),
       type: 'file',
       disabled: false,
       controlProps: {
-        dialogType: 'create_file',
+        // Every database is backed up into its own file in the directory.
+        dialogType: obj.backupType === 'databases' ? 'select_folder' : 'create_file',
         supportedTypes: ['*', 'sql', 'backup'],
-        dialogTitle: 'Select file',
+        dialogTitle: obj.backupType === 'databases' ? 'Select folder' : 'Select file',
       },
       deps: ['format'],
     }, {
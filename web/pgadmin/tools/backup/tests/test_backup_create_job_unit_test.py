@@ -680,6 +680,30 @@ class BackupCreateJobTest(BaseTestGenerator):
              expected_cmd_opts=['--globals-only'],
              not_expected_cmd_opts=[],
              expected_exit_code=[0, None]
+         )),
+        ('When backup all the databases',
+         dict(
+             class_params=dict(
+                 sid=1,
+                 name='test_backup_server',
+                 port=5444,
+                 host='localhost',
+                 database='postgres',
+                 bfile='test_backup',
+                 username='postgres'
+             ),
+             params=dict(
+                 file='test_backup_databases_folder',
+                 format='custom',
+                 verbose=True,
+                 type='databases'
+             ),
+             url='/backup/job/{0}',
+             expected_cmd_opts=['--globals=--globals-only',
+                                '--database=postgres', '--extension=backup',
+                                '--verbose', '--format=c'],
+             not_expected_cmd_opts=['--file'],
+             expected_exit_code=[0, None]
          ))
     ]
 
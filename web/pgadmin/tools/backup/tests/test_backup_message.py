@@ -121,6 +121,37 @@ class BackupMessageTest(BaseTestGenerator):
                                   '--no-password --database "postgres"',
              expected_storage_dir=expected_storage_dir
 
+         )),
+        ('When backup all the databases',
+         dict(
+             class_params=dict(
+                 type=BACKUP.DATABASES,
+                 sid=1,
+                 name='test_backup_server',
+                 port=5444,
+                 host='localhost',
+                 database=None,
+                 utility=expected_storage_dir + pg_dump,
+                 bfile='/test_path/test_backup_dir',
+                 args=[
+                     '--host',
+                     'localhost',
+                     '--port',
+                     '5444',
+                     '--username',
+                     'postgres',
+                     '--no-password',
+                     '--format=c'
+                 ],
+                 cmd='/usr/bin/python'
+             ),
+             expected_msg="Backing up all the databases on the server "
+                          "'test_backup_server (localhost:5444)'",
+             expected_details_cmd='/test_path/pg_dump --host "localhost" '
+                                  '--port "5444" --username "postgres" '
+                                  '--no-password --format=c',
+             expected_storage_dir=expected_storage_dir
+
          ))
     ]
 
@@ -137,7 +168,8 @@ class BackupMessageTest(BaseTestGenerator):
             self.class_params['sid'],
             self.class_params['bfile'],
             *self.class_params['args'],
-            **{'database': self.class_params['database']}
+            **{'database': self.class_params['database'],
+               'utility': self.class_params.get('utility')}
         )
 
         get_storage_directory_mock.return_value = '/'
@@ -0,0 +1,152 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import signal
+import stat
+import sys
+import tempfile
+from subprocess import Popen, PIPE
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.backup import parallel_backup
+
+# Writes its arguments into the file given by --file, fails for the
+# database named 'broken', and does not finish for the databases named
+# 'slow...'.
+FAKE_UTILITY = """#!{0}
+import sys
+import time
+args = sys.argv[1:]
+with open(args[args.index('--file') + 1], 'w') as f:
+    f.write(' '.join(args))
+sys.stderr.write('dumping\\n')
+sys.stderr.flush()
+if args[-1].startswith('slow'):
+    time.sleep(60)
+sys.exit(1 if args[-1] == 'broken' else 0)
+"""
+
+
+class ParallelBackupFileTestCase(BaseTestGenerator):
+    """
+    This class validates the backup file names of the databases.
+    """
+
+    scenarios = [
+        ('Database name is the file name', dict(
+            databases=['postgres'], extension='backup',
+            expected=['postgres.backup'])),
+        ('Invalid characters are replaced', dict(
+            databases=['my db/1', '..hidden'], extension='sql',
+            expected=['my_db_1.sql', 'hidden.sql'])),
+        ('Duplicate file names are numbered', dict(
+            databases=['Test', 'test', 'te?st'], extension='',
+            expected=['Test', 'test_2', 'te_st'])),
+    ]
+
+    def runTest(self):
+        used = set(['globals'])
+        self.assertEqual(
+            [os.path.basename(parallel_backup.get_backup_file(
+                '/backup', database, self.extension, used
+            )) for database in self.databases],
+            self.expected
+        )
+
+
+class ParallelBackupTestCase(BaseTestGenerator):
+    """
+    This class validates the script backs up the globals and every database,
+    and reports the failed ones.
+    """
+
+    scenarios = [
+        ('Back up all the databases', dict(
+            databases=['db1', 'db2', 'db3'],
+            expected_files=['db1.backup', 'db2.backup', 'db3.backup',
+                            'globals.sql'],
+            expected_exit_code=0)),
+        ('Back up with a failed database', dict(
+            databases=['db1', 'broken'],
+            expected_files=['broken.backup', 'db1.backup', 'globals.sql'],
+            expected_exit_code=1)),
+    ]
+
+    def setUp(self):
+        if os.name == 'nt':
+            self.skipTest('The fake utility is a script run by its shebang.')
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.utility = os.path.join(self.tmp_dir, 'fake_utility')
+        with open(self.utility, 'w') as f:
+            f.write(FAKE_UTILITY.format(sys.executable))
+        os.chmod(self.utility, stat.S_IRWXU)
+        self.backup_dir = os.path.join(self.tmp_dir, 'backup')
+
+    def start_backup(self):
+        return Popen(
+            [sys.executable, parallel_backup.__file__,
+             '--pg-dump=' + self.utility,
+             '--pg-dumpall=' + self.utility,
+             '--jobs=2',
+             '--directory=' + self.backup_dir,
+             '--extension=backup',
+             '--globals=--globals-only'] +
+            ['--database=' + database for database in self.databases] +
+            ['--', '--format=c'],
+            stdout=PIPE, stderr=PIPE
+        )
+
+    def runTest(self):
+        process = self.start_backup()
+        out, err = process.communicate()
+
+        self.assertEqual(process.returncode, self.expected_exit_code)
+        self.assertEqual(sorted(os.listdir(self.backup_dir)),
+                         self.expected_files)
+
+        with open(os.path.join(self.backup_dir, 'db1.backup')) as f:
+            self.assertEqual(f.read().split()[-2:], ['--format=c', 'db1'])
+
+        out = out.decode()
+        self.assertIn(
+            'Progress: {0}/{0} done'.format(len(self.databases) + 1), out
+        )
+        self.assertIn('[db1] dumping', err.decode())
+        if self.expected_exit_code:
+            self.assertIn('Failed to back up: broken', out)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+class ParallelBackupStopTestCase(ParallelBackupTestCase):
+    """
+    This class validates the running utilities are stopped, and no more
+    utility is started, when the backup is stopped by the user.
+    """
+
+    scenarios = [
+        ('Stop the backup', dict(databases=['slow1', 'slow2', 'db1'])),
+    ]
+
+    def runTest(self):
+        process = self.start_backup()
+        for line in iter(process.stderr.readline, b''):
+            if line.startswith(b'[slow1] dumping'):
+                break
+
+        process.send_signal(signal.SIGTERM)
+        out, err = process.communicate(timeout=30)
+
+        self.assertEqual(process.returncode, 1)
+        self.assertIn('Failed to back up: ', out.decode())
+        self.assertNotIn('db1.backup', os.listdir(self.backup_dir))
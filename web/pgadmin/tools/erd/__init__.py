@@ -68,6 +68,7 @@ class ERDModule(PgAdminModule):
             'erd.prequisite',
             'erd.sql',
             'erd.tables',
+            'erd.table',
             'erd.close'
         ]
 
@@ -611,6 +612,29 @@ def tables(trans_id, sgid, sid, did):
     )
 
 
+@blueprint.route('/table/<int:trans_id>/<int:sgid>/<int:sid>/<int:did>/'
+                 '<int:scid>/<int:tid>',
+                 methods=["GET"],
+                 endpoint='table')
+@login_required
+def table(trans_id, sgid, sid, did, scid, tid):
+    """
+    This function returns all the details of the table, tables are loaded
+    in the ERD with the details required to draw those only.
+    """
+    helper = ERDHelper(trans_id, sid, did)
+    _get_connection(sid, did, trans_id)
+    status, table_data = helper.get_table(scid, tid)
+
+    if not status:
+        return table_data
+
+    return make_json_response(
+        data=table_data,
+        status=200
+    )
+
+
 @blueprint.route('/close/<int:trans_id>/<int:sgid>/<int:sid>/<int:did>',
                  methods=["DELETE"],
                  endpoint='close')
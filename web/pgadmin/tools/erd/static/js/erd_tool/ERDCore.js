@@ -174,12 +174,13 @@ export default class ERDCore {
 
   getModel() {return this.getEngine().getModel();}
 
-  getNewNode(initData, dataUrl=null) {
+  getNewNode(initData, dataUrl=null, metadata={}) {
     return this.getEngine().getNodeFactories().getFactory('table').generateModel({
       initialConfig: {
         otherInfo: {
           data:initData,
           dataUrl: dataUrl,
+          metadata: metadata,
         },
       },
     });
@@ -202,8 +203,8 @@ export default class ERDCore {
     });
   }
 
-  addNode(data, position=[50, 50]) {
-    let newNode = this.getNewNode(data);
+  addNode(data, position=[50, 50], metadata={}) {
+    let newNode = this.getNewNode(data, null, metadata);
     this.clearSelection();
     newNode.setPosition(position[0], position[1]);
     this.getModel().addNode(newNode);
@@ -503,6 +504,22 @@ export default class ERDCore {
     return newData;
   }
 
+  mergeTableDetails(tableData, detailsData) {
+    /* Changes done in the diagram take precedence over the details */
+    const mergeRows = (rows, detailRows)=>(rows||[]).map((row)=>({
+      ..._.find(detailRows, (r)=>r.name==row.name),
+      ...row,
+    }));
+
+    return {
+      ...detailsData,
+      ...tableData,
+      columns: mergeRows(tableData.columns, detailsData.columns),
+      primary_key: mergeRows(tableData.primary_key, detailsData.primary_key),
+      unique_constraint: mergeRows(tableData.unique_constraint, detailsData.unique_constraint),
+    };
+  }
+
   serialize(version) {
     return {
       version: version||0,
@@ -537,7 +554,11 @@ export default class ERDCore {
 
     /* Add the nodes */
     data.forEach((nodeData)=>{
-      let newNode = this.addNode(TableSchema.getErdSupportedData(nodeData));
+      /* Only the details required to draw the table are loaded, keep the
+       * table oid to fetch the rest when the table is opened */
+      let newNode = this.addNode(TableSchema.getErdSupportedData(nodeData), undefined, {
+        oid: nodeData.oid, scid: nodeData.scid,
+      });
       oidUidMap[nodeData.oid] = newNode.getID();
     });
 
@@ -78,6 +78,10 @@ export class TableNodeModel extends DefaultNodeModel {
     return this._metadata;
   }
 
+  setMetadata(metadata) {
+    this._metadata = metadata;
+  }
+
   addColumn(col) {
     this._data.columns.push(col);
   }
@@ -94,9 +98,11 @@ export class TableNodeModel extends DefaultNodeModel {
     this._data['name'] = name;
   }
 
-  setData(data) {
+  setData(data, silent=false) {
     this._data = data;
-    this.fireEvent({}, 'nodeUpdated');
+    if(!silent) {
+      this.fireEvent({}, 'nodeUpdated');
+    }
   }
 
   getData() {
@@ -343,9 +343,42 @@ export default class BodyWidget extends React.Component {
     }
   }
 
-  addEditTable(node) {
+  async loadTableDetails(node) {
+    let {oid, scid} = node.getMetadata();
+    if(!oid) {
+      return;
+    }
+    this.setLoading(gettext('Fetching table details...'));
+    let url = url_for('erd.table', {
+      trans_id: this.props.params.trans_id,
+      sgid: this.props.params.sgid,
+      sid: this.props.params.sid,
+      did: this.props.params.did,
+      scid: scid,
+      tid: oid,
+    });
+
+    try {
+      let response = await axios.get(url);
+      let tableData = node.getData();
+      let detailsData = TableSchema.getErdSupportedData(response.data.data);
+      /* The diagram might be loaded from a file created from another database */
+      if(detailsData.schema == tableData.schema && detailsData.name == tableData.name) {
+        node.setData(this.diagram.mergeTableDetails(tableData, detailsData), true);
+      }
+    } catch (error) {
+      console.error(error);
+    } finally {
+      /* Details are fetched only once */
+      node.setMetadata(_.omit(node.getMetadata(), ['oid', 'scid']));
+      this.setLoading(null);
+    }
+  }
+
+  async addEditTable(node) {
     let dialog = this.getDialog('table_dialog');
     if(node) {
+      await this.loadTableDetails(node);
       let [schema, table] = node.getSchemaTableName();
       let oldData = node.getData();
       dialog(gettext('Table: %s (%s)', _.escape(table),_.escape(schema)), oldData, false, (newData)=>{
@@ -0,0 +1,24 @@
+SELECT att.attrelid AS tid, att.attname AS name, att.atttypid, att.attnum,
+    att.attndims, att.atttypmod, att.attnotnull,
+    pg_catalog.pg_get_expr(def.adbin, def.adrelid) AS defval,
+    pg_catalog.format_type(ty.oid,NULL) AS typname,
+    pg_catalog.format_type(ty.oid,att.atttypmod) AS displaytypname,
+    pg_catalog.format_type(ty.oid,att.atttypmod) AS cltype,
+    CASE WHEN ty.typelem > 0 THEN ty.typelem ELSE ty.oid END AS elemoid,
+    tnsp.nspname AS typnspname,
+    (SELECT count(1) FROM pg_catalog.pg_type t2 WHERE t2.typname=ty.typname) > 1 AS isdup,
+    CASE WHEN length(coll.collname::text) > 0 AND length(nspc.nspname::text) > 0 THEN
+      pg_catalog.concat(pg_catalog.quote_ident(nspc.nspname),'.',pg_catalog.quote_ident(coll.collname))
+    ELSE '' END AS collspcname,
+    des.description
+FROM pg_catalog.pg_attribute att
+    JOIN pg_catalog.pg_type ty ON ty.oid=att.atttypid
+    JOIN pg_catalog.pg_namespace tnsp ON tnsp.oid=ty.typnamespace
+    LEFT OUTER JOIN pg_catalog.pg_attrdef def ON adrelid=att.attrelid AND adnum=att.attnum
+    LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=att.attrelid AND des.objsubid=att.attnum AND des.classoid='pg_class'::regclass)
+    LEFT OUTER JOIN pg_catalog.pg_collation coll ON att.attcollation=coll.oid
+    LEFT OUTER JOIN pg_catalog.pg_namespace nspc ON coll.collnamespace=nspc.oid
+WHERE att.attrelid IN ({{ tids|join(', ') }})
+    AND att.attnum > 0
+    AND att.attisdropped IS FALSE
+ORDER BY att.attrelid, att.attnum;
@@ -0,0 +1,27 @@
+SELECT con.oid, con.conrelid AS tid, con.contype, con.conname AS name,
+    des.description AS comment, con.condeferrable, con.condeferred,
+    con.convalidated, con.confupdtype, con.confdeltype,
+    CASE con.confmatchtype
+        WHEN 's' THEN FALSE
+        WHEN 'f' THEN TRUE
+    END AS confmatchtype,
+    con.confrelid,
+    (SELECT pg_catalog.array_agg(att.attname ORDER BY k.ord)
+        FROM pg_catalog.unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+        JOIN pg_catalog.pg_attribute att ON att.attrelid = con.conrelid AND att.attnum = k.attnum
+    ) AS conattnames,
+    (SELECT pg_catalog.array_agg(att.attname ORDER BY k.ord)
+        FROM pg_catalog.unnest(con.confkey) WITH ORDINALITY AS k(attnum, ord)
+        JOIN pg_catalog.pg_attribute att ON att.attrelid = con.confrelid AND att.attnum = k.attnum
+    ) AS confattnames,
+    (CASE WHEN con.contype = 'f' THEN
+        (SELECT cls.relname FROM pg_catalog.pg_index idx
+            JOIN pg_catalog.pg_class cls ON cls.oid = idx.indexrelid
+        WHERE idx.indrelid = con.conrelid
+            AND idx.indkey::int2[] @> con.conkey AND idx.indkey::int2[] <@ con.conkey
+        ORDER BY cls.relname LIMIT 1)
+    END) AS coveringindex
+FROM pg_catalog.pg_constraint con
+    LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=con.oid AND des.objsubid=0 AND des.classoid='pg_constraint'::regclass)
+WHERE con.contype IN ('p', 'u', 'f') AND con.conrelid IN ({{ tids|join(', ') }})
+ORDER BY con.conrelid, con.conname;
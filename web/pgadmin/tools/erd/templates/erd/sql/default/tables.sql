@@ -0,0 +1,10 @@
+SELECT rel.oid, rel.relname AS name, nsp.oid AS scid, nsp.nspname AS schema,
+    des.description,
+    (CASE WHEN rel.relpersistence = 'u' THEN true ELSE false END) AS relpersistence,
+    substring(pg_catalog.array_to_string(rel.reloptions, ',') FROM 'fillfactor=([0-9]*)') AS fillfactor,
+    rel.relhasoids, rel.relrowsecurity AS rlspolicy, rel.relforcerowsecurity AS forcerlspolicy
+FROM pg_catalog.pg_class rel
+    JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+    LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=rel.oid AND des.objsubid=0 AND des.classoid='pg_class'::regclass)
+WHERE rel.relkind IN ('r','s','t') AND rel.relnamespace IN ({{ scids|join(', ') }})
+ORDER BY nsp.nspname, rel.relname;
@@ -0,0 +1,77 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import uuid
+import random
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils import test_utils as utils
+from regression import parent_node_dict
+from regression.test_setup import config_data
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.tests \
+    import utils as tables_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tests import \
+    utils as schema_utils
+
+
+class ERDTable(BaseTestGenerator):
+
+    def dropDB(self):
+        connection = utils.get_db_connection(self.server['db'],
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'])
+        utils.drop_database(connection, self.db_name)
+
+    def setUp(self):
+        self.db_name = "erdtestdb_{0}".format(str(uuid.uuid4())[1:8])
+        self.sid = parent_node_dict["server"][-1]["server_id"]
+        self.did = utils.create_database(self.server, self.db_name)
+
+        try:
+            self.sgid = config_data["server_group"]
+            connection = utils.get_db_connection(
+                self.db_name, self.server['username'],
+                self.server['db_password'], self.server['host'],
+                self.server['port'])
+            self.scid = schema_utils.create_schema(connection, 'erd1')[0]
+            self.tid = tables_utils.create_table(self.server, self.db_name,
+                                                 'erd1', 'table_1')
+        except Exception:
+            self.dropDB()
+            raise
+
+    def runTest(self):
+        db_con = database_utils.connect_database(self,
+                                                 self.sgid,
+                                                 self.sid,
+                                                 self.did)
+
+        if not db_con["info"] == "Database connected.":
+            raise Exception("Could not connect to database to add the schema.")
+
+        trans_id = random.randint(1, 9999999)
+        url = '/erd/table/{trans_id}/{sgid}/{sid}/{did}/{scid}/{tid}'.format(
+            trans_id=trans_id, sgid=self.sgid, sid=self.sid, did=self.did,
+            scid=self.scid, tid=self.tid)
+
+        response = self.tester.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(['erd1', 'table_1'], [response['data']['schema'],
+                                               response['data']['name']])
+        # All the details of the columns must be available
+        self.assertIn('edit_types', response['data']['columns'][0])
+
+    def tearDown(self):
+        self.dropDB()
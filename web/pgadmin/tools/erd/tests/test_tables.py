@@ -76,5 +76,12 @@ class ERDTables(BaseTestGenerator):
         self.assertEqual(self.tables, [[tab['schema'], tab['name']]
                                        for tab in response['data']])
 
+        # Columns and keys are loaded along with the tables
+        for tab in response['data']:
+            self.assertEqual([col['name'] for col in tab['columns']],
+                             ['id', 'name', 'location'])
+            self.assertEqual([[col['column'] for col in uk['columns']]
+                              for uk in tab['unique_constraint']], [['id']])
+
     def tearDown(self):
         self.dropDB()
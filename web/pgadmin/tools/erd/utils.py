@@ -7,8 +7,14 @@
 #
 ##########################################################################
 
+from collections import OrderedDict
+
+from flask import render_template
+
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
     import BaseTableView
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    columns.utils import fetch_length_precision
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import get_schemas
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
@@ -31,20 +37,137 @@ class ERDTableView(BaseTableView, DataTypeReader):
 
     @BaseTableView.check_precondition
     def fetch_all_tables(self, conn_id=None, did=None, sid=None):
+        """
+        This function will fetch the tables of all the schemas along with
+        their columns, primary keys, unique constraints and foreign keys
+        required by the ERD. Tables, columns and constraints are fetched
+        using one query each for all the tables, other details of the table
+        can be fetched using fetch_table when required.
+        """
         status, schemas = get_schemas(self.conn, show_system_objects=False)
         if not status:
             return status, schemas
 
-        all_tables = []
-        for row in schemas['rows']:
-            status, res = \
-                BaseTableView.fetch_tables(self, sid, did, row['oid'])
-            if not status:
-                return status, res
+        if len(schemas['rows']) == 0:
+            return True, []
+
+        template_path = 'erd/sql/#{0}#'.format(self.manager.version)
+
+        sql = render_template("/".join([template_path, 'tables.sql']),
+                              scids=[row['oid'] for row in schemas['rows']])
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return status, res
+
+        all_tables = OrderedDict()
+        for row in res['rows']:
+            row['columns'] = []
+            row['primary_key'] = []
+            row['unique_constraint'] = []
+            row['foreign_key'] = []
+            all_tables[row['oid']] = row
+
+        if len(all_tables) == 0:
+            return True, []
+
+        status, res = self._fetch_all_constraints(template_path, all_tables)
+        if not status:
+            return status, res
+
+        status, res = self._fetch_all_columns(template_path, all_tables)
+        if not status:
+            return status, res
+
+        return True, list(all_tables.values())
 
-            all_tables.extend(res.values())
+    def _fetch_all_constraints(self, template_path, all_tables):
+        """
+        This function will fetch the primary keys, unique constraints and
+        foreign keys of the tables and add them to the table data.
+        """
+        sql = render_template("/".join([template_path, 'constraints.sql']),
+                              tids=all_tables.keys())
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return status, res
+
+        for row in res['rows']:
+            table = all_tables[row['tid']]
+            if row['contype'] == 'f':
+                # Foreign keys referencing the tables out of the ERD
+                # can not be shown.
+                if row['confrelid'] not in all_tables:
+                    continue
+                ref_table = all_tables[row['confrelid']]
+                table['foreign_key'].append({
+                    'oid': row['oid'],
+                    'name': row['name'],
+                    'comment': row['comment'],
+                    'condeferrable': row['condeferrable'],
+                    'condeferred': row['condeferred'],
+                    'convalidated': row['convalidated'],
+                    'confupdtype': row['confupdtype'],
+                    'confdeltype': row['confdeltype'],
+                    'confmatchtype': row['confmatchtype'],
+                    'columns': [{
+                        'local_column': local_col,
+                        'references': row['confrelid'],
+                        'referenced': ref_col,
+                        'references_table_name':
+                            ref_table['schema'] + '.' + ref_table['name']
+                    } for local_col, ref_col in zip(row['conattnames'],
+                                                    row['confattnames'])],
+                    'remote_schema': ref_table['schema'],
+                    'remote_table': ref_table['name'],
+                    'coveringindex': row['coveringindex'],
+                    'autoindex': row['coveringindex'] is None,
+                    'hasindex': row['coveringindex'] is not None
+                })
+            else:
+                table['primary_key' if row['contype'] == 'p' else
+                      'unique_constraint'].append({
+                        'oid': row['oid'],
+                        'name': row['name'],
+                        'comment': row['comment'],
+                        'condeferrable': row['condeferrable'],
+                        'condeferred': row['condeferred'],
+                        'columns': [{'column': col}
+                                    for col in row['conattnames']]
+                    })
+
+        return True, None
+
+    def _fetch_all_columns(self, template_path, all_tables):
+        """
+        This function will fetch the columns of the tables and add them to
+        the table data.
+        """
+        sql = render_template("/".join([template_path, 'columns.sql']),
+                              tids=all_tables.keys())
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return status, res
+
+        for row in res['rows']:
+            table = all_tables[row.pop('tid')]
+            pk_cols = [col['column'] for pk in table['primary_key']
+                       for col in pk['columns']]
 
-        return True, all_tables
+            row['is_primary_key'] = row['name'] in pk_cols
+            row['is_pk'] = row['is_primary_key']
+            fetch_length_precision(row)
+            row['cltype'] = DataTypeReader.parse_type_name(row['cltype'])
+            table['columns'].append(row)
+
+        return True, None
+
+    @BaseTableView.check_precondition
+    def fetch_table(self, conn_id=None, did=None, sid=None, scid=None,
+                    tid=None):
+        """
+        This function will fetch all the details of the specified table.
+        """
+        return BaseTableView.fetch_tables(self, sid, did, scid, tid)
 
 
 class ERDHelper:
@@ -70,3 +193,10 @@ class ERDHelper:
             conn_id=self.conn_id, did=self.did, sid=self.sid)
 
         return status, res
+
+    def get_table(self, scid, tid):
+        status, res = self.table_view.fetch_table(
+            conn_id=self.conn_id, did=self.did, sid=self.sid, scid=scid,
+            tid=tid)
+
+        return status, res
@@ -15,6 +15,7 @@ from flask import url_for, Response, render_template, request, current_app
 from flask_babel import gettext as _
 from flask_security import login_required, current_user
 from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.misc.bgprocess.scheduler import PRIORITY_LOW
 from pgadmin.utils import PgAdminModule, html, does_utility_exist, get_server
 from pgadmin.utils.ajax import bad_request, make_json_response
 from pgadmin.utils.driver import get_driver
@@ -281,7 +282,7 @@ def create_maintenance_job(sid, did):
         else:
             p.set_env_variables(server)
 
-        p.start()
+        p.start(priority=PRIORITY_LOW)
         jid = p.id
     except Exception as e:
         current_app.logger.exception(e)
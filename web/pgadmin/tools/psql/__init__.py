@@ -26,6 +26,7 @@ from pgadmin.utils.constants import MIMETYPE_APP_JS
 from pgadmin.utils.driver import get_driver
 from ... import socketio as sio
 from pgadmin.utils import get_complete_file_path
+from .pty_multiplexer import PtyMultiplexer
 
 if _platform == 'win32':
     # Check Windows platform support for WinPty api, Disable psql
@@ -44,6 +45,23 @@ pdata = dict()
 cdata = dict()
 
 
+def emit_pty_output(sid, output, callback):
+    """
+    Emit the terminal output to the socket, the callback is called once the
+    client has written it to the terminal.
+    :param sid: socket id
+    :param output: terminal output
+    :param callback:
+    """
+    sio.emit('pty-output',
+             {'result': output,
+              'error': False},
+             namespace='/pty', to=sid, callback=callback)
+
+
+pty_multiplexer = PtyMultiplexer(emit_pty_output, sio.start_background_task)
+
+
 class PSQLModule(PgAdminModule):
     """
     class PSQLModule(PgAdminModule)
@@ -190,25 +208,6 @@ def create_pty_terminal(connection_data):
     return p, parent, fd
 
 
-def read_terminal_data(parent, data_ready, max_read_bytes, sid):
-    """
-    Read the terminal output.
-    :param parent:
-    :param data_ready:
-    :param max_read_bytes:
-    :param sid:
-    :return:
-    """
-    if parent in data_ready:
-        # Read the output from parent fd (terminal).
-        output = os.read(parent, max_read_bytes)
-
-        sio.emit('pty-output',
-                 {'result': output.decode(),
-                  'error': False},
-                 namespace='/pty', room=sid)
-
-
 def read_stdout(process, sid, max_read_bytes, win_emit_output=True):
     (data_ready, _, _) = select.select([process.fd], [], [], 0)
     if process.fd in data_ready:
@@ -233,7 +232,6 @@ def start_process(data):
     def read_and_forward_pty_output(sid, data):
 
         max_read_bytes = 1024 * 20
-        import time
         if _platform == 'win32':
 
             os.environ['PYWINPTY_BACKEND'] = '1'
@@ -253,23 +251,9 @@ def start_process(data):
 
             p, parent, fd = create_pty_terminal(connection_data)
 
-            while p and p.poll() is None:
-                if request.sid in app.config['sessions']:
-                    # This code is added to make this unit testable.
-                    if "is_test" not in data:
-                        sio.sleep(0.01)
-                    else:
-                        data['count'] += 1
-                        if data['count'] == 5:
-                            break
-
-                    timeout = 0
-                    # module provides access to platform-specific I/O
-                    # monitoring functions
-                    (data_ready, _, _) = select.select([parent, fd], [], [],
-                                                       timeout)
-
-                    read_terminal_data(parent, data_ready, max_read_bytes, sid)
+            # Output of all the terminals is forwarded by a single task.
+            if p:
+                pty_multiplexer.register(sid, parent, p)
 
     # Check user is authenticated and PSQL is enabled in config.
     if current_user.is_authenticated and config.ENABLE_PSQL:
@@ -557,9 +541,12 @@ def disconnect_socket():
     else:
         os.write(app.config['sessions'][request.sid], '\q\n'.encode())
         sio.sleep(1)
+        pty_multiplexer.unregister(request.sid)
         os.close(app.config['sessions'][request.sid])
-        os.close(cdata[request.sid])
+        os.close(cdata.pop(request.sid))
         del app.config['sessions'][request.sid]
+        # The socket is disconnected later on, once the terminal is closed.
+        pdata.pop(request.sid, None)
 
 
 def _get_database(sid, did):
@@ -0,0 +1,224 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Forwards the output of all the PSQL terminals to their sockets from a single
+background task.
+
+The task blocks until any of the terminals has some output, so the idle
+terminals cost nothing. The output read within FRAME_LATENCY seconds is sent
+as one frame, and the terminal is not read anymore while its socket has not
+acknowledged MAX_PENDING_FRAMES frames, so that a client falling behind
+makes psql wait, instead of the output piling up in the server.
+"""
+
+import codecs
+import os
+import selectors
+import threading
+import time
+
+# Maximum number of bytes read from a terminal at once.
+MAX_READ_BYTES = 1024 * 64
+
+# Number of seconds the output is collected before sending it.
+FRAME_LATENCY = 0.02
+
+# Output is sent without waiting, once it reaches this size.
+MAX_FRAME_BYTES = 1024 * 64
+
+# Number of frames sent, but not acknowledged by the client, after which the
+# terminal is not read until the client catches up.
+MAX_PENDING_FRAMES = 4
+
+
+class _Terminal(object):
+    """
+    Output of a PSQL terminal waiting to be sent to its socket.
+    """
+
+    def __init__(self, sid, fd, process):
+        self.sid = sid
+        self.fd = fd
+        self.process = process
+        # Multibyte characters may be split between the reads.
+        self.decoder = codecs.getincrementaldecoder('utf-8')(
+            errors='replace'
+        )
+        self.output = []
+        self.output_bytes = 0
+        self.output_since = None
+        self.pending_frames = 0
+        self.paused = False
+
+
+class PtyMultiplexer(object):
+    """
+    Reads the output of all the registered terminals, and sends it in frames
+    to their sockets.
+    """
+
+    def __init__(self, emit, start_background_task):
+        """
+        :param emit: function(sid, output, callback) sending the output to
+                     the socket, and calling the callback once the client
+                     has received it.
+        :param start_background_task: function(target) starting the task
+        """
+        self._emit = emit
+        self._start_background_task = start_background_task
+        self._lock = threading.Lock()
+        self._selector = None
+        self._wakeup_fds = None
+        self._terminals = dict()
+
+    def _start(self):
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_fds = os.pipe()
+        os.set_blocking(self._wakeup_fds[0], False)
+        self._selector.register(self._wakeup_fds[0], selectors.EVENT_READ)
+        self._start_background_task(self._run)
+
+    def _wakeup(self):
+        try:
+            os.write(self._wakeup_fds[1], b'x')
+        except BlockingIOError:
+            # Task is going to wake up anyway.
+            pass
+
+    def register(self, sid, fd, process=None):
+        """
+        Starts forwarding the output of the terminal to the socket.
+
+        :param sid: Socket ID
+        :param fd: Parent file descriptor of the terminal
+        :param process: psql process running in the terminal
+        """
+        with self._lock:
+            if self._selector is None:
+                self._start()
+
+            terminal = _Terminal(sid, fd, process)
+            self._terminals[sid] = terminal
+            self._selector.register(fd, selectors.EVENT_READ, terminal)
+
+        self._wakeup()
+
+    def unregister(self, sid):
+        """
+        Stops forwarding the output of the terminal, it must be called
+        before closing the terminal.
+
+        :param sid: Socket ID
+        """
+        with self._lock:
+            terminal = self._terminals.pop(sid, None)
+            if terminal is not None and not terminal.paused:
+                self._selector.unregister(terminal.fd)
+
+    def _acknowledged(self, terminal):
+        """
+        Called when the client has received a frame.
+        """
+        with self._lock:
+            terminal.pending_frames -= 1
+
+            if terminal.paused and \
+                    terminal.pending_frames < MAX_PENDING_FRAMES and \
+                    self._terminals.get(terminal.sid) is terminal:
+                terminal.paused = False
+                self._selector.register(
+                    terminal.fd, selectors.EVENT_READ, terminal
+                )
+                self._wakeup()
+
+    def _send(self, terminal):
+        """
+        Sends the output collected so far as one frame.
+        """
+        output = ''.join(terminal.output)
+        terminal.output = []
+        terminal.output_bytes = 0
+        terminal.output_since = None
+
+        with self._lock:
+            terminal.pending_frames += 1
+            if terminal.pending_frames >= MAX_PENDING_FRAMES and \
+                    not terminal.paused and \
+                    self._terminals.get(terminal.sid) is terminal:
+                # Let psql wait until the client catches up.
+                terminal.paused = True
+                self._selector.unregister(terminal.fd)
+
+        try:
+            self._emit(terminal.sid, output,
+                       lambda *args: self._acknowledged(terminal))
+        except Exception:
+            # Socket is gone, the terminal is unregistered on disconnect.
+            self._acknowledged(terminal)
+
+    def _read(self, terminal):
+        """
+        Reads the available output of the terminal.
+        """
+        try:
+            data = os.read(terminal.fd, MAX_READ_BYTES)
+        except OSError:
+            # Terminal is closed, i.e. psql has exited.
+            data = b''
+
+        if data:
+            if terminal.output_since is None:
+                terminal.output_since = time.time()
+            terminal.output.append(terminal.decoder.decode(data))
+            terminal.output_bytes += len(data)
+            return
+
+        terminal.output.append(terminal.decoder.decode(b'', final=True))
+        self.unregister(terminal.sid)
+        if terminal.process is not None:
+            # Do not leave the exited process as zombie.
+            terminal.process.poll()
+        if any(terminal.output):
+            self._send(terminal)
+
+    def _get_timeout(self):
+        """
+        Returns the number of seconds until the first frame is due, or None
+        if nothing is waiting to be sent.
+        """
+        since = [
+            terminal.output_since for terminal in list(
+                self._terminals.values()
+            ) if terminal.output_since is not None
+        ]
+        if not since:
+            return None
+
+        return max(0, min(since) + FRAME_LATENCY - time.time())
+
+    def _run(self):
+        while True:
+            for key, _ in self._selector.select(self._get_timeout()):
+                if key.data is None:
+                    try:
+                        while os.read(self._wakeup_fds[0], 512):
+                            pass
+                    except BlockingIOError:
+                        pass
+                elif self._terminals.get(key.data.sid) is key.data:
+                    self._read(key.data)
+
+            now = time.time()
+            for terminal in list(self._terminals.values()):
+                if terminal.output_since is not None and (
+                    terminal.output_bytes >= MAX_FRAME_BYTES or
+                    now - terminal.output_since >= FRAME_LATENCY
+                ):
+                    self._send(terminal)
@@ -288,11 +288,14 @@ export function initialize(gettext, url_for, $, _, pgAdmin, csrfToken, Browser)
     },
     psql_socket_io: function(socket, is_enable, sid, db, server_type, fitAddon, term) {
       // Listen all the socket events emit from server.
-      socket.on('pty-output', function(data){
+      socket.on('pty-output', function(data, ack){
         if(data.error) {
           term.write('\r\n');
         }
-        term.write(data.result);
+        /* Let the server send more output once this is written to the
+         * terminal, so that a huge output doesn't pile up in the browser.
+         */
+        term.write(data.result, ack);
         if(data.error) {
           term.write('\r\n');
         }
@@ -1,13 +1,15 @@
+import os
 import uuid
 import config
 import sys
+import time
 from pgadmin.utils.route import BaseTestGenerator
 from regression.python_test_utils import test_utils as utils
 from regression import parent_node_dict
 from regression.test_setup import config_data
-from pgadmin.utils import server_utils as server_utils
-from pgAdmin4 import app
+from pgadmin.utils import server_utils as server_utils, does_utility_exist
 from . import utils as psql_utils
+from .. import pty_multiplexer
 from .... import socketio
 
 
@@ -16,6 +18,22 @@ class PSQLBackend(BaseTestGenerator):
                                          psql_utils.test_cases)
 
     def setUp(self):
+        if 'default_binary_paths' not in self.server or \
+            self.server['default_binary_paths'] is None or \
+            self.server['type'] not in self.server['default_binary_paths'] or \
+                self.server['default_binary_paths'][self.server['type']] == '':
+            self.skipTest(
+                "default_binary_paths is not set for the server {0}".format(
+                    self.server['name']
+                )
+            )
+
+        retVal = does_utility_exist(os.path.join(
+            self.server['default_binary_paths'][self.server['type']], 'psql'
+        ))
+        if retVal is not None:
+            self.skipTest(retVal)
+
         self.db_name = "psqltestdb_{0}".format(str(uuid.uuid4())[1:8])
         database_info = parent_node_dict["database"][-1]
         self.did = database_info["db_id"]
@@ -27,43 +45,31 @@ class PSQLBackend(BaseTestGenerator):
     def runTest(self):
         if sys.platform == 'win32':
             self.skipTest('PSQL disabled for windows')
-        # Fetch flask client to access current user and other cookies.
-        flask_client = app.test_client()
-        flask_client.get('/')
-        self.test_client = socketio.test_client(app, namespace='/pty',
-                                                flask_test_client=flask_client)
+        # Set up by pgAdmin4.py, and by opening the panel.
+        self.app.config.setdefault('sessions', dict())
+        self.app.config.setdefault('sid_soid_mapping', dict())
+
+        # Use the logged in client, so that the user is authenticated.
+        self.test_client = socketio.test_client(
+            self.app, namespace='/pty', flask_test_client=self.tester)
         self.assertTrue(self.test_client.is_connected('/pty'))
         received = self.test_client.get_received('/pty')
 
         assert received[0]['name'] == 'connected'
         assert received[0]['args'][0]['sid'] != ''
+        socket_id = received[0]['args'][0]['sid']
 
         data = {
             'sid': self.sid,
             'db': 'postgres',
             'pwd': self.server['db_password'],
-            'user': self.server['username'],
-            'is_test': True,
-            'count': 0
+            'user': self.server['username']
         }
 
         self.test_client.emit('start_process', data, namespace='/pty')
-        self.test_client.get_received('/pty')
-
-        for p in self.server['db_password']:
-            input_data = {
-                'input': p,
-                'key_name': 'Key{0}'.format(p)
-            }
-            self.test_client.emit('socket_input', input_data, namespace='/pty')
-            self.test_client.get_received('/pty')
-
-        input_data = {
-            'input': '\\n',
-            'key_name': 'Enter'
-        }
-        self.test_client.emit('socket_input', input_data, namespace='/pty')
-        self.test_client.get_received('/pty')
+        self.assertTrue(self.wait_for(
+            lambda: socket_id in pty_multiplexer._terminals))
+        self.assertTrue(self.wait_for(self.get_output))
 
         for ip in self.input_cmd:
             input_data = {
@@ -71,16 +77,42 @@ class PSQLBackend(BaseTestGenerator):
                 'key_name': 'Key{0}'.format(ip)
             }
             self.test_client.emit('socket_input', input_data, namespace='/pty')
-            self.test_client.get_received('/pty')
 
         input_data = {
             'input': '\\n',
             'key_name': 'Enter'
         }
         self.test_client.emit('socket_input', input_data, namespace='/pty')
-        self.test_client.get_received('/pty')
+        self.assertTrue(self.wait_for(self.get_output))
+
+        # Stop the psql session, it stops forwarding its output.
+        self.test_client.emit('server-disconnect', {'sid': str(self.sid)},
+                              namespace='/pty')
+        self.assertNotIn(socket_id, pty_multiplexer._terminals)
         self.test_client.disconnect(namespace='/pty')
 
+    def get_output(self):
+        """
+        Returns the terminal output received since the last call.
+        """
+        return ''.join(
+            event['args'][0]['result']
+            for event in self.test_client.get_received('/pty')
+            if event['name'] == 'pty-output'
+        )
+
+    @staticmethod
+    def wait_for(condition, timeout=10):
+        """
+        Waits for the output forwarded by the background task.
+        """
+        end_time = time.time() + timeout
+        while not condition():
+            if time.time() > end_time:
+                return False
+            time.sleep(0.1)
+        return True
+
     def tearDown(self):
         connection = utils.get_db_connection(self.server['db'],
                                              self.server['username'],
@@ -0,0 +1,97 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import sys
+import threading
+import time
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.psql.pty_multiplexer import PtyMultiplexer, \
+    MAX_PENDING_FRAMES
+
+
+class PtyMultiplexerTestCase(BaseTestGenerator):
+    """
+    This class validates the output of the terminals is sent in frames, and
+    not read while the client has not acknowledged the frames.
+    """
+
+    scenarios = [
+        ('Output written at once is sent in one frame', dict(
+            writes=[b'select ', b'1', b';'], acknowledge=True,
+            expected_frames=1)),
+        ('Huge output waits for the client', dict(
+            writes=[b'x' * 1024 * 1024], acknowledge=False,
+            expected_frames=MAX_PENDING_FRAMES)),
+    ]
+
+    def setUp(self):
+        if sys.platform == 'win32':
+            self.skipTest('PSQL terminals are not used on Windows')
+
+        import pty
+        import termios
+        self.parent, self.child = pty.openpty()
+        # Do not let the terminal change the output.
+        attrs = termios.tcgetattr(self.child)
+        attrs[1] &= ~termios.OPOST
+        termios.tcsetattr(self.child, termios.TCSANOW, attrs)
+
+        self.frames = []
+        self.callbacks = []
+
+    def emit(self, sid, output, callback):
+        self.frames.append(output)
+        if self.acknowledge:
+            callback()
+        else:
+            self.callbacks.append(callback)
+
+    def start_background_task(self, target):
+        thread = threading.Thread(target=target)
+        thread.daemon = True
+        thread.start()
+
+    def write(self):
+        for data in self.writes:
+            os.write(self.child, data)
+        self.written = True
+
+    def runTest(self):
+        multiplexer = PtyMultiplexer(self.emit, self.start_background_task)
+        multiplexer.register('sid', self.parent)
+
+        self.written = False
+        writer = threading.Thread(target=self.write)
+        writer.daemon = True
+        writer.start()
+        time.sleep(0.5)
+
+        self.assertEqual(len(self.frames), self.expected_frames)
+        self.assertEqual(self.written, self.acknowledge)
+
+        if not self.acknowledge:
+            # Client catches up, the rest of the output is sent.
+            while not self.written or self.callbacks:
+                if self.callbacks:
+                    self.callbacks.pop(0)()
+                else:
+                    time.sleep(0.05)
+
+        time.sleep(0.1)
+        self.assertEqual(''.join(self.frames).encode(),
+                         b''.join(self.writes))
+
+        multiplexer.unregister('sid')
+
+    def tearDown(self):
+        if sys.platform != 'win32':
+            os.close(self.parent)
+            os.close(self.child)
@@ -23,11 +23,16 @@ from pgadmin.utils.ajax import make_json_response, bad_request, \
 from pgadmin.model import Server, SharedServer
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
+from pgadmin.tools.schema_diff.comparison_cache import ComparisonCache
+from pgadmin.tools.schema_diff.snapshot import create_snapshot, \
+    load_snapshot, write_snapshot_file, get_snapshot_file_path, \
+    find_snapshot_entry
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS,\
     ERROR_MSG_TRANS_ID_NOT_FOUND
 from sqlalchemy import or_
+from werkzeug.exceptions import InternalServerError
 
 MODULE_NAME = 'schema_diff'
 COMPARE_MSG = gettext("Comparing objects...")
@@ -70,9 +75,12 @@ class SchemaDiffModule(PgAdminModule):
             'schema_diff.compare_schema',
             'schema_diff.poll',
             'schema_diff.ddl_compare',
+            'schema_diff.ddl',
+            'schema_diff.generate_script',
             'schema_diff.connect_server',
             'schema_diff.connect_database',
             'schema_diff.get_server',
+            'schema_diff.snapshot',
             'schema_diff.close'
         ]
 
@@ -254,6 +262,7 @@ def close(trans_id):
         # session variable.
         schema_diff_data.pop(str(trans_id), None)
         session['schemaDiff'] = schema_diff_data
+        ComparisonCache.remove(trans_id)
     except Exception as e:
         app.logger.error(e)
         return internal_server_error(errormsg=str(e))
@@ -465,15 +474,20 @@ def schemas(sid, did):
 def compare_database(trans_id, source_sid, source_did, target_sid, target_did,
                      ignore_owner, ignore_whitespaces):
     """
-    This function will compare the two databases.
+    This function will compare the two databases. If 'stream' is specified
+    in the request arguments, results will be available through the poll
+    request only.
     """
     # Check the pre validation before compare
-    status, error_msg, diff_model_obj, session_obj = \
+    status, error_msg, diff_model_obj, session_obj, snapshots = \
         compare_pre_validation(trans_id, source_sid, target_sid)
     if not status:
         return error_msg
 
-    comparison_result = []
+    # Results and progress of the comparison are streamed through this
+    # cache, DDL of the objects will be generated on demand using it.
+    comparison_cache = ComparisonCache.create(trans_id)
+    comparison_cache.set_progress(COMPARE_MSG, 0)
 
     diff_model_obj.set_comparison_info(COMPARE_MSG, 0)
     update_session_diff_transaction(trans_id, session_obj,
@@ -486,7 +500,8 @@ def compare_database(trans_id, source_sid, source_did, target_sid, target_did,
         # Fetch all the schemas of source and target database
         # Compare them and get the status.
         schema_result = fetch_compare_schemas(source_sid, source_did,
-                                              target_sid, target_did)
+                                              target_sid, target_did,
+                                              **snapshots)
 
         total_schema = len(schema_result['source_only']) + len(
             schema_result['target_only']) + len(
@@ -499,88 +514,72 @@ def compare_database(trans_id, source_sid, source_did, target_sid, target_did,
         total_percent = 0
 
         # Compare Database objects
-        comparison_schema_result, total_percent = \
+        total_percent = \
             compare_database_objects(
-                trans_id=trans_id, session_obj=session_obj,
                 source_sid=source_sid, source_did=source_did,
                 target_sid=target_sid, target_did=target_did,
-                diff_model_obj=diff_model_obj, total_percent=total_percent,
+                total_percent=total_percent,
                 node_percent=node_percent,
                 ignore_owner=ignore_owner,
-                ignore_whitespaces=ignore_whitespaces)
-        comparison_result = \
-            comparison_result + comparison_schema_result
+                ignore_whitespaces=ignore_whitespaces,
+                comparison_cache=comparison_cache, **snapshots)
 
         # Compare Schema objects
         if 'source_only' in schema_result and \
                 len(schema_result['source_only']) > 0:
             for item in schema_result['source_only']:
-                comparison_schema_result, total_percent = \
+                total_percent = \
                     compare_schema_objects(
-                        trans_id=trans_id, session_obj=session_obj,
                         source_sid=source_sid, source_did=source_did,
                         source_scid=item['scid'], target_sid=target_sid,
                         target_did=target_did, target_scid=None,
                         schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
                         total_percent=total_percent,
                         node_percent=node_percent,
                         is_schema_source_only=True,
                         ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+                        ignore_whitespaces=ignore_whitespaces,
+                        comparison_cache=comparison_cache, **snapshots)
 
         if 'target_only' in schema_result and \
                 len(schema_result['target_only']) > 0:
             for item in schema_result['target_only']:
-                comparison_schema_result, total_percent = \
+                total_percent = \
                     compare_schema_objects(
-                        trans_id=trans_id, session_obj=session_obj,
                         source_sid=source_sid, source_did=source_did,
                         source_scid=None, target_sid=target_sid,
                         target_did=target_did, target_scid=item['scid'],
                         schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
                         total_percent=total_percent,
                         node_percent=node_percent,
                         ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+                        ignore_whitespaces=ignore_whitespaces,
+                        comparison_cache=comparison_cache, **snapshots)
 
         # Compare the two schema present in both the databases
         if 'in_both_database' in schema_result and \
                 len(schema_result['in_both_database']) > 0:
             for item in schema_result['in_both_database']:
-                comparison_schema_result, total_percent = \
+                total_percent = \
                     compare_schema_objects(
-                        trans_id=trans_id, session_obj=session_obj,
                         source_sid=source_sid, source_did=source_did,
                         source_scid=item['src_scid'], target_sid=target_sid,
                         target_did=target_did, target_scid=item['tar_scid'],
                         schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
                         total_percent=total_percent,
                         node_percent=node_percent,
                         ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+                        ignore_whitespaces=ignore_whitespaces,
+                        comparison_cache=comparison_cache, **snapshots)
 
         msg = gettext("Successfully compare the specified databases.")
         total_percent = 100
-        diff_model_obj.set_comparison_info(msg, total_percent)
-        # Update the message and total percentage done in session object
-        update_session_diff_transaction(trans_id, session_obj, diff_model_obj)
+        comparison_cache.set_progress(msg, total_percent)
 
     except Exception as e:
         app.logger.exception(e)
 
-    return make_json_response(data=comparison_result)
+    return get_comparison_response(comparison_cache)
 
 
 @blueprint.route(
@@ -595,15 +594,20 @@ def compare_schema(trans_id, source_sid, source_did, source_scid,
                    target_sid, target_did, target_scid, ignore_owner,
                    ignore_whitespaces):
     """
-    This function will compare the two schema.
+    This function will compare the two schema. If 'stream' is specified
+    in the request arguments, results will be available through the poll
+    request only.
     """
     # Check the pre validation before compare
-    status, error_msg, diff_model_obj, session_obj = \
+    status, error_msg, diff_model_obj, session_obj, snapshots = \
         compare_pre_validation(trans_id, source_sid, target_sid)
     if not status:
         return error_msg
 
-    comparison_result = []
+    # Results and progress of the comparison are streamed through this
+    # cache, DDL of the objects will be generated on demand using it.
+    comparison_cache = ComparisonCache.create(trans_id)
+    comparison_cache.set_progress(COMPARE_MSG, 0)
 
     diff_model_obj.set_comparison_info(COMPARE_MSG, 0)
     update_session_diff_transaction(trans_id, session_obj,
@@ -615,32 +619,42 @@ def compare_schema(trans_id, source_sid, source_did, source_scid,
         node_percent = round(100 / len(all_registered_nodes))
         total_percent = 0
 
-        comparison_schema_result, total_percent = \
+        total_percent = \
             compare_schema_objects(
-                trans_id=trans_id, session_obj=session_obj,
                 source_sid=source_sid, source_did=source_did,
                 source_scid=source_scid, target_sid=target_sid,
                 target_did=target_did, target_scid=target_scid,
                 schema_name=gettext('Schema Objects'),
-                diff_model_obj=diff_model_obj,
                 total_percent=total_percent,
                 node_percent=node_percent,
                 ignore_owner=ignore_owner,
-                ignore_whitespaces=ignore_whitespaces)
-
-        comparison_result = \
-            comparison_result + comparison_schema_result
+                ignore_whitespaces=ignore_whitespaces,
+                comparison_cache=comparison_cache, **snapshots)
 
         msg = gettext("Successfully compare the specified schemas.")
         total_percent = 100
-        diff_model_obj.set_comparison_info(msg, total_percent)
-        # Update the message and total percentage done in session object
-        update_session_diff_transaction(trans_id, session_obj, diff_model_obj)
+        comparison_cache.set_progress(msg, total_percent)
 
     except Exception as e:
         app.logger.exception(e)
 
-    return make_json_response(data=comparison_result)
+    return get_comparison_response(comparison_cache)
+
+
+def get_comparison_response(comparison_cache):
+    """
+    This function returns the response of the comparison. When the results
+    are streamed through the poll request only the number of results is
+    returned to avoid sending those twice.
+
+    :param comparison_cache: cache of the comparison
+    :return:
+    """
+    results, count = comparison_cache.get_results()
+    if request.args.get('stream', None):
+        return make_json_response(data={'count': count})
+
+    return make_json_response(data=results)
 
 
 @blueprint.route(
@@ -650,6 +664,8 @@ def compare_schema(trans_id, source_sid, source_did, source_scid,
 def poll(trans_id):
     """
     This function is used to check the schema comparison is completed or not.
+    Results of the comparison available after the 'cursor' specified in the
+    request arguments are returned along with the progress.
     :param trans_id:
     :return:
     """
@@ -661,15 +677,28 @@ def poll(trans_id):
     if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
         return make_json_response(success=0, errormsg=error_msg, status=404)
 
-    msg, diff_percentage = diff_model_obj.get_comparison_info()
+    comparison_cache = ComparisonCache.get(trans_id)
+    if comparison_cache is None:
+        msg, diff_percentage = diff_model_obj.get_comparison_info()
+        return make_json_response(data={'compare_msg': msg,
+                                        'diff_percentage': diff_percentage,
+                                        'results': [],
+                                        'cursor': 0})
+
+    try:
+        cursor = int(request.args.get('cursor', 0))
+    except ValueError:
+        cursor = 0
 
-    if diff_percentage == 100:
-        diff_model_obj.set_comparison_info(COMPARE_MSG, 0)
-        update_session_diff_transaction(trans_id, session_obj,
-                                        diff_model_obj)
+    # Progress must be read before the results, so that all the results
+    # are returned when the comparison is reported as completed.
+    msg, diff_percentage = comparison_cache.get_progress()
+    results, cursor = comparison_cache.get_results(cursor)
 
     return make_json_response(data={'compare_msg': msg,
-                                    'diff_percentage': diff_percentage})
+                                    'diff_percentage': diff_percentage,
+                                    'results': results,
+                                    'cursor': cursor})
 
 
 @blueprint.route(
@@ -695,6 +724,17 @@ def ddl_compare(trans_id, source_sid, source_did, source_scid,
         return make_json_response(success=0, errormsg=error_msg, status=404)
 
     view = SchemaDiffRegistry.get_node_view(node_type)
+    source_snapshot, target_snapshot = diff_model_obj.get_snapshots()
+    if view and hasattr(view, 'ddl_compare') and \
+            (source_snapshot or target_snapshot):
+        sql = snapshot_ddl_compare(
+            view, node_type, source_snapshot, target_snapshot,
+            source_sid=source_sid, source_did=source_did,
+            source_scid=source_scid, source_oid=source_oid,
+            target_sid=target_sid, target_did=target_did,
+            target_scid=target_scid, target_oid=target_oid)
+        return ajax_response(status=200, response=sql)
+
     if view and hasattr(view, 'ddl_compare'):
         sql = view.ddl_compare(source_sid=source_sid, source_did=source_did,
                                source_scid=source_scid, target_sid=target_sid,
@@ -719,22 +759,99 @@ def ddl_compare(trans_id, source_sid, source_did, source_scid,
     )
 
 
-def check_version_compatibility(sid, tid):
-    """Check the version compatibility of source and target servers."""
+@blueprint.route(
+    '/ddl/<int:trans_id>/<int:result_id>',
+    methods=["GET"],
+    endpoint="ddl"
+)
+@login_required
+def ddl(trans_id, result_id):
+    """
+    This function is used to return the source, target and difference DDL
+    of the object which is not identical, generated on demand and cached for
+    the comparison.
+    """
+    # Check the transaction and connection status
+    status, error_msg, diff_model_obj, session_obj = \
+        check_transaction_status(trans_id)
 
-    driver = get_driver(PG_DEFAULT_DRIVER)
-    src_server = Server.query.filter_by(id=sid).first()
-    src_manager = driver.connection_manager(src_server.id)
-    src_conn = src_manager.connection()
+    if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
+        return make_json_response(success=0, errormsg=error_msg, status=404)
+
+    ddl_cache = ComparisonCache.get(trans_id)
+    sql = ddl_cache.get_ddl(result_id) if ddl_cache is not None else None
+    if sql is None:
+        return make_json_response(
+            success=0, status=410,
+            errormsg=gettext('Could not find the object in the comparison '
+                             'result. Please compare again.'))
 
-    tar_server = Server.query.filter_by(id=tid).first()
-    tar_manager = driver.connection_manager(tar_server.id)
-    target_conn = tar_manager.connection()
+    return ajax_response(status=200, response=sql)
 
-    if not (src_conn.connected() and target_conn.connected()):
-        return False, gettext('Server(s) disconnected.')
 
-    if src_manager.server_type != tar_manager.server_type:
+@blueprint.route(
+    '/generate_script/<int:trans_id>',
+    methods=["POST"],
+    endpoint="generate_script"
+)
+@login_required
+def generate_script(trans_id):
+    """
+    This function is used to return the difference DDL of the specified
+    objects (ids of the comparison result) in one request.
+    """
+    # Check the transaction and connection status
+    status, error_msg, diff_model_obj, session_obj = \
+        check_transaction_status(trans_id)
+
+    if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
+        return make_json_response(success=0, errormsg=error_msg, status=404)
+
+    data = json.loads(request.data) if request.data else {}
+    ddl_cache = ComparisonCache.get(trans_id)
+    if ddl_cache is None:
+        return make_json_response(
+            success=0, status=410,
+            errormsg=gettext('Could not find the comparison result. '
+                             'Please compare again.'))
+
+    res = {}
+    try:
+        for result_id in data.get('ids', []):
+            sql = ddl_cache.get_ddl(int(result_id))
+            if sql is not None:
+                res[result_id] = sql['diff_ddl']
+    except Exception as e:
+        app.logger.exception(e)
+        return internal_server_error(errormsg=str(e))
+
+    return make_json_response(data=res)
+
+
+def check_version_compatibility(sid, tid, source_snapshot=None,
+                                target_snapshot=None):
+    """Check the version compatibility of source and target servers."""
+
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    server_info = []
+    for server_id, snapshot in ((sid, source_snapshot),
+                                (tid, target_snapshot)):
+        # Snapshot keeps the server type and version it was taken from.
+        if snapshot is not None:
+            server_info.append((snapshot['server_type'],
+                                snapshot['server_version']))
+            continue
+
+        server = Server.query.filter_by(id=server_id).first()
+        manager = driver.connection_manager(server.id)
+        if not manager.connection().connected():
+            return False, gettext('Server(s) disconnected.')
+        server_info.append((manager.server_type, manager.version))
+
+    (src_server_type, src_version), (tar_server_type, tar_version) = \
+        server_info
+
+    if src_server_type != tar_server_type:
         return False, gettext('Schema diff does not support the comparison '
                               'between Postgres Server and EDB Postgres '
                               'Advanced Server.')
@@ -745,8 +862,7 @@ def check_version_compatibility(sid, tid):
         else:
             return x + 10000 - x % 10000
 
-    if get_round_val(src_manager.version) == \
-            get_round_val(tar_manager.version):
+    if get_round_val(src_version) == get_round_val(tar_version):
         return True, None
 
     return False, gettext('Source and Target database server must be of '
@@ -773,23 +889,23 @@ def get_schemas(sid, did):
 
 def compare_database_objects(**kwargs):
     """
-    This function is used to compare the specified schema and their children.
+    This function is used to compare the database objects. Results of each
+    node are added into the comparison cache as soon as those are available.
 
     :param kwargs:
-    :return:
+    :return: total percentage done
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
     source_sid = kwargs.get('source_sid')
     source_did = kwargs.get('source_did')
     target_sid = kwargs.get('target_sid')
     target_did = kwargs.get('target_did')
-    diff_model_obj = kwargs.get('diff_model_obj')
     total_percent = kwargs.get('total_percent')
     node_percent = kwargs.get('node_percent')
     ignore_owner = kwargs.get('ignore_owner')
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
-    comparison_result = []
+    source_snapshot = kwargs.get('source_snapshot')
+    target_snapshot = kwargs.get('target_snapshot')
+    comparison_cache = kwargs.get('comparison_cache')
 
     all_registered_nodes = SchemaDiffRegistry.get_registered_nodes(None,
                                                                    'Database')
@@ -799,10 +915,7 @@ def compare_database_objects(**kwargs):
             msg = gettext('Comparing {0}'). \
                 format(gettext(view.blueprint.collection_label))
             app.logger.debug(msg)
-            diff_model_obj.set_comparison_info(msg, total_percent)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
+            comparison_cache.set_progress(msg, total_percent)
 
             res = view.compare(source_sid=source_sid,
                                source_did=source_did,
@@ -810,24 +923,27 @@ def compare_database_objects(**kwargs):
                                target_did=target_did,
                                group_name=gettext('Database Objects'),
                                ignore_owner=ignore_owner,
-                               ignore_whitespaces=ignore_whitespaces)
+                               ignore_whitespaces=ignore_whitespaces,
+                               source_snapshot=source_snapshot,
+                               target_snapshot=target_snapshot,
+                               ddl_cache=comparison_cache)
 
-            if res is not None:
-                comparison_result = comparison_result + res
+            if isinstance(res, list):
+                comparison_cache.add_results(res)
         total_percent = total_percent + node_percent
 
-    return comparison_result, total_percent
+    return total_percent
 
 
 def compare_schema_objects(**kwargs):
     """
     This function is used to compare the specified schema and their children.
+    Results of each node are added into the comparison cache as soon as those
+    are available.
 
     :param kwargs:
-    :return:
+    :return: total percentage done
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
     source_sid = kwargs.get('source_sid')
     source_did = kwargs.get('source_did')
     source_scid = kwargs.get('source_scid')
@@ -835,20 +951,20 @@ def compare_schema_objects(**kwargs):
     target_did = kwargs.get('target_did')
     target_scid = kwargs.get('target_scid')
     schema_name = kwargs.get('schema_name')
-    diff_model_obj = kwargs.get('diff_model_obj')
     total_percent = kwargs.get('total_percent')
     node_percent = kwargs.get('node_percent')
     is_schema_source_only = kwargs.get('is_schema_source_only', False)
     ignore_owner = kwargs.get('ignore_owner')
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
+    source_snapshot = kwargs.get('source_snapshot')
+    target_snapshot = kwargs.get('target_snapshot')
+    comparison_cache = kwargs.get('comparison_cache')
 
     source_schema_name = None
     if is_schema_source_only:
         driver = get_driver(PG_DEFAULT_DRIVER)
         source_schema_name = driver.qtIdent(None, schema_name)
 
-    comparison_result = []
-
     all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
     for node_name, node_view in all_registered_nodes.items():
         view = SchemaDiffRegistry.get_node_view(node_name)
@@ -861,10 +977,7 @@ def compare_schema_objects(**kwargs):
                     format(gettext(view.blueprint.collection_label),
                            gettext(schema_name))
             app.logger.debug(msg)
-            diff_model_obj.set_comparison_info(msg, total_percent)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
+            comparison_cache.set_progress(msg, total_percent)
 
             res = view.compare(source_sid=source_sid,
                                source_did=source_did,
@@ -875,31 +988,39 @@ def compare_schema_objects(**kwargs):
                                group_name=gettext(schema_name),
                                source_schema_name=source_schema_name,
                                ignore_owner=ignore_owner,
-                               ignore_whitespaces=ignore_whitespaces)
+                               ignore_whitespaces=ignore_whitespaces,
+                               source_snapshot=source_snapshot,
+                               target_snapshot=target_snapshot,
+                               ddl_cache=comparison_cache)
 
-            if res is not None:
-                comparison_result = comparison_result + res
+            if isinstance(res, list):
+                comparison_cache.add_results(res)
         total_percent = total_percent + node_percent
         # if total_percent is more then 100 then set it to less then 100
         if total_percent >= 100:
             total_percent = 96
 
-    return comparison_result, total_percent
+    return total_percent
 
 
-def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
+def fetch_compare_schemas(source_sid, source_did, target_sid, target_did,
+                          source_snapshot=None, target_snapshot=None):
     """
     This function is used to fetch all the schemas of source and target
-    database and compare them.
+    database (or snapshot) and compare them.
 
     :param source_sid:
     :param source_did:
     :param target_sid:
     :param target_did:
+    :param source_snapshot:
+    :param target_snapshot:
     :return:
     """
-    source_schemas = get_schemas(source_sid, source_did)
-    target_schemas = get_schemas(target_sid, target_did)
+    source_schemas = source_snapshot['schemas'] \
+        if source_snapshot is not None else get_schemas(source_sid, source_did)
+    target_schemas = target_snapshot['schemas'] \
+        if target_snapshot is not None else get_schemas(target_sid, target_did)
 
     src_schema_dict = {item['label']: item['_id'] for item in source_schemas}
     tar_schema_dict = {item['label']: item['_id'] for item in target_schemas}
@@ -940,7 +1061,9 @@ def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
 
 def compare_pre_validation(trans_id, source_sid, target_sid):
     """
-    This function is used to validate transaction id and version compatibility
+    This function is used to validate transaction id, snapshot files (if
+    specified as source_snapshot/target_snapshot request arguments) and
+    version compatibility
     :param trans_id:
     :param source_sid:
     :param target_sid:
@@ -952,12 +1075,120 @@ def compare_pre_validation(trans_id, source_sid, target_sid):
 
     if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
         res = make_json_response(success=0, errormsg=error_msg, status=404)
-        return False, res, None, None
+        return False, res, None, None, None
+
+    snapshot_files = (request.args.get('source_snapshot', None),
+                      request.args.get('target_snapshot', None))
+    snapshots = {'source_snapshot': None, 'target_snapshot': None}
+    for key, file_name in zip(('source_snapshot', 'target_snapshot'),
+                              snapshot_files):
+        if file_name:
+            status, snapshot_data = load_snapshot(file_name)
+            if not status:
+                res = make_json_response(success=0, errormsg=snapshot_data,
+                                         status=410)
+                return False, res, None, None, None
+            snapshots[key] = snapshot_data
 
     # Server version compatibility check
-    status, msg = check_version_compatibility(source_sid, target_sid)
+    status, msg = check_version_compatibility(source_sid, target_sid,
+                                              **snapshots)
     if not status:
         res = make_json_response(success=0, errormsg=msg, status=428)
-        return False, res, None, None
+        return False, res, None, None, None
+
+    diff_model_obj.set_snapshots(*snapshot_files)
 
-    return True, '', diff_model_obj, session_obj
+    return True, '', diff_model_obj, session_obj, snapshots
+
+
+def snapshot_ddl_compare(view, node_type, source_snapshot, target_snapshot,
+                         **kwargs):
+    """
+    This function is used to return the DDL of the object when either
+    source or target of the comparison is a snapshot.
+
+    :param view: node view object
+    :param node_type: type of the node
+    :param source_snapshot: source snapshot file
+    :param target_snapshot: target snapshot file
+    :return:
+    """
+    sql = {'diff_ddl': ''}
+    for side, file_name in (('source', source_snapshot),
+                            ('target', target_snapshot)):
+        sid = kwargs.get('{0}_sid'.format(side))
+        did = kwargs.get('{0}_did'.format(side))
+        scid = kwargs.get('{0}_scid'.format(side))
+        oid = kwargs.get('{0}_oid'.format(side))
+
+        if not file_name:
+            # Use the live object as both source and target to get its DDL.
+            live_sql = view.ddl_compare(
+                source_sid=sid, source_did=did, source_scid=scid,
+                target_sid=sid, target_did=did, target_scid=scid,
+                source_oid=oid, target_oid=oid, comp_status='identical')
+            sql[side + '_ddl'] = live_sql['source_ddl']
+            continue
+
+        status, snapshot_data = load_snapshot(file_name)
+        entry = find_snapshot_entry(snapshot_data, node_type, scid, oid) \
+            if status else None
+        sql[side + '_ddl'] = entry['ddl'] if entry is not None else ''
+
+    return sql
+
+
+@blueprint.route(
+    '/snapshot/<int:sid>/<int:did>',
+    methods=["POST"],
+    endpoint="snapshot"
+)
+@blueprint.route(
+    '/snapshot/<int:sid>/<int:did>/<int:scid>',
+    methods=["POST"],
+    endpoint="snapshot"
+)
+@login_required
+def snapshot(sid, did, scid=None):
+    """
+    This function will take the snapshot of the database or of the specified
+    schema and write it to the specified file, which can be used later as
+    source or target of the comparison.
+    """
+    data = json.loads(request.data) if request.data else {}
+    file_name = data.get('file', None)
+    if not file_name:
+        return bad_request(
+            errormsg=gettext('Please specify the snapshot file name.'))
+
+    schemas = get_schemas(sid, did)
+    if schemas is None:
+        return internal_server_error(
+            errormsg=gettext('Unable to fetch the schemas.'))
+
+    if scid is not None:
+        schemas = [sch for sch in schemas if sch['_id'] == scid]
+        if len(schemas) == 0:
+            return bad_request(
+                errormsg=gettext('Could not find the specified schema.'))
+
+    try:
+        file_path = get_snapshot_file_path(file_name)
+    except InternalServerError as e:
+        return internal_server_error(errormsg=e.description)
+
+    try:
+        snapshot_data = create_snapshot(
+            sid, did, schemas, include_database_objects=scid is None)
+        write_snapshot_file(file_path, snapshot_data)
+    except Exception as e:
+        app.logger.exception(e)
+        return internal_server_error(errormsg=str(e))
+
+    return make_json_response(
+        data={'file': file_name,
+              'database': snapshot_data['database'],
+              'schemas': [sch['label'] for sch in schemas]},
+        info=gettext('Snapshot created successfully.')
+    )
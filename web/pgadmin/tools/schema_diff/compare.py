@@ -14,6 +14,8 @@ from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.ajax import internal_server_error
 from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries
+from pgadmin.tools.schema_diff.snapshot import get_snapshot_objects, \
+    get_snapshot_schema_name
 
 
 class SchemaDiffObjectCompare:
@@ -45,6 +47,36 @@ class SchemaDiffObjectCompare:
 
         return status, schema_name
 
+    def get_target_schema(self, target_params, target_snapshot=None):
+        """
+        This function will return the target schema name either from the
+        snapshot or from the live database.
+        """
+        if target_snapshot is not None:
+            return True, get_snapshot_schema_name(target_snapshot,
+                                                  target_params.get('scid'))
+
+        return self.get_schema(target_params.get('sid'),
+                               target_params.get('did'),
+                               target_params.get('scid'))
+
+    def fetch_compare_objects(self, snapshot=None, **kwargs):
+        """
+        This function will fetch the objects to compare from the snapshot
+        if specified else from the live database.
+
+        :param snapshot: snapshot dictionary
+        :param kwargs: sid, did and scid (if required) of the objects
+        :return: object data dictionary and snapshot entries (if any)
+        """
+        if snapshot is not None:
+            entries = get_snapshot_objects(snapshot, self.node_type,
+                                           kwargs.get('scid'))
+            return {name: entry['data'] for name, entry in entries.items()}, \
+                entries
+
+        return self.fetch_objects_to_compare(**kwargs), None
+
     def compare(self, **kwargs):
         """
         This function is used to compare all the objects
@@ -62,27 +94,36 @@ class SchemaDiffObjectCompare:
 
         group_name = kwargs.get('group_name')
         source_schema_name = kwargs.get('source_schema_name', None)
+        source_snapshot = kwargs.get('source_snapshot', None)
+        target_snapshot = kwargs.get('target_snapshot', None)
         source = {}
         target = {}
+        source_entries = None
+        target_entries = None
 
-        status, target_schema = self.get_schema(kwargs.get('target_sid'),
-                                                kwargs.get('target_did'),
-                                                kwargs.get('target_scid'))
+        status, target_schema = self.get_target_schema(
+            {'sid': kwargs.get('target_sid'),
+             'did': kwargs.get('target_did'),
+             'scid': kwargs.get('target_scid')}, target_snapshot)
         if not status:
             return internal_server_error(errormsg=target_schema)
 
         if group_name == 'Database Objects':
-            source = self.fetch_objects_to_compare(**source_params)
-            target = self.fetch_objects_to_compare(**target_params)
+            source, source_entries = self.fetch_compare_objects(
+                source_snapshot, **source_params)
+            target, target_entries = self.fetch_compare_objects(
+                target_snapshot, **target_params)
         else:
             source_params['scid'] = kwargs.get('source_scid')
             target_params['scid'] = kwargs.get('target_scid')
 
             if 'scid' in source_params and source_params['scid'] is not None:
-                source = self.fetch_objects_to_compare(**source_params)
+                source, source_entries = self.fetch_compare_objects(
+                    source_snapshot, **source_params)
 
             if 'scid' in target_params and target_params['scid'] is not None:
-                target = self.fetch_objects_to_compare(**target_params)
+                target, target_entries = self.fetch_compare_objects(
+                    target_snapshot, **target_params)
 
         # If both the dict have no items then return None.
         if not (source or target) or (
@@ -101,7 +142,10 @@ class SchemaDiffObjectCompare:
                                     ignore_keys=self.keys_to_ignore,
                                     source_schema_name=source_schema_name,
                                     ignore_owner=ignore_owner,
-                                    ignore_whitespaces=ignore_whitespaces)
+                                    ignore_whitespaces=ignore_whitespaces,
+                                    source_snapshot=source_entries,
+                                    target_snapshot=target_entries,
+                                    ddl_cache=kwargs.get('ddl_cache', None))
 
     def ddl_compare(self, **kwargs):
         """
@@ -0,0 +1,186 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""In-process cache of the schema diff comparison."""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from flask_security import current_user
+
+import config
+
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.tools.schema_diff.directory_compare import get_object_ddl
+
+
+class ComparisonCache(object):
+    """
+    ComparisonCache
+
+    Keeps the comparison results and progress of a schema diff transaction
+    as those are computed, so that the results of each node are available
+    to the poll request without waiting for the whole comparison, along with
+    the information required to generate the DDL of the compared objects on
+    demand and the DDL already generated. It is kept in the process memory
+    instead of the session as it can be large for the big databases, hence
+    the caches are bounded by age and count (see SCHEMA_DIFF_CACHE_MAX_AGE
+    and SCHEMA_DIFF_CACHE_MAX_ENTRIES), the least recently used first.
+    """
+    _caches = OrderedDict()
+    _lock = Lock()
+
+    def __init__(self):
+        self._lock = Lock()
+        self._last_used = time.time()
+        self._pending = dict()
+        self._ddl = dict()
+        self._results = []
+        self._message = ''
+        self._percentage = 0
+
+    @staticmethod
+    def _key(trans_id):
+        return current_user.id, str(trans_id)
+
+    @classmethod
+    def create(cls, trans_id):
+        """
+        This function creates the new cache for the transaction, discarding
+        the cache of the previous comparison (if any).
+
+        :param trans_id: schema diff transaction id
+        :return:
+        """
+        cache = cls()
+        key = cls._key(trans_id)
+        with cls._lock:
+            cls._caches.pop(key, None)
+            cls._caches[key] = cache
+            cls._discard_old_caches()
+        return cache
+
+    @classmethod
+    def _discard_old_caches(cls):
+        """
+        Used internally by create to discard the caches not used for
+        SCHEMA_DIFF_CACHE_MAX_AGE seconds, and the least recently used ones
+        beyond SCHEMA_DIFF_CACHE_MAX_ENTRIES.
+        """
+        expired = time.time() - config.SCHEMA_DIFF_CACHE_MAX_AGE
+        for key in [key for key, cache in cls._caches.items()
+                    if cache._last_used < expired]:
+            del cls._caches[key]
+
+        while len(cls._caches) > config.SCHEMA_DIFF_CACHE_MAX_ENTRIES:
+            cls._caches.popitem(last=False)
+
+    @classmethod
+    def get(cls, trans_id):
+        """
+        This function returns the cache of the transaction.
+
+        :param trans_id: schema diff transaction id
+        :return: cache or None
+        """
+        key = cls._key(trans_id)
+        with cls._lock:
+            cache = cls._caches.get(key, None)
+            if cache is not None:
+                cache._last_used = time.time()
+                cls._caches.move_to_end(key)
+            return cache
+
+    @classmethod
+    def remove(cls, trans_id):
+        """
+        This function removes the cache of the transaction.
+
+        :param trans_id: schema diff transaction id
+        """
+        with cls._lock:
+            cls._caches.pop(cls._key(trans_id), None)
+
+    def set_progress(self, msg, percentage):
+        """
+        This function sets the progress message and percentage.
+
+        :param msg:
+        :param percentage:
+        """
+        with self._lock:
+            self._message = msg
+            self._percentage = percentage
+            # The comparison is still running.
+            self._last_used = time.time()
+
+    def get_progress(self):
+        """
+        This function returns the progress message and percentage.
+        """
+        with self._lock:
+            return self._message, self._percentage
+
+    def add_results(self, results):
+        """
+        This function appends the comparison results of a node.
+
+        :param results: list of comparison results
+        """
+        with self._lock:
+            self._results.extend(results)
+
+    def get_results(self, cursor=0):
+        """
+        This function returns the comparison results available after the
+        specified cursor, along with the cursor for the next call.
+
+        :param cursor: number of results already received
+        :return: list of results and next cursor
+        """
+        with self._lock:
+            return self._results[cursor:], len(self._results)
+
+    def add(self, result_id, **kwargs):
+        """
+        This function registers the compared object whose DDL will be
+        generated on demand.
+
+        :param result_id: id of the object in the comparison result
+        :param kwargs: arguments of get_object_ddl()
+        """
+        with self._lock:
+            self._pending[result_id] = kwargs
+
+    def get_ddl(self, result_id):
+        """
+        This function returns the source, target and difference DDL of the
+        compared object, generating it once if not done yet.
+
+        :param result_id: id of the object in the comparison result
+        :return: dictionary of DDL or None if object is not found
+        """
+        with self._lock:
+            if result_id in self._ddl:
+                return self._ddl[result_id]
+            ddl_args = self._pending.get(result_id, None)
+
+        if ddl_args is None:
+            return None
+
+        view = SchemaDiffRegistry.get_node_view(ddl_args['node'])
+        sql = get_object_ddl(view, **ddl_args)
+
+        with self._lock:
+            self._ddl[result_id] = sql
+            # Data of the object is not required anymore.
+            self._pending.pop(result_id, None)
+
+        return sql
@@ -10,11 +10,15 @@
 """Directory comparison"""
 
 import copy
+import hashlib
 import string
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
 from flask import current_app
+from config import PG_DEFAULT_DRIVER
+from pgadmin.utils.driver import get_driver
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PGADMIN_STRING_SEPARATOR
+from pgadmin.tools.schema_diff.snapshot import SNAPSHOT_TARGET_SCHEMA
 
 count = 1
 
@@ -36,6 +40,49 @@ def _get_user_mapping_name(user_mapping_name):
     return mapping_name
 
 
+def _get_dependencies(node, view_object, params, object_id, entry=None):
+    """
+    Get the dependencies of the object.
+    :param node: node type.
+    :param view_object: view object for get dependencies.
+    :param params: parameters of the object.
+    :param object_id: object id.
+    :param entry: snapshot entry if the object is from the snapshot.
+    :return: list of dependencies.
+    """
+    if entry is not None:
+        return entry['dependencies']
+
+    if node == 'table':
+        temp_params = copy.deepcopy(params)
+        temp_params['tid'] = object_id
+        temp_params['json_resp'] = False
+        return view_object.get_table_submodules_dependencies(**temp_params)
+
+    # Connection of the view may belong to the other side of the
+    # comparison, so use the connection of the object.
+    conn = get_driver(PG_DEFAULT_DRIVER).connection_manager(
+        params['sid']).connection(did=params['did'])
+    return view_object.get_dependencies(
+        conn, object_id, where=None, show_system_objects=None,
+        is_schema_diff=True)
+
+
+def _add_object_ddl(result, view_object, ddl_cache, **kwargs):
+    """
+    Add the DDL of the object into the result, or register the object into
+    the DDL cache so that the DDL will be generated on demand.
+    :param result: comparison result of the object.
+    :param view_object: view object for get sql.
+    :param ddl_cache: DDL cache of the comparison.
+    :return:
+    """
+    if ddl_cache is None:
+        result.update(get_object_ddl(view_object, **kwargs))
+    else:
+        ddl_cache.add(result['id'], **kwargs)
+
+
 def _get_source_list(**kwargs):
     """
     Get only source list.
@@ -51,6 +98,8 @@ def _get_source_list(**kwargs):
     group_name = kwargs.get('group_name')
     source_schema_name = kwargs.get('source_schema_name')
     target_schema = kwargs.get('target_schema')
+    source_snapshot = kwargs.get('source_snapshot')
+    ddl_cache = kwargs.get('ddl_cache')
 
     global count
     source_only = []
@@ -58,54 +107,34 @@ def _get_source_list(**kwargs):
         source_object_id = None
         if 'oid' in source_dict[item]:
             source_object_id = source_dict[item]['oid']
-
-        if node == 'table':
-            temp_src_params = copy.deepcopy(source_params)
-            temp_src_params['tid'] = source_object_id
-            temp_src_params['json_resp'] = False
-            temp_src_params['add_not_exists_clause'] = True
-            source_ddl = \
-                view_object.get_sql_from_table_diff(**temp_src_params)
-            temp_src_params.update({'target_schema': target_schema})
-            diff_ddl = view_object.get_sql_from_table_diff(**temp_src_params)
-            source_dependencies = \
-                view_object.get_table_submodules_dependencies(
-                    **temp_src_params)
-        else:
-            temp_src_params = copy.deepcopy(source_params)
-            temp_src_params['oid'] = source_object_id
-            # Provide Foreign Data Wrapper ID
-            if 'fdwid' in source_dict[item]:
-                temp_src_params['fdwid'] = source_dict[item]['fdwid']
-            # Provide Foreign Server ID
-            if 'fsid' in source_dict[item]:
-                temp_src_params['fsid'] = source_dict[item]['fsid']
-
-            source_ddl = view_object.get_sql_from_diff(**temp_src_params)
-            temp_src_params.update({'target_schema': target_schema})
-            diff_ddl = view_object.get_sql_from_diff(**temp_src_params)
-            source_dependencies = view_object.get_dependencies(
-                view_object.conn, source_object_id, where=None,
-                show_system_objects=None, is_schema_diff=True)
+        source_entry = source_snapshot[item] \
+            if source_snapshot is not None else None
 
         title = item
         if node == 'user_mapping':
             title = _get_user_mapping_name(item)
 
-        source_only.append({
+        result = {
             'id': count,
             'type': node,
             'label': node_label,
             'title': title,
             'oid': source_object_id,
             'status': SchemaDiffModel.COMPARISON_STATUS['source_only'],
-            'source_ddl': source_ddl,
-            'target_ddl': '',
-            'diff_ddl': diff_ddl,
             'group_name': group_name,
-            'dependencies': source_dependencies,
+            'dependencies': _get_dependencies(node, view_object,
+                                              source_params,
+                                              source_object_id,
+                                              source_entry),
             'source_schema_name': source_schema_name
-        })
+        }
+        _add_object_ddl(result, view_object, ddl_cache,
+                        status='source_only', node=node,
+                        source_data=source_dict[item],
+                        source_params=copy.deepcopy(source_params),
+                        target_schema=target_schema,
+                        source_entry=source_entry)
+        source_only.append(result)
         count += 1
 
     return source_only
@@ -127,7 +156,8 @@ def _delete_keys(temp_tgt_params):
 
 
 def _get_target_list(removed, target_dict, node, target_params, view_object,
-                     node_label, group_name):
+                     node_label, group_name, target_snapshot=None,
+                     ddl_cache=None):
     """
     Get only target list.
     :param removed: removed list.
@@ -137,6 +167,8 @@ def _get_target_list(removed, target_dict, node, target_params, view_object,
     :param view_object: view object for get sql.
     :param node_label: node label.
     :param group_name: group name.
+    :param target_snapshot: snapshot entries if target is a snapshot.
+    :param ddl_cache: DDL cache of the comparison.
     :return: list of target dict.
     """
     global count
@@ -146,46 +178,27 @@ def _get_target_list(removed, target_dict, node, target_params, view_object,
         if 'oid' in target_dict[item]:
             target_object_id = target_dict[item]['oid']
 
-        if node == 'table':
-            temp_tgt_params = copy.deepcopy(target_params)
-            temp_tgt_params['tid'] = target_object_id
-            temp_tgt_params['json_resp'] = False
-            temp_tgt_params['add_not_exists_clause'] = True
-            target_ddl = view_object.get_sql_from_table_diff(**temp_tgt_params)
-            _delete_keys(temp_tgt_params)
-            diff_ddl = view_object.get_drop_sql(**temp_tgt_params)
-        else:
-            temp_tgt_params = copy.deepcopy(target_params)
-            temp_tgt_params['oid'] = target_object_id
-            # Provide Foreign Data Wrapper ID
-            if 'fdwid' in target_dict[item]:
-                temp_tgt_params['fdwid'] = target_dict[item]['fdwid']
-            # Provide Foreign Server ID
-            if 'fsid' in target_dict[item]:
-                temp_tgt_params['fsid'] = target_dict[item]['fsid']
-
-            target_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
-            temp_tgt_params.update(
-                {'drop_sql': True})
-            diff_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
-
         title = item
         if node == 'user_mapping':
             title = _get_user_mapping_name(item)
 
-        target_only.append({
+        result = {
             'id': count,
             'type': node,
             'label': node_label,
             'title': title,
             'oid': target_object_id,
             'status': SchemaDiffModel.COMPARISON_STATUS['target_only'],
-            'source_ddl': '',
-            'target_ddl': target_ddl,
-            'diff_ddl': diff_ddl,
             'group_name': group_name,
             'dependencies': []
-        })
+        }
+        _add_object_ddl(result, view_object, ddl_cache,
+                        status='target_only', node=node,
+                        target_data=target_dict[item],
+                        target_params=copy.deepcopy(target_params),
+                        target_entry=target_snapshot[item]
+                        if target_snapshot is not None else None)
+        target_only.append(result)
         count += 1
 
     return target_only
@@ -254,22 +267,29 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
     group_name = kwargs['group_name']
     target_schema = kwargs.get('target_schema')
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
+    source_snapshot = kwargs.get('source_snapshot')
+    target_snapshot = kwargs.get('target_snapshot')
+    identical_keys = kwargs.get('identical_keys', set())
+    ddl_cache = kwargs.get('ddl_cache')
     for key in intersect_keys:
         source_object_id, target_object_id = \
             get_source_target_oid(source_dict, target_dict, key)
 
-        # Recursively Compare the two dictionary
-        current_app.logger.debug(
-            "Schema Diff: Source Dict: {0}".format(dict1[key]))
-        current_app.logger.debug(
-            "Schema Diff: Target Dict: {0}".format(dict2[key]))
+        if key not in identical_keys:
+            # Recursively Compare the two dictionary
+            current_app.logger.debug(
+                "Schema Diff: Source Dict: {0}".format(dict1[key]))
+            current_app.logger.debug(
+                "Schema Diff: Target Dict: {0}".format(dict2[key]))
 
-        if are_dictionaries_identical(dict1[key], dict2[key], ignore_keys,
-                                      ignore_whitespaces):
-            title = key
-            if node == 'user_mapping':
-                title = _get_user_mapping_name(key)
+        title = key
+        if node == 'user_mapping':
+            title = _get_user_mapping_name(key)
 
+        # Objects with the same digest are identical, compare the rest of
+        # them recursively.
+        if key in identical_keys or are_dictionaries_identical(
+                dict1[key], dict2[key], ignore_keys, ignore_whitespaces):
             identical.append({
                 'id': count,
                 'type': node,
@@ -287,68 +307,12 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
                 if 'scid' in target_params else 0,
             })
         else:
-            if node == 'table':
-                temp_src_params = copy.deepcopy(source_params)
-                temp_tgt_params = copy.deepcopy(target_params)
-                # Add submodules into the ignore keys so that directory
-                # difference won't include those in added, deleted and changed
-                sub_module = ['index', 'rule', 'trigger', 'compound_trigger']
-                temp_ignore_keys = view_object.keys_to_ignore + sub_module
-
-                diff_dict = directory_diff(
-                    dict1[key], dict2[key],
-                    ignore_keys=temp_ignore_keys,
-                    difference={}
-                )
-                parse_acl(dict1[key], dict2[key], diff_dict)
-
-                temp_src_params['tid'] = source_object_id
-                temp_tgt_params['tid'] = target_object_id
-                temp_src_params['json_resp'] = \
-                    temp_tgt_params['json_resp'] = False
-
-                source_ddl = \
-                    view_object.get_sql_from_table_diff(**temp_src_params)
-                diff_dependencies = \
-                    view_object.get_table_submodules_dependencies(
-                        **temp_src_params)
-                target_ddl = \
-                    view_object.get_sql_from_table_diff(**temp_tgt_params)
-                diff_ddl = view_object.get_sql_from_submodule_diff(
-                    source_params=temp_src_params,
-                    target_params=temp_tgt_params,
-                    source=dict1[key], target=dict2[key], diff_dict=diff_dict,
-                    target_schema=target_schema,
-                    ignore_whitespaces=ignore_whitespaces)
-            else:
-                temp_src_params = copy.deepcopy(source_params)
-                temp_tgt_params = copy.deepcopy(target_params)
-                diff_dict = directory_diff(
-                    dict1[key], dict2[key],
-                    ignore_keys=view_object.keys_to_ignore, difference={}
-                )
-                parse_acl(dict1[key], dict2[key], diff_dict)
-
-                temp_src_params['oid'] = source_object_id
-                temp_tgt_params['oid'] = target_object_id
-                # Provide Foreign Data Wrapper ID
-                _check_add_req_ids(source_dict, target_dict, key,
-                                   temp_src_params, temp_tgt_params)
-
-                source_ddl = view_object.get_sql_from_diff(**temp_src_params)
-                diff_dependencies = view_object.get_dependencies(
-                    view_object.conn, source_object_id, where=None,
-                    show_system_objects=None, is_schema_diff=True)
-                target_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
-                temp_tgt_params.update(
-                    {'data': diff_dict, 'target_schema': target_schema})
-                diff_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
-
-            title = key
-            if node == 'user_mapping':
-                title = _get_user_mapping_name(key)
-
-            different.append({
+            source_entry = source_snapshot[key] \
+                if source_snapshot is not None else None
+            target_entry = target_snapshot[key] \
+                if target_snapshot is not None else None
+
+            result = {
                 'id': count,
                 'type': node,
                 'label': node_label,
@@ -357,17 +321,284 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
                 'source_oid': source_object_id,
                 'target_oid': target_object_id,
                 'status': SchemaDiffModel.COMPARISON_STATUS['different'],
-                'source_ddl': source_ddl,
-                'target_ddl': target_ddl,
-                'diff_ddl': diff_ddl,
                 'group_name': group_name,
-                'dependencies': diff_dependencies
-            })
+                'dependencies': _get_dependencies(node, view_object,
+                                                  source_params,
+                                                  source_object_id,
+                                                  source_entry)
+            }
+            _add_object_ddl(result, view_object, ddl_cache,
+                            status='different', node=node,
+                            source_data=dict1[key], target_data=dict2[key],
+                            source_params=copy.deepcopy(source_params),
+                            target_params=copy.deepcopy(target_params),
+                            target_schema=target_schema,
+                            ignore_whitespaces=ignore_whitespaces,
+                            source_entry=source_entry,
+                            target_entry=target_entry)
+            different.append(result)
         count += 1
 
     return identical, different
 
 
+def _get_source_only_ddl(view_object, node, source_data, source_params,
+                         target_schema, source_entry=None):
+    """
+    Get the source and difference DDL of the source only object.
+    :return: source DDL and difference DDL.
+    """
+    # DDL of the snapshot objects is generated while taking the
+    # snapshot as there is no live database to fetch it from, for a
+    # placeholder schema which is replaced by the target schema.
+    if source_entry is not None:
+        diff_ddl = source_entry['create_ddl']
+        if target_schema is not None:
+            diff_ddl = diff_ddl.replace(
+                SNAPSHOT_TARGET_SCHEMA,
+                get_driver(PG_DEFAULT_DRIVER).qtIdent(None, target_schema))
+        return source_entry['ddl'], diff_ddl
+
+    source_object_id = source_data['oid'] if 'oid' in source_data else None
+    temp_src_params = copy.deepcopy(source_params)
+    if node == 'table':
+        temp_src_params['tid'] = source_object_id
+        temp_src_params['json_resp'] = False
+        temp_src_params['add_not_exists_clause'] = True
+        source_ddl = view_object.get_sql_from_table_diff(**temp_src_params)
+        temp_src_params.update({'target_schema': target_schema})
+        diff_ddl = view_object.get_sql_from_table_diff(**temp_src_params)
+    else:
+        temp_src_params['oid'] = source_object_id
+        # Provide Foreign Data Wrapper ID
+        if 'fdwid' in source_data:
+            temp_src_params['fdwid'] = source_data['fdwid']
+        # Provide Foreign Server ID
+        if 'fsid' in source_data:
+            temp_src_params['fsid'] = source_data['fsid']
+
+        source_ddl = view_object.get_sql_from_diff(**temp_src_params)
+        temp_src_params.update({'target_schema': target_schema})
+        diff_ddl = view_object.get_sql_from_diff(**temp_src_params)
+
+    return source_ddl, diff_ddl
+
+
+def _get_target_only_ddl(view_object, node, target_data, target_params,
+                         target_entry=None):
+    """
+    Get the target and difference (drop) DDL of the target only object.
+    :return: target DDL and difference DDL.
+    """
+    if target_entry is not None:
+        return target_entry['ddl'], target_entry['drop_ddl']
+
+    target_object_id = target_data['oid'] if 'oid' in target_data else None
+    temp_tgt_params = copy.deepcopy(target_params)
+    if node == 'table':
+        temp_tgt_params['tid'] = target_object_id
+        temp_tgt_params['json_resp'] = False
+        temp_tgt_params['add_not_exists_clause'] = True
+        target_ddl = view_object.get_sql_from_table_diff(**temp_tgt_params)
+        _delete_keys(temp_tgt_params)
+        diff_ddl = view_object.get_drop_sql(**temp_tgt_params)
+    else:
+        temp_tgt_params['oid'] = target_object_id
+        # Provide Foreign Data Wrapper ID
+        if 'fdwid' in target_data:
+            temp_tgt_params['fdwid'] = target_data['fdwid']
+        # Provide Foreign Server ID
+        if 'fsid' in target_data:
+            temp_tgt_params['fsid'] = target_data['fsid']
+
+        target_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
+        temp_tgt_params.update(
+            {'drop_sql': True})
+        diff_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
+
+    return target_ddl, diff_ddl
+
+
+def _get_different_ddl(view_object, node, source_data, target_data,
+                       **kwargs):
+    """
+    Get the source, target and difference DDL of the object which is
+    different in source and target.
+    :return: source DDL, target DDL and difference DDL.
+    """
+    source_params = kwargs['source_params']
+    target_params = kwargs['target_params']
+    target_schema = kwargs.get('target_schema')
+    ignore_whitespaces = kwargs.get('ignore_whitespaces')
+    source_entry = kwargs.get('source_entry')
+    target_entry = kwargs.get('target_entry')
+
+    if source_entry is not None or target_entry is not None:
+        return _get_snapshot_different_ddl(
+            view_object, node, source_data, target_data, source_entry,
+            target_entry, source_params=source_params,
+            target_params=target_params, target_schema=target_schema)
+
+    source_object_id = source_data['oid'] if 'oid' in source_data else None
+    target_object_id = target_data['oid'] if 'oid' in target_data else None
+    temp_src_params = copy.deepcopy(source_params)
+    temp_tgt_params = copy.deepcopy(target_params)
+
+    if node == 'table':
+        # Add submodules into the ignore keys so that directory
+        # difference won't include those in added, deleted and changed
+        sub_module = ['index', 'rule', 'trigger', 'compound_trigger']
+        temp_ignore_keys = view_object.keys_to_ignore + sub_module
+
+        diff_dict = directory_diff(
+            source_data, target_data,
+            ignore_keys=temp_ignore_keys,
+            difference={}
+        )
+        parse_acl(source_data, target_data, diff_dict)
+
+        temp_src_params['tid'] = source_object_id
+        temp_tgt_params['tid'] = target_object_id
+        temp_src_params['json_resp'] = \
+            temp_tgt_params['json_resp'] = False
+
+        source_ddl = view_object.get_sql_from_table_diff(**temp_src_params)
+        target_ddl = view_object.get_sql_from_table_diff(**temp_tgt_params)
+        diff_ddl = view_object.get_sql_from_submodule_diff(
+            source_params=temp_src_params,
+            target_params=temp_tgt_params,
+            source=source_data, target=target_data, diff_dict=diff_dict,
+            target_schema=target_schema,
+            ignore_whitespaces=ignore_whitespaces)
+    else:
+        diff_dict = directory_diff(
+            source_data, target_data,
+            ignore_keys=view_object.keys_to_ignore, difference={}
+        )
+        parse_acl(source_data, target_data, diff_dict)
+
+        temp_src_params['oid'] = source_object_id
+        temp_tgt_params['oid'] = target_object_id
+        # Provide Foreign Data Wrapper ID
+        _check_add_req_ids({'obj': source_data}, {'obj': target_data}, 'obj',
+                           temp_src_params, temp_tgt_params)
+
+        source_ddl = view_object.get_sql_from_diff(**temp_src_params)
+        target_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
+        temp_tgt_params.update(
+            {'data': diff_dict, 'target_schema': target_schema})
+        diff_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
+
+    return source_ddl, target_ddl, diff_ddl
+
+
+def _get_snapshot_different_ddl(view_object, node, source_data, target_data,
+                                source_entry, target_entry, **kwargs):
+    """
+    Get the source, target and difference DDL of the object which is
+    different when either source or target is a snapshot.
+
+    The difference DDL can only be generated against a live target, for the
+    target snapshot or for the tables (whose sub-modules are compared using
+    the live source) the object is dropped and created again.
+    :param view_object: view object for get sql.
+    :param node: node type.
+    :param source_data: source object dict.
+    :param target_data: target object dict.
+    :param source_entry: snapshot entry if source is a snapshot.
+    :param target_entry: snapshot entry if target is a snapshot.
+    :return: source DDL, target DDL and difference DDL.
+    """
+    source_params = kwargs['source_params']
+    target_params = kwargs['target_params']
+    target_schema = kwargs.get('target_schema')
+    source_object_id = source_data['oid'] if 'oid' in source_data else None
+    target_object_id = target_data['oid'] if 'oid' in target_data else None
+
+    if source_entry is not None:
+        source_ddl = source_entry['ddl']
+    else:
+        temp_src_params = copy.deepcopy(source_params)
+        if node == 'table':
+            temp_src_params['tid'] = source_object_id
+            temp_src_params['json_resp'] = False
+            source_ddl = \
+                view_object.get_sql_from_table_diff(**temp_src_params)
+        else:
+            temp_src_params['oid'] = source_object_id
+            _check_add_req_ids({'obj': source_data}, {'obj': target_data},
+                               'obj', temp_src_params, {})
+            source_ddl = view_object.get_sql_from_diff(**temp_src_params)
+
+    temp_tgt_params = copy.deepcopy(target_params)
+    if target_entry is not None:
+        target_ddl = target_entry['ddl']
+        drop_ddl = target_entry['drop_ddl']
+    elif node == 'table':
+        temp_tgt_params['tid'] = target_object_id
+        temp_tgt_params['json_resp'] = False
+        target_ddl = view_object.get_sql_from_table_diff(**temp_tgt_params)
+        _delete_keys(temp_tgt_params)
+        drop_ddl = view_object.get_drop_sql(**temp_tgt_params)
+    else:
+        temp_tgt_params['oid'] = target_object_id
+        _check_add_req_ids({'obj': source_data}, {'obj': target_data}, 'obj',
+                           {}, temp_tgt_params)
+        target_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
+        diff_dict = directory_diff(
+            source_data, target_data,
+            ignore_keys=view_object.keys_to_ignore, difference={}
+        )
+        parse_acl(source_data, target_data, diff_dict)
+        temp_tgt_params.update(
+            {'data': diff_dict, 'target_schema': target_schema})
+        diff_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
+        return source_ddl, target_ddl, diff_ddl
+
+    diff_ddl = drop_ddl + '\n\n' + source_ddl
+    return source_ddl, target_ddl, diff_ddl
+
+
+def get_object_ddl(view_object, **kwargs):
+    """
+    This function generates the source, target and difference DDL of the
+    compared object as per its comparison status.
+
+    :param view_object: view object for get sql.
+    :param kwargs: comparison status, node type, data, parameters and
+    snapshot entries of the source and target object.
+    :return: dictionary of source, target and difference DDL.
+    """
+    status = kwargs.get('status')
+    node = kwargs.get('node')
+
+    if status == 'source_only':
+        source_ddl, diff_ddl = _get_source_only_ddl(
+            view_object, node, kwargs['source_data'],
+            kwargs['source_params'], kwargs.get('target_schema'),
+            kwargs.get('source_entry'))
+        return {'source_ddl': source_ddl, 'target_ddl': '',
+                'diff_ddl': diff_ddl}
+
+    if status == 'target_only':
+        target_ddl, diff_ddl = _get_target_only_ddl(
+            view_object, node, kwargs['target_data'],
+            kwargs['target_params'], kwargs.get('target_entry'))
+        return {'source_ddl': '', 'target_ddl': target_ddl,
+                'diff_ddl': diff_ddl}
+
+    source_ddl, target_ddl, diff_ddl = _get_different_ddl(
+        view_object, node, kwargs['source_data'], kwargs['target_data'],
+        source_params=kwargs['source_params'],
+        target_params=kwargs['target_params'],
+        target_schema=kwargs.get('target_schema'),
+        ignore_whitespaces=kwargs.get('ignore_whitespaces'),
+        source_entry=kwargs.get('source_entry'),
+        target_entry=kwargs.get('target_entry'))
+    return {'source_ddl': source_ddl, 'target_ddl': target_ddl,
+            'diff_ddl': diff_ddl}
+
+
 def compare_dictionaries(**kwargs):
     """
     This function will compare the two dictionaries.
@@ -388,13 +619,13 @@ def compare_dictionaries(**kwargs):
     source_schema_name = kwargs.get('source_schema_name')
     ignore_owner = kwargs.get('ignore_owner')
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
-
-    dict1 = copy.deepcopy(source_dict)
-    dict2 = copy.deepcopy(target_dict)
+    source_snapshot = kwargs.get('source_snapshot')
+    target_snapshot = kwargs.get('target_snapshot')
+    ddl_cache = kwargs.get('ddl_cache')
 
     # Find the duplicate keys in both the dictionaries
-    dict1_keys = set(dict1.keys())
-    dict2_keys = set(dict2.keys())
+    dict1_keys = set(source_dict.keys())
+    dict2_keys = set(target_dict.keys())
     intersect_keys = dict1_keys.intersection(dict2_keys)
 
     # Add gid to the params
@@ -410,13 +641,16 @@ def compare_dictionaries(**kwargs):
                                    node_label=node_label,
                                    group_name=group_name,
                                    source_schema_name=source_schema_name,
-                                   target_schema=target_schema)
+                                   target_schema=target_schema,
+                                   source_snapshot=source_snapshot,
+                                   ddl_cache=ddl_cache)
 
     target_only = []
     # Keys that are available in target and missing in source.
     removed = dict2_keys - dict1_keys
     target_only = _get_target_list(removed, target_dict, node, target_params,
-                                   view_object, node_label, group_name)
+                                   view_object, node_label, group_name,
+                                   target_snapshot, ddl_cache)
 
     # if ignore_owner is True then add all the possible owner keys to the
     # ignore keys.
@@ -426,6 +660,25 @@ def compare_dictionaries(**kwargs):
                       'typeowner']
         ignore_keys = ignore_keys + owner_keys
 
+    # Objects having the same digest are identical, only the rest of them
+    # are copied (as the comparison sorts the lists in place) and compared
+    # in detail.
+    source_digests = get_object_digests(source_dict, intersect_keys,
+                                        ignore_keys, ignore_whitespaces,
+                                        source_snapshot)
+    target_digests = get_object_digests(target_dict, intersect_keys,
+                                        ignore_keys, ignore_whitespaces,
+                                        target_snapshot)
+    identical_keys = set(
+        key for key in intersect_keys
+        if source_digests[key] is not None and
+        source_digests[key] == target_digests[key])
+
+    dict1 = {key: copy.deepcopy(source_dict[key])
+             for key in intersect_keys - identical_keys}
+    dict2 = {key: copy.deepcopy(target_dict[key])
+             for key in intersect_keys - identical_keys}
+
     # Compare the values of duplicates keys.
     other_param = {
         "dict1": dict1,
@@ -435,7 +688,11 @@ def compare_dictionaries(**kwargs):
         "target_params": target_params,
         "group_name": group_name,
         "target_schema": target_schema,
-        "ignore_whitespaces": ignore_whitespaces
+        "ignore_whitespaces": ignore_whitespaces,
+        "source_snapshot": source_snapshot,
+        "target_snapshot": target_snapshot,
+        "identical_keys": identical_keys,
+        "ddl_cache": ddl_cache
     }
 
     identical, different = _get_identical_and_different_list(
@@ -445,6 +702,116 @@ def compare_dictionaries(**kwargs):
     return source_only + target_only + different + identical
 
 
+def _canonical_list(value_list, ignore_keys, ignore_whitespaces):
+    """
+    This function returns the canonical form of the list, sorted the same
+    way as sort_list() does before comparing the lists.
+    :param value_list:
+    :param ignore_keys:
+    :param ignore_whitespaces:
+    :return:
+    """
+    value_list, _ = sort_list(value_list, None)
+
+    canonical = []
+    for value in value_list:
+        if isinstance(value, dict):
+            canonical.append(
+                ('d', _canonical_dict(value, ignore_keys, ignore_whitespaces)))
+        else:
+            canonical.append(('v', type(value).__name__, value))
+    return tuple(canonical)
+
+
+def _canonical_dict(value_dict, ignore_keys, ignore_whitespaces):
+    """
+    This function returns the canonical form of the dictionary which is
+    equal for the dictionaries are_dictionaries_identical() considers
+    identical.
+    :param value_dict:
+    :param ignore_keys:
+    :param ignore_whitespaces:
+    :return:
+    """
+    canonical = []
+    for key in sorted(value_dict.keys(), key=repr):
+        # Keys must be same in both the dictionaries even if those are
+        # ignored, so keep the key and skip the value only.
+        if key in ignore_keys:
+            canonical.append((key,))
+            continue
+
+        value = value_dict[key]
+        if isinstance(value, dict):
+            canonical.append(
+                (key, 'd',
+                 _canonical_dict(value, ignore_keys, ignore_whitespaces)))
+        elif isinstance(value, list):
+            canonical.append(
+                (key, 'l',
+                 _canonical_list(value, ignore_keys, ignore_whitespaces)))
+        else:
+            value, _ = check_for_ignore_whitespaces(ignore_whitespaces,
+                                                    value, None)
+            # '' and None are considered same while comparing.
+            if value == '':
+                value = None
+            canonical.append((key, 'v', type(value).__name__, value))
+    return tuple(canonical)
+
+
+def get_object_digest(source_dict, ignore_keys, ignore_whitespaces):
+    """
+    This function returns the digest of the canonical form of the object
+    dictionary honouring the ignore keys and ignore whitespaces option.
+    Objects having the same digest are identical, objects having different
+    digests may still be identical (i.e. 1 and True) and must be compared
+    using are_dictionaries_identical().
+    :param source_dict: object dictionary
+    :param ignore_keys: ignore keys to compare
+    :param ignore_whitespaces: ignore whitespaces while comparing
+    :return: digest or None if the digest can not be computed
+    """
+    try:
+        canonical = _canonical_dict(source_dict, ignore_keys,
+                                    ignore_whitespaces)
+    except (TypeError, KeyError):
+        # Lists which can not be sorted, compare them in detail.
+        return None
+
+    return hashlib.sha256(repr(canonical).encode('utf-8')).hexdigest()
+
+
+def get_object_digests(source_dict, keys, ignore_keys, ignore_whitespaces,
+                       snapshot=None):
+    """
+    This function returns the digests of the specified objects. Digests of
+    the snapshot objects are kept in the snapshot entries, so those are
+    computed only once per snapshot for the given comparison options.
+    :param source_dict: dictionary of the objects
+    :param keys: keys of the objects
+    :param ignore_keys: ignore keys to compare
+    :param ignore_whitespaces: ignore whitespaces while comparing
+    :param snapshot: snapshot entries if the objects are from the snapshot
+    :return: dictionary of the object key and digest
+    """
+    options = (tuple(sorted(ignore_keys)), bool(ignore_whitespaces))
+    digests = dict()
+    for key in keys:
+        if snapshot is None:
+            digests[key] = get_object_digest(source_dict[key], ignore_keys,
+                                             ignore_whitespaces)
+            continue
+
+        entry_digests = snapshot[key].setdefault('digests', {})
+        if options not in entry_digests:
+            entry_digests[options] = get_object_digest(
+                source_dict[key], ignore_keys, ignore_whitespaces)
+        digests[key] = entry_digests[options]
+
+    return digests
+
+
 def are_lists_identical(source_list, target_list, ignore_keys,
                         ignore_whitespaces):
     """
@@ -34,6 +34,8 @@ class SchemaDiffModel(object):
         self._comparison_result = dict()
         self._comparison_msg = gettext('Comparision started...')
         self._comparison_percentage = 0
+        self._source_snapshot = None
+        self._target_snapshot = None
 
     def clear_data(self):
         """
@@ -76,3 +78,23 @@ class SchemaDiffModel(object):
         """
         self._comparison_msg = msg
         self._comparison_percentage = percentage
+
+    def get_snapshots(self):
+        """
+        This function is used to get the snapshot files used as source and
+        target of the comparison.
+        :return:
+        """
+        return getattr(self, '_source_snapshot', None), \
+            getattr(self, '_target_snapshot', None)
+
+    def set_snapshots(self, source_snapshot, target_snapshot):
+        """
+        This function is used to set the snapshot files used as source and
+        target of the comparison.
+        :param source_snapshot:
+        :param target_snapshot:
+        :return:
+        """
+        self._source_snapshot = source_snapshot
+        self._target_snapshot = target_snapshot
@@ -0,0 +1,290 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Offline schema snapshots which can be used as schema diff source or
+target."""
+
+import copy
+import gzip
+import os
+from datetime import datetime
+from functools import lru_cache
+
+import simplejson as json
+from flask_babel import gettext
+from werkzeug.exceptions import InternalServerError
+
+from config import PG_DEFAULT_DRIVER
+from pgadmin.utils import get_storage_directory, document_dir, \
+    get_complete_file_path
+from pgadmin.utils.driver import get_driver
+from pgadmin.misc.file_manager import Filemanager
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+
+SNAPSHOT_FORMAT = 'pgadmin4-schema-diff-snapshot'
+SNAPSHOT_VERSION = 2
+# Schema name used to generate the create DDL of the schema objects, which
+# is replaced by the target schema when the object is compared.
+SNAPSHOT_TARGET_SCHEMA = 'pgadmin_snapshot_target_schema'
+
+
+def get_snapshot_file_path(file_name):
+    """
+    This function returns the full path of the snapshot file to be written,
+    resolved the same way as the backup file is resolved.
+
+    :param file_name: file name returned from the client file manager
+    :return:
+    """
+    storage_dir = get_storage_directory()
+    if storage_dir:
+        # Do not allow the user to write outside the storage directory.
+        Filemanager.check_access_permission(storage_dir, file_name)
+        return os.path.join(storage_dir,
+                            file_name.lstrip('/').lstrip('\\'))
+    elif not os.path.isabs(file_name):
+        return os.path.join(document_dir(), file_name)
+    return file_name
+
+
+def write_snapshot_file(path, snapshot):
+    """
+    This function writes the snapshot as gzip compressed JSON.
+
+    :param path: full path of the snapshot file
+    :param snapshot: snapshot dictionary
+    """
+    with gzip.open(path, 'wt', encoding='utf-8') as fp:
+        json.dump(snapshot, fp, default=str, separators=(',', ':'))
+
+
+def read_snapshot_file(path):
+    """
+    This function reads and validates the snapshot file.
+
+    :param path: full path of the snapshot file
+    :return: status and snapshot dictionary or error message
+    """
+    try:
+        return True, _read_snapshot(path, os.path.getmtime(path))
+    except (OSError, ValueError) as e:
+        return False, gettext(
+            "Unable to read the snapshot file '{0}': {1}").format(
+            os.path.basename(path), str(e))
+
+
+@lru_cache(maxsize=4)
+def _read_snapshot(path, mtime):
+    """
+    Read the snapshot file, cached on the path and modification time so that
+    repeated comparisons against the same baseline do not parse it again.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as fp:
+        snapshot = json.load(fp, use_decimal=True)
+
+    if not isinstance(snapshot, dict) or \
+            snapshot.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError(gettext('Not a schema diff snapshot file.'))
+
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(
+            gettext('Unsupported snapshot version {0}.').format(
+                snapshot.get('version')))
+
+    return snapshot
+
+
+def load_snapshot(file_name):
+    """
+    This function loads the snapshot file selected from the file manager.
+
+    :param file_name: file name returned from the client file manager
+    :return: status and snapshot dictionary or error message
+    """
+    storage_dir = get_storage_directory()
+    if storage_dir:
+        try:
+            Filemanager.check_access_permission(storage_dir, file_name)
+        except InternalServerError as e:
+            return False, e.description
+
+    path = get_complete_file_path(file_name)
+    if path is None:
+        return False, gettext(
+            "Snapshot file '{0}' does not exist.").format(file_name)
+
+    return read_snapshot_file(path)
+
+
+def _fetch_node_objects(view, node_name, params):
+    """
+    This function fetches the objects of the node along with their DDL,
+    create DDL (for the target schema placeholder), drop DDL and
+    dependencies.
+
+    :param view: node view object
+    :param node_name: name of the node
+    :param params: sid, did and scid (if required) of the objects
+    :return:
+    """
+    if node_name == 'table':
+        objects = view.fetch_tables(**params)
+    else:
+        objects = view.fetch_objects_to_compare(**params)
+
+    # Views returns the error response if anything goes wrong.
+    if not isinstance(objects, dict):
+        return {}
+
+    result = dict()
+    for name, data in objects.items():
+        oid = data['oid'] if 'oid' in data else None
+        temp_params = copy.deepcopy(params)
+        temp_params['gid'] = 1
+
+        create_params = copy.deepcopy(temp_params)
+        if 'scid' in params:
+            create_params['target_schema'] = SNAPSHOT_TARGET_SCHEMA
+
+        if node_name == 'table':
+            temp_params['tid'] = oid
+            temp_params['json_resp'] = False
+            ddl = view.get_sql_from_table_diff(**temp_params)
+            create_params.update(tid=oid, json_resp=False,
+                                 add_not_exists_clause=True)
+            create_ddl = view.get_sql_from_table_diff(**create_params)
+            dependencies = \
+                view.get_table_submodules_dependencies(**temp_params)
+            drop_ddl = view.get_drop_sql(sid=params['sid'],
+                                         did=params['did'],
+                                         scid=params['scid'], tid=oid)
+        else:
+            temp_params['oid'] = oid
+            # Provide Foreign Data Wrapper ID
+            if 'fdwid' in data:
+                temp_params['fdwid'] = data['fdwid']
+            # Provide Foreign Server ID
+            if 'fsid' in data:
+                temp_params['fsid'] = data['fsid']
+
+            ddl = view.get_sql_from_diff(**temp_params)
+            create_params.update(temp_params)
+            create_ddl = view.get_sql_from_diff(**create_params)
+            dependencies = view.get_dependencies(
+                view.conn, oid, where=None, show_system_objects=None,
+                is_schema_diff=True)
+            temp_params['drop_sql'] = True
+            drop_ddl = view.get_sql_from_diff(**temp_params)
+
+        result[name] = {
+            'data': data,
+            'ddl': ddl,
+            'create_ddl': create_ddl,
+            'drop_ddl': drop_ddl,
+            'dependencies': dependencies
+        }
+
+    return result
+
+
+def create_snapshot(sid, did, schemas, include_database_objects=True):
+    """
+    This function creates the snapshot of the database or of the specified
+    schemas using the dictionaries produced by fetch_objects_to_compare of
+    each node.
+
+    :param sid: Server Id
+    :param did: Database Id
+    :param schemas: list of schemas ({'_id': , 'label': }) to include
+    :param include_database_objects: include database level objects or not
+    :return: snapshot dictionary
+    """
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    manager = driver.connection_manager(sid)
+    conn = manager.connection(did=did)
+
+    snapshot = {
+        'format': SNAPSHOT_FORMAT,
+        'version': SNAPSHOT_VERSION,
+        'created': datetime.now().isoformat(),
+        'server_type': manager.server_type,
+        'server_version': manager.version,
+        'database': conn.db,
+        'schemas': [{'_id': sch['_id'], 'label': sch['label']}
+                    for sch in schemas],
+        'database_objects': {},
+        'schema_objects': {}
+    }
+
+    if include_database_objects:
+        for node_name in SchemaDiffRegistry.get_registered_nodes(
+                None, 'Database'):
+            view = SchemaDiffRegistry.get_node_view(node_name)
+            if hasattr(view, 'compare'):
+                snapshot['database_objects'][node_name] = \
+                    _fetch_node_objects(view, node_name,
+                                        {'sid': sid, 'did': did})
+
+    for sch in schemas:
+        schema_objects = dict()
+        for node_name in SchemaDiffRegistry.get_registered_nodes():
+            view = SchemaDiffRegistry.get_node_view(node_name)
+            if hasattr(view, 'compare'):
+                schema_objects[node_name] = _fetch_node_objects(
+                    view, node_name,
+                    {'sid': sid, 'did': did, 'scid': sch['_id']})
+        snapshot['schema_objects'][str(sch['_id'])] = schema_objects
+
+    return snapshot
+
+
+def get_snapshot_objects(snapshot, node_name, scid=None):
+    """
+    This function returns the snapshot entries of the specified node.
+
+    :param snapshot: snapshot dictionary
+    :param node_name: name of the node
+    :param scid: Schema Id, None for the database level objects
+    :return: dictionary of object name and snapshot entry
+    """
+    if scid is None:
+        return snapshot['database_objects'].get(node_name, {})
+
+    return snapshot['schema_objects'].get(str(scid), {}).get(node_name, {})
+
+
+def get_snapshot_schema_name(snapshot, scid):
+    """
+    This function returns the schema name stored in the snapshot.
+
+    :param snapshot: snapshot dictionary
+    :param scid: Schema Id
+    :return:
+    """
+    for sch in snapshot['schemas']:
+        if scid is not None and str(sch['_id']) == str(scid):
+            return sch['label']
+    return None
+
+
+def find_snapshot_entry(snapshot, node_name, scid, oid):
+    """
+    This function finds the snapshot entry of the object by its oid.
+
+    :param snapshot: snapshot dictionary
+    :param node_name: name of the node
+    :param scid: Schema Id, 0 or None for the database level objects
+    :param oid: object id
+    :return: snapshot entry or None
+    """
+    objects = get_snapshot_objects(snapshot, node_name, scid or None)
+    for entry in objects.values():
+        if 'oid' in entry['data'] and entry['data']['oid'] == oid:
+            return entry
+    return None
@@ -202,19 +202,23 @@ export default class SchemaDiffUI {
       'diff_ddl': undefined,
     });
 
+    // Results are streamed through the poll request as those are available.
+    self.compare_results = [];
+    self.compare_cursor = 0;
+
     self.render_grid([]);
     self.footer.render();
     self.startDiffPoller();
 
     return $.ajax({
-      url: baseUrl,
+      url: baseUrl + '?stream=1',
       method: 'GET',
       dataType: 'json',
       contentType: 'application/json',
     })
-      .done(function (res) {
+      .done(function () {
+        // The last polling will fetch the remaining results.
         self.stopDiffPoller();
-        self.render_grid(res.data);
       })
       .fail(function (xhr) {
         self.raise_error_on_fail(gettext('Schema compare error'), xhr);
@@ -285,7 +289,7 @@ export default class SchemaDiffUI {
         });
     };
 
-    if (sel_rows.length > 0) {
+    let generate_selected_script = function() {
       let script_array = {1: [], 2: [], 3: [], 4: [], 5: []},
         script_body = '';
       for (let sel_row_val of sel_rows) {
@@ -313,6 +317,42 @@ export default class SchemaDiffUI {
 
       generated_script = script_header + 'BEGIN;' + '\n' + script_body + 'END;';
       open_query_tool();
+    };
+
+    if (sel_rows.length > 0) {
+      // Fetch the DDL of the selected objects which is not generated yet.
+      let pending_rows = {};
+      for (let sel_row_val of sel_rows) {
+        let data = self.grid.getData().getItem(sel_row_val);
+        if (_.isUndefined(data.diff_ddl) && data.status &&
+            data.status.toLowerCase() != 'identical') {
+          pending_rows[data.id] = data;
+        }
+      }
+
+      if (_.isEmpty(pending_rows)) {
+        generate_selected_script();
+        return false;
+      }
+
+      $.ajax({
+        url: url_for('schema_diff.generate_script', {'trans_id': self.trans_id}),
+        method: 'POST',
+        dataType: 'json',
+        contentType: 'application/json',
+        data: JSON.stringify({'ids': Object.keys(pending_rows)}),
+      })
+        .done(function (res) {
+          _.each(res.data, function(diff_ddl, id) {
+            if (id in pending_rows) pending_rows[id].diff_ddl = diff_ddl;
+          });
+          generate_selected_script();
+        })
+        .fail(function (xhr) {
+          self.raise_error_on_fail(gettext('Generate script error'), xhr);
+          $('#diff_fetching_data').find('.schema-diff-busy-text').text('');
+          $('#diff_fetching_data').addClass('d-none');
+        });
     } else if (!_.isUndefined(self.model.get('diff_ddl'))) {
       open_query_tool();
     }
@@ -547,6 +587,7 @@ export default class SchemaDiffUI {
   getCompareStatus() {
     var self = this,
       url_params = {'trans_id': self.trans_id},
+      cursor = self.compare_cursor || 0,
       baseUrl = url_for('schema_diff.poll', url_params);
 
     $.ajax({
@@ -554,8 +595,19 @@ export default class SchemaDiffUI {
       method: 'GET',
       dataType: 'json',
       contentType: 'application/json',
+      data: {'cursor': cursor},
     })
       .done(function (res) {
+        // Another poll may have received some of the results already, keep
+        // the ones after it only.
+        let received = (self.compare_cursor || 0) - cursor,
+          results = res.data.results || [];
+        if (self.compare_results && received >= 0 && results.length > received) {
+          self.compare_results = self.compare_results.concat(results.slice(received));
+          self.compare_cursor = res.data.cursor;
+          self.render_grid(self.compare_results);
+        }
+
         let msg = _.escape(res.data.compare_msg);
         if (res.data.diff_percentage != 100) {
           msg = msg + gettext(' (this may take a few minutes)...');
@@ -631,6 +683,28 @@ export default class SchemaDiffUI {
           $('#ddl_comp_fetching_data').addClass('d-none');
         },
       });
+    } else if (_.isUndefined(data.diff_ddl)) {
+      // DDL of the object is generated on demand by the server.
+      $('#ddl_comp_fetching_data').removeClass('d-none');
+
+      self.model.url = url_for('schema_diff.ddl', {
+        'trans_id': self.trans_id,
+        'result_id': data.id,
+      });
+
+      self.model.fetch({
+        success: function() {
+          data.source_ddl = self.model.get('source_ddl');
+          data.target_ddl = self.model.get('target_ddl');
+          data.diff_ddl = self.model.get('diff_ddl');
+          self.footer.render();
+          $('#ddl_comp_fetching_data').addClass('d-none');
+        },
+        error: function() {
+          self.footer.render();
+          $('#ddl_comp_fetching_data').addClass('d-none');
+        },
+      });
     } else {
       self.model.set({
         'source_ddl': data.source_ddl,
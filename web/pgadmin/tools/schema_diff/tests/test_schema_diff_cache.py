@@ -0,0 +1,54 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff import comparison_cache
+from pgadmin.tools.schema_diff.comparison_cache import ComparisonCache
+
+
+class SchemaDiffCacheTestCase(BaseTestGenerator):
+    """
+    This class validates the caches of the comparisons are bounded by age
+    and count, the least recently used first.
+    """
+    scenarios = [
+        ('Keep the comparisons within the limits', dict(
+            max_entries=3, idle=[], used=[], expected=[1, 2, 3])),
+        ('Discard the least recently used comparison', dict(
+            max_entries=2, idle=[], used=[1], expected=[1, 3])),
+        ('Discard the comparison not used for too long', dict(
+            max_entries=3, idle=[2], used=[], expected=[1, 3])),
+    ]
+
+    def runTest(self):
+        with patch.object(comparison_cache, 'current_user',
+                          SimpleNamespace(id=1)), \
+                patch.object(ComparisonCache, '_caches', OrderedDict()), \
+                patch.object(config, 'SCHEMA_DIFF_CACHE_MAX_AGE', 60), \
+                patch.object(config, 'SCHEMA_DIFF_CACHE_MAX_ENTRIES',
+                             self.max_entries):
+            for trans_id in (1, 2):
+                ComparisonCache.create(trans_id)
+            for trans_id in self.idle:
+                ComparisonCache.get(trans_id)._last_used = time.time() - 120
+            for trans_id in self.used:
+                ComparisonCache.get(trans_id)
+            ComparisonCache.create(3)
+
+            self.assertEqual(
+                [trans_id for trans_id in (1, 2, 3)
+                 if ComparisonCache.get(trans_id) is not None],
+                self.expected
+            )
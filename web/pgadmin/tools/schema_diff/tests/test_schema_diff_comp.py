@@ -148,6 +148,7 @@ class SchemaDiffTestCase(BaseTestGenerator):
         diff_file = os.path.join(self.sql_folder, 'diff_{0}.sql'.format(
             str(random.randint(1, 99999))))
         file_obj = open(diff_file, 'a')
+        pending_ids = []
 
         for diff in response_data['data']:
             if diff['status'] == 'Identical':
@@ -178,6 +179,19 @@ class SchemaDiffTestCase(BaseTestGenerator):
                     file_obj.write(response_data['diff_ddl'])
             elif 'diff_ddl' in diff:
                 file_obj.write(diff['diff_ddl'])
+            else:
+                pending_ids.append(diff['id'])
+
+        # DDL of the objects which are not identical is generated on demand.
+        if len(pending_ids) > 0:
+            response = self.tester.post(
+                'schema_diff/generate_script/{0}'.format(self.trans_id),
+                data=json.dumps({'ids': pending_ids}),
+                content_type='html/json')
+            self.assertEqual(response.status_code, 200)
+            script_data = json.loads(response.data.decode('utf-8'))['data']
+            for result_id in pending_ids:
+                file_obj.write(script_data[str(result_id)])
 
         file_obj.close()
         try:
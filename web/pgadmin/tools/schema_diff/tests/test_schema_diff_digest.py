@@ -0,0 +1,67 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.directory_compare import get_object_digest, \
+    are_dictionaries_identical
+
+
+class SchemaDiffDigestTestCase(BaseTestGenerator):
+    """ This class will test the digest of the schema diff objects. """
+    scenarios = [
+        ('Same objects with different order of list', dict(
+            source={'name': 'tab1', 'oid': 1,
+                    'columns': [{'name': 'b', 'attnum': 2},
+                                {'name': 'a', 'attnum': 1}]},
+            target={'name': 'tab1', 'oid': 2,
+                    'columns': [{'name': 'a', 'attnum': 3},
+                                {'name': 'b', 'attnum': 4}]},
+            ignore_keys=['oid', 'attnum'], ignore_whitespaces=False,
+            same_digest=True)),
+        ('Objects with empty string and None', dict(
+            source={'name': 'seq1', 'comment': ''},
+            target={'name': 'seq1', 'comment': None},
+            ignore_keys=[], ignore_whitespaces=False,
+            same_digest=True)),
+        ('Objects with whitespace difference', dict(
+            source={'name': 'func1', 'prosrc': 'BEGIN\n  RETURN 1;\nEND'},
+            target={'name': 'func1', 'prosrc': 'BEGIN RETURN 1; END'},
+            ignore_keys=[], ignore_whitespaces=True,
+            same_digest=True)),
+        ('Objects with whitespace difference not ignored', dict(
+            source={'name': 'func1', 'prosrc': 'BEGIN\n  RETURN 1;\nEND'},
+            target={'name': 'func1', 'prosrc': 'BEGIN RETURN 1; END'},
+            ignore_keys=[], ignore_whitespaces=False,
+            same_digest=False)),
+        ('Objects with different keys', dict(
+            source={'name': 'view1', 'oid': 1},
+            target={'name': 'view1', 'relacl': None},
+            ignore_keys=['oid'], ignore_whitespaces=False,
+            same_digest=False)),
+        ('Objects with different values in the list', dict(
+            source={'name': 'tab1', 'columns': [{'name': 'a',
+                                                 'cltype': 'integer'}]},
+            target={'name': 'tab1', 'columns': [{'name': 'a',
+                                                 'cltype': 'bigint'}]},
+            ignore_keys=[], ignore_whitespaces=False,
+            same_digest=False)),
+    ]
+
+    def runTest(self):
+        source_digest = get_object_digest(self.source, self.ignore_keys,
+                                          self.ignore_whitespaces)
+        target_digest = get_object_digest(self.target, self.ignore_keys,
+                                          self.ignore_whitespaces)
+        self.assertEqual(source_digest == target_digest, self.same_digest)
+
+        # Same digest must always mean identical objects.
+        if self.same_digest:
+            self.assertTrue(are_dictionaries_identical(
+                self.source, self.target, self.ignore_keys,
+                self.ignore_whitespaces))
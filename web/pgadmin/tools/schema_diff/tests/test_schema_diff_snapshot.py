@@ -0,0 +1,129 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import gzip
+import os
+import tempfile
+from decimal import Decimal
+from unittest.mock import patch
+
+import config
+from werkzeug.exceptions import InternalServerError
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.directory_compare import _get_source_only_ddl
+from pgadmin.tools.schema_diff.snapshot import write_snapshot_file, \
+    read_snapshot_file, get_snapshot_objects, find_snapshot_entry, \
+    get_snapshot_schema_name, get_snapshot_file_path, SNAPSHOT_FORMAT, \
+    SNAPSHOT_VERSION, SNAPSHOT_TARGET_SCHEMA
+
+
+class SchemaDiffSnapshotTestCase(BaseTestGenerator):
+    """ This class will test the schema diff snapshot files. """
+    scenarios = [
+        ('Read the snapshot which has been written', dict(
+            version=SNAPSHOT_VERSION, file_format=SNAPSHOT_FORMAT,
+            expected_status=True)),
+        ('Read the snapshot with unsupported version', dict(
+            version=SNAPSHOT_VERSION + 1, file_format=SNAPSHOT_FORMAT,
+            expected_status=False)),
+        ('Read the file which is not a snapshot', dict(
+            version=SNAPSHOT_VERSION, file_format='backup',
+            expected_status=False)),
+    ]
+
+    def setUp(self):
+        fd, self.snapshot_file = tempfile.mkstemp(suffix='.json.gz')
+        os.close(fd)
+        self.snapshot = {
+            'format': self.file_format,
+            'version': self.version,
+            'server_type': 'pg',
+            'server_version': 140000,
+            'database': 'postgres',
+            'schemas': [{'_id': 2200, 'label': 'public'}],
+            'database_objects': {
+                'extension': {
+                    'plpgsql': {'data': {'oid': 13, 'name': 'plpgsql'},
+                                'ddl': 'CREATE EXTENSION plpgsql;',
+                                'create_ddl': 'CREATE EXTENSION plpgsql;',
+                                'drop_ddl': 'DROP EXTENSION plpgsql;',
+                                'dependencies': []}
+                }
+            },
+            'schema_objects': {
+                '2200': {
+                    'sequence': {
+                        'seq1': {'data': {'oid': 16384, 'name': 'seq1',
+                                          'increment': Decimal('1')},
+                                 'ddl': 'CREATE SEQUENCE public.seq1;',
+                                 'create_ddl': 'CREATE SEQUENCE {0}.seq1;'
+                                 .format(SNAPSHOT_TARGET_SCHEMA),
+                                 'drop_ddl': 'DROP SEQUENCE public.seq1;',
+                                 'dependencies': []}
+                    }
+                }
+            }
+        }
+
+    def runTest(self):
+        write_snapshot_file(self.snapshot_file, self.snapshot)
+
+        # Snapshot must be stored compressed.
+        with gzip.open(self.snapshot_file, 'rt') as fp:
+            self.assertIn(self.file_format, fp.read())
+
+        status, snapshot = read_snapshot_file(self.snapshot_file)
+        self.assertEqual(status, self.expected_status)
+        if not self.expected_status:
+            return
+
+        self.assertEqual(snapshot, self.snapshot)
+        self.assertEqual(
+            list(get_snapshot_objects(snapshot, 'sequence', 2200).keys()),
+            ['seq1'])
+        self.assertEqual(get_snapshot_objects(snapshot, 'table', 2200), {})
+        self.assertEqual(get_snapshot_schema_name(snapshot, 2200), 'public')
+        self.assertEqual(
+            find_snapshot_entry(snapshot, 'extension', 0, 13)['ddl'],
+            'CREATE EXTENSION plpgsql;')
+        self.assertIsNone(find_snapshot_entry(snapshot, 'sequence', 2200, 1))
+
+        # Source only objects must be created in the target schema.
+        entry = find_snapshot_entry(snapshot, 'sequence', 2200, 16384)
+        self.assertEqual(
+            _get_source_only_ddl(None, 'sequence', entry['data'], {},
+                                 'Target', entry),
+            ('CREATE SEQUENCE public.seq1;',
+             'CREATE SEQUENCE "Target".seq1;'))
+
+    def tearDown(self):
+        os.remove(self.snapshot_file)
+
+
+class SchemaDiffSnapshotPathTestCase(BaseTestGenerator):
+    """ This class will test the path of the snapshot file to be written. """
+    scenarios = [
+        ('Write the snapshot in the storage directory', dict(
+            file_name='/snapshots/db.json.gz',
+            expected='/storage/user/snapshots/db.json.gz')),
+        ('Write the snapshot outside the storage directory', dict(
+            file_name='/../other_user/db.json.gz',
+            expected=None)),
+    ]
+
+    @patch('pgadmin.tools.schema_diff.snapshot.get_storage_directory',
+           return_value='/storage/user')
+    def runTest(self, storage_dir_mock):
+        with patch.object(config, 'SERVER_MODE', True):
+            if self.expected is None:
+                self.assertRaises(InternalServerError,
+                                  get_snapshot_file_path, self.file_name)
+            else:
+                self.assertEqual(get_snapshot_file_path(self.file_name),
+                                 self.expected)
@@ -73,13 +73,28 @@ def search(sid, did):
     URL args:
         text <required>: search text
         type <optional>: type of object to be searched.
+        offset <optional>: number of the objects to skip.
+        limit <optional>: maximum number of the objects to return.
+        fuzzy <optional>: if no name contains the text, return the names
+            containing its characters in the same order.
+
+    Returns the list of the objects, or when limit or fuzzy is given, the
+    objects in the page with the total number of the objects found.
     """
     text = request.args.get('text', None)
     obj_type = request.args.get('type', None)
 
     so_obj = SearchObjectsHelper(sid, did, blueprint.show_system_objects())
 
-    status, res = so_obj.search(text, obj_type)
+    if 'limit' in request.args or 'fuzzy' in request.args:
+        status, res = so_obj.search_page(
+            text, obj_type,
+            offset=request.args.get('offset', 0, type=int),
+            limit=request.args.get('limit', None, type=int),
+            fuzzy=request.args.get('fuzzy', 'false').lower() == 'true'
+        )
+    else:
+        status, res = so_obj.search(text, obj_type)
 
     if not status:
         return internal_server_error(errormsg=res)
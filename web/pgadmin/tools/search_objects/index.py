@@ -0,0 +1,217 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Keeps the names of the objects of the databases in memory, for searching
+them without querying the catalogs on every search.
+
+The index of a database is loaded from the search query once, and is kept up
+to date by comparing the change counters of the system catalogs (from
+pg_stat_sys_tables) before a search: only the object types stored in the
+catalogs changed since are loaded again. The whole index is loaded again
+after SEARCH_OBJECTS_INDEX_MAX_AGE seconds, as the statistics may be
+disabled, reset or reported late.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# Number of the databases kept in the memory.
+MAX_INDEXED_DATABASES = 16
+
+# The object types stored in (or named after) the system catalogs. A change
+# in a catalog not listed here does not change any name.
+CATALOG_OBJECT_TYPES = {
+    'pg_class': [
+        'table', 'partition', 'sequence', 'view', 'mview', 'foreign_table',
+        'index', 'column', 'trigger', 'compound_trigger', 'rule',
+        'row_security_policy', 'check_constraint', 'exclusion_constraint',
+        'foreign_key', 'primary_key', 'unique_constraint'
+    ],
+    'pg_inherits': ['table', 'partition'],
+    'pg_attribute': ['column'],
+    'pg_index': ['index', 'primary_key', 'unique_constraint',
+                 'exclusion_constraint'],
+    'pg_constraint': ['check_constraint', 'exclusion_constraint',
+                      'foreign_key', 'primary_key', 'unique_constraint',
+                      'domain_constraints'],
+    'pg_trigger': ['trigger', 'compound_trigger'],
+    'pg_rewrite': ['rule'],
+    'pg_policy': ['row_security_policy'],
+    'pg_type': ['type', 'domain', 'domain_constraints', 'cast', 'operator'],
+    'pg_proc': ['function', 'procedure', 'trigger_function', 'aggregate',
+                'edbfunc', 'edbproc'],
+    'pg_aggregate': ['aggregate'],
+    'pg_operator': ['operator'],
+    'pg_cast': ['cast'],
+    'pg_ts_config': ['fts_configuration'],
+    'pg_ts_dict': ['fts_dictionary'],
+    'pg_ts_parser': ['fts_parser'],
+    'pg_ts_template': ['fts_template'],
+    'pg_collation': ['collation'],
+    'pg_extension': ['extension'],
+    'pg_language': ['language'],
+    'pg_event_trigger': ['event_trigger'],
+    'pg_foreign_data_wrapper': ['foreign_data_wrapper', 'foreign_server',
+                                'user_mapping'],
+    'pg_foreign_server': ['foreign_server', 'user_mapping'],
+    'pg_foreign_table': ['foreign_table'],
+    'pg_user_mapping': ['user_mapping'],
+    'pg_publication': ['publication'],
+    'pg_subscription': ['subscription'],
+    'pg_synonym': ['synonym'],
+    'edb_package': ['package', 'edbfunc', 'edbproc', 'edbvar'],
+    'edb_variable': ['edbvar'],
+}
+
+# The schema name is part of the path of every object in a schema.
+ALL_OBJECT_TYPES_CATALOGS = ['pg_namespace']
+
+
+def get_changed_types(old_changes, new_changes):
+    """
+    Returns the object types stored in the catalogs, whose change counters
+    differ, or None if all the object types may have changed.
+    """
+    changed_types = set()
+    for catalog in set(old_changes) | set(new_changes):
+        if old_changes.get(catalog) == new_changes.get(catalog):
+            continue
+        if catalog in ALL_OBJECT_TYPES_CATALOGS:
+            return None
+        changed_types.update(CATALOG_OBJECT_TYPES.get(catalog, []))
+    return changed_types
+
+
+def fuzzy_pattern(text):
+    """
+    Returns the pattern matching the names containing the characters of the
+    text in the same order, e.g. 'cstmr' matches 'customer'.
+    """
+    return re.compile('.*?'.join(re.escape(c) for c in text))
+
+
+class ObjectNameIndex(object):
+    """
+    The objects of a database, grouped by their type.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # {obj_type: [(lower case name, row)]}
+        self._objects = {}
+        # {catalog: change counter}
+        self.catalog_changes = None
+        self.loaded_at = 0
+        # The object types supported by the server, the ones the user can
+        # not search, and the preferences the rows were loaded with.
+        self.obj_types = set()
+        self.skip_obj_type = []
+        self.show_node_prefs = {}
+        # {obj_type: label} of all the object types, and the version of the
+        # user preferences the node types were read with.
+        self.node_labels = {}
+        self.preferences_version = None
+
+    @property
+    def loaded(self):
+        return self.catalog_changes is not None
+
+    def clear(self):
+        """
+        Removes all the objects, so that the index is loaded again.
+        """
+        self._objects = {}
+        self.catalog_changes = None
+
+    def load(self, rows, catalog_changes):
+        """
+        Replaces all the objects with the rows of the search query.
+        """
+        self._objects = {}
+        self.update(None, rows, catalog_changes)
+        self.loaded_at = time.time()
+
+    def update(self, obj_types, rows, catalog_changes):
+        """
+        Replaces the objects of the types with the rows of the search query.
+        """
+        for obj_type in obj_types or []:
+            self._objects[obj_type] = []
+        for row in rows:
+            self._objects.setdefault(row['obj_type'], []).append(
+                (row['obj_name'].lower(), row)
+            )
+        self.catalog_changes = catalog_changes
+
+    def __len__(self):
+        return sum(len(objects) for objects in self._objects.values())
+
+    def search(self, text, obj_types=None, fuzzy=False):
+        """
+        Finds the objects whose names contain the text, ignoring the case.
+        If fuzzy and no name contains the text, finds the objects whose names
+        contain the characters of the text in the same order instead.
+
+        :param text: search text
+        :param obj_types: types of the objects to search, None for all
+        :param fuzzy: use the fuzzy search if no name contains the text
+        :returns: (rows sorted by type, name and path, True if fuzzy matched)
+        """
+        text = text.lower()
+        objects = [
+            self._objects.get(obj_type, []) for obj_type in (
+                self._objects.keys() if obj_types is None else obj_types
+            )
+        ]
+
+        rows = [row for typed_objects in objects
+                for name, row in typed_objects if text in name]
+        fuzzy_matched = False
+
+        if not rows and fuzzy and text:
+            pattern = fuzzy_pattern(text)
+            rows = [row for typed_objects in objects
+                    for name, row in typed_objects if pattern.search(name)]
+            fuzzy_matched = True
+
+        rows.sort(key=lambda row: (
+            row['obj_type'], row['obj_name'], row['obj_path']
+        ))
+        return rows, fuzzy_matched
+
+
+class ObjectNameIndexes(object):
+    """
+    The indexes of the recently searched databases.
+    """
+
+    def __init__(self, max_size=MAX_INDEXED_DATABASES):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._indexes = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = ObjectNameIndex()
+                while len(self._indexes) > self._max_size:
+                    self._indexes.popitem(last=False)
+            self._indexes.move_to_end(key)
+            return index
+
+    def remove(self, key):
+        with self._lock:
+            self._indexes.pop(key, None)
+
+
+object_name_indexes = ObjectNameIndexes()
@@ -16,6 +16,9 @@ import Slick from 'sources/../bundle/slickgrid';
 import pgAdmin from 'sources/pgadmin';
 import _ from 'underscore';
 
+// Maximum number of the objects shown for a search.
+export const SEARCH_RESULT_LIMIT = 1000;
+
 
 export default class SearchObjectsDialogWrapper extends DialogWrapper {
   constructor(dialogContainerSelector, dialogTitle, typeOfDialog,
@@ -622,13 +625,24 @@ export default class SearchObjectsDialogWrapper extends DialogWrapper {
         params: {
           text: this.searchBoxVal(),
           type: this.typesVal(),
+          limit: SEARCH_RESULT_LIMIT,
+          fuzzy: true,
         },
       }).then((res)=>{
-        let grid_data = res.data.data.map((row)=>{
+        let result = res.data.data;
+        let grid_data = result.rows.map((row)=>{
           return this.finaliseData(row);
         });
 
         this.setGridData(grid_data);
+
+        if(result.fuzzy && result.total > 0) {
+          this.showMessage(gettext('No names contain the search text, showing the similar names.'));
+        }
+        if(result.total > result.rows.length) {
+          this.showMessage(gettext('Showing the first %s of %s matches, refine the search text to find the others.',
+            result.rows.length, result.total));
+        }
       }).catch((error)=>{
         let errmsg = '';
 
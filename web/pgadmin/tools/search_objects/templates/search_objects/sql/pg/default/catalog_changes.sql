@@ -0,0 +1,3 @@
+SELECT relname, (n_tup_ins + n_tup_upd + n_tup_del)::text AS changes
+FROM pg_catalog.pg_stat_sys_tables
+WHERE schemaname = 'pg_catalog'
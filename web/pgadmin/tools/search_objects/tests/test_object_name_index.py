@@ -0,0 +1,161 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.search_objects.index import ObjectNameIndex, \
+    ObjectNameIndexes, get_changed_types
+
+
+def _row(obj_type, obj_name, obj_path=None):
+    return dict(obj_type=obj_type, obj_name=obj_name,
+                obj_path=obj_path or '/' + obj_name, show_node=True,
+                other_info=None, catalog_level='N')
+
+
+ROWS = [
+    _row('table', 'customer'),
+    _row('table', 'Customer_Orders'),
+    _row('view', 'customer_view'),
+    _row('column', 'customer_id', '/orders/customer_id'),
+    _row('column', 'customer_id', '/customer/customer_id'),
+    _row('function', 'get_order'),
+]
+
+
+class ObjectNameIndexSearchTestCase(BaseTestGenerator):
+    """
+    This class validates the objects are found by their names.
+    """
+
+    scenarios = [
+        ('Names containing the text, ignoring the case', dict(
+            kwargs=dict(text='CUSTOMER'),
+            expected=[('column', '/customer/customer_id'),
+                      ('column', '/orders/customer_id'),
+                      ('table', '/Customer_Orders'),
+                      ('table', '/customer'),
+                      ('view', '/customer_view')],
+            expected_fuzzy=False)),
+        ('Names of the types', dict(
+            kwargs=dict(text='customer', obj_types=['table', 'function']),
+            expected=[('table', '/Customer_Orders'),
+                      ('table', '/customer')],
+            expected_fuzzy=False)),
+        ('Similar names if no name contains the text', dict(
+            kwargs=dict(text='cstords', fuzzy=True),
+            expected=[('table', '/Customer_Orders')],
+            expected_fuzzy=True)),
+        ('No similar names without fuzzy', dict(
+            kwargs=dict(text='cstords'),
+            expected=[],
+            expected_fuzzy=False)),
+        ('No similar names if a name contains the text', dict(
+            kwargs=dict(text='order', fuzzy=True),
+            expected=[('function', '/get_order'),
+                      ('table', '/Customer_Orders')],
+            expected_fuzzy=False)),
+        ('Unknown type', dict(
+            kwargs=dict(text='customer', obj_types=['schema']),
+            expected=[],
+            expected_fuzzy=False)),
+    ]
+
+    def runTest(self):
+        index = ObjectNameIndex()
+        index.load(ROWS, {'pg_class': '1'})
+
+        rows, fuzzy = index.search(**self.kwargs)
+        self.assertEqual([(r['obj_type'], r['obj_path']) for r in rows],
+                         self.expected)
+        self.assertEqual(fuzzy, self.expected_fuzzy)
+
+
+class ObjectNameIndexUpdateTestCase(BaseTestGenerator):
+    """
+    This class validates the objects of the updated types are replaced, and
+    the others are kept.
+    """
+
+    scenarios = [
+        ('Update a type', dict(
+            obj_types=['table'], rows=[_row('table', 'customers')],
+            expected=['column', 'column', 'table', 'view'])),
+        ('Update a type without objects left', dict(
+            obj_types=['table', 'view'], rows=[],
+            expected=['column', 'column'])),
+    ]
+
+    def runTest(self):
+        index = ObjectNameIndex()
+        self.assertFalse(index.loaded)
+        index.load(ROWS, {'pg_class': '1'})
+        self.assertTrue(index.loaded)
+        self.assertEqual(len(index), len(ROWS))
+
+        index.update(self.obj_types, self.rows, {'pg_class': '2'})
+        rows, _ = index.search('customer')
+        self.assertEqual([r['obj_type'] for r in rows], self.expected)
+        self.assertEqual(index.catalog_changes, {'pg_class': '2'})
+
+
+class ChangedTypesTestCase(BaseTestGenerator):
+    """
+    This class validates the object types to load again are found from the
+    change counters of the catalogs.
+    """
+
+    scenarios = [
+        ('No change', dict(
+            old={'pg_class': '1', 'pg_proc': '5'},
+            new={'pg_class': '1', 'pg_proc': '5'},
+            expected=set())),
+        ('Catalog changed', dict(
+            old={'pg_rewrite': '1', 'pg_proc': '5'},
+            new={'pg_rewrite': '2', 'pg_proc': '5'},
+            expected={'rule'})),
+        ('Catalog not naming any object changed', dict(
+            old={'pg_statistic': '1'},
+            new={'pg_statistic': '7'},
+            expected=set())),
+        ('Catalog appeared', dict(
+            old={},
+            new={'pg_language': '1'},
+            expected={'language'})),
+        ('Schemas changed', dict(
+            old={'pg_namespace': '1', 'pg_proc': '5'},
+            new={'pg_namespace': '2', 'pg_proc': '5'},
+            expected=None)),
+    ]
+
+    def runTest(self):
+        self.assertEqual(get_changed_types(self.old, self.new),
+                         self.expected)
+
+
+class ObjectNameIndexesTestCase(BaseTestGenerator):
+    """
+    This class validates only the recently searched databases are kept.
+    """
+
+    scenarios = [
+        ('Least recently searched database is dropped', dict())
+    ]
+
+    def runTest(self):
+        indexes = ObjectNameIndexes(max_size=2)
+        first = indexes.get(1)
+        second = indexes.get(2)
+        self.assertIs(indexes.get(1), first)
+        indexes.get(3)
+
+        self.assertIs(indexes.get(1), first)
+        self.assertIsNot(indexes.get(2), second)
+
+        indexes.remove(1)
+        self.assertIsNot(indexes.get(1), first)
@@ -7,10 +7,13 @@
 #
 ##########################################################################
 
+from pgadmin.tools.search_objects.index import ObjectNameIndex
 from pgadmin.tools.search_objects.utils import SearchObjectsHelper, current_app
 from pgadmin.utils.route import BaseTestGenerator
 from unittest.mock import patch, MagicMock
 
+import config
+
 
 class SearchObjectsHelperTest(BaseTestGenerator):
     scenarios = [
@@ -95,7 +98,9 @@ class SearchObjectsHelperTest(BaseTestGenerator):
 
         get_node_blueprint_mock.side_effect = __get_node_blueprint_mock
 
-        with self.app.app_context():
+        # Search the catalogs, the index is tested on its own.
+        with self.app.app_context(), patch.object(
+                config, 'SEARCH_OBJECTS_INDEX', False, create=True):
 
             so_obj = SearchObjectsHelper(2, 18456,
                                          node_types=self.all_node_types)
@@ -118,3 +123,77 @@ class SearchObjectsHelperTest(BaseTestGenerator):
 
             self.assertEqual(so_obj.search('searchtext', 'all'),
                              self.expected_search_op)
+
+
+class SearchObjectsIndexNodeTypesTest(BaseTestGenerator):
+    """
+    This class validates the searches served from the index read the node
+    types only once the user preferences have changed.
+    """
+
+    scenarios = [
+        ('Preferences unchanged', dict(
+            versions=[1, 1], show_node=[True, True], expected_loads=1,
+            expected_reads=1)),
+        ('Preferences changed, same nodes shown', dict(
+            versions=[1, 2], show_node=[True, True], expected_loads=1,
+            expected_reads=2)),
+        ('Preferences changed, other nodes shown', dict(
+            versions=[1, 2], show_node=[True, False], expected_loads=2,
+            expected_reads=2)),
+    ]
+
+    def __execute_dict(self, sql):
+        if sql == 'catalog_changes.sql':
+            return True, dict(rows=[dict(relname='pg_class', changes=1)])
+        if sql == 'search.sql':
+            self.loads += 1
+            return True, dict(rows=[
+                dict(obj_name='name1', obj_type='table',
+                     obj_path='some/path', show_node=True,
+                     other_info=None, catalog_level='N'),
+            ])
+        return True, dict(rows=[dict(count='1')])
+
+    @patch('pgadmin.tools.search_objects.utils.object_name_indexes')
+    @patch('pgadmin.tools.search_objects.utils.get_preferences_version')
+    @patch('pgadmin.tools.search_objects.utils.current_user')
+    @patch('pgadmin.tools.search_objects.utils.get_node_blueprint')
+    @patch('pgadmin.tools.search_objects.utils.get_driver')
+    def runTest(self, get_driver_mock, get_node_blueprint_mock,
+                current_user_mock, get_preferences_version_mock,
+                object_name_indexes_mock):
+        self.loads = 0
+        connection = MagicMock()
+        connection.execute_dict.side_effect = self.__execute_dict
+        manager = MagicMock(connection=lambda did: connection,
+                            server_type='pg', version=140000)
+        get_driver_mock.return_value = MagicMock(
+            connection_manager=lambda session_id: manager)
+        current_user_mock.id = 1
+        object_name_indexes_mock.get.return_value = ObjectNameIndex()
+
+        show_node = []
+        get_node_blueprint_mock.side_effect = lambda node_type: MagicMock(
+            backend_supported=MagicMock(return_value=True),
+            collection_label='Tables', show_node=show_node[0])
+
+        with self.app.app_context(), \
+                patch.object(config, 'SEARCH_OBJECTS_INDEX', True,
+                             create=True), \
+                patch.object(config, 'SEARCH_OBJECTS_INDEX_MAX_AGE', 3600,
+                             create=True):
+            so_obj = SearchObjectsHelper(2, 18456, node_types=['table'])
+            so_obj.get_sql = lambda sql_file, **kwargs: sql_file
+
+            for version, node_shown in zip(self.versions, self.show_node):
+                get_preferences_version_mock.return_value = version
+                show_node[:] = [node_shown]
+                status, res = so_obj.search_page('name')
+                self.assertTrue(status)
+                self.assertEqual(res['rows'][0]['type_label'], 'Tables')
+
+        self.assertEqual(self.loads, self.expected_loads)
+        # Each read of the node types looks up the blueprint three times.
+        self.assertEqual(get_node_blueprint_mock.call_count,
+                         self.expected_reads * 3)
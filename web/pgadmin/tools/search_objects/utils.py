@@ -7,12 +7,22 @@
 #
 ##########################################################################
 
+import time
+
 from flask import current_app, render_template
 from flask_babel import gettext
+from flask_security import current_user
 
+import config
 from pgadmin.utils.driver import get_driver
+from pgadmin.utils.preferences import get_preferences_version
+from pgadmin.tools.search_objects.index import object_name_indexes, \
+    get_changed_types
 from config import PG_DEFAULT_DRIVER
 
+CONSTRAINT_TYPES = ['check_constraint', 'exclusion_constraint',
+                    'foreign_key', 'primary_key', 'unique_constraint']
+
 
 def get_node_blueprint(node_type):
     blueprint = None
@@ -108,19 +118,24 @@ class SearchObjectsHelper:
 
         return skip_obj_type
 
-    def search(self, text, obj_type=None):
-        skip_obj_type = []
-        conn = self.manager.connection(did=self.did)
-        last_system_oid = (self.manager.db_info[self.did])['datlastsysoid'] \
+    def _get_last_system_oid(self):
+        return (self.manager.db_info[self.did])['datlastsysoid'] \
             if self.manager.db_info is not None and self.did in \
             self.manager.db_info else 0
 
-        show_node_prefs = self.get_show_node_prefs()
-        node_labels = self.get_supported_types(skip_check=True)
+    def _search_catalogs(self, conn, text, obj_type, show_node_prefs,
+                         skip_obj_type):
+        """
+        This function runs the search query on the catalogs.
+        :param conn:
+        :param text: search text, '' for all the objects
+        :param obj_type: type of the objects, 'all' or None for all
+        :param show_node_prefs:
+        :param skip_obj_type: types the user has no permission to see
+        :return: status, rows of the query
+        """
         # escape the single quote from search text
         text = text.replace("'", "''")
-        skip_obj_type = self._check_permission(obj_type, conn,
-                                               skip_obj_type)
 
         # Column catalog_level has values as
         # N - Not a catalog schema
@@ -131,23 +146,181 @@ class SearchObjectsHelper:
                          search_text=text.lower(), obj_type=obj_type,
                          show_system_objects=self.show_system_objects,
                          show_node_prefs=show_node_prefs, _=gettext,
-                         last_system_oid=last_system_oid,
+                         last_system_oid=self._get_last_system_oid(),
                          skip_obj_type=skip_obj_type)
         )
 
         if not status:
             return status, res
+        return True, res['rows']
 
-        ret_val = [
-            {
-                'name': row['obj_name'],
-                'type': row['obj_type'],
-                'type_label': node_labels[row['obj_type']],
-                'path': row['obj_path'],
-                'show_node': row['show_node'],
-                'other_info': row['other_info'],
-                'catalog_level': row['catalog_level'],
-            }
-            for row in res['rows']
-        ]
-        return True, ret_val
+    def _get_catalog_changes(self, conn):
+        """
+        This function returns the change counters of the system catalogs.
+        :param conn:
+        :return: status, {catalog: change counter}
+        """
+        status, res = conn.execute_dict(self.get_sql('catalog_changes.sql'))
+        if not status:
+            return status, res
+        return True, dict(
+            (row['relname'], row['changes']) for row in res['rows']
+        )
+
+    def _refresh_index(self, conn, index, catalog_changes):
+        """
+        This function loads again the object types of the index whose
+        catalogs have changed since it was loaded.
+        :return: True if refreshed, False if it must be loaded in full
+        """
+        if not index.loaded or time.time() - index.loaded_at >= \
+                getattr(config, 'SEARCH_OBJECTS_INDEX_MAX_AGE', 0):
+            return False
+
+        changed_types = get_changed_types(index.catalog_changes,
+                                          catalog_changes)
+        if changed_types is None:
+            return False
+
+        changed_types = sorted(
+            (changed_types & index.obj_types) - set(index.skip_obj_type)
+        )
+        # Loading many types one by one is slower than a single query.
+        if len(changed_types) > len(index.obj_types) // 2:
+            return False
+
+        rows = []
+        for obj_type in changed_types:
+            status, res = self._search_catalogs(
+                conn, '', obj_type, index.show_node_prefs,
+                index.skip_obj_type
+            )
+            if not status:
+                return False
+            # The query of a type may return the types sharing its catalog.
+            rows.extend(row for row in res if row['obj_type'] == obj_type)
+
+        index.update(changed_types, rows, catalog_changes)
+        return True
+
+    def _refresh_node_types(self, index):
+        """
+        This function reads the node types into the index again, if the user
+        preferences have changed since they were read, and clears the index
+        if the nodes to show have changed.
+        :param index:
+        """
+        version = get_preferences_version()
+        if index.preferences_version == version:
+            return
+
+        show_node_prefs = self.get_show_node_prefs()
+        if show_node_prefs != index.show_node_prefs:
+            index.clear()
+        index.show_node_prefs = show_node_prefs
+        index.node_labels = self.get_supported_types(skip_check=True)
+        index.obj_types = set(self.get_supported_types().keys())
+        index.preferences_version = version
+
+    def _get_index(self, conn):
+        """
+        This function returns the object name index of the database, loaded
+        and refreshed.
+        :param conn:
+        :return: status, ObjectNameIndex or error message
+        """
+        key = (current_user.id, self.sid, self.did,
+               self.show_system_objects, self.manager.version)
+        index = object_name_indexes.get(key)
+
+        with index.lock:
+            self._refresh_node_types(index)
+
+            status, catalog_changes = self._get_catalog_changes(conn)
+            if not status:
+                return status, catalog_changes
+
+            if self._refresh_index(conn, index, catalog_changes):
+                return True, index
+
+            skip_obj_type = self._check_permission('all', conn, [])
+            status, rows = self._search_catalogs(
+                conn, '', 'all', index.show_node_prefs, skip_obj_type
+            )
+            if not status:
+                object_name_indexes.remove(key)
+                return status, rows
+
+            index.skip_obj_type = skip_obj_type
+            index.load(rows, catalog_changes)
+
+        return True, index
+
+    def search_page(self, text, obj_type=None, offset=0, limit=None,
+                    fuzzy=False):
+        """
+        This function searches the objects whose names contain the text.
+        :param text: search text
+        :param obj_type: type of the objects, 'all' or None for all
+        :param offset: number of the objects to skip
+        :param limit: maximum number of the objects to return, None for all
+        :param fuzzy: if no name contains the text, search the names
+        containing its characters in the same order
+        :return: status, {'rows': objects in the page, 'total': number of
+        the objects found, 'fuzzy': True if fuzzy matched}
+        """
+        conn = self.manager.connection(did=self.did)
+        fuzzy_matched = False
+
+        if getattr(config, 'SEARCH_OBJECTS_INDEX', False):
+            # The node types are read with the index, only once the user
+            # preferences have changed.
+            status, index = self._get_index(conn)
+            if not status:
+                return status, index
+            node_labels = index.node_labels
+
+            if obj_type in (None, 'all'):
+                obj_types = None
+            elif obj_type == 'constraints':
+                obj_types = CONSTRAINT_TYPES
+            else:
+                obj_types = [obj_type]
+            rows, fuzzy_matched = index.search(text, obj_types, fuzzy)
+        else:
+            show_node_prefs = self.get_show_node_prefs()
+            node_labels = self.get_supported_types(skip_check=True)
+            skip_obj_type = self._check_permission(obj_type, conn, [])
+            status, rows = self._search_catalogs(
+                conn, text, obj_type, show_node_prefs, skip_obj_type
+            )
+            if not status:
+                return status, rows
+
+        total = len(rows)
+        offset = max(int(offset or 0), 0)
+        rows = rows[offset:] if limit is None else \
+            rows[offset:offset + max(int(limit), 0)]
+
+        return True, {
+            'rows': [
+                {
+                    'name': row['obj_name'],
+                    'type': row['obj_type'],
+                    'type_label': node_labels[row['obj_type']],
+                    'path': row['obj_path'],
+                    'show_node': row['show_node'],
+                    'other_info': row['other_info'],
+                    'catalog_level': row['catalog_level'],
+                }
+                for row in rows
+            ],
+            'total': total,
+            'fuzzy': fuzzy_matched
+        }
+
+    def search(self, text, obj_type=None):
+        status, res = self.search_page(text, obj_type)
+        if not status:
+            return status, res
+        return True, res['rows']
@@ -27,6 +27,7 @@ from pgadmin.utils.csrf import pgCSRFProtect
 from pgadmin.utils.constants import MIMETYPE_APP_JS, INTERNAL,\
     SUPPORTED_AUTH_SOURCES, KERBEROS, LDAP
 from pgadmin.utils.validation_utils import validate_email
+from pgadmin.utils.preferences import invalidate_user_preferences
 from pgadmin.model import db, Role, User, UserPreference, Server, \
     ServerGroup, Process, Setting, roles_users, SharedServer
 
@@ -355,6 +356,7 @@ def delete(uid):
         Setting.query.filter_by(user_id=uid).delete()
 
         UserPreference.query.filter_by(uid=uid).delete()
+        invalidate_user_preferences(uid)
 
         Server.query.filter_by(user_id=uid).delete()
 
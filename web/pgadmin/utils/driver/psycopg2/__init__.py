@@ -250,6 +250,19 @@ class Driver(BaseDriver):
             ):
                 mgr.release()
 
+    def invalidate_nodes_cache(self):
+        """
+        Invalidate the cached browser tree nodes of all the servers for the
+        current session.
+        """
+        sess_mgr = self.managers.get(session.sid, None)
+
+        if sess_mgr:
+            for mgr in (
+                m for m in sess_mgr.values() if isinstance(m, ServerManager)
+            ):
+                mgr.invalidate_nodes_cache()
+
     @staticmethod
     def qtLiteral(value, force_quote=False):
         adapted = adapt(value)
@@ -12,6 +12,10 @@ Implementation of ServerManager
 """
 import os
 import datetime
+import time
+from collections import OrderedDict
+from threading import Lock
+
 import config
 from flask import current_app, session
 from flask_security import current_user
@@ -28,9 +32,6 @@ from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
 from pgadmin.utils.master_password import get_crypt_key
 from pgadmin.utils.exception import ObjectGone
 
-if config.SUPPORT_SSH_TUNNEL:
-    from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
-
 
 class ServerManager(object):
     """
@@ -40,6 +41,8 @@ class ServerManager(object):
     And, acts as connection manager for that particular session.
     """
     _INFORMATION_MSG = gettext("Information is not available.")
+    # Maximum number of browser tree node lists cached per server
+    _NODES_CACHE_SIZE = 512
 
     def __init__(self, server):
         self.connections = dict()
@@ -47,6 +50,8 @@ class ServerManager(object):
         self.local_bind_port = None
         self.tunnel_object = None
         self.tunnel_created = False
+        self._nodes_cache = OrderedDict()
+        self._nodes_cache_lock = Lock()
 
         self.update(server)
 
@@ -462,6 +467,7 @@ WHERE db.oid = {0}""".format(did))
                 del self.connections[my_id]
                 if did is not None:
                     del self.db_info[did]
+                    self.invalidate_nodes_cache(did)
 
                 if len(self.connections) == 0:
                     self.ver = None
@@ -486,6 +492,7 @@ WHERE db.oid = {0}""".format(did))
             conn._release()
 
         self.connections = dict()
+        self.invalidate_nodes_cache()
         self.ver = None
         self.sversion = None
         self.server_type = None
@@ -496,6 +503,62 @@ WHERE db.oid = {0}""".format(did))
 
         return True
 
+    def get_cached_nodes(self, did, path, fingerprint):
+        """
+        Returns the browser tree nodes cached for the given path, only if
+        the catalog fingerprint has not changed since those were cached, and
+        those were cached less than BROWSER_NODES_CACHE_MAX_AGE seconds ago.
+
+        :param did: Database Id (None for the server level nodes)
+        :param path: Path of the nodes/children request
+        :param fingerprint: Current catalog fingerprint of the database
+        :return: Cached response body or None
+        """
+        with self._nodes_cache_lock:
+            cached = self._nodes_cache.get((did, path), None)
+            if cached is None:
+                return None
+
+            max_age = config.BROWSER_NODES_CACHE_MAX_AGE
+            if cached[0] != fingerprint or time.time() - cached[2] > max_age:
+                del self._nodes_cache[(did, path)]
+                return None
+
+            self._nodes_cache.move_to_end((did, path))
+            return cached[1]
+
+    def cache_nodes(self, did, path, fingerprint, nodes):
+        """
+        Caches the browser tree nodes of the given path along with the
+        catalog fingerprint they were fetched with.
+
+        :param did: Database Id (None for the server level nodes)
+        :param path: Path of the nodes/children request
+        :param fingerprint: Catalog fingerprint of the database
+        :param nodes: Response body
+        """
+        with self._nodes_cache_lock:
+            self._nodes_cache[(did, path)] = (fingerprint, nodes, time.time())
+            self._nodes_cache.move_to_end((did, path))
+            while len(self._nodes_cache) > self._NODES_CACHE_SIZE:
+                self._nodes_cache.popitem(last=False)
+
+    def invalidate_nodes_cache(self, did=None):
+        """
+        Invalidates the cached browser tree nodes of the given database and
+        the server level nodes, or all of them if database is not given.
+
+        :param did: Database Id
+        """
+        with self._nodes_cache_lock:
+            if did is None:
+                self._nodes_cache.clear()
+                return
+
+            for key in [k for k in self._nodes_cache
+                        if k[0] is None or k[0] == did]:
+                del self._nodes_cache[key]
+
     def _update_password(self, passwd):
         self.password = passwd
         for conn_id in self.connections:
@@ -564,6 +627,10 @@ WHERE db.oid = {0}""".format(did))
                 return False, gettext("Failed to decrypt the SSH tunnel "
                                       "password.\nError: {0}").format(str(e))
 
+        # Imported here, as it is slow to import and only used by the servers
+        # connecting through a tunnel.
+        from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
+
         try:
             # If authentication method is 1 then it uses identity file
             # and password
@@ -0,0 +1,66 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Reads and writes the module manifest.
+
+At startup, pgAdmin finds its modules (the PgAdminModule instances) by
+importing every module and package under each module's package, including
+the tests and the helpers, and scanning them. The manifest records the
+modules which hold a PgAdminModule for each package, as found by a previous
+startup, so that the other ones are not imported and the packages are not
+scanned.
+"""
+
+import json
+import os
+
+import config
+
+MANIFEST_FORMAT = 1
+
+
+def load_module_manifest(path):
+    """
+    Reads the module manifest.
+
+    :param path: manifest file, None for no manifest
+    :returns: {package: [names of the modules holding a PgAdminModule]}, or
+        None if there is no manifest or it was generated for another version
+        of pgAdmin.
+    """
+    if path is None or not os.path.exists(path):
+        return None
+
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+
+    if manifest.get('format') != MANIFEST_FORMAT or \
+            manifest.get('version') != config.APP_VERSION:
+        return None
+    return manifest['modules']
+
+
+def save_module_manifest(path, modules):
+    """
+    Writes the module manifest.
+
+    :param path: manifest file
+    :param modules: {package: [names of the modules holding a PgAdminModule]}
+    """
+    manifest = {
+        'format': MANIFEST_FORMAT,
+        'version': config.APP_VERSION,
+        'modules': modules
+    }
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
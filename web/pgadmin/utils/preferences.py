@@ -16,13 +16,88 @@ import decimal
 import simplejson as json
 
 import dateutil.parser as dateutil_parser
-from flask import current_app
+from flask import current_app, g, has_request_context
 from flask_babel import gettext
 from flask_security import current_user
 
 from pgadmin.model import db, Preferences as PrefTable, \
     ModulePreference as ModulePrefTable, UserPreference as UserPrefTable, \
-    PreferenceCategory as PrefCategoryTbl
+    PreferenceCategory as PrefCategoryTbl, Version
+
+# Name of the counter in the version table, which gets incremented on every
+# change in the user preferences, so that the other worker processes can find
+# out their cached preferences are stale.
+PREFERENCES_VERSION = 'UserPreferences'
+
+# Snapshot of the preferences of the users, loaded from the configuration
+# database at once, i.e. {uid: (version, {pid: value})}
+_user_preferences_cache = dict()
+
+
+def get_preferences_version():
+    """
+    Returns the current version of the user preferences, which is read from
+    the configuration database only once per request.
+    """
+    if has_request_context() and 'preferences_version' in g:
+        return g.preferences_version
+
+    version = Version.query.filter_by(name=PREFERENCES_VERSION).first()
+    version = 0 if version is None else version.value
+
+    if has_request_context():
+        g.preferences_version = version
+
+    return version
+
+
+def get_user_preferences(uid):
+    """
+    Returns the values of all the preferences set by the given user, as
+    stored in the configuration database, i.e. {pid: value}.
+
+    The values are loaded from the configuration database once, and served
+    from the cache until the preferences are changed by any worker.
+
+    :param uid: User ID
+    """
+    version = get_preferences_version()
+
+    cached = _user_preferences_cache.get(uid)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    values = dict(
+        (pref.pid, pref.value)
+        for pref in UserPrefTable.query.filter_by(uid=uid)
+    )
+    _user_preferences_cache[uid] = (version, values)
+
+    return values
+
+
+def invalidate_user_preferences(uid=None):
+    """
+    Marks the cached user preferences stale in all the worker processes by
+    incrementing the preferences version. It must be called before committing
+    the change in the user preferences, so that both are committed together.
+
+    :param uid: User ID, whose preferences are changed (None for all users)
+    """
+    updated = Version.query.filter_by(name=PREFERENCES_VERSION).update(
+        {Version.value: Version.value + 1}, synchronize_session=False
+    )
+    if not updated:
+        db.session.add(Version(name=PREFERENCES_VERSION, value=1))
+
+    if uid is None:
+        _user_preferences_cache.clear()
+    else:
+        _user_preferences_cache.pop(uid, None)
+
+    # Read the new version again in this request.
+    if has_request_context():
+        g.pop('preferences_version', None)
 
 
 class _Preference(object):
@@ -104,21 +179,19 @@ class _Preference(object):
 
         :returns: value for this preference.
         """
-        res = UserPrefTable.query.filter_by(
-            pid=self.pid
-        ).filter_by(uid=current_user.id).first()
+        value = get_user_preferences(current_user.id).get(self.pid)
 
         # Could not find any preference for this user, return default value.
-        if res is None:
+        if value is None:
             return self.default
 
         # The data stored in the configuration will be in string format, we
         # need to convert them in proper format.
-        is_format_data, data = self._get_format_data(res)
+        is_format_data, data = self._get_format_data(value)
         if is_format_data:
             return data
 
-        if self._type == 'text' and res.value == '' and not self.allow_blanks:
+        if self._type == 'text' and value == '' and not self.allow_blanks:
             return self.default
 
         parser_map = {
@@ -129,33 +202,33 @@ class _Preference(object):
             'keyboardshortcut': json.loads
         }
         try:
-            return parser_map.get(self._type, lambda v: v)(res.value)
+            return parser_map.get(self._type, lambda v: v)(value)
         except Exception as e:
             current_app.logger.exception(e)
             return self.default
-        return res.value
+        return value
 
-    def _get_format_data(self, res):
+    def _get_format_data(self, value):
         """
         Configuration data get stored in string format, convert it in to
         required format.
-        :param res: type value.
+        :param value: stored value.
         """
         if self._type in ('boolean', 'switch', 'node'):
-            return True, res.value == 'True'
+            return True, value == 'True'
         if self._type == 'options':
             for opt in self.options:
-                if 'value' in opt and opt['value'] == res.value:
-                    return True, res.value
+                if 'value' in opt and opt['value'] == value:
+                    return True, value
             if self.select and self.select['tags']:
-                return True, res.value
+                return True, value
             return True, self.default
         if self._type == 'select':
-            if res.value:
-                res.value = res.value.replace('[', '')
-                res.value = res.value.replace(']', '')
-                res.value = res.value.replace('\'', '')
-                return True, [val.strip() for val in res.value.split(',')]
+            if value:
+                value = value.replace('[', '')
+                value = value.replace(']', '')
+                value = value.replace('\'', '')
+                return True, [val.strip() for val in value.split(',')]
             return True, None
 
         return False, None
@@ -222,6 +295,7 @@ class _Preference(object):
             db.session.add(pref)
         else:
             pref.value = value
+        invalidate_user_preferences(current_user.id)
         db.session.commit()
 
         return True, None
@@ -553,14 +627,7 @@ class Preferences(object):
         if pref is None:
             return None
 
-        user_pref = UserPrefTable.query.filter_by(
-            pid=pref.id
-        ).filter_by(uid=_user_id).first()
-
-        if user_pref is not None:
-            return user_pref.value
-
-        return None
+        return get_user_preferences(_user_id).get(pref.id)
 
     @classmethod
     def module(cls, name, create=True):
@@ -655,4 +722,5 @@ class Preferences(object):
         for pref in user_prefs:
             pref.value = converter_func(pref.value)
 
+        invalidate_user_preferences()
         db.session.commit()
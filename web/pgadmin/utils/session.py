@@ -19,17 +19,19 @@ import base64
 import datetime
 import hmac
 import hashlib
+import logging
 import os
 import random
+import sqlite3
 import string
 import time
 import config
-from uuid import uuid4
-from threading import Lock
+from uuid import uuid4, UUID
+from threading import Lock, Thread, local
 from flask import current_app, request, flash, redirect
 from flask_login import login_url
 
-from pickle import dump, load
+from pickle import dump, load, dumps, loads
 from collections import OrderedDict
 
 from flask.sessions import SessionInterface, SessionMixin
@@ -46,8 +48,18 @@ def _calc_hmac(body, secret):
     ).decode()
 
 
+def _is_session_id(name):
+    try:
+        return str(UUID(name)) == name
+    except ValueError:
+        return False
+
+
 sess_lock = Lock()
+cleanup_lock = Lock()
 LAST_CHECK_SESSION_FILES = None
+# Number of expired sessions removed at once by the cleanup
+SESSION_CLEANUP_BATCH_SIZE = 500
 
 
 class ManagedSession(CallbackDict, SessionMixin):
@@ -65,6 +77,9 @@ class ManagedSession(CallbackDict, SessionMixin):
         self.force_write = False
         self.hmac_digest = hmac_digest
         self.permanent = True
+        # Digests of the stored values of the keys, used by the session
+        # managers storing the keys separately to write the changed only.
+        self.stored_digests = dict()
 
     def sign(self, secret):
         if not self.hmac_digest:
@@ -96,6 +111,10 @@ class SessionManager(object):
         'Store a managed session'
         raise NotImplementedError
 
+    def cleanup(self, expiration_time):
+        'Remove the sessions not stored since the expiration time'
+        pass
+
 
 class CachingSessionManager(SessionManager):
     def __init__(self, parent, num_to_store, skip_paths=None):
@@ -179,16 +198,54 @@ class CachingSessionManager(SessionManager):
             self._cache[session.sid] = session
         self._normalize()
 
+    def cleanup(self, expiration_time):
+        self.parent.cleanup(expiration_time)
+
 
 class FileBackedSessionManager(SessionManager):
 
-    def __init__(self, path, secret, disk_write_delay, skip_paths=None):
+    def __init__(self, path, secret, disk_write_delay, skip_paths=None,
+                 expiry_index=False, logger=None):
         self.path = path
         self.secret = secret
         self.disk_write_delay = disk_write_delay
         if not os.path.exists(self.path):
             os.makedirs(self.path)
         self.skip_paths = [] if skip_paths is None else skip_paths
+        self.logger = logger or logging.getLogger(__name__)
+
+        # The expiry index is optional, as SQLite may not work on the file
+        # system of the session directory (e.g. a network share). Without
+        # it, the expired sessions are found by scanning the directory.
+        self.expiry_index = None
+        if expiry_index:
+            try:
+                self.expiry_index = SessionExpiryIndex(self.path)
+            except Exception as e:
+                self.logger.warning(
+                    'Unable to open the session expiry index, scanning the '
+                    'session directory instead: {0}'.format(e))
+
+    def _drop_expiry_index(self, error):
+        """
+        Stops using the expiry index after it failed. Its file is removed,
+        so that it is built again from the session files next time, as the
+        writes from now on are not recorded.
+        """
+        self.logger.warning(
+            'Unable to update the session expiry index, scanning the session '
+            'directory instead: {0}'.format(error))
+        index, self.expiry_index = self.expiry_index, None
+        if index is not None:
+            index.drop()
+
+    def _index_session(self, sid, last_write):
+        if self.expiry_index is None:
+            return
+        try:
+            self.expiry_index.touch(sid, last_write)
+        except Exception as e:
+            self._drop_expiry_index(e)
 
     def exists(self, sid):
         fname = os.path.join(self.path, sid)
@@ -198,6 +255,11 @@ class FileBackedSessionManager(SessionManager):
         fname = os.path.join(self.path, sid)
         if os.path.exists(fname):
             os.unlink(fname)
+        if self.expiry_index is not None:
+            try:
+                self.expiry_index.remove([sid])
+            except Exception as e:
+                self._drop_expiry_index(e)
 
     def new_session(self):
         sid = str(uuid4())
@@ -214,7 +276,8 @@ class FileBackedSessionManager(SessionManager):
 
         # touch the file
         with open(fname, 'wb'):
-            return ManagedSession(sid=sid)
+            pass
+        self._index_session(sid, time.time())
 
         return ManagedSession(sid=sid)
 
@@ -271,6 +334,336 @@ class FileBackedSessionManager(SessionManager):
                 (session.randval, session.hmac_digest, dict(session)),
                 f
             )
+        self._index_session(session.sid, current_time)
+
+    def cleanup(self, expiration_time):
+        """
+        Removes the session files not written since the expiration time.
+        """
+        if self.expiry_index is not None:
+            try:
+                self._cleanup_indexed(expiration_time)
+                return
+            except Exception as e:
+                self._drop_expiry_index(e)
+
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if not _is_session_id(entry.name):
+                    continue
+                try:
+                    if entry.stat().st_mtime < expiration_time:
+                        os.unlink(entry.path)
+                except OSError:
+                    # Already removed, or can not be removed at all
+                    continue
+
+    def _cleanup_indexed(self, expiration_time):
+        """
+        Removes the expired session files in batches, looking for those in
+        the expiry index.
+        """
+        self.expiry_index.index_existing_files()
+
+        while True:
+            sids = self.expiry_index.expired(
+                expiration_time, SESSION_CLEANUP_BATCH_SIZE
+            )
+            if not sids:
+                break
+
+            expired = []
+            for sid in sids:
+                fname = os.path.join(self.path, sid)
+                try:
+                    last_write = os.stat(fname).st_mtime
+                    if last_write >= expiration_time:
+                        # Written by other means than this manager
+                        self.expiry_index.touch(sid, last_write)
+                        continue
+                    os.unlink(fname)
+                except OSError:
+                    # Already removed, or can not be removed at all
+                    pass
+                expired.append(sid)
+
+            self.expiry_index.remove(expired)
+
+
+class SQLiteStore(object):
+    """
+    Base class of the session stores kept in a SQLite database in the
+    session directory. SQLite takes care of the locking between the worker
+    processes, while the connections can not be shared between the threads,
+    hence each thread opens its own connection.
+    """
+    DB_FILE = None
+    SCHEMA = ()
+    # PRAGMA synchronous of the connections, None for the SQLite default
+    SYNCHRONOUS = None
+
+    def init_db(self, path):
+        self.db_file = os.path.join(path, self.DB_FILE)
+        self._local = local()
+
+        conn = self._connect()
+        try:
+            with conn:
+                for statement in self.SCHEMA:
+                    conn.execute(statement)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        if self.SYNCHRONOUS is not None:
+            conn.execute('PRAGMA synchronous={0}'.format(self.SYNCHRONOUS))
+        return conn
+
+    @property
+    def conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+
+class SessionExpiryIndex(SQLiteStore):
+    """
+    Keeps the last write time of the session files, so that the expired
+    sessions can be found using the index instead of scanning the session
+    directory.
+    """
+    DB_FILE = 'session_expiry.db'
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS session_expiry ('
+        'sid TEXT PRIMARY KEY, last_write REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS session_expiry_last_write '
+        'ON session_expiry (last_write)',
+    )
+    # Version of the index once the existing session files are added
+    INDEXED_VERSION = 1
+    # The commits are not synced to the disk, only the WAL checkpoints are.
+    # The index only loses the last writes on a power failure, leaving the
+    # sessions to be removed by a later cleanup.
+    SYNCHRONOUS = 'NORMAL'
+
+    def __init__(self, path):
+        self.path = path
+        self.init_db(path)
+
+    def drop(self):
+        """
+        Removes the index files, ignoring the errors.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        for suffix in ('', '-wal', '-shm'):
+            try:
+                os.unlink(self.db_file + suffix)
+            except OSError:
+                pass
+
+    def touch(self, sid, last_write):
+        with self.conn as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO session_expiry (sid, last_write) '
+                'VALUES (?, ?)', (sid, last_write)
+            )
+
+    def remove(self, sids):
+        with self.conn as conn:
+            conn.executemany(
+                'DELETE FROM session_expiry WHERE sid = ?',
+                [(sid,) for sid in sids]
+            )
+
+    def expired(self, expiration_time, limit):
+        return [row[0] for row in self.conn.execute(
+            'SELECT sid FROM session_expiry WHERE last_write < ? '
+            'ORDER BY last_write LIMIT ?', (expiration_time, limit)
+        )]
+
+    def index_existing_files(self):
+        """
+        Adds the session files written before the index was introduced,
+        which requires to scan the session directory only once.
+        """
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] >= \
+                self.INDEXED_VERSION:
+            return
+
+        entries = []
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if not entry.is_file() or not _is_session_id(entry.name):
+                    continue
+                try:
+                    entries.append((entry.name, entry.stat().st_mtime))
+                except FileNotFoundError:
+                    continue
+
+        with self.conn as conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO session_expiry (sid, last_write) '
+                'VALUES (?, ?)', entries
+            )
+            conn.execute(
+                'PRAGMA user_version = {0}'.format(self.INDEXED_VERSION)
+            )
+
+
+class SQLiteBackedSessionManager(SessionManager, SQLiteStore):
+    """
+    Stores the sessions in a SQLite database in the session directory, with
+    a row per session key, so that only the keys changed since the session
+    was loaded are written, instead of the whole session. The sessions not
+    written for a while are removed by a single query.
+    """
+    DB_FILE = 'sessions.db'
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS session ('
+        'sid TEXT PRIMARY KEY, randval TEXT, hmac_digest TEXT, '
+        'last_write REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS session_last_write '
+        'ON session (last_write)',
+        'CREATE TABLE IF NOT EXISTS session_key ('
+        'sid TEXT NOT NULL, key TEXT NOT NULL, '
+        'value BLOB NOT NULL, PRIMARY KEY (sid, key))',
+    )
+
+    def __init__(self, path, secret, disk_write_delay, skip_paths=None):
+        self.path = path
+        self.secret = secret
+        self.disk_write_delay = disk_write_delay
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+        self.skip_paths = [] if skip_paths is None else skip_paths
+        self.init_db(self.path)
+
+    def _skip_path(self):
+        return any(request.path.startswith(sp) for sp in self.skip_paths)
+
+    def exists(self, sid):
+        return self.conn.execute(
+            'SELECT 1 FROM session WHERE sid = ?', (sid,)
+        ).fetchone() is not None
+
+    def remove(self, sid):
+        with self.conn as conn:
+            conn.execute('DELETE FROM session_key WHERE sid = ?', (sid,))
+            conn.execute('DELETE FROM session WHERE sid = ?', (sid,))
+
+    def new_session(self):
+        sid = str(uuid4())
+
+        # Do not store the session if skip paths
+        if self._skip_path():
+            return ManagedSession(sid=sid)
+
+        with self.conn as conn:
+            while conn.execute(
+                'INSERT OR IGNORE INTO session (sid, last_write) '
+                'VALUES (?, ?)', (sid, time.time())
+            ).rowcount == 0:
+                sid = str(uuid4())
+
+        return ManagedSession(sid=sid)
+
+    def get(self, sid, digest):
+        'Retrieve a managed session by session-id, checking the HMAC digest'
+
+        row = self.conn.execute(
+            'SELECT randval, hmac_digest FROM session WHERE sid = ?', (sid,)
+        ).fetchone()
+
+        # This assumes the stored digest is correct, if you really want to
+        # make sure the session is good from the server side, you can
+        # re-calculate the hmac
+        if row is None or row[1] is None or row[1] != digest:
+            return self.new_session()
+
+        data = dict()
+        stored_digests = dict()
+        for key, value in self.conn.execute(
+            'SELECT key, value FROM session_key WHERE sid = ?', (sid,)
+        ):
+            try:
+                data[key] = loads(value)
+            except Exception:
+                continue
+            stored_digests[key] = hashlib.sha1(value).digest()
+
+        if not data:
+            return self.new_session()
+
+        session = ManagedSession(
+            data, sid=sid, randval=row[0], hmac_digest=row[1]
+        )
+        session.stored_digests = stored_digests
+        return session
+
+    def put(self, session):
+        """Store the keys of a managed session changed since loaded"""
+        current_time = time.time()
+        if not session.hmac_digest:
+            session.sign(self.secret)
+        elif not session.force_write and session.last_write is not None and \
+            (current_time - float(session.last_write)) < \
+                self.disk_write_delay:
+            return
+
+        session.last_write = current_time
+        session.force_write = False
+
+        # Do not store the session if skip paths
+        if self._skip_path():
+            return
+
+        changed = []
+        stored_digests = dict()
+        for key, value in session.items():
+            value = dumps(value)
+            stored_digests[key] = hashlib.sha1(value).digest()
+            if session.stored_digests.get(key, None) != stored_digests[key]:
+                changed.append((session.sid, key, value))
+
+        removed = [(session.sid, key) for key in session.stored_digests
+                   if key not in stored_digests]
+
+        with self.conn as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO session '
+                '(sid, randval, hmac_digest, last_write) VALUES (?, ?, ?, ?)',
+                (session.sid, session.randval, session.hmac_digest,
+                 current_time)
+            )
+            conn.executemany(
+                'INSERT OR REPLACE INTO session_key (sid, key, value) '
+                'VALUES (?, ?, ?)', changed
+            )
+            conn.executemany(
+                'DELETE FROM session_key WHERE sid = ? AND key = ?', removed
+            )
+
+        session.stored_digests = stored_digests
+
+    def cleanup(self, expiration_time):
+        with self.conn as conn:
+            conn.execute(
+                'DELETE FROM session_key WHERE sid IN ('
+                'SELECT sid FROM session WHERE last_write < ?)',
+                (expiration_time,)
+            )
+            conn.execute(
+                'DELETE FROM session WHERE last_write < ?',
+                (expiration_time,)
+            )
 
 
 class ManagedSessionInterface(SessionInterface):
@@ -320,13 +713,23 @@ class ManagedSessionInterface(SessionInterface):
 
 
 def create_session_interface(app, skip_paths=[]):
+    session_manager_class = FileBackedSessionManager
+    kwargs = dict(
+        expiry_index=app.config.get('SESSION_EXPIRY_INDEX', False),
+        logger=app.logger
+    )
+    if app.config.get('SESSION_STORAGE', 'file') == 'sqlite':
+        session_manager_class = SQLiteBackedSessionManager
+        kwargs = dict()
+
     return ManagedSessionInterface(
         CachingSessionManager(
-            FileBackedSessionManager(
+            session_manager_class(
                 app.config['SESSION_DB_PATH'],
                 app.config['SECRET_KEY'],
                 app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
-                skip_paths
+                skip_paths,
+                **kwargs
             ),
             1000,
             skip_paths
@@ -365,11 +768,42 @@ def pga_unauthorised():
     return redirect(login_url(lm.login_view, request.url))
 
 
+def _cleanup_process_logs(path, expiration_time):
+    """
+    Removes the log files of the background processes not modified since
+    the expiration time.
+    """
+    for root, dirs, files in os.walk(path):
+        for file_name in files:
+            absolute_file_name = os.path.join(root, file_name)
+            try:
+                if os.stat(absolute_file_name).st_mtime < expiration_time:
+                    os.unlink(absolute_file_name)
+            except FileNotFoundError:
+                continue
+
+
+def _cleanup_sessions(manager, process_logs_path, expiration_time, logger):
+    if not cleanup_lock.acquire(blocking=False):
+        # Previous cleanup is still running
+        return
+
+    try:
+        if isinstance(manager, SessionManager):
+            manager.cleanup(expiration_time)
+        _cleanup_process_logs(process_logs_path, expiration_time)
+    except Exception as e:
+        logger.exception(e)
+    finally:
+        cleanup_lock.release()
+
+
 def cleanup_session_files():
     """
-    This function will iterate through session directory and check the last
-    modified time, if it older than (session expiration time + 1) days then
-    delete that file.
+    This function will remove the sessions (and the logs of the background
+    processes) not modified since (session expiration time + 1) days. The
+    expired sessions are found by the session manager, and removed in the
+    background.
     """
     iterate_session_files = False
 
@@ -381,22 +815,21 @@ def cleanup_session_files():
         LAST_CHECK_SESSION_FILES = datetime.datetime.now()
 
     if iterate_session_files:
-        for root, dirs, files in os.walk(
-                current_app.config['SESSION_DB_PATH']):
-            for file_name in files:
-                absolute_file_name = os.path.join(root, file_name)
-                st = os.stat(absolute_file_name)
-
-                # Get the last modified time of the session file
-                last_modified_time = \
-                    datetime.datetime.fromtimestamp(st.st_mtime)
-
-                # Calculate session file expiry time.
-                file_expiration_time = \
-                    last_modified_time + \
-                    current_app.permanent_session_lifetime + \
-                    datetime.timedelta(days=1)
-
-                if file_expiration_time <= datetime.datetime.now() and \
-                        os.path.exists(absolute_file_name):
-                    os.unlink(absolute_file_name)
+        expiration_time = (
+            datetime.datetime.now() -
+            current_app.permanent_session_lifetime -
+            datetime.timedelta(days=1)
+        ).timestamp()
+
+        Thread(
+            target=_cleanup_sessions,
+            args=(
+                getattr(current_app.session_interface, 'manager', None),
+                os.path.join(
+                    current_app.config['SESSION_DB_PATH'], 'process_logs'
+                ),
+                expiration_time,
+                current_app.logger
+            ),
+            daemon=True
+        ).start()
@@ -0,0 +1,156 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.module_manifest import load_module_manifest, \
+    save_module_manifest
+
+WEB_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.realpath(__file__)))))
+
+# Run in a new interpreter, so that no module has been imported yet.
+STARTUP_SCRIPT = """
+import builtins
+import sys
+import time
+start_time = time.time()
+builtins.SERVER_MODE = {server_mode!r}
+sys.path.insert(0, {web_dir!r})
+import config
+config.MODULE_MANIFEST_PATH = {manifest!r}
+from pgadmin import create_app
+from pgadmin.utils.module_manifest import save_module_manifest
+app = create_app(config.APP_NAME + '-cli')
+elapsed = time.time() - start_time
+if {save!r}:
+    save_module_manifest({manifest!r}, app.discovered_modules)
+print(elapsed)
+"""
+
+MODULES = {
+    'pgadmin': ['pgadmin.about', 'pgadmin.browser'],
+    'pgadmin.browser': ['pgadmin.browser.server_groups']
+}
+
+
+class TestModuleManifestFile(BaseTestGenerator):
+    scenarios = [
+        (
+            "Read the manifest written by this version",
+            dict(version=None, expected=MODULES)
+        ),
+        (
+            "Ignore the manifest written by another version",
+            dict(version='1.0', expected=None)
+        ),
+    ]
+
+    def setUp(self):
+        self.manifest_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.manifest_dir, 'modules.json')
+
+    def runTest(self):
+        self.assertIsNone(load_module_manifest(None))
+        self.assertIsNone(load_module_manifest(self.path))
+
+        with patch.object(config, 'APP_VERSION',
+                          self.version or config.APP_VERSION):
+            save_module_manifest(self.path, MODULES)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)['modules'], MODULES)
+
+        self.assertEqual(load_module_manifest(self.path), self.expected)
+
+    def tearDown(self):
+        shutil.rmtree(self.manifest_dir, ignore_errors=True)
+
+
+class TestModuleManifestDiscovery(BaseTestGenerator):
+    """
+    Finds the modules of every package with the module manifest generated
+    from the startup of the application, and by scanning the packages, which
+    must give the same modules.
+    """
+    scenarios = [
+        ("Find the same modules with the manifest", dict())
+    ]
+
+    def find_all_submodules(self, manifest):
+        self.app._module_manifest = manifest
+        return dict(
+            (package, [m.name for m in self.app.find_submodules(package)])
+            for package in self.packages
+        )
+
+    def runTest(self):
+        manifest = dict(self.app.discovered_modules)
+        self.packages = list(manifest.keys())
+        self.assertIn('pgadmin', self.packages)
+
+        saved_manifest = self.app._module_manifest
+        try:
+            scanned = self.find_all_submodules(None)
+            listed = self.find_all_submodules(manifest)
+        finally:
+            self.app._module_manifest = saved_manifest
+
+        self.assertEqual(listed, scanned)
+
+
+class TestModuleManifestStartupTime(BaseTestGenerator):
+    """
+    Creates the application in new interpreters, scanning the packages and
+    with the module manifest, and reports the best time of each. Startup
+    with the manifest must not be slower, within the tolerance.
+    """
+    scenarios = [
+        ("Start up with the manifest", dict(runs=3, tolerance=0.25))
+    ]
+
+    def setUp(self):
+        self.manifest_dir = tempfile.mkdtemp()
+        self.manifest = os.path.join(self.manifest_dir, 'modules.json')
+
+    def startup_time(self, manifest, save=False):
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            STARTUP_SCRIPT.format(
+                server_mode=config.SERVER_MODE, web_dir=WEB_DIR,
+                manifest=manifest, save=save)
+        ], cwd=WEB_DIR, stderr=subprocess.DEVNULL)
+        return float(output.decode().strip().splitlines()[-1])
+
+    def runTest(self):
+        # Generate the manifest, and warm up the file system caches.
+        self.startup_time(self.manifest, save=True)
+        self.assertIsNotNone(load_module_manifest(self.manifest))
+
+        without_manifest = min(
+            self.startup_time(None) for _ in range(self.runs))
+        with_manifest = min(
+            self.startup_time(self.manifest) for _ in range(self.runs))
+
+        print('Startup time, best of {0} runs: {1:.3f} seconds scanning the '
+              'packages, {2:.3f} seconds with the manifest'.format(
+                  self.runs, without_manifest, with_manifest),
+              file=sys.stderr)
+        self.assertLessEqual(
+            with_manifest, without_manifest * (1 + self.tolerance))
+
+    def tearDown(self):
+        shutil.rmtree(self.manifest_dir, ignore_errors=True)
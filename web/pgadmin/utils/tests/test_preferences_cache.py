@@ -0,0 +1,78 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.model import db, User, Version, Preferences as PrefTable, \
+    UserPreference as UserPrefTable
+from pgadmin.utils.preferences import PREFERENCES_VERSION, \
+    get_user_preferences, invalidate_user_preferences
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class PreferencesCacheTestCase(BaseTestGenerator):
+    """
+    This class validates the cache of the user preferences is reloaded only
+    after the preferences are changed by this, or another worker process.
+    """
+
+    scenarios = [
+        ('Preference changed by this worker', dict(other_worker=False)),
+        ('Preference changed by another worker', dict(other_worker=True)),
+    ]
+
+    def setUp(self):
+        with self.app.app_context():
+            self.uid = User.query.first().id
+            self.pid = PrefTable.query.first().id
+            pref = self.get_pref()
+            self.old_value = None if pref is None else pref.value
+
+            if pref is None:
+                db.session.add(UserPrefTable(
+                    uid=self.uid, pid=self.pid, value='initial'))
+            else:
+                pref.value = 'initial'
+            invalidate_user_preferences(self.uid)
+            db.session.commit()
+
+    def get_pref(self):
+        return UserPrefTable.query.filter_by(
+            pid=self.pid, uid=self.uid).first()
+
+    def runTest(self):
+        with self.app.test_request_context('/browser/'):
+            values = get_user_preferences(self.uid)
+            self.assertEqual(values[self.pid], 'initial')
+
+            # Same snapshot is returned, without querying it again.
+            self.assertIs(get_user_preferences(self.uid), values)
+
+        with self.app.test_request_context('/browser/'):
+            self.get_pref().value = 'changed'
+            if self.other_worker:
+                # Another worker only increments the version.
+                Version.query.filter_by(name=PREFERENCES_VERSION).update(
+                    {Version.value: Version.value + 1},
+                    synchronize_session=False
+                )
+            else:
+                invalidate_user_preferences(self.uid)
+            db.session.commit()
+
+        with self.app.test_request_context('/browser/'):
+            self.assertEqual(get_user_preferences(self.uid)[self.pid],
+                             'changed')
+
+    def tearDown(self):
+        with self.app.app_context():
+            if self.old_value is None:
+                db.session.delete(self.get_pref())
+            else:
+                self.get_pref().value = self.old_value
+            invalidate_user_preferences(self.uid)
+            db.session.commit()
@@ -0,0 +1,91 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.session import FileBackedSessionManager
+
+
+class SessionExpiryTestCase(BaseTestGenerator):
+    """
+    This class validates the removal of the expired session files, using
+    the expiry index or scanning the session directory.
+    """
+
+    scenarios = [
+        ('Expired session is removed', dict(
+            age=3600, legacy=False, indexed=True, expired=True)),
+        ('Recent session is kept', dict(
+            age=0, legacy=False, indexed=True, expired=False)),
+        ('Expired session written before the index is removed', dict(
+            age=3600, legacy=True, indexed=True, expired=True)),
+        ('Recent session written before the index is kept', dict(
+            age=0, legacy=True, indexed=True, expired=False)),
+        ('Expired session is removed without the index', dict(
+            age=3600, legacy=False, indexed=False, expired=True)),
+        ('Recent session is kept without the index', dict(
+            age=0, legacy=False, indexed=False, expired=False)),
+        ('Expired session is removed after the index failed', dict(
+            age=3600, legacy=False, indexed=True, broken=True,
+            expired=True)),
+    ]
+
+    def setUp(self):
+        self.session_dir = tempfile.mkdtemp()
+
+    def runTest(self):
+        write_time = time.time() - self.age
+
+        if self.legacy:
+            sid = str(uuid4())
+            fname = os.path.join(self.session_dir, sid)
+            with open(fname, 'wb'):
+                pass
+            os.utime(fname, (write_time, write_time))
+            manager = self.create_manager()
+        else:
+            manager = self.create_manager()
+            with self.app.test_request_context('/browser/'):
+                sid = manager.new_session().sid
+            fname = os.path.join(self.session_dir, sid)
+            os.utime(fname, (write_time, write_time))
+            if self.indexed:
+                manager.expiry_index.touch(sid, write_time)
+
+        if getattr(self, 'broken', False):
+            manager.expiry_index.expired = MagicMock(
+                side_effect=sqlite3.OperationalError('disk I/O error'))
+
+        manager.cleanup(time.time() - 60)
+
+        self.assertEqual(os.path.exists(fname), not self.expired)
+        if manager.expiry_index is not None:
+            self.assertEqual(
+                manager.expiry_index.expired(time.time() + 60, 10),
+                [] if self.expired else [sid]
+            )
+        else:
+            self.assertFalse(os.path.exists(
+                os.path.join(self.session_dir, 'session_expiry.db')))
+
+    def create_manager(self):
+        manager = FileBackedSessionManager(
+            self.session_dir, 'secret', 0, expiry_index=self.indexed)
+        self.assertEqual(manager.expiry_index is not None, self.indexed)
+        return manager
+
+    def tearDown(self):
+        shutil.rmtree(self.session_dir, ignore_errors=True)
@@ -0,0 +1,89 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import shutil
+import tempfile
+import time
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.session import SQLiteBackedSessionManager
+
+
+class SQLiteSessionManagerTestCase(BaseTestGenerator):
+    """
+    This class validates the session manager storing the keys of the
+    sessions in a SQLite database.
+    """
+
+    scenarios = [
+        ('Session is stored and loaded again', dict(
+            changes={}, expected_writes=0)),
+        ('Only the changed key is written', dict(
+            changes={'gridData': {'1': 'changed'}}, expected_writes=1)),
+        ('Removed key is deleted', dict(
+            changes={'gridData': None}, expected_writes=1)),
+    ]
+
+    def setUp(self):
+        self.session_dir = tempfile.mkdtemp()
+        self.manager = SQLiteBackedSessionManager(
+            self.session_dir, 'secret', 0
+        )
+
+    def runTest(self):
+        with self.app.test_request_context('/browser/'):
+            session = self.manager.new_session()
+            session['user'] = 'pgadmin'
+            session['gridData'] = {'1': 'initial'}
+            self.manager.put(session)
+
+            digest = session.hmac_digest
+            self.assertTrue(self.manager.exists(session.sid))
+
+            session = self.manager.get(session.sid, digest)
+            self.assertEqual(session['user'], 'pgadmin')
+            self.assertEqual(session['gridData'], {'1': 'initial'})
+
+            # Session is not returned for the invalid digest
+            self.assertNotEqual(
+                self.manager.get(session.sid, 'invalid').sid, session.sid
+            )
+
+            for key, value in self.changes.items():
+                if value is None:
+                    del session[key]
+                else:
+                    session[key] = value
+
+            total_changes = self.manager.conn.total_changes
+            self.manager.put(session)
+            # Session row itself is always written
+            self.assertEqual(
+                self.manager.conn.total_changes - total_changes,
+                self.expected_writes + 1
+            )
+
+            # Every session is permanent.
+            expected = dict(_permanent=True, user='pgadmin',
+                            gridData={'1': 'initial'})
+            expected.update(self.changes)
+            expected = dict((k, v) for k, v in expected.items()
+                            if v is not None)
+            self.assertEqual(dict(self.manager.get(session.sid, digest)),
+                             expected)
+
+            # Sessions not written since the expiration time are removed
+            self.manager.cleanup(time.time() - 60)
+            self.assertTrue(self.manager.exists(session.sid))
+            self.manager.cleanup(time.time() + 60)
+            self.assertFalse(self.manager.exists(session.sid))
+
+    def tearDown(self):
+        self.manager.conn.close()
+        shutil.rmtree(self.session_dir, ignore_errors=True)
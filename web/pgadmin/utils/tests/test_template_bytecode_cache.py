@@ -0,0 +1,68 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import tempfile
+
+from jinja2 import Environment
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.versioned_template_loader import VersionedTemplateLoader, \
+    TemplateBytecodeCache, precompile_templates
+from .test_versioned_template_loader import FakeApp
+
+
+class TestTemplateBytecodeCache(BaseTestGenerator):
+    scenarios = [
+        (
+            "Share the compiled template between the versioned names",
+            dict(templates=[
+                "some_feature/sql/#90000#/some_action_with_default.sql",
+                "some_feature/sql/#80000#/some_action_with_default.sql",
+                "some_feature/sql/default/some_action_with_default.sql"
+            ], cached_files=1)
+        ),
+        (
+            "Keep the compiled templates of different files apart",
+            dict(templates=[
+                "some_feature/sql/#90100#/some_action.sql",
+                "some_feature/sql/#90300#/some_action.sql"
+            ], cached_files=2)
+        ),
+    ]
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def get_environment(self):
+        return Environment(
+            loader=VersionedTemplateLoader(FakeApp()),
+            bytecode_cache=TemplateBytecodeCache(self.cache_dir)
+        )
+
+    def runTest(self):
+        environment = self.get_environment()
+        for template in self.templates:
+            environment.get_template(template)
+
+        self.assertEqual(len(os.listdir(self.cache_dir)), self.cached_files)
+
+        # Precompiling the template files must reuse the same cache entries
+        compiled, failed = precompile_templates(self.get_environment())
+        self.assertEqual(failed, [])
+        self.assertEqual(len(os.listdir(self.cache_dir)), compiled)
+
+        # New environment loads the compiled template from the cache
+        rendered = self.get_environment().get_template(
+            self.templates[0]).render()
+        self.assertTrue(rendered.startswith("Some"))
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -0,0 +1,43 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2022, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from werkzeug.routing import Map
+
+from pgadmin import PgAdminRule
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestPgAdminRule(BaseTestGenerator):
+    """Test the URL rules compiling their URL builders on first use"""
+    scenarios = [
+        ('Build and match a URL with arguments', dict(
+            rule='/obj/<int:gid>/<int:sid>/<did>',
+            endpoint='obj',
+            values=dict(gid=1, sid=2, did='db'),
+            url='/obj/1/2/db'
+        )),
+        ('Build a URL with unknown arguments', dict(
+            rule='/nodes/',
+            endpoint='nodes',
+            values=dict(refresh='true'),
+            url='/nodes/?refresh=true'
+        )),
+    ]
+
+    def runTest(self):
+        url_map = Map([PgAdminRule(self.rule, endpoint=self.endpoint)])
+        adapter = url_map.bind('localhost')
+
+        # Build twice, once compiling the builder and once reusing it.
+        for _ in range(2):
+            self.assertEqual(adapter.build(self.endpoint, self.values),
+                             self.url)
+
+        endpoint, _ = adapter.match(self.url.split('?')[0])
+        self.assertEqual(endpoint, self.endpoint)
@@ -8,8 +8,10 @@
 ##########################################################################
 
 import os
+from unittest.mock import patch
 
 from flask import Flask
+from flask.templating import DispatchingJinjaLoader
 from jinja2 import FileSystemLoader
 from jinja2 import TemplateNotFound
 
@@ -40,6 +42,10 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
             "Raise error when version is smaller than available templates",
             dict(scenario=5)
         ),
+        (
+            "Reuse the resolved path when the same template is requested",
+            dict(scenario=6)
+        ),
     ]
 
     def setUp(self):
@@ -63,6 +69,8 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
             # test_raise_not_found_exception_when_postgres_version_less_than_
             # all_available_sql_templates
             self.test_raise_not_found_exception()
+        if self.scenario == 6:
+            self.test_get_source_reuses_resolved_path()
 
     def test_get_source_returns_a_template(self):
         expected_content = "Some SQL" \
@@ -139,6 +147,36 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
         except TemplateNotFound:
             return
 
+    def test_get_source_reuses_resolved_path(self):
+        """Reuse the resolved path when the same template is requested"""
+        sql_path = os.path.join(
+            "some_feature", "sql", "default", "some_action_with_default.sql"
+        )
+        template = "some_feature/sql/#90000#/some_action_with_default.sql"
+        self.loader.get_source(None, template)
+
+        with patch.object(DispatchingJinjaLoader, 'get_source',
+                          wraps=self.loader.app.jinja_loader.get_source) \
+                as get_source_mock:
+            content, filename, up_to_dateness = self.loader.get_source(
+                None, template
+            )
+            # Only the resolved path is loaded, no other version is probed.
+            self.assertEqual(get_source_mock.call_count, 1)
+
+        self.assertEqual("Some default SQL", str(content).replace("\r", ""))
+        self.assertIn(sql_path, filename)
+
+        # Missing templates are not probed again either.
+        template = "some_feature/sql/#10100#/some_action.sql"
+        self.assertRaises(TemplateNotFound, self.loader.get_source,
+                          None, template)
+        with patch.object(DispatchingJinjaLoader, 'get_source') \
+                as get_source_mock:
+            self.assertRaises(TemplateNotFound, self.loader.get_source,
+                              None, template)
+            self.assertEqual(get_source_mock.call_count, 0)
+
 
 class FakeApp(Flask):
     def __init__(self):
@@ -6,11 +6,29 @@
 # This software is released under the PostgreSQL Licence
 #
 ##########################################################################
+from hashlib import sha1
+
 from flask.templating import DispatchingJinjaLoader
-from jinja2 import TemplateNotFound
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound, \
+    TemplateSyntaxError
+
+_NOT_RESOLVED = object()
 
 
 class VersionedTemplateLoader(DispatchingJinjaLoader):
+    """
+    Loads the versioned templates (i.e. 'path/#<version>#/file.sql' or
+    'path/#<server_type>#<version>#/file.sql') from the directory of the
+    highest version not greater than the requested one.
+
+    The path resolved for each versioned template, or its absence, is
+    remembered, so that the version directories are probed only once.
+    """
+
+    def __init__(self, app):
+        super(VersionedTemplateLoader, self).__init__(app)
+        self._resolved_paths = dict()
+
     def get_source(self, environment, template):
         specified_version_number, exists = parse_version(template)
         if not exists:
@@ -18,6 +36,21 @@ class VersionedTemplateLoader(DispatchingJinjaLoader):
                 environment, template
             )
 
+        # Templates can be added or removed while those are auto reloaded.
+        use_cache = not getattr(environment, 'auto_reload', False)
+        if use_cache:
+            template_path = self._resolved_paths.get(template, _NOT_RESOLVED)
+            if template_path is None:
+                raise TemplateNotFound(template)
+
+            if template_path is not _NOT_RESOLVED:
+                try:
+                    return super(VersionedTemplateLoader, self).get_source(
+                        environment, template_path
+                    )
+                except TemplateNotFound:
+                    self._resolved_paths.pop(template, None)
+
         template_dir, file_name = parse_template(template)
 
         for version_mapping in get_version_mapping(template):
@@ -31,14 +64,63 @@ class VersionedTemplateLoader(DispatchingJinjaLoader):
             ])
 
             try:
-                return super(VersionedTemplateLoader, self).get_source(
+                source = super(VersionedTemplateLoader, self).get_source(
                     environment, template_path
                 )
             except TemplateNotFound:
                 continue
+
+            if use_cache:
+                self._resolved_paths[template] = template_path
+            return source
+
+        if use_cache:
+            self._resolved_paths[template] = None
         raise TemplateNotFound(template)
 
 
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Stores the compiled templates on the disk, so that those are compiled
+    once instead of by every worker process after each restart.
+
+    The compiled template is kept against the file it was loaded from,
+    instead of the requested name, so that all the versioned names resolved
+    to the same file (i.e. of the different server versions) share it, and
+    it can be precompiled using the names of the template files.
+    """
+
+    def __init__(self, directory):
+        super(TemplateBytecodeCache, self).__init__(
+            directory, 'pgadmin-%s.cache'
+        )
+
+    def get_cache_key(self, name, filename=None):
+        return sha1((filename or name).encode('utf-8')).hexdigest()
+
+
+def precompile_templates(environment, extensions=('sql',)):
+    """
+    Compiles the templates with the specified extensions, which stores
+    those in the bytecode cache of the environment.
+
+    :param environment: Jinja environment
+    :param extensions: Extensions of the templates to compile
+    :return: Number of templates compiled, and list of the templates
+        which failed to compile
+    """
+    compiled = 0
+    failed = []
+    for name in environment.list_templates(extensions=extensions):
+        try:
+            environment.get_template(name)
+            compiled += 1
+        except (TemplateNotFound, TemplateSyntaxError):
+            failed.append(name)
+
+    return compiled, failed
+
+
 def parse_version(template):
     template_path_parts = template.split("#", 3)
     if len(template_path_parts) == 1:
@@ -0,0 +1,42 @@
+/////////////////////////////////////////////////////////////
+//
+// pgAdmin 4 - PostgreSQL Tools
+//
+// Copyright (C) 2013 - 2022, The pgAdmin Development Team
+// This software is released under the PostgreSQL Licence
+//
+//////////////////////////////////////////////////////////////
+
+import {applyRowChanges} from '../../../pgadmin/dashboard/static/js/Dashboard';
+
+describe('Dashboard.js', ()=>{
+  describe('applyRowChanges', ()=>{
+    let rows = [
+      {pid: 1, state: 'idle'},
+      {pid: 2, state: 'active'},
+      {pid: 3, state: 'idle'},
+    ];
+
+    it('with all the rows', ()=>{
+      expect(applyRowChanges(rows, {version: 'a:2', rows: [{pid: 4}]})).toEqual([{pid: 4}]);
+    });
+
+    it('with unchanged rows', ()=>{
+      expect(applyRowChanges(rows, {version: 'a:2', unchanged: true})).toBe(rows);
+    });
+
+    it('with the changes', ()=>{
+      expect(applyRowChanges(rows, {
+        version: 'a:2',
+        key: ['pid'],
+        added: [{pid: 4, state: 'active'}],
+        changed: [{pid: 1, state: 'active'}],
+        removed: [[2]],
+      })).toEqual([
+        {pid: 1, state: 'active'},
+        {pid: 3, state: 'idle'},
+        {pid: 4, state: 'active'},
+      ]);
+    });
+  });
+});
@@ -4,7 +4,7 @@ import {mount} from 'enzyme';
 import '../helper/enzyme.helper';
 
 import Graphs, {GraphsWrapper, X_AXIS_LENGTH, POINT_SIZE, transformData, legendCallback,
-  getStatsUrl, statsReducer} from '../../../pgadmin/dashboard/static/js/Graphs';
+  getStatsUrl, statsReducer, getHistoryUrl, historyToStats} from '../../../pgadmin/dashboard/static/js/Graphs';
 
 describe('Graphs.js', ()=>{
   it('transformData', ()=>{
@@ -63,6 +63,38 @@ describe('Graphs.js', ()=>{
     });
   });
 
+  describe('getHistoryUrl', ()=>{
+    it('for server', ()=>{
+      expect(getHistoryUrl(432, -1)).toEqual('/dashboard/history/432');
+    });
+    it('for database', ()=>{
+      expect(getHistoryUrl(432, 123)).toEqual('/dashboard/history/432/123');
+    });
+  });
+
+  describe('historyToStats', ()=>{
+    it('with no counter', ()=>{
+      expect(historyToStats({
+        'Label1': [1, 2, 3, 4, 5], 'Label2': [null, null, 1, null, 2],
+      }, 2, false)).toEqual({
+        'Label1': [5, 3, 1], 'Label2': [2, 1, null],
+      });
+    });
+
+    it('with counter', ()=>{
+      expect(historyToStats({
+        'Label1': [1, 2, 3, 4, 5],
+      }, 2, true)).toEqual({
+        'Label1': [10, 6, 2],
+      });
+    });
+
+    it('with more history than the chart', ()=>{
+      let history = {'Label1': [...Array(X_AXIS_LENGTH + 10).keys()]};
+      expect(historyToStats(history, 1, false)['Label1'].length).toEqual(X_AXIS_LENGTH);
+    });
+  });
+
   describe('statsReducer', ()=>{
     it('with incoming no counter', ()=>{
       let state = {
@@ -102,6 +102,7 @@ describe('ERDCore', ()=>{
           otherInfo: {
             data:data,
             dataUrl: null,
+            metadata: {},
           },
         },
       });
@@ -143,7 +144,7 @@ describe('ERDCore', ()=>{
 
       /* Without position */
       erdCoreObj.addNode(data);
-      expect(erdCoreObj.getNewNode).toHaveBeenCalledWith(data);
+      expect(erdCoreObj.getNewNode).toHaveBeenCalledWith(data, null, {});
       expect(erdEngine.getModel().addNode).toHaveBeenCalledWith(newNode);
       expect(erdCoreObj.clearSelection).toHaveBeenCalled();
 
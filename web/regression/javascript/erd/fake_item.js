@@ -4,6 +4,9 @@ export class FakeNode {
   constructor(data, id='nid1') {
     this.data = data || {};
     this.id = id;
+    this.metadata = {
+      is_promise: false,
+    };
   }
   setSelected() {/*This is intentional (SonarQube)*/}
   getColumns() {return this.data.columns;}
@@ -25,11 +28,8 @@ export class FakeNode {
     retVal.name = tabName;
     return retVal;
   }
-  getMetadata() {
-    return {
-      is_promise: false,
-    };
-  }
+  getMetadata() {return this.metadata;}
+  setMetadata(metadata) {this.metadata = metadata;}
 }
 
 export class FakeLink {
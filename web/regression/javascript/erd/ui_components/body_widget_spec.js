@@ -122,6 +122,10 @@ describe('ERD BodyWidget', ()=>{
       'schemas': schemas,
     }});
     networkMock.onGet('/erd/tables/110008/1/5/13637').reply(200, {'data': []});
+    networkMock.onGet('/erd/table/110008/1/5/13637/2200/16384').reply(200, {'data': {
+      name: 'table1', schema: 'erd1', relpersistence: false,
+      columns: [{name: 'col1', attnum: 1, attstorage: 'p'}],
+    }});
 
     networkMock.onPost('/erd/sql/110008/1/5/13637').reply(200, {'data': 'SELECT 1;'});
 
@@ -249,7 +253,7 @@ describe('ERD BodyWidget', ()=>{
     expect(mtmDialog.show).toHaveBeenCalled();
   });
 
-  it('addEditTable', ()=>{
+  it('addEditTable', async ()=>{
     let node1 = new FakeNode({'name': 'table1', schema: 'erd1', columns: [{name: 'col1', type: 'type1', attnum: 1}]}, 'id1');
     let node2 = new FakeNode({'name': 'table2', schema: 'erd2', columns: [{name: 'col2', type: 'type2', attnum: 2}]}, 'id2');
     let nodesDict = {
@@ -275,7 +279,7 @@ describe('ERD BodyWidget', ()=>{
     tableDialog.show.calls.reset();
     let node = new FakeNode({name: 'table1', schema: 'erd1'});
     spyOn(node, 'setData');
-    bodyInstance.addEditTable(node);
+    await bodyInstance.addEditTable(node);
     expect(tableDialog.show).toHaveBeenCalled();
 
     saveCallback = tableDialog.show.calls.mostRecent().args[7];
@@ -284,6 +288,24 @@ describe('ERD BodyWidget', ()=>{
     expect(node.setData).toHaveBeenCalledWith(newData);
   });
 
+  it('loadTableDetails', async ()=>{
+    let node = new FakeNode({name: 'table1', schema: 'erd1', columns: [{name: 'col1', attnum: 1, attnotnull: true}]});
+    node.setMetadata({is_promise: false, oid: 16384, scid: 2200});
+    spyOn(node, 'setData').and.callThrough();
+
+    await bodyInstance.loadTableDetails(node);
+    expect(node.setData).toHaveBeenCalledWith(jasmine.objectContaining({
+      name: 'table1', schema: 'erd1', relpersistence: false,
+      columns: [{name: 'col1', attnum: 1, attstorage: 'p', attnotnull: true}],
+    }), true);
+    expect(node.getMetadata()).toEqual({is_promise: false});
+
+    /* Details are fetched only once */
+    node.setData.calls.reset();
+    await bodyInstance.loadTableDetails(node);
+    expect(node.setData).not.toHaveBeenCalled();
+  });
+
   it('onEditTable', ()=>{
     let node = {key: 'value'};
     spyOn(bodyInstance, 'addEditTable');
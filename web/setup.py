@@ -14,6 +14,7 @@ and settings database."""
 import argparse
 import os
 import sys
+import time
 import builtins
 
 # Grab the SERVER_MODE if it's been set by the runtime
@@ -28,6 +29,9 @@ from pgadmin.model import db, Version, SCHEMA_VERSION as CURRENT_SCHEMA_VERSION
 from pgadmin import create_app
 from pgadmin.utils import clear_database_servers, dump_database_servers,\
     load_database_servers
+from pgadmin.utils.versioned_template_loader import \
+    precompile_templates as precompile_template_files
+from pgadmin.utils.module_manifest import save_module_manifest
 
 
 def dump_servers(args):
@@ -113,6 +117,51 @@ def setup_db():
             os.chmod(config.SQLITE_PATH, 0o600)
 
 
+def precompile_templates():
+    """Compile the SQL templates into the compiled templates cache."""
+
+    create_app_data_directory(config)
+
+    app = create_app(f'{config.APP_NAME}-cli')
+    if app.jinja_env.bytecode_cache is None:
+        print('The compiled templates cache is disabled, set the '
+              'TEMPLATE_CACHE_PATH to enable it.')
+        return
+
+    start_time = time.time()
+    with app.app_context():
+        compiled, failed = precompile_template_files(app.jinja_env)
+
+    print('Compiled {0} SQL templates into {1} in {2:.2f} seconds.'.format(
+        compiled, config.TEMPLATE_CACHE_PATH, time.time() - start_time))
+    for name in failed:
+        print('Failed to compile:', name)
+
+
+def generate_module_manifest():
+    """Write the modules found by scanning the packages into the module
+    manifest."""
+
+    if config.MODULE_MANIFEST_PATH is None:
+        print('The module manifest is disabled, set the MODULE_MANIFEST_PATH '
+              'to enable it.')
+        return
+
+    manifest_path = config.MODULE_MANIFEST_PATH
+    # Scan the packages, rather than reading the manifest being replaced.
+    config.MODULE_MANIFEST_PATH = None
+
+    start_time = time.time()
+    app = create_app(f'{config.APP_NAME}-cli')
+    save_module_manifest(manifest_path, app.discovered_modules)
+
+    print('Wrote {0} modules of {1} packages into {2} in {3:.2f} '
+          'seconds.'.format(
+              sum(len(m) for m in app.discovered_modules.values()),
+              len(app.discovered_modules), manifest_path,
+              time.time() - start_time))
+
+
 def clear_servers():
     """Clear groups and servers configurations.
 
@@ -154,6 +203,21 @@ if __name__ == '__main__':
                            required=False)
 
     imp_group.set_defaults(replace=False)
+
+    tpl_group = parser.add_argument_group('Compiled templates cache')
+    tpl_group.add_argument('--precompile-templates', dest='precompile',
+                           action='store_true',
+                           help='Compile the SQL templates into the cache, '
+                                'i.e. after an upgrade', required=False)
+    tpl_group.set_defaults(precompile=False)
+
+    mod_group = parser.add_argument_group('Module manifest')
+    mod_group.add_argument('--generate-module-manifest',
+                           dest='module_manifest', action='store_true',
+                           help='Write the modules to load into the module '
+                                'manifest, i.e. after an upgrade',
+                           required=False)
+    mod_group.set_defaults(module_manifest=False)
     # Common args
     parser.add_argument('--sqlite-path', metavar="PATH",
                         help='Dump/load with the specified pgAdmin config DB'
@@ -185,5 +249,9 @@ if __name__ == '__main__':
             load_servers(args)
         except Exception as e:
             print(e)
+    elif args.precompile:
+        precompile_templates()
+    elif args.module_manifest:
+        generate_module_manifest()
     else:
         setup_db()